@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""Measure the cold-start import time of packages with "python -X importtime".
+
+Each module is imported in a fresh interpreter, several times, and the median of the
+cumulative import time is reported with the slowest imported modules. With --max-ms,
+exits with a non-zero code if a module takes longer to import, to track regressions:
+
+    python scripts/import_time.py azure.core azure.storage.blob --max-ms 500
+"""
+from __future__ import print_function
+import argparse
+import json
+import re
+import subprocess
+import sys
+
+
+DEFAULT_MODULES = [
+    'azure.core',
+    'azure.storage.blob',
+    'azure.storage.queue',
+    'azure.storage.file',
+    'azure.cosmos',
+]
+
+_IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+
+def parse_import_times(output):
+    """Parse the output of -X importtime into a list of (module, self_us, cumulative_us, depth)."""
+    entries = []
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def measure(module, python=sys.executable):
+    """Import a module in a fresh interpreter, and return the parsed import times."""
+    process = subprocess.Popen(
+        [python, '-X', 'importtime', '-c', 'import {}'.format(module)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    _, stderr = process.communicate()
+    if process.returncode:
+        raise RuntimeError('Unable to import {}:\n{}'.format(module, stderr.strip().splitlines()[-1]))
+    return parse_import_times(stderr)
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2.0
+
+
+def report(module, runs, top):
+    """Measure a module several times, and summarize the results."""
+    totals = []
+    self_times = {}
+    for _ in range(runs):
+        entries = measure(module)
+        # The module, and its parent packages if they were not imported by the module itself
+        totals.append(sum(
+            cumulative for name, _, cumulative, depth in entries
+            if depth == 0 and (name == module or module.startswith(name + '.'))
+        ))
+        for name, self_us, _, _ in entries:
+            self_times.setdefault(name, []).append(self_us)
+    slowest = sorted(
+        ((name, _median(times) / 1000.0) for name, times in self_times.items()),
+        key=lambda item: item[1],
+        reverse=True
+    )[:top]
+    return {
+        'module': module,
+        'median_ms': _median(totals) / 1000.0,
+        'min_ms': min(totals) / 1000.0,
+        'slowest': [{'module': name, 'self_ms': self_ms} for name, self_ms in slowest],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure the cold-start import time of packages.')
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help='The modules to import.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters per module.')
+    parser.add_argument('--top', type=int, default=10, help='Number of slowest modules to show.')
+    parser.add_argument('--max-ms', type=float, help='Fail if the median import time of a module is above.')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON.')
+    args = parser.parse_args(argv)
+
+    results = []
+    failed = False
+    for module in args.modules:
+        try:
+            result = report(module, args.runs, args.top)
+        except RuntimeError as err:
+            print(err, file=sys.stderr)
+            failed = True
+            continue
+        results.append(result)
+        if args.max_ms is not None and result['median_ms'] > args.max_ms:
+            print('{} imports in {:.1f}ms, above {:.1f}ms'.format(
+                module, result['median_ms'], args.max_ms), file=sys.stderr)
+            failed = True
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            print('{module}: median {median_ms:.1f}ms, min {min_ms:.1f}ms'.format(**result))
+            for slow in result['slowest']:
+                print('    {self_ms:8.1f}ms  {module}'.format(**slow))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
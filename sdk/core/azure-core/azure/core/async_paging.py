@@ -23,9 +23,12 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import asyncio
 import collections.abc
 import logging
 from typing import (
+    Any,
+    List,
     Iterable,
     AsyncIterator,
     TypeVar,
@@ -74,7 +77,9 @@ class AsyncPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
 
         :param get_next: Callable that take the continuation token and return a HTTP response
         :param extract_data: Callable that take an HTTP response and return a tuple continuation token,
-         list of ReturnType
+         list of ReturnType. The continuation token can be a callable without argument, in which case
+         it is called when the token is needed, usually once the page has been consumed. This allows
+         to stream pages whose continuation token is located after the items in the payload.
         :param str continuation_token: The continuation token needed by get_next
         """
         self._get_next = get_next
@@ -84,6 +89,17 @@ class AsyncPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
         self._response = None
         self._current_page = None
 
+    @property
+    def continuation_token(self) -> Optional[str]:
+        """The continuation token of the next page, or None if this is the last page."""
+        if callable(self._continuation_token):
+            self._continuation_token = self._continuation_token()
+        return self._continuation_token
+
+    @continuation_token.setter
+    def continuation_token(self, value: Optional[str]) -> None:
+        self._continuation_token = value
+
     async def __anext__(self):
         if self.continuation_token is None and self._did_a_call_already:
             raise StopAsyncIteration("End of paging")
@@ -102,12 +118,97 @@ class AsyncPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
         return self._current_page
 
 
+_END_OF_PAGING = object()
+
+
+async def _prefetch_pages(
+    page_iterator: AsyncIterator[AsyncIterator[ReturnType]], pages: asyncio.Queue
+) -> None:
+    """Read pages ahead and put them, with their continuation token, in a bounded queue."""
+    while True:
+        try:
+            page_items = []  # type: List[ReturnType]
+            page = await page_iterator.__anext__()
+            while True:
+                try:
+                    page_items.append(await page.__anext__())
+                except StopAsyncIteration:
+                    break
+            entry = (page_items, getattr(page_iterator, "continuation_token", None))  # type: Any
+        except StopAsyncIteration:
+            entry = _END_OF_PAGING
+        except Exception as err:  # pylint: disable=broad-except
+            entry = err
+        await pages.put(entry)
+        if entry is _END_OF_PAGING or isinstance(entry, Exception):
+            return
+
+
+class AsyncPrefetchPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
+    def __init__(
+        self,
+        page_iterator: AsyncIterator[AsyncIterator[ReturnType]],
+        prefetch_pages: int,
+        continuation_token: Optional[str] = None,
+    ) -> None:
+        """Wrap an async iterator of pages to read pages ahead in a background task.
+
+        Up to `prefetch_pages` pages are fetched while the caller consumes the current one.
+        The continuation token is the one of the page following the last page returned
+        to the caller, not the one of the last page fetched, so it can safely be used to
+        resume paging with `by_page(continuation_token=...)`.
+
+        :param page_iterator: The async iterator of pages to read ahead.
+        :param int prefetch_pages: The maximum number of pages buffered ahead.
+        :param str continuation_token: The continuation token the page iterator starts from.
+        """
+        if prefetch_pages < 1:
+            raise ValueError("prefetch_pages must be a positive integer.")
+        self.continuation_token = continuation_token
+        self._page_iterator = page_iterator
+        self._prefetch_pages = prefetch_pages
+        self._pages = None  # type: Optional[asyncio.Queue]
+        self._worker = None  # type: Optional[asyncio.Future]
+        self._done = False
+
+    async def __anext__(self) -> AsyncIterator[ReturnType]:
+        if self._done:
+            raise StopAsyncIteration("End of paging")
+        if self._worker is None:
+            self._pages = asyncio.Queue(maxsize=self._prefetch_pages)
+            self._worker = asyncio.ensure_future(
+                _prefetch_pages(self._page_iterator, self._pages)
+            )
+        entry = await self._pages.get()  # type: ignore
+        if entry is _END_OF_PAGING:
+            self._done = True
+            raise StopAsyncIteration("End of paging")
+        if isinstance(entry, Exception):
+            self._done = True
+            raise entry
+        page, self.continuation_token = entry
+        return AsyncList(page)
+
+    def close(self) -> None:
+        """Stop reading pages ahead."""
+        self._done = True
+        if self._worker is not None:
+            self._worker.cancel()
+
+    def __del__(self):
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+
+
 class AsyncItemPaged(AsyncIterator[ReturnType]):
     def __init__(self, *args, **kwargs) -> None:
         """Return an async iterator of items.
 
         args and kwargs will be passed to the AsyncPageIterator constructor directly,
-        except page_iterator_class
+        except page_iterator_class and prefetch_pages.
+
+        If prefetch_pages is set, up to that many pages are read ahead in a background
+        task while the current page is consumed. Disabled by default.
         """
         self._args = args
         self._kwargs = kwargs
@@ -118,6 +219,7 @@ class AsyncItemPaged(AsyncIterator[ReturnType]):
         self._page_iterator_class = self._kwargs.pop(
             "page_iterator_class", AsyncPageIterator
         )
+        self._prefetch_pages = self._kwargs.pop("prefetch_pages", None)
 
     def by_page(
         self, continuation_token: Optional[str] = None
@@ -130,9 +232,14 @@ class AsyncItemPaged(AsyncIterator[ReturnType]):
             this generator will begin returning results from this point.
         :returns: An async iterator of pages (themselves async iterator of objects)
         """
-        return self._page_iterator_class(
+        page_iterator = self._page_iterator_class(
             *self._args, **self._kwargs, continuation_token=continuation_token
         )
+        if self._prefetch_pages:
+            return AsyncPrefetchPageIterator(
+                page_iterator, self._prefetch_pages, continuation_token
+            )
+        return page_iterator
 
     async def __anext__(self) -> ReturnType:
         if self._page_iterator is None:
@@ -95,6 +95,12 @@ class ConnectionConfiguration(object):
     :param str connection_cert: Client-side certificates. You can specify a local cert to use as client side
      certificate, as a single file (containing the private key and the certificate) or as a tuple of both files' paths.
     :param int connection_data_block_size: The block size of data sent over the connection. Defaults to 4096 bytes.
+    :param int connection_pool_connections: The number of per-host connection pools to cache. Defaults to 10.
+    :param int connection_pool_maxsize: The maximum number of connections kept open per host. Defaults to 10.
+    :param bool connection_pool_block: Whether a request should wait for a free connection when the pool of
+     the host is exhausted, instead of opening a new connection that will be discarded after use. Defaults to False.
+    :param int connection_idle_timeout: The time in seconds after which idle keep-alive connections are
+     closed instead of reused. Defaults to None, which keeps idle connections open.
 
     Example:
         .. literalinclude:: ../examples/test_example_config.py
@@ -110,3 +116,7 @@ class ConnectionConfiguration(object):
         self.verify = kwargs.pop('connection_verify', True)
         self.cert = kwargs.pop('connection_cert', None)
         self.data_block_size = kwargs.pop('connection_data_block_size', 4096)
+        self.pool_connections = kwargs.pop('connection_pool_connections', 10)
+        self.pool_maxsize = kwargs.pop('connection_pool_maxsize', 10)
+        self.pool_block = kwargs.pop('connection_pool_block', False)
+        self.idle_timeout = kwargs.pop('connection_idle_timeout', None)
@@ -24,8 +24,11 @@
 #
 # --------------------------------------------------------------------------
 import itertools
+import threading
 from typing import (
+    Any,
     Callable,
+    List,
     Optional,
     TypeVar,
     Iterator,
@@ -34,6 +37,11 @@ from typing import (
 )  # pylint: disable=unused-import
 import logging
 
+try:
+    import queue
+except ImportError:  # Python 2.7
+    import Queue as queue  # type: ignore
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,7 +60,9 @@ class PageIterator(Iterator[Iterator[ReturnType]]):
 
         :param get_next: Callable that take the continuation token and return a HTTP response
         :param extract_data: Callable that take an HTTP response and return a tuple continuation token,
-         list of ReturnType
+         list of ReturnType. The continuation token can be a callable without argument, in which case
+         it is called when the token is needed, usually once the page has been consumed. This allows
+         to stream pages whose continuation token is located after the items in the payload.
         :param str continuation_token: The continuation token needed by get_next
         """
         self._get_next = get_next
@@ -62,6 +72,18 @@ class PageIterator(Iterator[Iterator[ReturnType]]):
         self._response = None  # type: Optional[ResponseType]
         self._current_page = None  # type: Optional[Iterable[ReturnType]]
 
+    @property
+    def continuation_token(self):
+        # type: () -> Optional[str]
+        """The continuation token of the next page, or None if this is the last page."""
+        if callable(self._continuation_token):
+            self._continuation_token = self._continuation_token()
+        return self._continuation_token
+
+    @continuation_token.setter
+    def continuation_token(self, value):
+        self._continuation_token = value
+
     def __iter__(self):
         """Return 'self'."""
         return self
@@ -81,12 +103,103 @@ class PageIterator(Iterator[Iterator[ReturnType]]):
     next = __next__  # Python 2 compatibility.
 
 
+_END_OF_PAGING = object()
+
+
+def _prefetch_pages(page_iterator, pages, stop):
+    # type: (Iterator[Iterator[ReturnType]], queue.Queue, threading.Event) -> None
+    """Read pages ahead and put them, with their continuation token, in a bounded queue.
+
+    This does not keep any reference to the consuming iterator, so that it can be
+    garbage collected (and stop this worker) if the caller stops consuming pages.
+    """
+    while not stop.is_set():
+        try:
+            page = list(next(page_iterator))
+            entry = (page, getattr(page_iterator, "continuation_token", None))  # type: Any
+        except StopIteration:
+            entry = _END_OF_PAGING
+        except Exception as err:  # pylint: disable=broad-except
+            entry = err
+        while not stop.is_set():
+            try:
+                pages.put(entry, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        if entry is _END_OF_PAGING or isinstance(entry, Exception):
+            return
+
+
+class PrefetchPageIterator(Iterator[Iterator[ReturnType]]):
+    def __init__(self, page_iterator, prefetch_pages, continuation_token=None):
+        # type: (Iterator[Iterator[ReturnType]], int, Optional[str]) -> None
+        """Wrap an iterator of pages to read pages ahead on a background thread.
+
+        Up to `prefetch_pages` pages are fetched while the caller consumes the current one.
+        The continuation token is the one of the page following the last page returned
+        to the caller, not the one of the last page fetched, so it can safely be used to
+        resume paging with `by_page(continuation_token=...)`.
+
+        :param page_iterator: The iterator of pages to read ahead.
+        :param int prefetch_pages: The maximum number of pages buffered ahead.
+        :param str continuation_token: The continuation token the page iterator starts from.
+        """
+        if prefetch_pages < 1:
+            raise ValueError("prefetch_pages must be a positive integer.")
+        self.continuation_token = continuation_token
+        self._page_iterator = page_iterator
+        self._pages = queue.Queue(maxsize=prefetch_pages)  # type: queue.Queue
+        self._stop = threading.Event()
+        self._worker = None  # type: Optional[threading.Thread]
+        self._done = False
+
+    def __iter__(self):
+        """Return 'self'."""
+        return self
+
+    def __next__(self):
+        # type: () -> Iterator[ReturnType]
+        if self._done:
+            raise StopIteration("End of paging")
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=_prefetch_pages,
+                args=(self._page_iterator, self._pages, self._stop)
+            )
+            self._worker.daemon = True
+            self._worker.start()
+        entry = self._pages.get()
+        if entry is _END_OF_PAGING:
+            self._done = True
+            raise StopIteration("End of paging")
+        if isinstance(entry, Exception):
+            self._done = True
+            raise entry
+        page, self.continuation_token = entry
+        return iter(page)
+
+    next = __next__  # Python 2 compatibility.
+
+    def close(self):
+        # type: () -> None
+        """Stop reading pages ahead."""
+        self._done = True
+        self._stop.set()
+
+    def __del__(self):
+        self._stop.set()
+
+
 class ItemPaged(Iterator[ReturnType]):
     def __init__(self, *args, **kwargs):
         """Return an iterator of items.
 
         args and kwargs will be passed to the PageIterator constructor directly,
-        except page_iterator_class
+        except page_iterator_class and prefetch_pages.
+
+        If prefetch_pages is set, up to that many pages are read ahead on a background
+        thread while the current page is consumed. Disabled by default.
         """
         self._args = args
         self._kwargs = kwargs
@@ -94,6 +207,7 @@ class ItemPaged(Iterator[ReturnType]):
         self._page_iterator_class = self._kwargs.pop(
             "page_iterator_class", PageIterator
         )
+        self._prefetch_pages = self._kwargs.pop("prefetch_pages", None)
 
     def by_page(self, continuation_token=None):
         # type: (Optional[str]) -> Iterator[Iterator[ReturnType]]
@@ -105,9 +219,12 @@ class ItemPaged(Iterator[ReturnType]):
             this generator will begin returning results from this point.
         :returns: An iterator of pages (themselves iterator of objects)
         """
-        return self._page_iterator_class(
+        page_iterator = self._page_iterator_class(
             continuation_token=continuation_token, *self._args, **self._kwargs
         )
+        if self._prefetch_pages:
+            return PrefetchPageIterator(page_iterator, self._prefetch_pages, continuation_token)
+        return page_iterator
 
     def __iter__(self):
         """Return 'self'."""
@@ -57,9 +57,16 @@ class PipelineContext(dict):
     as well as used by the SDK developer to carry arbitrary data through
     the pipeline.
 
+    A policy can set the POLICY_TIMER entry to an object with a `measure(name)` method
+    returning a context manager: the pipeline then runs each hook of the SansIO policies
+    within `measure` with the policy class name, and the transport call with "transport".
+
     :param transport: The HTTP transport type.
     :param kwargs: Developer-defined keyword arguments.
     """
+    # Name of the context entry timing the policies and the transport
+    POLICY_TIMER = "policy_timer"
+
     def __init__(self, transport, **kwargs): #pylint: disable=super-init-not-called
         self.transport = transport
         self.options = kwargs
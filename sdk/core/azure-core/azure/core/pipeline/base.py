@@ -26,14 +26,18 @@
 
 import logging
 from typing import (TYPE_CHECKING, Generic, TypeVar, cast, IO, List, Union, Any, Mapping, Dict, Optional, # pylint: disable=unused-import
-                    Tuple, Callable, Iterator)
+                    Tuple, Callable, Iterator, Iterable, Set)
 from azure.core.pipeline import AbstractContextManager, PipelineRequest, PipelineResponse, PipelineContext
 from azure.core.pipeline.policies import HTTPPolicy, SansIOHTTPPolicy
+if TYPE_CHECKING:
+    from concurrent.futures import Future  # pylint: disable=unused-import
+
 HTTPResponseType = TypeVar("HTTPResponseType")
 HTTPRequestType = TypeVar("HTTPRequestType")
 HttpTransportType = TypeVar("HttpTransportType")
 
 _LOGGER = logging.getLogger(__name__)
+_DEFAULT_MAX_CONCURRENCY = 10
 PoliciesType = List[Union[HTTPPolicy, SansIOHTTPPolicy]]
 
 
@@ -60,6 +64,9 @@ class _SansIOHTTPPolicyRunner(HTTPPolicy, Generic[HTTPRequestType, HTTPResponseT
         :return: The PipelineResponse object.
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
+        timer = request.context.get(PipelineContext.POLICY_TIMER)
+        if timer is not None:
+            return self._send_measured(request, timer)
         self._policy.on_request(request)
         try:
             response = self.next.send(request)
@@ -70,6 +77,24 @@ class _SansIOHTTPPolicyRunner(HTTPPolicy, Generic[HTTPRequestType, HTTPResponseT
             self._policy.on_response(request, response)
         return response
 
+    def _send_measured(self, request, timer):
+        # type: (PipelineRequest, Any) -> PipelineResponse
+        """Same as send, measuring the time spent in the policy with the timer of the context."""
+        name = type(self._policy).__name__
+        with timer.measure(name):
+            self._policy.on_request(request)
+        try:
+            response = self.next.send(request)
+        except Exception: #pylint: disable=broad-except
+            with timer.measure(name):
+                handled = self._policy.on_exception(request)
+            if not handled:
+                raise
+        else:
+            with timer.measure(name):
+                self._policy.on_response(request, response)
+        return response
+
 
 class _TransportRunner(HTTPPolicy):
     """Transport runner.
@@ -91,9 +116,15 @@ class _TransportRunner(HTTPPolicy):
         :return: The PipelineResponse object.
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
+        timer = request.context.get(PipelineContext.POLICY_TIMER)
+        if timer is not None:
+            with timer.measure("transport"):
+                http_response = self._sender.send(request.http_request, **request.context.options)
+        else:
+            http_response = self._sender.send(request.http_request, **request.context.options)
         return PipelineResponse(
             request.http_request,
-            self._sender.send(request.http_request, **request.context.options),
+            http_response,
             context=request.context
         )
 
@@ -151,3 +182,51 @@ class Pipeline(AbstractContextManager, Generic[HTTPRequestType, HTTPResponseType
         pipeline_request = PipelineRequest(request, context) # type: PipelineRequest
         first_node = self._impl_policies[0] if self._impl_policies else _TransportRunner(self._transport)
         return first_node.send(pipeline_request)  # type: ignore
+
+    def run_many(self, requests, max_concurrency=None, **kwargs):
+        # type: (Iterable[HTTPRequestType], Optional[int], Any) -> Iterator[PipelineResponse]
+        """Runs several HTTP Requests through the chained policies.
+
+        Requests are consumed lazily from the given iterable and sent on a pool of
+        worker threads, with at most `max_concurrency` requests in flight at any time.
+        Each request gets its own PipelineContext, built from the same keyword arguments
+        as `run`. Responses are yielded in completion order, not in submission order: use
+        `PipelineResponse.http_request` to correlate a response with its request.
+
+        If a request fails, the exception is raised to the caller and the requests
+        that have not been started yet are cancelled.
+
+        :param requests: The HTTP request objects.
+        :type requests: iterable[~azure.core.pipeline.transport.HttpRequest]
+        :param int max_concurrency: The maximum number of requests in flight. Defaults to 10.
+        :return: An iterator of PipelineResponse objects.
+        :rtype: iterator[~azure.core.pipeline.PipelineResponse]
+        """
+        if max_concurrency is None:
+            max_concurrency = _DEFAULT_MAX_CONCURRENCY
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        # Validated before the generator is created, so that the error is raised by the call
+        return self._run_many(requests, max_concurrency, **kwargs)
+
+    def _run_many(self, requests, max_concurrency, **kwargs):
+        # type: (Iterable[HTTPRequestType], int, Any) -> Iterator[PipelineResponse]
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        pending = set()  # type: Set[Future]
+        try:
+            for request in requests:
+                pending.add(executor.submit(self.run, request, **kwargs))
+                if len(pending) >= max_concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
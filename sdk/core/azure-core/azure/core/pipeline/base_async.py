@@ -24,17 +24,24 @@
 #
 # --------------------------------------------------------------------------
 import abc
+import asyncio
+import collections
 
-from typing import Any, Union, List, Generic, TypeVar
+from typing import Any, Union, List, Generic, TypeVar, Iterable, AsyncIterator, Optional, Set, TYPE_CHECKING
 
 from azure.core.pipeline import PipelineRequest, PipelineResponse, PipelineContext
 from azure.core.pipeline.policies import AsyncHTTPPolicy, SansIOHTTPPolicy
 
+if TYPE_CHECKING:
+    from typing import Deque  # pylint: disable=unused-import
+
 AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType")
 HTTPRequestType = TypeVar("HTTPRequestType")
 ImplPoliciesType = List[AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]] #pylint: disable=unsubscriptable-object
 AsyncPoliciesType = List[Union[AsyncHTTPPolicy, SansIOHTTPPolicy]]
 
+_DEFAULT_MAX_CONCURRENCY = 10
+
 try:
     from contextlib import AbstractAsyncContextManager  # type: ignore
 except ImportError: # Python <= 3.7
@@ -70,6 +77,9 @@ class _SansIOAsyncHTTPPolicyRunner(AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPRes
         :return: The PipelineResponse object.
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
+        timer = request.context.get(PipelineContext.POLICY_TIMER)
+        if timer is not None:
+            return await self._send_measured(request, timer)
         self._policy.on_request(request)
         try:
             response = await self.next.send(request)  # type: ignore
@@ -80,6 +90,23 @@ class _SansIOAsyncHTTPPolicyRunner(AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPRes
             self._policy.on_response(request, response)
         return response
 
+    async def _send_measured(self, request: PipelineRequest, timer: Any):
+        """Same as send, measuring the time spent in the policy with the timer of the context."""
+        name = type(self._policy).__name__
+        with timer.measure(name):
+            self._policy.on_request(request)
+        try:
+            response = await self.next.send(request)  # type: ignore
+        except Exception: #pylint: disable=broad-except
+            with timer.measure(name):
+                handled = self._policy.on_exception(request)
+            if not handled:
+                raise
+        else:
+            with timer.measure(name):
+                self._policy.on_response(request, response)
+        return response
+
 
 class _AsyncTransportRunner(AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]): #pylint: disable=unsubscriptable-object
     """Async Transport runner.
@@ -100,13 +127,73 @@ class _AsyncTransportRunner(AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseTy
         :return: The PipelineResponse object.
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
+        timer = request.context.get(PipelineContext.POLICY_TIMER)
+        if timer is not None:
+            with timer.measure("transport"):
+                http_response = await self._sender.send(request.http_request, **request.context.options)
+        else:
+            http_response = await self._sender.send(request.http_request, **request.context.options)
         return PipelineResponse(
             request.http_request,
-            await self._sender.send(request.http_request, **request.context.options),
+            http_response,
             request.context
         )
 
 
+class _AsyncRunManyIterator(AsyncIterator[PipelineResponse]):
+    """Async iterator of the responses of several requests run through an AsyncPipeline.
+
+    Requests are consumed lazily, at most `max_concurrency` of them are in flight at any
+    time, and responses are returned in completion order.
+
+    :param pipeline: The async pipeline used to run each request.
+    :type pipeline: ~azure.core.pipeline.AsyncPipeline
+    :param requests: The HTTP request objects.
+    :param int max_concurrency: The maximum number of requests in flight.
+    """
+    def __init__(self, pipeline: 'AsyncPipeline', requests: Iterable, max_concurrency: int, **kwargs: Any) -> None:
+        self._pipeline = pipeline
+        self._requests = iter(requests)
+        self._max_concurrency = max_concurrency
+        self._kwargs = kwargs
+        self._pending = set()  # type: Set[asyncio.Future]
+        self._done = collections.deque()  # type: Deque[asyncio.Future]
+        self._exhausted = False
+
+    def _schedule(self) -> None:
+        while not self._exhausted and len(self._pending) < self._max_concurrency:
+            try:
+                request = next(self._requests)
+            except StopIteration:
+                self._exhausted = True
+            else:
+                self._pending.add(asyncio.ensure_future(self._pipeline.run(request, **self._kwargs)))
+
+    def _cancel(self) -> None:
+        for task in self._pending:
+            task.cancel()
+        self._pending = set()
+        self._exhausted = True
+
+    async def __anext__(self) -> PipelineResponse:
+        if not self._done:
+            self._schedule()
+            if not self._pending:
+                raise StopAsyncIteration("All requests have completed")
+            try:
+                done, self._pending = await asyncio.wait(self._pending, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                self._cancel()
+                raise
+            self._done.extend(done)
+        task = self._done.popleft()
+        try:
+            return task.result()
+        except Exception:  # pylint: disable=broad-except
+            self._cancel()
+            raise
+
+
 class AsyncPipeline(AbstractAsyncContextManager, Generic[HTTPRequestType, AsyncHTTPResponseType]):
     """Async pipeline implementation.
 
@@ -165,3 +252,32 @@ class AsyncPipeline(AbstractAsyncContextManager, Generic[HTTPRequestType, AsyncH
         pipeline_request = PipelineRequest(request, context)
         first_node = self._impl_policies[0] if self._impl_policies else _AsyncTransportRunner(self._transport)
         return await first_node.send(pipeline_request)  # type: ignore
+
+    def run_many(
+            self,
+            requests: Iterable,
+            max_concurrency: Optional[int] = None,
+            **kwargs: Any
+        ) -> AsyncIterator[PipelineResponse]:
+        """Runs several HTTP Requests through the chained policies.
+
+        Requests are consumed lazily from the given iterable and sent as asyncio tasks,
+        with at most `max_concurrency` requests in flight at any time. Each request gets its
+        own PipelineContext, built from the same keyword arguments as `run`. Responses are
+        returned in completion order, not in submission order: use
+        `PipelineResponse.http_request` to correlate a response with its request.
+
+        If a request fails, the exception is raised to the caller and the requests
+        still in flight are cancelled.
+
+        :param requests: The HTTP request objects.
+        :type requests: iterable[~azure.core.pipeline.transport.HttpRequest]
+        :param int max_concurrency: The maximum number of requests in flight. Defaults to 10.
+        :return: An async iterator of PipelineResponse objects.
+        :rtype: AsyncIterator[~azure.core.pipeline.PipelineResponse]
+        """
+        if max_concurrency is None:
+            max_concurrency = _DEFAULT_MAX_CONCURRENCY
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        return _AsyncRunManyIterator(self, requests, max_concurrency, **kwargs)
@@ -26,7 +26,10 @@
 
 from .base import HTTPPolicy, SansIOHTTPPolicy
 from .authentication import BearerTokenCredentialPolicy
+from .cache import CachePolicy
 from .custom_hook import CustomHookPolicy
+from .metrics import MetricsPolicy
+from .rate_limit import RateLimitPolicy
 from .redirect import RedirectPolicy
 from .retry import RetryPolicy
 from .universal import (
@@ -48,7 +51,10 @@ __all__ = [
     'RetryPolicy',
     'RedirectPolicy',
     'ProxyPolicy',
-    'CustomHookPolicy'
+    'CustomHookPolicy',
+    'MetricsPolicy',
+    'RateLimitPolicy',
+    'CachePolicy'
 ]
 
 #pylint: disable=unused-import
@@ -58,11 +64,15 @@ try:
     from .authentication_async import AsyncBearerTokenCredentialPolicy
     from .redirect_async import AsyncRedirectPolicy
     from .retry_async import AsyncRetryPolicy
+    from .rate_limit_async import AsyncRateLimitPolicy
+    from .cache_async import AsyncCachePolicy
     __all__.extend([
         'AsyncHTTPPolicy',
         'AsyncBearerTokenCredentialPolicy',
         'AsyncRedirectPolicy',
-        'AsyncRetryPolicy'
+        'AsyncRetryPolicy',
+        'AsyncRateLimitPolicy',
+        'AsyncCachePolicy'
     ])
 except (ImportError, SyntaxError):
     pass  # Async not supported
@@ -0,0 +1,499 @@
+#pylint: disable=no-self-use
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""
+This module implements a client-side HTTP response cache policy, with ETag revalidation.
+"""
+from __future__ import absolute_import  # we have a "requests" module that conflicts with "requests" on Py2.7
+import collections
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple  # pylint: disable=unused-import
+
+from requests.structures import CaseInsensitiveDict
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from .base import HTTPPolicy
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from azure.core.pipeline.transport import HttpRequest
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Request headers selecting a different representation of the same URL
+_VARIANT_HEADERS = ('accept', 'range', 'x-ms-range', 'x-ms-version')
+_CONDITIONAL_HEADERS = ('if-match', 'if-none-match', 'if-modified-since', 'if-unmodified-since')
+_SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def parse_cache_control(value):
+    # type: (Optional[str]) -> Dict[str, Optional[str]]
+    """Parse a Cache-Control header into a dict of lower-case directives.
+
+    :param str value: The header value.
+    :return: The directives, mapped to their argument or None.
+    :rtype: dict
+    """
+    directives = {}  # type: Dict[str, Optional[str]]
+    for directive in (value or '').split(','):
+        name, _, argument = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip().strip('"') or None
+    return directives
+
+
+def _max_age(directives):
+    # type: (Dict[str, Optional[str]]) -> float
+    if 'no-cache' in directives:
+        return 0
+    try:
+        return max(0, int(directives.get('max-age') or 0))
+    except ValueError:
+        return 0
+
+
+class CacheEntry(object):
+    """A cached response.
+
+    :param str url: The URL of the request.
+    :param int status_code: The status code of the response.
+    :param str reason: The status reason of the response.
+    :param dict headers: The response headers.
+    :param bytes body: The response body.
+    :param float expires: The time (as returned by time.time()) until which the entry
+     can be served without revalidation.
+    :param dict vary: The request headers listed in the `Vary` response header, with their values.
+    """
+
+    def __init__(self, url, status_code, reason, headers, body, expires, vary=None):
+        # type: (str, int, Optional[str], Dict[str, str], bytes, float, Optional[Dict[str, Optional[str]]]) -> None
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.expires = expires
+        self.vary = vary or {}
+
+    @property
+    def etag(self):
+        # type: () -> Optional[str]
+        return CaseInsensitiveDict(self.headers).get('etag')
+
+    def is_fresh(self, now=None):
+        # type: (Optional[float]) -> bool
+        return (now if now is not None else time.time()) < self.expires
+
+
+class CacheStore(object):
+    """Storage of the cached responses.
+
+    Entries are grouped by URL: a store maps an URL to a dict of variant keys to CacheEntry,
+    so that every variant of an URL can be evicted at once. Implementations must be thread-safe.
+    """
+
+    def get(self, url):
+        # type: (str) -> Optional[Dict[Tuple, CacheEntry]]
+        """Get the entries of an URL.
+
+        :param str url: The URL.
+        :rtype: dict
+        """
+        raise NotImplementedError()
+
+    def set(self, url, entries):
+        # type: (str, Dict[Tuple, CacheEntry]) -> None
+        """Set the entries of an URL.
+
+        :param str url: The URL.
+        :param dict entries: The entries, by variant key.
+        """
+        raise NotImplementedError()
+
+    def delete(self, url):
+        # type: (str) -> None
+        """Delete the entries of an URL, if any.
+
+        :param str url: The URL.
+        """
+        raise NotImplementedError()
+
+    def clear(self):
+        # type: () -> None
+        """Delete all the entries."""
+        raise NotImplementedError()
+
+
+class MemoryCacheStore(CacheStore):
+    """A thread-safe in-memory LRU store.
+
+    :param int max_entries: The maximum number of URLs kept in the store. Default value is 256.
+    """
+
+    def __init__(self, max_entries=256):
+        # type: (int) -> None
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()  # type: collections.OrderedDict
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, url):
+        with self._lock:
+            entries = self._entries.pop(url, None)
+            if entries is not None:
+                self._entries[url] = entries  # Most recently used last
+            return entries
+
+    def set(self, url, entries):
+        with self._lock:
+            self._entries.pop(url, None)
+            self._entries[url] = entries
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, url):
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCacheStore(CacheStore):
+    """A store persisting the entries on disk, one pickle file per URL.
+
+    The least recently used files (by modification time) are removed when the number of
+    files exceeds `max_entries`. Only use a directory trusted by, and private to, the process:
+    files are unpickled when read.
+
+    :param str directory: The directory of the cache files. Created if it does not exist.
+    :param int max_entries: The maximum number of URLs kept in the store. Default value is 1024.
+    """
+
+    _SUFFIX = '.cache'
+
+    def __init__(self, directory, max_entries=1024):
+        # type: (str, int) -> None
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, url):
+        # type: (str) -> str
+        name = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + self._SUFFIX)
+
+    def _files(self):
+        # type: () -> List[str]
+        return [
+            os.path.join(self.directory, name) for name in os.listdir(self.directory)
+            if name.endswith(self._SUFFIX)
+        ]
+
+    def get(self, url):
+        path = self._path(url)
+        with self._lock:
+            try:
+                with open(path, 'rb') as cache_file:
+                    stored_url, entries = pickle.load(cache_file)
+                os.utime(path, None)
+            except (IOError, OSError, EOFError, ValueError, pickle.UnpicklingError) as err:
+                if os.path.exists(path):
+                    _LOGGER.warning("Unable to read cache file %s: %s", path, err)
+                return None
+        return entries if stored_url == url else None
+
+    def set(self, url, entries):
+        path = self._path(url)
+        temp_path = '{}.{}.tmp'.format(path, threading.current_thread().ident)
+        with self._lock:
+            try:
+                with open(temp_path, 'wb') as cache_file:
+                    pickle.dump((url, entries), cache_file, pickle.HIGHEST_PROTOCOL)
+                if os.path.exists(path):
+                    os.remove(path)  # os.rename does not replace on Windows
+                os.rename(temp_path, path)
+            except (IOError, OSError) as err:
+                _LOGGER.warning("Unable to write cache file %s: %s", path, err)
+                return
+            files = self._files()
+            if len(files) > self.max_entries:
+                files.sort(key=os.path.getmtime)
+                for old_path in files[:len(files) - self.max_entries]:
+                    self._remove(old_path)
+
+    @staticmethod
+    def _remove(path):
+        # type: (str) -> None
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def delete(self, url):
+        with self._lock:
+            self._remove(self._path(url))
+
+    def clear(self):
+        with self._lock:
+            for path in self._files():
+                self._remove(path)
+
+
+class CachePolicy(HTTPPolicy):
+    """A client-side HTTP response cache policy.
+
+    Successful GET responses are stored in a bounded LRU store, following the `Cache-Control`
+    response header: `no-store` responses are not cached, and responses are served from the
+    cache without contacting the service for `max-age` seconds. Stale entries (or entries of
+    responses without `max-age`, or with `no-cache`) having an ETag are revalidated with an
+    `If-None-Match` request, and a 304 response is answered with the cached response.
+    Responses having neither an ETag nor a `max-age` are not cached. Any other method on an
+    URL evicts the cached entries of the URL.
+
+    Requests sent with `stream=True` or with conditional headers bypass the cache. A
+    `Cache-Control: no-cache` request header forces a revalidation. The cache is not keyed on
+    the credentials: do not share a store between clients using different identities.
+
+    Place this policy after the HeadersPolicy and before the RetryPolicy, so that cache hits
+    do not go through the retry and authentication policies.
+
+    **Keyword arguments:**
+
+    *cache_store (CacheStore)* - The store of the cached responses. Defaults to a MemoryCacheStore.
+
+    *cache_max_entries (int)* - The maximum number of URLs of the default store. Default value is 256.
+
+    *cache_directory (str)* - If set and no store is given, persist the entries on disk in this
+    directory with a FileCacheStore.
+
+    *cache_enable (bool)* - Use the cache. Default value is True. Can be overridden per operation.
+    """
+
+    def __init__(self, **kwargs):
+        max_entries = kwargs.pop('cache_max_entries', 256)
+        directory = kwargs.pop('cache_directory', None)
+        store = kwargs.pop('cache_store', None)
+        if store is None:
+            store = FileCacheStore(directory, max_entries) if directory else MemoryCacheStore(max_entries)
+        self.store = store
+        self.enabled = kwargs.pop('cache_enable', True)
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        super(CachePolicy, self).__init__()
+
+    @property
+    def stats(self):
+        # type: () -> Dict[str, int]
+        """The cache counters: `hits` (served fresh from the cache), `revalidations`
+        (served from the cache after a 304) and `misses`.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'revalidations': self.revalidations, 'misses': self.misses}
+
+    def _count(self, counter):
+        # type: (str) -> None
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def _variant_key(http_request):
+        # type: (HttpRequest) -> Tuple
+        headers = CaseInsensitiveDict(http_request.headers)
+        return tuple(headers.get(name) for name in _VARIANT_HEADERS)
+
+    def _is_cacheable_request(self, request):
+        # type: (PipelineRequest) -> bool
+        options = request.context.options
+        enabled = options.pop('cache_enable', self.enabled)
+        if not enabled or options.get('stream', False):
+            return False
+        headers = CaseInsensitiveDict(request.http_request.headers)
+        if any(name in headers for name in _CONDITIONAL_HEADERS):
+            return False
+        return 'no-store' not in parse_cache_control(headers.get('cache-control'))
+
+    def on_request(self, request):
+        # type: (PipelineRequest) -> Tuple[Optional[CacheEntry], Optional[Tuple]]
+        """Look up the cache before sending a request.
+
+        Evicts the entries of the URL for unsafe methods. Returns the cached entry to serve
+        or revalidate, and the variant key of the request; the variant key is None if the
+        response must not be cached.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :rtype: tuple
+        """
+        http_request = request.http_request
+        if http_request.method.upper() != 'GET':
+            if http_request.method.upper() not in _SAFE_METHODS:
+                self.store.delete(http_request.url)
+            request.context.options.pop('cache_enable', None)
+            return None, None
+        if not self._is_cacheable_request(request):
+            return None, None
+        variant = self._variant_key(http_request)
+        entry = (self.store.get(http_request.url) or {}).get(variant)
+        if entry is not None:
+            headers = CaseInsensitiveDict(http_request.headers)
+            if any(headers.get(name) != value for name, value in entry.vary.items()):
+                entry = None
+        return entry, variant
+
+    def must_revalidate(self, request, entry):
+        # type: (PipelineRequest, CacheEntry) -> bool
+        """Checks if a cached entry must be revalidated before being served.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param entry: The cached entry.
+        :type entry: ~azure.core.pipeline.policies.cache.CacheEntry
+        :rtype: bool
+        """
+        headers = CaseInsensitiveDict(request.http_request.headers)
+        directives = parse_cache_control(headers.get('cache-control'))
+        if 'no-cache' in directives or directives.get('max-age') == '0':
+            return True
+        return not entry.is_fresh()
+
+    def from_cache(self, request, entry):
+        # type: (PipelineRequest, CacheEntry) -> PipelineResponse
+        """Build the response of a request from a cached entry.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param entry: The cached entry.
+        :type entry: ~azure.core.pipeline.policies.cache.CacheEntry
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        # The transport imports the policies: import it here to avoid a circular import
+        from azure.core.pipeline.transport.base import _CachedHttpResponse
+        return PipelineResponse(
+            request.http_request,
+            _CachedHttpResponse(request.http_request, entry.status_code, entry.reason, entry.headers, entry.body),
+            request.context
+        )
+
+    def on_response(self, request, response, entry, variant):
+        # type: (PipelineRequest, PipelineResponse, Optional[CacheEntry], Optional[Tuple]) -> PipelineResponse
+        """Update the cache with a response, and return the response to give back to the caller.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param response: The PipelineResponse object.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        :param entry: The entry that was revalidated, if any.
+        :type entry: ~azure.core.pipeline.policies.cache.CacheEntry
+        :param tuple variant: The variant key of the request, None if the response must not be cached.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        if variant is None:
+            return response
+        http_response = response.http_response
+        url = request.http_request.url
+        if http_response.status_code == 304 and entry is not None:
+            self._count('revalidations')
+            headers = CaseInsensitiveDict(entry.headers)
+            headers.update(http_response.headers)
+            directives = parse_cache_control(headers.get('cache-control'))
+            entry = CacheEntry(
+                url, entry.status_code, entry.reason, dict(headers), entry.body,
+                time.time() + _max_age(directives), entry.vary
+            )
+            self._store(url, variant, entry)
+            return self.from_cache(request, entry)
+        self._count('misses')
+        if http_response.status_code != 200:
+            return response
+        directives = parse_cache_control(http_response.headers.get('Cache-Control'))
+        vary = [name.strip().lower() for name in http_response.headers.get('Vary', '').split(',') if name.strip()]
+        if 'no-store' in directives or '*' in vary:
+            return response
+        max_age = _max_age(directives)
+        if not max_age and 'etag' not in CaseInsensitiveDict(http_response.headers):
+            return response
+        request_headers = CaseInsensitiveDict(request.http_request.headers)
+        self._store(url, variant, CacheEntry(
+            url,
+            http_response.status_code,
+            http_response.reason,
+            dict(http_response.headers),
+            http_response.body(),
+            time.time() + max_age,
+            {name: request_headers.get(name) for name in vary}
+        ))
+        return response
+
+    def _store(self, url, variant, entry):
+        # type: (str, Tuple, CacheEntry) -> None
+        entries = dict(self.store.get(url) or {})
+        entries[variant] = entry
+        self.store.set(url, entries)
+
+    def send(self, request):
+        # type: (PipelineRequest) -> PipelineResponse
+        """Serves the request from the cache if possible, otherwise sends it (revalidating
+        the cached entry if any) and caches the response.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: Returns the PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        entry, variant = self.on_request(request)
+        if entry is not None:
+            if not self.must_revalidate(request, entry):
+                self._count('hits')
+                return self.from_cache(request, entry)
+            if entry.etag:
+                request.http_request.headers['If-None-Match'] = entry.etag
+            else:
+                entry = None
+        try:
+            response = self.next.send(request)
+        finally:
+            # The request may be sent again by the caller, which must not send a stale ETag
+            if entry is not None:
+                request.http_request.headers.pop('If-None-Match', None)
+        return self.on_response(request, response, entry, variant)
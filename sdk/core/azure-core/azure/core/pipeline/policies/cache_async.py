@@ -0,0 +1,73 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module implements the async flavor of the client-side HTTP response cache policy.
+"""
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from .base_async import AsyncHTTPPolicy
+from .cache import CacheEntry, CachePolicy
+
+
+class AsyncCachePolicy(CachePolicy, AsyncHTTPPolicy):  # type: ignore
+    """Async flavor of the client-side HTTP response cache policy.
+
+    See ~azure.core.pipeline.policies.CachePolicy for the keyword arguments.
+    """
+
+    def from_cache(self, request: PipelineRequest, entry: CacheEntry) -> PipelineResponse:
+        # The transport imports the policies: import it here to avoid a circular import
+        from azure.core.pipeline.transport.base_async import _AsyncCachedHttpResponse
+        return PipelineResponse(
+            request.http_request,
+            _AsyncCachedHttpResponse(request.http_request, entry.status_code, entry.reason, entry.headers, entry.body),
+            request.context
+        )
+
+    async def send(self, request):  # type: ignore
+        """Serves the request from the cache if possible, otherwise sends it (revalidating
+        the cached entry if any) and caches the response.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: Returns the PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        entry, variant = self.on_request(request)
+        if entry is not None:
+            if not self.must_revalidate(request, entry):
+                self._count('hits')
+                return self.from_cache(request, entry)
+            if entry.etag:
+                request.http_request.headers['If-None-Match'] = entry.etag
+            else:
+                entry = None
+        try:
+            response = await self.next.send(request)  # type: ignore
+        finally:
+            # The request may be sent again by the caller, which must not send a stale ETag
+            if entry is not None:
+                request.http_request.headers.pop('If-None-Match', None)
+        return self.on_response(request, response, entry, variant)
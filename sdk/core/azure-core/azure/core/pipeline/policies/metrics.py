@@ -0,0 +1,378 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module implements a policy recording request metrics into a pluggable sink.
+"""
+import bisect
+import contextlib
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple  # pylint: disable=unused-import
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse  # type: ignore
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse, PipelineContext  # pylint: disable=unused-import
+from .base import SansIOHTTPPolicy
+
+LabelsType = Tuple[Tuple[str, str], ...]
+
+# A monotonic clock, so that durations are not affected by adjustments of the system clock
+_clock = getattr(time, "perf_counter", time.time)  # Python 2.7 only has time.time
+
+#: Default histogram buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class MetricsSink(object):
+    """Base class of the metrics sinks used by the MetricsPolicy.
+
+    A sink receives counter increments and histogram observations, identified by a metric
+    name and a dict of labels. Implementations must be thread-safe, since a pipeline can be
+    used by several threads at once.
+    """
+
+    def increment(self, name, value=1, labels=None):
+        # type: (str, float, Optional[Dict[str, str]]) -> None
+        """Increment a counter.
+
+        :param str name: The metric name.
+        :param float value: The increment.
+        :param dict labels: The labels of the metric.
+        """
+        raise NotImplementedError()
+
+    def observe(self, name, value, labels=None):
+        # type: (str, float, Optional[Dict[str, str]]) -> None
+        """Record an observation in a histogram.
+
+        :param str name: The metric name.
+        :param float value: The observed value.
+        :param dict labels: The labels of the metric.
+        """
+        raise NotImplementedError()
+
+
+class CallbackMetricsSink(MetricsSink):
+    """A sink calling the given callback for every metric.
+
+    :param callback: A callable taking the metric kind ("counter" or "histogram"),
+     the metric name, the value and the labels dict.
+    """
+
+    def __init__(self, callback):
+        # type: (Callable[[str, str, float, Dict[str, str]], None]) -> None
+        self._callback = callback
+
+    def increment(self, name, value=1, labels=None):
+        self._callback("counter", name, value, labels or {})
+
+    def observe(self, name, value, labels=None):
+        self._callback("histogram", name, value, labels or {})
+
+
+class _Histogram(object):
+    def __init__(self, buckets):
+        # type: (Tuple[float, ...]) -> None
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        # type: (float) -> None
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape_label(value):
+    # type: (str) -> str
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=None):
+    # type: (LabelsType, Optional[Tuple[str, str]]) -> str
+    all_labels = list(labels) + ([extra] if extra else [])
+    if not all_labels:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(k, _escape_label(v)) for k, v in all_labels) + '}'
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """A thread-safe sink aggregating the metrics in memory.
+
+    Counters are summed and observations are aggregated into bucketed histograms. The
+    content can be read with `get_counter` and `get_histogram`, or dumped in the Prometheus
+    text exposition format with `to_prometheus_text`.
+
+    :param buckets: The upper bounds of the histogram buckets. Defaults to DEFAULT_BUCKETS.
+    """
+
+    def __init__(self, buckets=None):
+        # type: (Optional[Tuple[float, ...]]) -> None
+        self._buckets = tuple(sorted(buckets or DEFAULT_BUCKETS))
+        self._lock = threading.Lock()
+        self._counters = {}  # type: Dict[str, Dict[LabelsType, float]]
+        self._histograms = {}  # type: Dict[str, Dict[LabelsType, _Histogram]]
+
+    @staticmethod
+    def _key(labels):
+        # type: (Optional[Dict[str, str]]) -> LabelsType
+        return tuple(sorted((labels or {}).items()))
+
+    def increment(self, name, value=1, labels=None):
+        key = self._key(labels)
+        with self._lock:
+            counter = self._counters.setdefault(name, {})
+            counter[key] = counter.get(key, 0) + value
+
+    def observe(self, name, value, labels=None):
+        key = self._key(labels)
+        with self._lock:
+            histograms = self._histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = _Histogram(self._buckets)
+            histogram.observe(value)
+
+    def get_counter(self, name, **labels):
+        # type: (str, str) -> float
+        """Get the value of a counter, summed over the labels not specified.
+
+        :param str name: The metric name.
+        :return: The counter value.
+        :rtype: float
+        """
+        with self._lock:
+            return sum(
+                value for key, value in self._counters.get(name, {}).items()
+                if set(labels.items()).issubset(key)
+            )
+
+    def get_histogram(self, name, **labels):
+        # type: (str, str) -> Dict[str, Any]
+        """Get the aggregated observations of a histogram, merged over the labels not specified.
+
+        :param str name: The metric name.
+        :return: A dict with the "count", "sum" and cumulative "buckets" (a list of
+         (upper bound, count) tuples) of the histogram.
+        :rtype: dict
+        """
+        counts = [0] * (len(self._buckets) + 1)
+        total = 0.0
+        with self._lock:
+            for key, histogram in self._histograms.get(name, {}).items():
+                if set(labels.items()).issubset(key):
+                    counts = [a + b for a, b in zip(counts, histogram.counts)]
+                    total += histogram.sum
+        cumulative = []
+        running = 0
+        for bound, count in zip(self._buckets + (float("inf"),), counts):
+            running += count
+            cumulative.append((bound, running))
+        return {"count": running, "sum": total, "buckets": cumulative}
+
+    def clear(self):
+        # type: () -> None
+        """Reset all the metrics."""
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+
+    def to_prometheus_text(self):
+        # type: () -> str
+        """Dump the metrics in the Prometheus text exposition format.
+
+        :rtype: str
+        """
+        lines = []  # type: List[str]
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.append("# TYPE {} counter".format(name))
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append("{}{} {}".format(name, _format_labels(key), value))
+            for name in sorted(self._histograms):
+                lines.append("# TYPE {} histogram".format(name))
+                for key, histogram in sorted(self._histograms[name].items(), key=lambda item: item[0]):
+                    running = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                        running += count
+                        bound_text = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append("{}_bucket{} {}".format(name, _format_labels(key, ("le", bound_text)), running))
+                    lines.append("{}_sum{} {}".format(name, _format_labels(key), histogram.sum))
+                    lines.append("{}_count{} {}".format(name, _format_labels(key), histogram.count))
+        return "\n".join(lines) + "\n"
+
+
+class _RequestMetrics(object):
+    """Metrics of one request, carried in the pipeline context.
+
+    This is also the policy timer of the context, so that the pipeline reports the time spent
+    in each policy and in the transport.
+    """
+
+    def __init__(self):
+        self.start = _clock()
+        self.policy_timings = {}  # type: Dict[str, float]
+        self.phase_timings = []  # type: List[Tuple[str, float]]
+
+    def record_phase(self, phase, duration):
+        # type: (str, float) -> None
+        """Record the duration of a connection phase reported by the transport."""
+        self.phase_timings.append((phase, duration))
+
+    @contextlib.contextmanager
+    def measure(self, name):
+        """Add the time spent in the block to the timing of the given policy."""
+        start = _clock()
+        try:
+            yield
+        finally:
+            self.policy_timings[name] = self.policy_timings.get(name, 0.0) + _clock() - start
+
+
+def _content_length(message):
+    # type: (Any) -> Optional[int]
+    try:
+        return int(message.headers['Content-Length'])
+    except (KeyError, TypeError, ValueError):
+        pass
+    data = getattr(message, 'data', None)
+    if isinstance(data, (bytes, str)):
+        return len(data)
+    return None
+
+
+class MetricsPolicy(SansIOHTTPPolicy):
+    """A policy recording latency and throughput metrics into a sink.
+
+    For every request, it records the total duration, the time spent in each SansIO policy
+    and in the transport, the time to first byte when the transport provides it, the
+    number of retries, the bytes sent and received and the status code. This policy should
+    be the first of the pipeline, so its timings cover all the other policies.
+
+    Only the aiohttp transport, with a session it created, reports the connection phases:
+    the DNS resolution and the connection, which includes the TLS handshake. The requests
+    transports report none, and a request reusing a pooled connection has no phase.
+
+    When the policy is disabled, globally or per operation with "metrics_enable", nothing is
+    measured and the pipeline does not pay for any timing.
+
+    Recorded metrics:
+
+    - azure_core_requests_total (counter): labels method, host and status_code (or error).
+    - azure_core_request_duration_seconds (histogram): labels method, host and status_code.
+    - azure_core_policy_duration_seconds (histogram): label policy. The transport is
+      reported as the "transport" policy.
+    - azure_core_time_to_first_byte_seconds (histogram): labels method and host.
+    - azure_core_connection_phase_duration_seconds (histogram): labels method, host and
+      phase ("dns" or "connect").
+    - azure_core_retries_total (counter): labels method and host.
+    - azure_core_request_bytes_total and azure_core_response_bytes_total (counters):
+      labels method and host.
+
+    :param sink: The sink receiving the metrics. Defaults to a new InMemoryMetricsSink.
+    :type sink: ~azure.core.pipeline.policies.metrics.MetricsSink
+    :param bool metrics_enable: Use to enable the policy. Defaults to True.
+    """
+    # Name used in context
+    CONTEXT_NAME = "metrics"
+
+    def __init__(self, sink=None, metrics_enable=True, **kwargs):  # pylint: disable=unused-argument
+        self.sink = sink if sink is not None else InMemoryMetricsSink()
+        self.enabled = metrics_enable
+
+    def on_request(self, request):
+        # type: (PipelineRequest) -> None
+        if request.context.options.pop("metrics_enable", self.enabled):  # type: ignore
+            metrics = _RequestMetrics()
+            request.context[self.CONTEXT_NAME] = metrics  # type: ignore
+            request.context[PipelineContext.POLICY_TIMER] = metrics  # type: ignore
+            if getattr(request.context.transport, "_traces_connection_phases", False):  # type: ignore
+                request.context.options["trace_request_ctx"] = metrics  # type: ignore
+
+    @staticmethod
+    def _labels(request):
+        # type: (PipelineRequest) -> Dict[str, str]
+        return {
+            "method": request.http_request.method,
+            "host": urlparse(request.http_request.url).netloc,
+        }
+
+    def _pop_metrics(self, request):
+        # type: (PipelineRequest) -> Optional[_RequestMetrics]
+        request.context.pop(PipelineContext.POLICY_TIMER, None)  # type: ignore
+        return request.context.pop(self.CONTEXT_NAME, None)  # type: ignore
+
+    def _record(self, request, metrics, labels):
+        # type: (PipelineRequest, _RequestMetrics, Dict[str, str]) -> None
+        base_labels = self._labels(request)
+        self.sink.increment("azure_core_requests_total", labels=labels)
+        self.sink.observe("azure_core_request_duration_seconds", _clock() - metrics.start, labels=labels)
+        for policy, duration in metrics.policy_timings.items():
+            self.sink.observe("azure_core_policy_duration_seconds", duration, labels={"policy": policy})
+        for phase, duration in metrics.phase_timings:
+            phase_labels = dict(base_labels, phase=phase)
+            self.sink.observe("azure_core_connection_phase_duration_seconds", duration, labels=phase_labels)
+        retries = len(request.context.get("history", []))  # type: ignore
+        if retries:
+            self.sink.increment("azure_core_retries_total", retries, labels=base_labels)
+        request_bytes = _content_length(request.http_request)
+        if request_bytes:
+            self.sink.increment("azure_core_request_bytes_total", request_bytes, labels=base_labels)
+
+    def on_response(self, request, response):
+        # type: (PipelineRequest, PipelineResponse) -> None
+        metrics = self._pop_metrics(request)
+        if metrics is None:
+            return
+        labels = self._labels(request)
+        http_response = response.http_response
+        elapsed = getattr(getattr(http_response, "internal_response", None), "elapsed", None)
+        if elapsed is not None:
+            try:
+                self.sink.observe("azure_core_time_to_first_byte_seconds", elapsed.total_seconds(), labels=labels)
+            except AttributeError:
+                pass
+        response_bytes = _content_length(http_response)
+        if response_bytes:
+            self.sink.increment("azure_core_response_bytes_total", response_bytes, labels=labels)
+        labels["status_code"] = str(http_response.status_code)
+        self._record(request, metrics, labels)
+
+    def on_exception(self, request):
+        # type: (PipelineRequest) -> bool
+        metrics = self._pop_metrics(request)
+        if metrics is not None:
+            labels = self._labels(request)
+            exc_type = sys.exc_info()[0]
+            labels["error"] = exc_type.__name__ if exc_type else "Exception"
+            self._record(request, metrics, labels)
+        return False
@@ -0,0 +1,309 @@
+#pylint: disable=no-self-use
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+"""
+This module implements a client-side adaptive rate limiting policy.
+"""
+from __future__ import absolute_import  # we have a "requests" module that conflicts with "requests" on Py2.7
+import logging
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional  # pylint: disable=unused-import
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse  # type: ignore
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse  # pylint: disable=unused-import
+from .base import HTTPPolicy
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_SUBSCRIPTION_REGEX = re.compile(r'/subscriptions/([^/?]+)', re.IGNORECASE)
+_REMAINING_HEADER_PREFIX = 'x-ms-ratelimit-remaining-'
+
+# A clock which is not affected by changes of the system time, Python 2.7 only has time.time
+_clock = getattr(time, "monotonic", time.time)
+
+
+def host_key(request):
+    # type: (PipelineRequest) -> str
+    """Rate limit key of a request: its host."""
+    return urlparse(request.http_request.url).netloc
+
+
+def subscription_key(request):
+    # type: (PipelineRequest) -> str
+    """Rate limit key of a request: its subscription id if any, its host otherwise."""
+    match = _SUBSCRIPTION_REGEX.search(request.http_request.url)
+    if match:
+        return match.group(1).lower()
+    return host_key(request)
+
+
+class TokenBucket(object):
+    """A thread-safe token bucket whose rate adapts with AIMD.
+
+    The rate increases additively on success, at most once per `increase_interval`
+    so that the increase does not grow with the request rate, and decreases
+    multiplicatively when the service throttles. A decrease also restarts the interval.
+
+    :param float rate: The initial rate, in requests per second.
+    :param float min_rate: The minimum rate, in requests per second.
+    :param float max_rate: The maximum rate, in requests per second.
+    :param float capacity: The size of the bucket, i.e. the maximum burst. Defaults to the rate.
+    :param float increase: The rate increase applied on success, in requests per second.
+    :param float decrease_factor: The factor applied to the rate on throttling.
+    :param float increase_interval: The minimum time in seconds between two rate increases.
+    """
+
+    def __init__(self, rate, min_rate, max_rate, capacity=None, increase=1.0, decrease_factor=0.5,
+                 increase_interval=1.0):
+        # type: (float, float, float, Optional[float], float, float, float) -> None
+        self.rate = float(rate)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.capacity = float(capacity or max(rate, 1))
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.increase_interval = increase_interval
+        self._tokens = self.capacity
+        self._last = _clock()
+        self._last_adjustment = self._last
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        # type: (float) -> None
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self):
+        # type: () -> float
+        """Take a token from the bucket.
+
+        :return: The time in seconds to wait before sending the request.
+        :rtype: float
+        """
+        with self._lock:
+            now = _clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            return wait
+
+    def on_success(self):
+        # type: () -> None
+        """Additive increase of the rate, if the last adjustment is older than the increase interval."""
+        with self._lock:
+            now = _clock()
+            if now - self._last_adjustment < self.increase_interval:
+                return
+            self._refill(now)
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self._last_adjustment = now
+
+    def on_throttled(self, retry_after=None):
+        # type: (Optional[float]) -> None
+        """Multiplicative decrease of the rate.
+
+        :param float retry_after: If set, no token is delivered for that many seconds.
+        """
+        with self._lock:
+            now = _clock()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._last_adjustment = now
+            self._tokens = min(self._tokens, self.capacity)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+
+class _TokenBucketRegistry(object):
+    """Process-wide registry of the token buckets, by rate limit key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}  # type: Dict[str, TokenBucket]
+
+    def get(self, key, factory):
+        # type: (str, Callable[[], TokenBucket]) -> TokenBucket
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = factory()
+            return bucket
+
+    def clear(self):
+        # type: () -> None
+        with self._lock:
+            self._buckets = {}
+
+
+_SHARED_BUCKETS = _TokenBucketRegistry()
+
+
+class RateLimitPolicy(HTTPPolicy):
+    """A client-side rate limiting policy.
+
+    Requests are delayed so that the rate of requests for a given key (by default the host)
+    does not exceed the rate of a token bucket. The rate adapts with AIMD: it increases
+    additively on success, at most once per increase interval, and decreases multiplicatively
+    on 429/503 responses or when an `x-ms-ratelimit-remaining-*` header reports that the quota
+    is almost exhausted. A `Retry-After` header on a throttled response pauses all the requests
+    sharing the bucket.
+
+    By default, buckets are shared process-wide, so every pipeline (sync or async) sending
+    requests with the same key is limited together; the settings of the first policy creating the bucket of a key are used.
+    Place this policy after the RetryPolicy so that retried attempts are rate limited as well.
+
+    **Keyword arguments:**
+
+    *rate_limit_initial (float)* - The initial rate, in requests per second. Default value is 50.
+
+    *rate_limit_min (float)* - The minimum rate, in requests per second. Default value is 1.
+
+    *rate_limit_max (float)* - The maximum rate, in requests per second. Default value is 1000.
+
+    *rate_limit_burst (float)* - The maximum burst of requests. Defaults to the initial rate.
+
+    *rate_limit_increase (float)* - The rate increase on success, in requests per second. Default value is 1.
+
+    *rate_limit_decrease_factor (float)* - The factor applied to the rate on throttling. Default value is 0.5.
+
+    *rate_limit_increase_interval (float)* - The minimum time in seconds between two rate increases,
+    in the order of the round-trip time of a request. Default value is 1.
+
+    *rate_limit_remaining_threshold (int)* - Decrease the rate when a `x-ms-ratelimit-remaining-*`
+    header is below this value. Default value is 10.
+
+    *rate_limit_key (callable)* - Callable taking the PipelineRequest and returning the rate limit key.
+    Defaults to `host_key`; `subscription_key` limits requests per subscription.
+
+    *rate_limit_shared (bool)* - Share the token buckets process-wide. Default value is True.
+    With False, the policy has buckets of its own.
+    """
+
+    def __init__(self, **kwargs):
+        self.initial_rate = kwargs.pop('rate_limit_initial', 50)
+        self.min_rate = kwargs.pop('rate_limit_min', 1)
+        self.max_rate = kwargs.pop('rate_limit_max', 1000)
+        self.burst = kwargs.pop('rate_limit_burst', None)
+        self.increase = kwargs.pop('rate_limit_increase', 1.0)
+        self.decrease_factor = kwargs.pop('rate_limit_decrease_factor', 0.5)
+        self.increase_interval = kwargs.pop('rate_limit_increase_interval', 1.0)
+        self.remaining_threshold = kwargs.pop('rate_limit_remaining_threshold', 10)
+        self._get_key = kwargs.pop('rate_limit_key', host_key)
+        self._buckets = _SHARED_BUCKETS if kwargs.pop('rate_limit_shared', True) else _TokenBucketRegistry()
+        super(RateLimitPolicy, self).__init__()
+
+    def _create_bucket(self):
+        # type: () -> TokenBucket
+        return TokenBucket(
+            self.initial_rate,
+            self.min_rate,
+            self.max_rate,
+            capacity=self.burst,
+            increase=self.increase,
+            decrease_factor=self.decrease_factor,
+            increase_interval=self.increase_interval
+        )
+
+    def get_bucket(self, request):
+        # type: (PipelineRequest) -> TokenBucket
+        """Get the token bucket of a request.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :rtype: ~azure.core.pipeline.policies.rate_limit.TokenBucket
+        """
+        return self._buckets.get(self._get_key(request), self._create_bucket)
+
+    @staticmethod
+    def _parse_retry_after(response):
+        # type: (PipelineResponse) -> Optional[float]
+        retry_after = response.http_response.headers.get('Retry-After')
+        if retry_after is None:
+            return None
+        try:
+            return float(retry_after)
+        except ValueError:
+            return None
+
+    def is_throttled(self, response):
+        # type: (PipelineResponse) -> bool
+        """Checks if the response means the service is throttling the client.
+
+        :param response: The PipelineResponse object.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        :rtype: bool
+        """
+        if response.http_response.status_code in (429, 503):
+            return True
+        for header, value in response.http_response.headers.items():
+            if header.lower().startswith(_REMAINING_HEADER_PREFIX):
+                try:
+                    if int(value) < self.remaining_threshold:
+                        return True
+                except ValueError:
+                    continue
+        return False
+
+    def update(self, bucket, response):
+        # type: (TokenBucket, PipelineResponse) -> None
+        """Adapt the rate of the bucket to the response.
+
+        :param bucket: The token bucket of the request.
+        :type bucket: ~azure.core.pipeline.policies.rate_limit.TokenBucket
+        :param response: The PipelineResponse object.
+        :type response: ~azure.core.pipeline.PipelineResponse
+        """
+        if self.is_throttled(response):
+            retry_after = self._parse_retry_after(response)
+            bucket.on_throttled(retry_after)
+            _LOGGER.debug("Throttled by the service, rate limit lowered to %.2f requests/s", bucket.rate)
+        else:
+            bucket.on_success()
+
+    def send(self, request):
+        """Waits for a token of the rate limit bucket, then sends the request to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: Returns the PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        bucket = self.get_bucket(request)
+        wait = bucket.reserve()
+        if wait > 0:
+            request.context.transport.sleep(wait)
+        response = self.next.send(request)
+        self.update(bucket, response)
+        return response
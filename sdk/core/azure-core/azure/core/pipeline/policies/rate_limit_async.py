@@ -0,0 +1,56 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module implements the async flavor of the client-side adaptive rate limiting policy.
+"""
+from .base_async import AsyncHTTPPolicy
+from .rate_limit import RateLimitPolicy
+
+
+class AsyncRateLimitPolicy(RateLimitPolicy, AsyncHTTPPolicy):  # type: ignore
+    """Async flavor of the client-side rate limiting policy.
+
+    Token buckets are shared with the sync RateLimitPolicy, so sync and async pipelines
+    sending requests with the same key are limited together.
+
+    See ~azure.core.pipeline.policies.RateLimitPolicy for the keyword arguments.
+    """
+
+    async def send(self, request):  # type: ignore
+        """Waits for a token of the rate limit bucket, then sends the request to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: Returns the PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        bucket = self.get_bucket(request)
+        wait = bucket.reserve()
+        if wait > 0:
+            await request.context.transport.sleep(wait)
+        response = await self.next.send(request)  # type: ignore
+        self.update(bucket, response)
+        return response
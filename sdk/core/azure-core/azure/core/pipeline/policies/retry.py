@@ -343,6 +343,7 @@ class RetryPolicy(HTTPPolicy):
         """
         retry_active = True
         response = None
+        resume_settings = self.configure_retries(dict(request.context.options))
         retry_settings = self.configure_retries(request.context.options)
         while retry_active:
             try:
@@ -363,7 +364,10 @@ class RetryPolicy(HTTPPolicy):
                     if retry_active:
                         self.sleep(retry_settings, request.context.transport)
                         continue
+                self.update_context(request.context, retry_settings)
                 raise err
 
         self.update_context(response.context, retry_settings)
+        # Resumptions of a streamed download are retried with the options of its request
+        response.http_response._resume_retry = (self, resume_settings)  # pylint: disable=protected-access
         return response
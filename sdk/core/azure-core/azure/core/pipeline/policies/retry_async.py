@@ -131,6 +131,7 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):  # type: ignore
         """
         retry_active = True
         response = None
+        resume_settings = self.configure_retries(dict(request.context.options))
         retry_settings = self.configure_retries(request.context.options)
         while retry_active:
             try:
@@ -151,7 +152,10 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):  # type: ignore
                     if retry_active:
                         await self.sleep(retry_settings, request.context.transport)
                         continue
+                self.update_context(request.context, retry_settings)
                 raise err
 
         self.update_context(response.context, retry_settings)
+        # Resumptions of a streamed download are retried with the options of its request
+        response.http_response._resume_retry = (self, resume_settings)  # pylint: disable=protected-access
         return response
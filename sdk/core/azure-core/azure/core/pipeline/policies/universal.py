@@ -27,6 +27,8 @@
 This module is the requests implementation of Pipeline ABC
 """
 from __future__ import absolute_import  # we have a "requests" module that conflicts with "requests" on Py2.7
+import codecs
+import collections
 import json
 import logging
 import os
@@ -35,7 +37,7 @@ import xml.etree.ElementTree as ET
 import types
 import re
 from typing import (Mapping, IO, TypeVar, TYPE_CHECKING, Type, cast, List, Callable, Iterator, # pylint: disable=unused-import
-                    Any, Union, Dict, Optional)
+                    Iterable, Any, Union, Dict, Optional)
 
 from azure.core import __version__  as azcore_version
 from azure.core.exceptions import (
@@ -263,6 +265,323 @@ class NetworkTraceLoggingPolicy(SansIOHTTPPolicy):
                 _LOGGER.debug("Failed to log response: %s", repr(err))
 
 
+_CHUNK_SIZE = 16 * 1024
+
+
+def _iter_chunks(data):
+    # type: (Union[IO, Iterable[Union[bytes, str]]]) -> Iterator[Union[bytes, str]]
+    """Iterate over a file-like object or an iterable of chunks."""
+    if hasattr(data, 'read'):
+        while True:
+            chunk = cast(IO, data).read(_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in cast(Iterable, data):
+            if chunk:
+                yield chunk
+
+
+class _ChunksReader(object):
+    """Minimal file-like object reading bytes from an iterator of chunks."""
+    def __init__(self, chunks):
+        # type: (Iterator[Union[bytes, str]]) -> None
+        self._chunks = chunks
+        self._buffer = b""
+
+    def read(self, size=-1):
+        # type: (int) -> bytes
+        while size < 0 or len(self._buffer) < size:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                break
+            if not isinstance(chunk, bytes):
+                chunk = chunk.encode("utf-8")
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _IncrementalDecoder(object):
+    """Base class of the incremental decoders.
+
+    Iterating yields the items of the list being streamed. The rest of the document is
+    available in `document` once the iteration is over. Accessing `document` before that
+    reads the rest of the payload, buffering the remaining items.
+    """
+    def __init__(self):
+        self._items = self._parse()
+        self._pending = collections.deque()  # type: collections.deque
+        self._complete = False
+
+    def _parse(self):
+        # type: () -> Iterator[Any]
+        raise NotImplementedError()
+
+    def _get_document(self):
+        # type: () -> Any
+        raise NotImplementedError()
+
+    @property
+    def document(self):
+        # type: () -> Any
+        """The decoded document, without the streamed items."""
+        if not self._complete:
+            self._pending.extend(self._items)
+        return self._get_document()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._pending:
+            return self._pending.popleft()
+        return next(self._items)
+
+    next = __next__  # Python 2 compatibility.
+
+
+class _JsonValueScanner(object):
+    """Find the end of a JSON value in a buffer growing chunk by chunk.
+
+    The scan state (position, nesting depth, whether it is in a string) is kept between
+    calls, so that each character is scanned once. The value is not validated, which is
+    left to the JSON decoder once its end is found.
+    """
+    _STRING_SPECIALS = re.compile(r'["\\]')
+    _CONTAINER_SPECIALS = re.compile(r'["\[\]{}]')
+    _SCALAR_END = re.compile(r'[\s,:\]}]')
+
+    def __init__(self):
+        self._offset = 0  # Position of the next character to scan, relative to the start of the value
+        self._depth = 0
+        self._in_string = False
+        self._scalar = False
+
+    def scan(self, buffer, start):
+        # type: (str, int) -> bool
+        """Scan the buffer for the end of the value starting at `start`.
+
+        :return: True if the end of the value is in the buffer.
+        """
+        pos = start + self._offset
+        if pos >= len(buffer):
+            return False
+        if self._offset == 0:
+            first = buffer[pos]
+            if first == '"':
+                self._in_string = True
+            elif first in "[{":
+                self._depth = 1
+            else:
+                self._scalar = True
+            pos += 1
+        while True:
+            if self._scalar:
+                # A number or a literal, ended by a delimiter: at the end of the buffer it might be truncated
+                match = self._SCALAR_END.search(buffer, pos)
+                if match:
+                    return True
+                pos = len(buffer)
+                break
+            if self._in_string:
+                match = self._STRING_SPECIALS.search(buffer, pos)
+                if not match:
+                    pos = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # The escaped character is in the next chunk
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                pos = match.end()
+                self._in_string = False
+                if self._depth == 0:
+                    return True
+                continue
+            match = self._CONTAINER_SPECIALS.search(buffer, pos)
+            if not match:
+                pos = len(buffer)
+                break
+            pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        self._offset = pos - start
+        return False
+
+
+class _IncrementalJsonArrayDecoder(_IncrementalDecoder):
+    """Decode a JSON array found under a top-level key element by element.
+
+    :param chunks: The JSON payload, as an iterator of chunks.
+    :param str key: The top-level key of the array to stream, or None if the
+     payload itself is an array.
+    """
+    _WHITESPACES = " \t\n\r"
+
+    def __init__(self, chunks, key):
+        # type: (Iterator[Union[bytes, str]], Optional[str]) -> None
+        self._chunks = chunks
+        self._key = key
+        self._json_decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._document = {}  # type: Dict[str, Any]
+        super(_IncrementalJsonArrayDecoder, self).__init__()
+
+    def _get_document(self):
+        return self._document
+
+    def _read_more(self):
+        # type: () -> bool
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            text = self._text_decoder.decode(b"", final=True)
+        else:
+            text = self._text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        # type: () -> Optional[str]
+        """Skip whitespaces and return the next character, None at the end of the payload."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._WHITESPACES:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                return None
+
+    def _expect(self, characters):
+        # type: (str) -> str
+        char = self._peek()
+        if char is None or char not in characters:
+            raise DecodeError(message="JSON is invalid: expected one of '{}' at position {}, found {!r}".format(
+                characters, self._pos, char))
+        self._pos += 1
+        return char
+
+    def _decode_value(self):
+        # type: () -> Any
+        """Decode the value at the current position.
+
+        The value is scanned for its end as chunks are read, resuming where the previous chunk
+        left off, and decoded once complete. A value spanning many chunks is thus scanned once,
+        instead of being decoded again from its start after each chunk.
+        """
+        self._peek()
+        scanner = _JsonValueScanner()
+        while True:
+            # self._pos is the start of the value, even after the buffer is rebased by _read_more
+            if scanner.scan(self._buffer, self._pos) or not self._read_more():
+                break
+        try:
+            value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+        except ValueError as err:
+            raise DecodeError(message="JSON is invalid: {}".format(err), error=err)
+        self._pos = end
+        return value
+
+    def _parse_array(self):
+        # type: () -> Iterator[Any]
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._expect(",]") == "]":
+                return
+
+    def _parse(self):
+        if self._key is None:
+            for item in self._parse_array():
+                yield item
+        else:
+            self._expect("{")
+            if self._peek() == "}":
+                self._pos += 1
+            else:
+                while True:
+                    key = self._decode_value()
+                    self._expect(":")
+                    if key == self._key and self._peek() == "[":
+                        for item in self._parse_array():
+                            yield item
+                    else:
+                        self._document[key] = self._decode_value()
+                    if self._expect(",}") == "}":
+                        break
+        if self._peek() is not None:
+            raise DecodeError(message="JSON is invalid: extra data at position {}".format(self._pos))
+        self._complete = True
+
+
+class _IncrementalXmlDecoder(_IncrementalDecoder):
+    """Decode the XML elements with a given tag one by one.
+
+    Yielded elements are detached from their parent, so only the element being
+    decoded is kept in memory. Matching elements nested in a matching element are
+    yielded as part of it, and the root element is never yielded, even if it has
+    the tag: it is the `document`.
+
+    :param chunks: The XML payload, as an iterator of chunks.
+    :param str tag: The tag of the elements to stream.
+    """
+    def __init__(self, chunks, tag):
+        # type: (Iterator[Union[bytes, str]], str) -> None
+        self._source = _ChunksReader(chunks)
+        self._tag = tag
+        self._root = None  # type: Optional[ET.Element]
+        super(_IncrementalXmlDecoder, self).__init__()
+
+    def _get_document(self):
+        return self._root
+
+    def _parse(self):
+        stack = []  # type: List[ET.Element]
+        depth = 0  # Number of matching elements currently open
+        try:
+            for event, elem in ET.iterparse(self._source, events=("start", "end")):
+                if event == "start":
+                    if self._root is None:
+                        self._root = elem
+                    elif elem.tag == self._tag:
+                        depth += 1
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if stack and elem.tag == self._tag:
+                    depth -= 1
+                    if depth == 0:
+                        stack[-1].remove(elem)
+                        yield elem
+        except ET.ParseError as err:
+            raise DecodeError(message="XML is invalid: {}".format(err), error=err)
+        self._complete = True
+
+
 class ContentDecodePolicy(SansIOHTTPPolicy):
     """Policy for decoding unstreamed response content.
     """
@@ -336,6 +655,43 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
                 raise_with_traceback(DecodeError, message="XML is invalid", response=response)
         raise DecodeError("Cannot deserialize content-type: {}".format(content_type))
 
+    @classmethod
+    def iter_json_array(cls, data, key="value"):
+        # type: (Type[ContentDecodePolicyType], Union[IO, Iterable[Union[bytes, str]]], Optional[str]) -> Iterator[Any]
+        """Decode a JSON array incrementally, element by element.
+
+        This is intended for streamed list responses (for instance `value` based pages), so
+        that the payload is never loaded in memory at once. The other top-level fields (like
+        `nextLink`) are available in the `document` dict of the returned iterator once the
+        iteration is over.
+
+        :param data: The payload, as a file-like object or an iterable of chunks
+         (for instance the result of `stream_download`).
+        :param str key: The top-level key of the array. Use None if the payload is itself an array.
+        :return: An iterator of the decoded array elements.
+        :raises ~azure.core.exceptions.DecodeError: If the payload is not valid JSON.
+        """
+        return _IncrementalJsonArrayDecoder(_iter_chunks(data), key)
+
+    @classmethod
+    def iter_xml_elements(cls, data, tag):
+        # type: (Type[ContentDecodePolicyType], Union[IO, Iterable[Union[bytes, str]]], str) -> Iterator[ET.Element]
+        """Decode the XML elements with the given tag incrementally, element by element.
+
+        This is intended for streamed XML list responses (for instance blob listings). Each
+        element is removed from its parent once decoded, and the root element, without the
+        streamed elements, is available in the `document` attribute of the returned iterator
+        once the iteration is over. The root element itself is never yielded, even if it has
+        the given tag.
+
+        :param data: The payload, as a file-like object or an iterable of chunks
+         (for instance the result of `stream_download`).
+        :param str tag: The tag of the elements to stream.
+        :return: An iterator of the decoded elements.
+        :raises ~azure.core.exceptions.DecodeError: If the payload is not valid XML.
+        """
+        return _IncrementalXmlDecoder(_iter_chunks(data), tag)
+
     @classmethod
     def deserialize_from_http_generics(cls, response):
         # type: (Type[ContentDecodePolicyType], PipelineResponse) -> Any
@@ -24,6 +24,8 @@
 #
 # --------------------------------------------------------------------------
 
+import sys
+
 from .base import HttpTransport, HttpRequest, HttpResponse
 from .requests_basic import RequestsTransport, RequestsTransportResponse
 
@@ -47,22 +49,47 @@ try:
         'AsyncioRequestsTransportResponse'
     ])
 
-    try:
-        from .requests_trio import TrioRequestsTransport, TrioRequestsTransportResponse
-        __all__.extend([
-            'TrioRequestsTransport',
-            'TrioRequestsTransportResponse'
-        ])
-    except ImportError:
-        pass  # Trio not installed
+    # The third-party async transports are the most expensive imports of azure-core:
+    # on Python 3.7+, they are imported on first access instead (PEP 562).
+    _LAZY_TRANSPORTS = {
+        'TrioRequestsTransport': ('.requests_trio', 'trio'),
+        'TrioRequestsTransportResponse': ('.requests_trio', 'trio'),
+        'AioHttpTransport': ('.aiohttp', 'aiohttp'),
+        'AioHttpTransportResponse': ('.aiohttp', 'aiohttp'),
+    }
+
+    if sys.version_info >= (3, 7):
+        import importlib
+        import importlib.util
+        __all__.extend(
+            name for name, (_, package) in _LAZY_TRANSPORTS.items() if importlib.util.find_spec(package)
+        )
+
+        def __getattr__(name):
+            try:
+                module_name, _ = _LAZY_TRANSPORTS[name]
+                value = getattr(importlib.import_module(module_name, __name__), name)
+            except (KeyError, ImportError):
+                raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+            globals()[name] = value
+            return value
+    else:
+        try:
+            from .requests_trio import TrioRequestsTransport, TrioRequestsTransportResponse
+            __all__.extend([
+                'TrioRequestsTransport',
+                'TrioRequestsTransportResponse'
+            ])
+        except ImportError:
+            pass  # Trio not installed
 
-    try:
-        from .aiohttp import AioHttpTransport, AioHttpTransportResponse
-        __all__.extend([
-            'AioHttpTransport',
-            'AioHttpTransportResponse',
-        ])
-    except ImportError:
-        pass  # Aiohttp not installed
+        try:
+            from .aiohttp import AioHttpTransport, AioHttpTransportResponse
+            __all__.extend([
+                'AioHttpTransport',
+                'AioHttpTransportResponse',
+            ])
+        except ImportError:
+            pass  # Aiohttp not installed
 except (ImportError, SyntaxError):
     pass  # Asynchronous pipelines not supported.
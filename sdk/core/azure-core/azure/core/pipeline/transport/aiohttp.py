@@ -28,17 +28,16 @@ from collections.abc import AsyncIterator
 
 import logging
 import asyncio
+import time
 import aiohttp
 
 from azure.core.configuration import ConnectionConfiguration
 from azure.core.exceptions import ServiceRequestError, ServiceResponseError
-from azure.core.pipeline import Pipeline
+from azure.core.pipeline import Pipeline, PipelineRequest
 
-from requests.exceptions import (
-    ChunkedEncodingError,
-    StreamConsumedError)
+from requests.exceptions import StreamConsumedError
 
-from .base import HttpRequest
+from .base import HttpRequest, _get_resume_retry, _build_resume_request, _check_resume_response
 from .base_async import (
     AsyncHttpTransport,
     AsyncHttpResponse,
@@ -49,11 +48,56 @@ CONTENT_CHUNK_SIZE = 10 * 1024
 _LOGGER = logging.getLogger(__name__)
 
 
+async def _on_dns_resolvehost_start(session, trace_config_ctx, params):  # pylint: disable=unused-argument
+    trace_config_ctx.dns_start = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(session, trace_config_ctx, params):  # pylint: disable=unused-argument
+    duration = time.perf_counter() - trace_config_ctx.dns_start
+    trace_config_ctx.dns_duration = getattr(trace_config_ctx, 'dns_duration', 0.0) + duration
+    _record_phase(trace_config_ctx, "dns", duration)
+
+
+async def _on_connection_create_start(session, trace_config_ctx, params):  # pylint: disable=unused-argument
+    trace_config_ctx.connect_start = time.perf_counter()
+    trace_config_ctx.dns_duration = 0.0
+
+
+async def _on_connection_create_end(session, trace_config_ctx, params):  # pylint: disable=unused-argument
+    duration = time.perf_counter() - trace_config_ctx.connect_start
+    # The DNS resolution happens within the connection creation and is reported on its own
+    _record_phase(trace_config_ctx, "connect", duration - trace_config_ctx.dns_duration)
+
+
+def _record_phase(trace_config_ctx, phase, duration):
+    recorder = getattr(trace_config_ctx.trace_request_ctx, 'record_phase', None)
+    if recorder is not None:
+        recorder(phase, duration)
+
+
+def _build_trace_config():
+    """Build the trace config reporting the connection phases of a request.
+
+    The phases are given to the "record_phase(phase, duration)" method of the
+    "trace_request_ctx" keyword argument of the request, if any.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    return trace_config
+
+
 class AioHttpTransport(AsyncHttpTransport):
     """AioHttp HTTP sender implementation.
 
     Fully asynchronous implementation using the aiohttp library.
 
+    The sessions created by the transport report the DNS resolution and the connection
+    (TCP connect and TLS handshake) of a request to the "record_phase" method of its
+    "trace_request_ctx" keyword argument. A session given to the transport does not.
+
     :param session: The client session.
     :param loop: The event loop.
     :param bool session_owner: Session owner. Defaults True.
@@ -70,6 +114,9 @@ class AioHttpTransport(AsyncHttpTransport):
             :dedent: 4
             :caption: Asynchronous transport with aiohttp.
     """
+    # The sessions of the transport report the connection phases of the requests
+    _traces_connection_phases = True
+
     def __init__(self, *, session=None, loop=None, session_owner=True, **kwargs):
         self._loop = loop
         self._session_owner = session_owner
@@ -90,7 +137,9 @@ class AioHttpTransport(AsyncHttpTransport):
         if not self.session and self._session_owner:
             self.session = aiohttp.ClientSession(
                 loop=self._loop,
-                trust_env=self._use_env_settings
+                trust_env=self._use_env_settings,
+                connector=self._build_connector(),
+                trace_configs=[_build_trace_config()]
             )
         if self.session is not None:
             await self.session.__aenter__()
@@ -103,6 +152,22 @@ class AioHttpTransport(AsyncHttpTransport):
             self._session_owner = False
             self.session = None
 
+    def _build_connector(self):
+        """Build a connector honoring the connection pool configuration.
+
+        aiohttp always waits for a free connection once the pool is exhausted,
+        so the per-host limit is only applied when pool blocking is requested.
+        Returns None to let aiohttp use its default connector.
+        """
+        connector_kwargs = {}
+        if self.connection_config.pool_block:
+            connector_kwargs['limit_per_host'] = self.connection_config.pool_maxsize
+        if self.connection_config.idle_timeout is not None:
+            connector_kwargs['keepalive_timeout'] = self.connection_config.idle_timeout
+        if not connector_kwargs:
+            return None
+        return aiohttp.TCPConnector(loop=self._loop, **connector_kwargs)
+
     def _build_ssl_config(self, cert, verify):
         ssl_ctx = None
 
@@ -191,6 +256,10 @@ class AioHttpTransport(AsyncHttpTransport):
 class AioHttpStreamDownloadGenerator(AsyncIterator):
     """Streams the response body data.
 
+    If the connection is interrupted, the download is resumed with a range request
+    pinned to the ETag of the response. Resumptions are limited and delayed according
+    to the AsyncRetryPolicy which sent the request, and the download is not resumed without one.
+
     :param pipeline: The pipeline object
     :param response: The client response object.
     :param block_size: block size of data sent over connection.
@@ -203,40 +272,38 @@ class AioHttpStreamDownloadGenerator(AsyncIterator):
         self.block_size = response.block_size
         self.content_length = int(response.internal_response.headers.get('Content-Length', 0))
         self.downloaded = 0
+        self._etag = response.internal_response.headers.get('ETag')
+        self._retry_policy, self._retry_settings = _get_resume_retry(response)
 
     def __len__(self):
         return self.content_length
 
     async def __anext__(self):
-        retry_active = True
-        retry_total = 3
-        retry_interval = 1000
-        while retry_active:
+        while True:
             try:
                 chunk = await self.response.internal_response.content.read(self.block_size)
                 if not chunk:
                     raise _ResponseStopIteration()
-                self.downloaded += self.block_size
+                self.downloaded += len(chunk)
                 return chunk
             except _ResponseStopIteration:
                 self.response.internal_response.close()
                 raise StopAsyncIteration()
-            except (ChunkedEncodingError, ConnectionError):
-                retry_total -= 1
-                if retry_total <= 0:
-                    retry_active = False
-                else:
-                    await asyncio.sleep(retry_interval)
-                    headers = {'range': 'bytes=' + self.downloaded + '-'}
-                    resp = self.pipeline.run(self.request, stream=True, headers=headers)
-                    if resp.status_code == 416:
-                        raise
-                    chunk = await self.response.internal_response.content.read(self.block_size)
-                    if not chunk:
-                        raise StopIteration()
-                    self.downloaded += chunk
-                    return chunk
-                continue
+            except (aiohttp.ClientPayloadError,
+                    aiohttp.ClientConnectionError,
+                    asyncio.TimeoutError) as err:
+                self.response.internal_response.close()
+                error = ServiceResponseError(err, error=err)
+                retry_active = self._retry_policy is not None and self._retry_policy.increment(
+                    self._retry_settings,
+                    response=PipelineRequest(self.request, None),
+                    error=error
+                )
+                if not retry_active:
+                    raise error
+                _LOGGER.warning("Stream download interrupted after %d bytes, resuming: %s", self.downloaded, err)
+                await asyncio.sleep(self._retry_policy.get_backoff_time(self._retry_settings))
+                await self._resume()
             except StreamConsumedError:
                 raise
             except Exception as err:
@@ -244,6 +311,12 @@ class AioHttpStreamDownloadGenerator(AsyncIterator):
                 self.response.internal_response.close()
                 raise
 
+    async def _resume(self):
+        request = _build_resume_request(self.request, self.downloaded, self._etag)
+        response = (await self.pipeline.run(request, stream=True)).http_response
+        _check_resume_response(response)
+        self.response = response
+
 class AioHttpTransportResponse(AsyncHttpResponse):
     """Methods for accessing response body data.
 
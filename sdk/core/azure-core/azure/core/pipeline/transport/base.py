@@ -28,6 +28,7 @@ import abc
 import json
 import logging
 import os
+import re
 import time
 try:
     binary_type = str
@@ -45,6 +46,7 @@ from typing import (TYPE_CHECKING, Generic, TypeVar, cast, IO, List, Union, Any,
 # If one day we reach the point where "requests" can be skip totally,
 # might provide our own implementation
 from requests.structures import CaseInsensitiveDict
+from azure.core.exceptions import HttpResponseError, ResourceModifiedError
 from azure.core.pipeline import ABC, AbstractContextManager, PipelineRequest, PipelineResponse
 
 
@@ -81,6 +83,69 @@ def _urljoin(base_url, stub_url):
     return parsed.geturl()
 
 
+_RANGE_HEADERS = ('x-ms-range', 'range')
+_RANGE_REGEX = re.compile(r'bytes=(\d+)-(\d*)')
+
+
+def _get_resume_retry(response):
+    """Get the retry policy and settings limiting the resumptions of a streamed download.
+
+    They are set on the response by the retry policy of the pipeline which sent the request,
+    from the options of the request. A download without them, e.g. sent by a pipeline
+    without retry policy, is not resumed.
+
+    :param response: The response of the download.
+    :return: The retry policy and its retry settings, or (None, None).
+    """
+    return getattr(response, '_resume_retry', None) or (None, None)
+
+
+def _build_resume_request(request, downloaded, etag=None):
+    # type: (HttpRequest, int, Optional[str]) -> HttpRequest
+    """Build the request resuming an interrupted streamed download.
+
+    The range of the original request (if any) is shifted by the number of bytes
+    already downloaded, and the request is pinned to the ETag of the original response
+    so that the download fails instead of mixing two versions of the resource.
+
+    :param request: The request of the interrupted download.
+    :type request: ~azure.core.pipeline.transport.HttpRequest
+    :param int downloaded: The number of bytes already downloaded.
+    :param str etag: The ETag of the original response.
+    :return: The request to resume the download.
+    :rtype: ~azure.core.pipeline.transport.HttpRequest
+    """
+    headers = request.headers.copy()
+    range_header = 'range'
+    start, end = 0, ''
+    for header in _RANGE_HEADERS:
+        if header in headers:
+            range_header = header
+            match = _RANGE_REGEX.match(headers[header])
+            if match:
+                start, end = int(match.group(1)), match.group(2)
+            break
+    headers[range_header] = 'bytes={}-{}'.format(start + downloaded, end)
+    if etag:
+        headers['If-Match'] = etag
+    return HttpRequest(request.method, request.url, headers=headers, data=request.data)
+
+
+def _check_resume_response(response):
+    """Check that a resumed download returned the expected range of the same resource.
+
+    :param response: The HTTP response of the resume request.
+    :type response: ~azure.core.pipeline.transport.HttpResponse
+    :raises: ~azure.core.exceptions.ResourceModifiedError if the resource was modified.
+    :raises: ~azure.core.exceptions.HttpResponseError if the range was not returned.
+    """
+    if response.status_code == 412:
+        raise ResourceModifiedError(
+            message="The resource was modified while it was being downloaded.", response=response)
+    if response.status_code != 206:
+        raise HttpResponseError(message="Unable to resume the download.", response=response)
+
+
 class HttpTransport(AbstractContextManager, ABC, Generic[HTTPRequestType, HTTPResponseType]): # type: ignore
     """An http sender ABC.
     """
@@ -271,6 +336,8 @@ class _HttpResponseBase(object):
         self.reason = None  # type: Optional[str]
         self.content_type = None  # type: Optional[str]
         self.block_size = block_size or 4096  # Default to same as Requests
+        # Set by the retry policy: the policy and retry settings of a resumed streamed download
+        self._resume_retry = None  # type: Optional[Tuple[Any, Dict[str, Any]]]
 
 
     def body(self):
@@ -298,6 +365,36 @@ class HttpResponse(_HttpResponseBase):
         """
 
 
+class _CachedHttpResponse(HttpResponse):
+    """A HttpResponse with an in-memory body, served by the CachePolicy.
+
+    :param request: The request.
+    :type request: ~azure.core.pipeline.transport.HttpRequest
+    :param int status_code: The status code of the response
+    :param str reason: Status reason of response.
+    :param dict headers: The response headers.
+    :param bytes body: The response body.
+    """
+    def __init__(self, request, status_code, reason, headers, body, block_size=None):
+        # type: (HttpRequest, int, Optional[str], Mapping[str, str], bytes, Optional[int]) -> None
+        super(_CachedHttpResponse, self).__init__(request, None, block_size=block_size)
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = CaseInsensitiveDict(headers)
+        self.content_type = self.headers.get('content-type')
+        self._body = body
+
+    def body(self):
+        # type: () -> bytes
+        return self._body
+
+    def stream_download(self, pipeline):
+        # type: (PipelineType) -> Iterator[bytes]
+        return iter([
+            self._body[start:start + self.block_size] for start in range(0, len(self._body), self.block_size)
+        ])
+
+
 class PipelineClientBase(object):
     """Base class for pipeline clients.
 
@@ -28,6 +28,7 @@ import asyncio
 import abc
 
 from typing import Any, List, Union, Callable, AsyncIterator, Optional, Generic, TypeVar
+from requests.structures import CaseInsensitiveDict
 from azure.core.pipeline import PipelineRequest, PipelineResponse, Pipeline
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from .base import _HttpResponseBase
@@ -81,6 +82,41 @@ class AsyncHttpResponse(_HttpResponseBase):
         """
 
 
+class _CachedBodyIterator(AsyncIterator[bytes]):
+
+    def __init__(self, body: bytes, block_size: int) -> None:
+        self._body = body
+        self._block_size = block_size
+        self._position = 0
+
+    async def __anext__(self) -> bytes:
+        if self._position >= len(self._body):
+            raise StopAsyncIteration()
+        chunk = self._body[self._position:self._position + self._block_size]
+        self._position += len(chunk)
+        return chunk
+
+
+class _AsyncCachedHttpResponse(AsyncHttpResponse):
+    """An AsyncHttpResponse with an in-memory body, served by the AsyncCachePolicy.
+
+    See ~azure.core.pipeline.transport.base._CachedHttpResponse for the parameters.
+    """
+    def __init__(self, request, status_code, reason, headers, body, block_size=None):
+        super(_AsyncCachedHttpResponse, self).__init__(request, None, block_size=block_size)
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = CaseInsensitiveDict(headers)
+        self.content_type = self.headers.get('content-type')
+        self._body = body
+
+    def body(self) -> bytes:
+        return self._body
+
+    def stream_download(self, pipeline) -> AsyncIterator[bytes]:
+        return _CachedBodyIterator(self._body, self.block_size)
+
+
 class AsyncHttpTransport(AbstractAsyncContextManager, abc.ABC, Generic[HTTPRequestType, AsyncHTTPResponseType]):
     """An http sender ABC.
     """
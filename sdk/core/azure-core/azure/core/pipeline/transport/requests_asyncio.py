@@ -36,8 +36,8 @@ from azure.core.exceptions import (
     ServiceRequestError,
     ServiceResponseError
 )
-from azure.core.pipeline import Pipeline
-from .base import HttpRequest
+from azure.core.pipeline import Pipeline, PipelineRequest
+from .base import HttpRequest, _get_resume_retry, _build_resume_request, _check_resume_response
 from .base_async import (
     AsyncHttpTransport,
     AsyncHttpResponse,
@@ -137,6 +137,10 @@ class AsyncioRequestsTransport(RequestsTransport, AsyncHttpTransport):  # type:
 class AsyncioStreamDownloadGenerator(AsyncIterator):
     """Streams the response body data.
 
+    If the connection is interrupted, the download is resumed with a range request
+    pinned to the ETag of the response. Resumptions are limited and delayed according
+    to the AsyncRetryPolicy which sent the request, and the download is not resumed without one.
+
     :param pipeline: The pipeline object
     :param response: The response object.
     :param generator iter_content_func: Iterator for response data.
@@ -150,16 +154,15 @@ class AsyncioStreamDownloadGenerator(AsyncIterator):
         self.iter_content_func = self.response.internal_response.iter_content(self.block_size)
         self.content_length = int(response.headers.get('Content-Length', 0))
         self.downloaded = 0
+        self._etag = response.headers.get('ETag')
+        self._retry_policy, self._retry_settings = _get_resume_retry(response)
 
     def __len__(self):
         return self.content_length
 
     async def __anext__(self):
         loop = _get_running_loop()
-        retry_active = True
-        retry_total = 3
-        retry_interval = 1000
-        while retry_active:
+        while True:
             try:
                 chunk = await loop.run_in_executor(
                     None,
@@ -168,32 +171,25 @@ class AsyncioStreamDownloadGenerator(AsyncIterator):
                 )
                 if not chunk:
                     raise _ResponseStopIteration()
-                self.downloaded += self.block_size
+                self.downloaded += len(chunk)
                 return chunk
             except _ResponseStopIteration:
                 self.response.internal_response.close()
                 raise StopAsyncIteration()
             except (requests.exceptions.ChunkedEncodingError,
-                    requests.exceptions.ConnectionError):
-                retry_total -= 1
-                if retry_total <= 0:
-                    retry_active = False
-                else:
-                    await asyncio.sleep(retry_interval)
-                    headers = {'range': 'bytes=' + self.downloaded + '-'}
-                    resp = self.pipeline.run(self.request, stream=True, headers=headers)
-                    if resp.status_code == 416:
-                        raise
-                    chunk = await loop.run_in_executor(
-                        None,
-                        _iterate_response_content,
-                        self.iter_content_func,
-                    )
-                    if not chunk:
-                        raise StopIteration()
-                    self.downloaded += chunk
-                    return chunk
-                continue
+                    requests.exceptions.ConnectionError) as err:
+                self.response.internal_response.close()
+                error = ServiceResponseError(err, error=err)
+                retry_active = self._retry_policy is not None and self._retry_policy.increment(
+                    self._retry_settings,
+                    response=PipelineRequest(self.request, None),
+                    error=error
+                )
+                if not retry_active:
+                    raise error
+                _LOGGER.warning("Stream download interrupted after %d bytes, resuming: %s", self.downloaded, err)
+                await asyncio.sleep(self._retry_policy.get_backoff_time(self._retry_settings))
+                await self._resume()
             except requests.exceptions.StreamConsumedError:
                 raise
             except Exception as err:
@@ -201,6 +197,13 @@ class AsyncioStreamDownloadGenerator(AsyncIterator):
                 self.response.internal_response.close()
                 raise
 
+    async def _resume(self):
+        request = _build_resume_request(self.request, self.downloaded, self._etag)
+        response = (await self.pipeline.run(request, stream=True)).http_response
+        _check_resume_response(response)
+        self.response = response
+        self.iter_content_func = response.internal_response.iter_content(self.block_size)
+
 
 class AsyncioRequestsTransportResponse(AsyncHttpResponse, RequestsTransportResponse): # type: ignore
     """Asynchronous streaming of data from the response.
@@ -25,8 +25,14 @@
 # --------------------------------------------------------------------------
 from __future__ import absolute_import
 import logging
-from typing import Iterator, Optional, Any, Union, TypeVar
+import threading
+from typing import Iterator, Optional, Any, Union, TypeVar, Dict, Tuple, Callable, List # pylint: disable=unused-import
 import time
+import weakref
+try:
+    import queue
+except ImportError:  # Python 2.7
+    import Queue as queue  # type: ignore
 import urllib3 # type: ignore
 from urllib3.util.retry import Retry # type: ignore
 import requests
@@ -36,12 +42,16 @@ from azure.core.exceptions import (
     ServiceRequestError,
     ServiceResponseError
 )
+from azure.core.pipeline import PipelineRequest
 from . import HttpRequest # pylint: disable=unused-import
 
 from .base import (
     HttpTransport,
     HttpResponse,
-    _HttpResponseBase
+    _HttpResponseBase,
+    _get_resume_retry,
+    _build_resume_request,
+    _check_resume_response
 )
 
 PipelineType = TypeVar("PipelineType")
@@ -79,6 +89,10 @@ class _RequestsTransportResponseBase(_HttpResponseBase):
 class StreamDownloadGenerator(object):
     """Generator for streaming response data.
 
+    If the connection is interrupted, the download is resumed with a range request
+    pinned to the ETag of the response. Resumptions are limited and delayed according
+    to the RetryPolicy which sent the request, and the download is not resumed without one.
+
     :param pipeline: The pipeline object
     :param response: The response object.
     :param generator iter_content_func: Iterator for response data.
@@ -92,6 +106,8 @@ class StreamDownloadGenerator(object):
         self.iter_content_func = self.response.internal_response.iter_content(self.block_size)
         self.content_length = int(response.headers.get('Content-Length', 0))
         self.downloaded = 0
+        self._etag = response.headers.get('ETag')
+        self._retry_policy, self._retry_settings = _get_resume_retry(response)
 
     def __len__(self):
         return self.content_length
@@ -100,36 +116,30 @@ class StreamDownloadGenerator(object):
         return self
 
     def __next__(self):
-        retry_active = True
-        retry_total = 3
-        retry_interval = 1000
-        while retry_active:
+        while True:
             try:
                 chunk = next(self.iter_content_func)
                 if not chunk:
                     raise StopIteration()
-                self.downloaded += self.block_size
+                self.downloaded += len(chunk)
                 return chunk
             except StopIteration:
                 self.response.internal_response.close()
                 raise StopIteration()
             except (requests.exceptions.ChunkedEncodingError,
-                    requests.exceptions.ConnectionError):
-                retry_total -= 1
-                if retry_total <= 0:
-                    retry_active = False
-                else:
-                    time.sleep(retry_interval)
-                    headers = {'range': 'bytes=' + self.downloaded + '-'}
-                    resp = self.pipeline.run(self.request, stream=True, headers=headers)
-                    if resp.status_code == 416:
-                        raise
-                    chunk = next(self.iter_content_func)
-                    if not chunk:
-                        raise StopIteration()
-                    self.downloaded += chunk
-                    return chunk
-                continue
+                    requests.exceptions.ConnectionError) as err:
+                self.response.internal_response.close()
+                error = ServiceResponseError(err, error=err)
+                retry_active = self._retry_policy is not None and self._retry_policy.increment(
+                    self._retry_settings,
+                    response=PipelineRequest(self.request, None),
+                    error=error
+                )
+                if not retry_active:
+                    raise error
+                _LOGGER.warning("Stream download interrupted after %d bytes, resuming: %s", self.downloaded, err)
+                time.sleep(self._retry_policy.get_backoff_time(self._retry_settings))
+                self._resume()
             except requests.exceptions.StreamConsumedError:
                 raise
             except Exception as err:
@@ -138,6 +148,116 @@ class StreamDownloadGenerator(object):
                 raise
     next = __next__  # Python 2 compatibility.
 
+    def _resume(self):
+        request = _build_resume_request(self.request, self.downloaded, self._etag)
+        response = self.pipeline.run(request, stream=True).http_response
+        _check_resume_response(response)
+        self.response = response
+        self.iter_content_func = response.internal_response.iter_content(self.block_size)
+
+
+class _IdleTimeoutHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that drops the pooled connections of a host once they have been idle for too long.
+
+    The idle time is tracked per urllib3 connection pool: a pool is idle when no request is in
+    flight on it, and its connections are closed before the first request following an idle
+    period longer than the timeout. The closed connections are reopened by urllib3 on use.
+
+    :param int idle_timeout: The time in seconds after which idle connections are not reused.
+     If None, idle connections are kept open.
+    """
+    def __init__(self, idle_timeout=None, **kwargs):
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # the number of requests in flight and the time the last one completed, by connection pool
+        self._pool_usage = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+        super(_IdleTimeoutHTTPAdapter, self).__init__(**kwargs)
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        if self._idle_timeout is None:
+            return super(_IdleTimeoutHTTPAdapter, self).send(request, *args, **kwargs)
+
+        pool = self._get_pool(request, kwargs)
+        with self._lock:
+            usage = self._pool_usage.get(pool)
+            if usage is None:
+                usage = self._pool_usage[pool] = [0, None]
+            in_flight, last_used = usage
+            if in_flight == 0 and last_used is not None and time.time() - last_used > self._idle_timeout:
+                _LOGGER.debug("Connection pool idle for more than %s seconds, closing its connections.",
+                              self._idle_timeout)
+                _close_idle_connections(pool)
+            usage[0] += 1
+        try:
+            return super(_IdleTimeoutHTTPAdapter, self).send(request, *args, **kwargs)
+        finally:
+            with self._lock:
+                usage[0] -= 1
+                usage[1] = time.time()
+
+    def _get_pool(self, request, kwargs):
+        if hasattr(self, "get_connection_with_tls_context"):
+            # requests >= 2.32.2
+            return self.get_connection_with_tls_context(
+                request, kwargs.get("verify", True), proxies=kwargs.get("proxies"), cert=kwargs.get("cert"))
+        return self.get_connection(request.url, kwargs.get("proxies"))
+
+
+def _close_idle_connections(pool):
+    """Closes the connections waiting in the queue of a urllib3 connection pool.
+
+    The connections are put back closed, so that the pool keeps its size and reconnects on their next use.
+    """
+    connection_queue = getattr(pool, "pool", None)
+    if connection_queue is None:
+        # the pool is closed
+        return
+    connections = []
+    while True:
+        try:
+            connections.append(connection_queue.get(block=False))
+        except queue.Empty:
+            break
+    for connection in connections:
+        if connection is not None:
+            connection.close()
+        connection_queue.put(connection, block=False)
+
+
+class _SharedSessionRegistry(object):
+    """Thread-safe, reference counted registry of sessions shared between transports.
+
+    Transports configured with the same connection pool settings get the same
+    session, and thus the same connection pools. The session is closed when the
+    last transport using it is closed.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = {}  # type: Dict[Tuple, List[Any]]
+
+    def acquire(self, key, session_factory):
+        # type: (Tuple, Callable[[], requests.Session]) -> requests.Session
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = self._sessions[key] = [session_factory(), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, key):
+        # type: (Tuple) -> None
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._sessions[key]
+                entry[0].close()
+
+
+_SHARED_SESSIONS = _SharedSessionRegistry()
+
 
 class RequestsTransportResponse(HttpResponse, _RequestsTransportResponseBase):
     """Streaming of data from the response.
@@ -159,10 +279,16 @@ class RequestsTransport(HttpTransport):
     - You provide the configured session if you want to, or a basic session is created.
     - All kwargs received by "send" are sent to session.request directly
 
+    The connection pools of the session are sized using the connection configuration
+    (see ~azure.core.configuration.ConnectionConfiguration). With `shared_session`, all
+    transports using the same connection configuration share one session, so many clients
+    targeting the same account reuse the same connections instead of opening new TLS sessions.
+
     **Keyword argument:**
 
     *session (requests.Session)* - Request session to use instead of the default one.
     *session_owner (bool)* - Decide if the session provided by user is owned by this transport. Default to True.
+    *shared_session (bool)* - Use a process-wide session shared with other transports. Defaults to False.
     *use_env_settings (bool)* - Uses proxy settings from environment. Defaults to True.
 
     Example:
@@ -182,6 +308,15 @@ class RequestsTransport(HttpTransport):
         self._session_owner = kwargs.get('session_owner', True)
         self.connection_config = ConnectionConfiguration(**kwargs)
         self._use_env_settings = kwargs.pop('use_env_settings', True)
+        self._shared_session_key = None  # type: Optional[Tuple]
+        if kwargs.get('shared_session', False) and not self.session:
+            self._shared_session_key = (
+                self._use_env_settings,
+                self.connection_config.pool_connections,
+                self.connection_config.pool_maxsize,
+                self.connection_config.pool_block,
+                self.connection_config.idle_timeout
+            )
 
     def __enter__(self):
         # type: () -> RequestsTransport
@@ -199,18 +334,36 @@ class RequestsTransport(HttpTransport):
         """
         session.trust_env = self._use_env_settings
         disable_retries = Retry(total=False, redirect=False, raise_on_status=False)
-        adapter = requests.adapters.HTTPAdapter(max_retries=disable_retries)
+        adapter = _IdleTimeoutHTTPAdapter(
+            idle_timeout=self.connection_config.idle_timeout,
+            pool_connections=self.connection_config.pool_connections,
+            pool_maxsize=self.connection_config.pool_maxsize,
+            pool_block=self.connection_config.pool_block,
+            max_retries=disable_retries
+        )
         for p in self._protocols:
             session.mount(p, adapter)
 
+    def _create_session(self):
+        # type: () -> requests.Session
+        session = requests.Session()
+        self._init_session(session)
+        return session
+
     def open(self):
         if not self.session and self._session_owner:
-            self.session = requests.Session()
-            self._init_session(self.session)
+            if self._shared_session_key:
+                self.session = _SHARED_SESSIONS.acquire(self._shared_session_key, self._create_session)
+            else:
+                self.session = self._create_session()
 
     def close(self):
         if self._session_owner:
-            self.session.close()
+            if self._shared_session_key:
+                if self.session:
+                    _SHARED_SESSIONS.release(self._shared_session_key)
+            else:
+                self.session.close()
             self._session_owner = False
             self.session = None
 
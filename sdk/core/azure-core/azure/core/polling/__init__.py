@@ -25,8 +25,9 @@
 # --------------------------------------------------------------------------
 import sys
 
-from .poller import LROPoller, NoPolling, PollingMethod
-__all__ = ['LROPoller', 'NoPolling', 'PollingMethod']
+from .poller import LROPoller, NoPolling, PollingMethod, ScheduledPollingMethod
+from .scheduler import PollingScheduler
+__all__ = ['LROPoller', 'NoPolling', 'PollingMethod', 'ScheduledPollingMethod', 'PollingScheduler']
 
 #pylint: disable=unused-import
 if sys.version_info >= (3, 5, 2):
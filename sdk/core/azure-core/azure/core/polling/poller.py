@@ -23,7 +23,9 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import logging
 import threading
+import time
 import uuid
 try:
     from urlparse import urlparse # type: ignore # pylint: disable=unused-import
@@ -34,6 +36,7 @@ from typing import Any, Callable, Union, List, Optional, TYPE_CHECKING
 from azure.core.pipeline.transport.base import HttpResponse  # type: ignore
 from azure.core.tracing.context import tracing_context
 from azure.core.tracing.decorator import distributed_trace
+from .scheduler import PollingScheduler, get_default_scheduler
 
 if TYPE_CHECKING:
     import requests
@@ -41,6 +44,9 @@ if TYPE_CHECKING:
     DeserializationCallbackType = Union[Model, Callable[[requests.Response], Model]]
 
 
+_LOGGER = logging.getLogger(__name__)
+
+
 class PollingMethod(object):
     """ABC class for polling method.
     """
@@ -64,6 +70,36 @@ class PollingMethod(object):
         # type: () -> Any
         raise NotImplementedError("This method needs to be implemented")
 
+
+class ScheduledPollingMethod(PollingMethod):  # pylint: disable=abstract-method
+    """ABC class for polling method which can be polled one step at a time.
+
+    Such a polling method can be driven by a PollingScheduler, instead of a dedicated thread
+    running the blocking `run`.
+    """
+    def update_status(self):
+        # type: () -> None
+        """Poll the service once and update the status of the operation."""
+        raise NotImplementedError("This method needs to be implemented")
+
+    def get_delay(self):
+        # type: () -> float
+        """The delay in seconds before the next poll.
+
+        Implementations should honor the Retry-After header of the last response.
+
+        :rtype: float
+        """
+        raise NotImplementedError("This method needs to be implemented")
+
+    def run(self):
+        # type: () -> None
+        """Poll until the operation is finished, blocking the current thread."""
+        while not self.finished():
+            time.sleep(self.get_delay())
+            self.update_status()
+
+
 class NoPolling(PollingMethod):
     """An empty poller that returns the deserialized initial response.
     """
@@ -114,10 +150,17 @@ class LROPoller(object):
     :type deserialization_callback: callable or msrest.serialization.Model
     :param polling_method: The polling strategy to adopt
     :type polling_method: ~msrest.polling.PollingMethod
+
+    **Keyword argument:**
+
+    *polling_scheduler (PollingScheduler or bool)* - Drive the polling with this scheduler (or with the
+    process-wide scheduler if True) instead of a dedicated thread per operation. Only used if the polling
+    method is a ScheduledPollingMethod. The done callbacks then run on a worker thread of the scheduler,
+    so they should not block for long, since they delay the polling of the other operations.
     """
 
-    def __init__(self, client, initial_response, deserialization_callback, polling_method):
-        # type: (Any, HttpResponse, DeserializationCallbackType, PollingMethod) -> None
+    def __init__(self, client, initial_response, deserialization_callback, polling_method, **kwargs):
+        # type: (Any, HttpResponse, DeserializationCallbackType, PollingMethod, Any) -> None
         self._client = client
         self._response = initial_response
         self._callbacks = []  # type: List[Callable]
@@ -136,14 +179,44 @@ class LROPoller(object):
         self._thread = None
         self._done = None
         self._exception = None
+        self._scheduler = None  # type: Optional[PollingScheduler]
         if not self._polling_method.finished():
             self._done = threading.Event()
+            scheduler = kwargs.pop('polling_scheduler', None)
+            if isinstance(scheduler, bool):
+                scheduler = get_default_scheduler() if scheduler else None
+            if scheduler is not None and isinstance(self._polling_method, ScheduledPollingMethod):
+                self._scheduler = scheduler
+                scheduler.schedule(
+                    tracing_context.with_current_context(self._step),
+                    self._polling_method.get_delay()
+                )
+                return
+            if scheduler is not None:
+                _LOGGER.debug("%s can't be scheduled, polling in a thread.", type(self._polling_method).__name__)
             self._thread = threading.Thread(
                 target=tracing_context.with_current_context(self._start),
                 name="LROPoller({})".format(uuid.uuid4()))
             self._thread.daemon = True
             self._thread.start()
 
+    def _step(self):
+        # type: () -> Optional[float]
+        """Poll the long running operation once, from the scheduler.
+        On completion, runs any callbacks.
+
+        :returns: The delay before the next poll, or None if the operation is done.
+        """
+        try:
+            self._polling_method.update_status()  # type: ignore
+            if not self._polling_method.finished():
+                return self._polling_method.get_delay()  # type: ignore
+        except Exception as err: #pylint: disable=broad-except
+            self._exception = err
+        self._done.set()  # type: ignore
+        self._run_callbacks()
+        return None
+
     def _start(self):
         """Start the long running operation.
         On completion, runs any callbacks.
@@ -159,6 +232,9 @@ class LROPoller(object):
         finally:
             self._done.set()
 
+        self._run_callbacks()
+
+    def _run_callbacks(self):
         callbacks, self._callbacks = self._callbacks, []
         while callbacks:
             for call in callbacks:
@@ -197,9 +273,12 @@ class LROPoller(object):
          operation to complete (in seconds).
         :raises CloudError: Server problem with the query.
         """
-        if self._thread is None:
+        if self._scheduler is not None:
+            self._done.wait(timeout=timeout)  # type: ignore
+        elif self._thread is None:
             return
-        self._thread.join(timeout=timeout)
+        else:
+            self._thread.join(timeout=timeout)
         try:
             # Let's handle possible None in forgiveness here
             raise self._exception  # type: ignore
@@ -212,6 +291,8 @@ class LROPoller(object):
 
         :returns: 'True' if the process has completed, else 'False'.
         """
+        if self._scheduler is not None:
+            return self._done.is_set()  # type: ignore
         return self._thread is None or not self._thread.is_alive()
 
     def add_done_callback(self, func):
@@ -219,6 +300,10 @@ class LROPoller(object):
         """Add callback function to be run once the long running operation
         has completed - regardless of the status of the operation.
 
+        The callback runs on the polling thread, or on a worker thread of the polling
+        scheduler if there is one. If the operation has already completed, it runs
+        immediately on the calling thread.
+
         :param callable func: Callback function that takes at least one
          argument, a completed LongRunningOperation.
         """
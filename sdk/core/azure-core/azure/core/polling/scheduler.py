@@ -0,0 +1,146 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""
+This module implements a scheduler driving many long running operations with a few threads.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple  # pylint: disable=unused-import
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_MAX_WORKERS = 4
+
+# A step polls an operation once, and returns the delay before the next step, or None if the operation is done
+StepType = Callable[[], Optional[float]]
+
+
+class PollingScheduler(object):
+    """Drives the polling of many long running operations with a single timer thread.
+
+    The timer thread keeps a heap of the next polling deadline of every pending operation,
+    and hands the operations due to a small pool of worker threads, which poll the service
+    once and schedule the next poll. The number of threads does not depend on the number of
+    operations in flight. The timer thread stops when no operation is pending.
+
+    :param int max_workers: The maximum number of concurrent status requests. Default value is 4.
+    """
+
+    def __init__(self, max_workers=_DEFAULT_MAX_WORKERS):
+        # type: (int) -> None
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._heap = []  # type: List[Tuple[float, int, StepType]]
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None  # type: Optional[threading.Thread]
+        self._executor = None  # type: Any
+        self._running = 0
+
+    def __len__(self):
+        # type: () -> int
+        """Number of operations scheduled or being polled."""
+        with self._condition:
+            return len(self._heap) + self._running
+
+    def schedule(self, step, delay=0):
+        # type: (StepType, float) -> None
+        """Schedule a polling step.
+
+        :param callable step: Polls the operation once, and returns the delay in seconds before
+         the next poll, or None if the operation is done. Must not raise.
+        :param float delay: The delay in seconds before calling the step.
+        """
+        with self._condition:
+            heapq.heappush(self._heap, (time.time() + max(0, delay or 0), next(self._counter), step))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="PollingScheduler")
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify()
+
+    def _get_executor(self):
+        # type: () -> Any
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-error
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _run(self):
+        # type: () -> None
+        with self._condition:
+            while True:
+                if not self._heap:
+                    if not self._running:
+                        self._thread = None
+                        return
+                    self._condition.wait()
+                    continue
+                wait = self._heap[0][0] - time.time()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                if self._running >= self.max_workers:
+                    self._condition.wait()
+                    continue
+                _, _, step = heapq.heappop(self._heap)
+                self._running += 1
+                self._get_executor().submit(self._execute, step)
+
+    def _execute(self, step):
+        # type: (StepType) -> None
+        try:
+            delay = step()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning("Unexpected error in polling step", exc_info=True)
+            delay = None
+        with self._condition:
+            self._running -= 1
+            if delay is not None:
+                heapq.heappush(self._heap, (time.time() + max(0, delay), next(self._counter), step))
+            self._condition.notify()
+
+
+_DEFAULT_SCHEDULER = None  # type: Optional[PollingScheduler]
+_DEFAULT_SCHEDULER_LOCK = threading.Lock()
+
+
+def get_default_scheduler():
+    # type: () -> PollingScheduler
+    """Get the process-wide PollingScheduler.
+
+    :rtype: ~azure.core.polling.PollingScheduler
+    """
+    global _DEFAULT_SCHEDULER  # pylint: disable=global-statement
+    with _DEFAULT_SCHEDULER_LOCK:
+        if _DEFAULT_SCHEDULER is None:
+            _DEFAULT_SCHEDULER = PollingScheduler()
+        return _DEFAULT_SCHEDULER
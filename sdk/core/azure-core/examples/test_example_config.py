@@ -81,7 +81,10 @@ def example_connection_config():
         connection_timeout=100,
         connection_verify=True,
         connection_cert=None,
-        connection_data_block_size=4096
+        connection_data_block_size=4096,
+        connection_pool_maxsize=10,
+        connection_pool_block=False,
+        connection_idle_timeout=None
     )
 
     # Or parameters can be tweaked later:
@@ -89,4 +92,7 @@ def example_connection_config():
     config.connection.verify = True
     config.connection.cert = None
     config.connection.data_block_size = 4096
+    config.connection.pool_maxsize = 10
+    config.connection.pool_block = False
+    config.connection.idle_timeout = None
     # [END connection_configuration]
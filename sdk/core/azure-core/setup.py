@@ -64,6 +64,6 @@ setup(
         'requests>=2.18.4',
     ],
     extras_require={
-        ":python_version<'3.0'": ['azure-nspkg'],
+        ":python_version<'3.0'": ['azure-nspkg', 'futures'],
     }
 )
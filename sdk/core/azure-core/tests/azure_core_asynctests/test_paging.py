@@ -120,3 +120,31 @@ class TestPaging:
         result_iterated = await _as_list(pager)
 
         assert len(result_iterated) == 0
+
+    @pytest.mark.asyncio
+    async def test_prefetch_paging(self):
+
+        async def get_next(continuation_token=None):
+            index = int(continuation_token or 0)
+            if index == 5:
+                raise ValueError("Broken")
+            return {
+                'nextLink': str(index + 1) if index < 9 else None,
+                'value': ['value{}.0'.format(index), 'value{}.1'.format(index)]
+            }
+
+        async def extract_data(response):
+            return response['nextLink'], AsyncList(response['value'])
+
+        pages = AsyncItemPaged(get_next, extract_data, prefetch_pages=2).by_page(continuation_token='2')
+        assert await _as_list(await pages.__anext__()) == ['value2.0', 'value2.1']
+        assert pages.continuation_token == '3'
+        assert await _as_list(await pages.__anext__()) == ['value3.0', 'value3.1']
+        assert await _as_list(await pages.__anext__()) == ['value4.0', 'value4.1']
+        with pytest.raises(ValueError):
+            await pages.__anext__()
+
+        pager = AsyncItemPaged(get_next, extract_data, prefetch_pages=2).by_page(continuation_token='6')
+        result_iterated = await _as_list(pager)
+        assert len(result_iterated) == 4
+        assert pager.continuation_token is None
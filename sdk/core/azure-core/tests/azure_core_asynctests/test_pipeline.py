@@ -23,13 +23,17 @@
 # THE SOFTWARE.
 #
 #--------------------------------------------------------------------------
+import asyncio
 import sys
+from unittest import mock
 
+from azure.core.exceptions import ServiceResponseError
 from azure.core.pipeline import AsyncPipeline
 from azure.core.pipeline.policies import SansIOHTTPPolicy, UserAgentPolicy, AsyncRedirectPolicy
 from azure.core.pipeline.transport import (
     AsyncHttpTransport,
     HttpRequest,
+    HttpResponse,
     AsyncioRequestsTransport,
     TrioRequestsTransport,
     AioHttpTransport
@@ -73,6 +77,53 @@ async def test_sans_io_exception():
         await pipeline.run(req)
 
 
+@pytest.mark.asyncio
+async def test_run_many():
+    class EchoSender(AsyncHttpTransport):
+        def __init__(self):
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def send(self, request, **config):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            if request.url == "/broken":
+                raise ValueError("Broken")
+            return config
+
+        async def open(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def __aexit__(self, exc_type, exc_value, traceback):
+            pass
+
+    sender = EchoSender()
+    pipeline = AsyncPipeline(sender, [SansIOHTTPPolicy()])
+    requests_to_send = [HttpRequest("GET", "/{}".format(i)) for i in range(20)]
+
+    responses = []
+    async for response in pipeline.run_many(requests_to_send, max_concurrency=4, custom="value"):
+        responses.append(response)
+
+    assert len(responses) == 20
+    assert set(r.http_request for r in responses) == set(requests_to_send)
+    assert len(set(id(r.context) for r in responses)) == 20
+    assert all(r.http_response == {"custom": "value"} for r in responses)
+    assert sender.max_in_flight == 4
+
+    with pytest.raises(ValueError):
+        async for response in pipeline.run_many([HttpRequest("GET", "/broken")]):
+            pass
+
+    with pytest.raises(ValueError):
+        pipeline.run_many(requests_to_send, max_concurrency=0)
+
+
 @pytest.mark.asyncio
 async def test_basic_aiohttp():
 
@@ -161,4 +212,170 @@ def test_conf_async_trio_requests():
             return await pipeline.run(request)
 
     response = trio.run(do)
-    assert response.http_response.status_code == 200
\ No newline at end of file
+    assert response.http_response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_stream_download_resume():
+    import requests
+    from azure.core.pipeline.policies import AsyncRetryPolicy
+    from azure.core.pipeline.transport import AsyncioRequestsTransportResponse
+
+    data = b"0123456789abcdefghij"
+
+    def build_response(request, body, interrupt_after=None):
+        def iter_content(block_size):
+            for i in range(0, len(body), block_size):
+                if interrupt_after is not None and i >= interrupt_after:
+                    raise requests.exceptions.ChunkedEncodingError("Connection broken")
+                yield body[i:i + block_size]
+        internal_response = mock.Mock(status_code=206, headers={'ETag': '"etag"'}, reason="OK")
+        internal_response.iter_content = iter_content
+        return AsyncioRequestsTransportResponse(request, internal_response, block_size=4)
+
+    class ResumingSender(AsyncHttpTransport):
+        def __init__(self):
+            self.requests = []
+
+        async def send(self, request, **config):
+            self.requests.append(request)
+            if len(self.requests) == 1:
+                return build_response(request, data, interrupt_after=8)
+            assert request.headers['range'] == 'bytes=8-'
+            assert request.headers['If-Match'] == '"etag"'
+            return build_response(request, data[8:])
+
+        async def open(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def __aexit__(self, exc_type, exc_value, traceback):
+            pass
+
+    pipeline = AsyncPipeline(ResumingSender(), [AsyncRetryPolicy(retry_backoff_factor=0)])
+    response = (await pipeline.run(HttpRequest("GET", "/"), stream=True)).http_response
+    result = b""
+    async for chunk in response.stream_download(pipeline):
+        result += chunk
+    assert result == data
+
+    # A pipeline without retry policy does not resume the download
+    pipeline = AsyncPipeline(ResumingSender(), [])
+    response = (await pipeline.run(HttpRequest("GET", "/"), stream=True)).http_response
+    with pytest.raises(ServiceResponseError):
+        async for chunk in response.stream_download(pipeline):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_policy():
+    from azure.core.pipeline.policies import AsyncRateLimitPolicy
+
+    class ThrottledSender(AsyncHttpTransport):
+        def __init__(self):
+            self.sleeps = []
+
+        async def send(self, request, **config):
+            response = HttpResponse(request, None)
+            response.status_code = 429
+            response.headers = {"Retry-After": "2"}
+            return response
+
+        async def sleep(self, duration):
+            self.sleeps.append(duration)
+
+        async def open(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def __aexit__(self, exc_type, exc_value, traceback):
+            pass
+
+    sender = ThrottledSender()
+    policy = AsyncRateLimitPolicy(rate_limit_initial=8)
+    pipeline = AsyncPipeline(sender, [policy])
+    await pipeline.run(HttpRequest("GET", "https://bing.com"))
+    await pipeline.run(HttpRequest("GET", "https://bing.com"))
+    assert 1.5 < sender.sleeps[0] <= 2
+    assert policy.get_bucket(mock.Mock(http_request=HttpRequest("GET", "https://bing.com"))).rate == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_policy():
+    from azure.core.pipeline.policies import AsyncCachePolicy
+    from azure.core.pipeline.transport.base_async import _AsyncCachedHttpResponse
+
+    class MockSender(AsyncHttpTransport):
+        def __init__(self):
+            self.requests = []
+
+        async def send(self, request, **config):
+            self.requests.append(dict(request.headers))
+            if 'If-None-Match' in request.headers:
+                return _AsyncCachedHttpResponse(request, 304, None, {}, b'')
+            return _AsyncCachedHttpResponse(request, 200, None, {'ETag': '"1"'}, b'content')
+
+        async def open(self):
+            pass
+
+        async def close(self):
+            pass
+
+        async def __aexit__(self, exc_type, exc_value, traceback):
+            pass
+
+    sender = MockSender()
+    policy = AsyncCachePolicy()
+    pipeline = AsyncPipeline(sender, [policy])
+    await pipeline.run(HttpRequest("GET", "https://bing.com"))
+    response = (await pipeline.run(HttpRequest("GET", "https://bing.com"))).http_response
+    assert response.status_code == 200
+    assert response.body() == b'content'
+    chunks = []
+    async for chunk in response.stream_download(None):
+        chunks.append(chunk)
+    assert chunks == [b'content']
+    assert sender.requests[1]['If-None-Match'] == '"1"'
+    assert policy.stats == {'hits': 0, 'revalidations': 1, 'misses': 1}
+
+    # The revalidation does not leave its conditional header on a request sent again
+    request = HttpRequest("GET", "https://bing.com")
+    for _ in range(2):
+        response = (await pipeline.run(request)).http_response
+        assert (response.status_code, response.body()) == (200, b'content')
+        assert 'If-None-Match' not in request.headers
+    assert policy.stats == {'hits': 0, 'revalidations': 3, 'misses': 1}
+
+
+@pytest.mark.asyncio
+async def test_metrics_policy_connection_phases():
+    from aiohttp import web
+    from azure.core.pipeline.policies import MetricsPolicy
+    from azure.core.pipeline.policies.metrics import InMemoryMetricsSink
+
+    async def handler(request):
+        return web.Response(body=b'content')
+
+    app = web.Application()
+    app.router.add_get('/', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, 'localhost', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        sink = InMemoryMetricsSink()
+        async with AsyncPipeline(AioHttpTransport(), [MetricsPolicy(sink)]) as pipeline:
+            for _ in range(2):
+                response = await pipeline.run(HttpRequest("GET", "http://localhost:{}/".format(port)))
+                assert response.http_response.status_code == 200
+    finally:
+        await runner.cleanup()
+
+    # The second request reuses the pooled connection
+    host = "localhost:{}".format(port)
+    assert sink.get_histogram("azure_core_connection_phase_duration_seconds", host=host, phase="dns")["count"] == 1
+    assert sink.get_histogram("azure_core_connection_phase_duration_seconds", host=host, phase="connect")["count"] == 1
@@ -25,7 +25,19 @@
 # --------------------------------------------------------------------------
 import sys
 
+import pytest
+
+from azure.core.pipeline.policies.rate_limit import _SHARED_BUCKETS
+
 # Ignore collection of async tests for Python 2
 collect_ignore = []
 if sys.version_info < (3, 5):
     collect_ignore.append("azure_core_asynctests")
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_buckets():
+    # Rate limit buckets are shared process-wide, so each test starts with none
+    _SHARED_BUCKETS.clear()
+    yield
+    _SHARED_BUCKETS.clear()
@@ -0,0 +1,175 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the HTTP response cache policy."""
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import pytest
+
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import CachePolicy
+from azure.core.pipeline.policies.cache import FileCacheStore, MemoryCacheStore, parse_cache_control
+from azure.core.pipeline.transport import HttpRequest, HttpTransport
+from azure.core.pipeline.transport.base import _CachedHttpResponse
+
+
+class MockTransport(HttpTransport):
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append((request.method, dict(request.headers)))
+        status_code, headers, body = self._responses.pop(0)
+        return _CachedHttpResponse(request, status_code, None, headers, body)
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('max-age=60, No-Cache, private="x"') == {
+        'max-age': '60', 'no-cache': None, 'private': 'x'
+    }
+    assert parse_cache_control(None) == {}
+
+
+def test_cache_policy_max_age():
+    transport = MockTransport([(200, {'Cache-Control': 'max-age=60'}, b'content')])
+    policy = CachePolicy()
+    pipeline = Pipeline(transport, [policy])
+
+    with mock.patch("time.time", return_value=100.0):
+        assert pipeline.run(HttpRequest("GET", "https://bing.com")).http_response.body() == b'content'
+        response = pipeline.run(HttpRequest("GET", "https://bing.com")).http_response
+    assert response.body() == b'content'
+    assert response.status_code == 200
+    assert b''.join(response.stream_download(None)) == b'content'
+    assert len(transport.requests) == 1
+    assert policy.stats == {'hits': 1, 'revalidations': 0, 'misses': 1}
+
+
+def test_cache_policy_etag_revalidation():
+    transport = MockTransport([
+        (200, {'ETag': '"1"'}, b'content'),
+        (304, {'ETag': '"1"'}, b''),
+        (200, {'ETag': '"2"'}, b'new content'),
+    ])
+    policy = CachePolicy()
+    pipeline = Pipeline(transport, [policy])
+
+    pipeline.run(HttpRequest("GET", "https://bing.com"))
+    response = pipeline.run(HttpRequest("GET", "https://bing.com")).http_response
+    assert response.status_code == 200
+    assert response.body() == b'content'
+    assert transport.requests[1][1]['If-None-Match'] == '"1"'
+
+    response = pipeline.run(HttpRequest("GET", "https://bing.com")).http_response
+    assert response.body() == b'new content'
+    assert policy.stats == {'hits': 0, 'revalidations': 1, 'misses': 2}
+    assert policy.store.get("https://bing.com")[CachePolicy._variant_key(HttpRequest("GET", "/"))].etag == '"2"'
+
+
+def test_cache_policy_revalidation_keeps_request_unchanged():
+    transport = MockTransport([
+        (200, {'ETag': '"1"'}, b'content'),
+        (304, {'ETag': '"1"'}, b''),
+        (304, {'ETag': '"1"'}, b''),
+    ])
+    policy = CachePolicy()
+    pipeline = Pipeline(transport, [policy])
+    request = HttpRequest("GET", "https://bing.com")
+
+    pipeline.run(request)
+    for _ in range(2):
+        response = pipeline.run(request).http_response
+        assert (response.status_code, response.body()) == (200, b'content')
+        assert 'If-None-Match' not in request.headers
+    assert [headers.get('If-None-Match') for _, headers in transport.requests] == [None, '"1"', '"1"']
+    assert policy.stats == {'hits': 0, 'revalidations': 2, 'misses': 1}
+
+
+def test_cache_policy_not_cached():
+    transport = MockTransport([
+        (200, {'Cache-Control': 'no-store', 'ETag': '"1"'}, b'content'),
+        (200, {}, b'content'),
+        (200, {'Cache-Control': 'max-age=60'}, b'content'),
+        (200, {'Cache-Control': 'max-age=60'}, b'content'),
+        (200, {'Cache-Control': 'max-age=60'}, b'content'),
+        (200, {'Cache-Control': 'max-age=60'}, b'content'),
+    ])
+    policy = CachePolicy()
+    pipeline = Pipeline(transport, [policy])
+
+    pipeline.run(HttpRequest("GET", "https://bing.com/no-store"))
+    pipeline.run(HttpRequest("GET", "https://bing.com/no-validator"))
+    assert len(policy.store) == 0
+
+    pipeline.run(HttpRequest("GET", "https://bing.com"), stream=True)
+    pipeline.run(HttpRequest("GET", "https://bing.com"), cache_enable=False)
+    assert len(policy.store) == 0
+
+    # Different ranges are different entries
+    request = HttpRequest("GET", "https://bing.com")
+    request.headers['x-ms-range'] = 'bytes=0-10'
+    pipeline.run(request)
+    pipeline.run(HttpRequest("GET", "https://bing.com"))
+    assert policy.stats['hits'] == 0
+    assert not transport._responses
+
+
+def test_cache_policy_invalidation():
+    transport = MockTransport([
+        (200, {'Cache-Control': 'max-age=60'}, b'content'),
+        (201, {}, b''),
+        (200, {'Cache-Control': 'max-age=60'}, b'new content'),
+    ])
+    policy = CachePolicy()
+    pipeline = Pipeline(transport, [policy])
+
+    pipeline.run(HttpRequest("GET", "https://bing.com"))
+    pipeline.run(HttpRequest("PUT", "https://bing.com"))
+    assert pipeline.run(HttpRequest("GET", "https://bing.com")).http_response.body() == b'new content'
+    assert policy.stats['hits'] == 0
+
+
+def test_memory_cache_store_lru():
+    store = MemoryCacheStore(max_entries=2)
+    store.set('a', {})
+    store.set('b', {})
+    store.get('a')
+    store.set('c', {})
+    assert store.get('b') is None
+    assert store.get('a') == {}
+    assert store.get('c') == {}
+    with pytest.raises(ValueError):
+        MemoryCacheStore(max_entries=0)
+
+
+def test_file_cache_store(tmpdir):
+    transport = MockTransport([(200, {'ETag': '"1"'}, b'content'), (304, {}, b'')])
+    pipeline = Pipeline(transport, [CachePolicy(cache_directory=str(tmpdir))])
+    pipeline.run(HttpRequest("GET", "https://bing.com"))
+
+    # A new policy on the same directory reuses the entries
+    policy = CachePolicy(cache_directory=str(tmpdir))
+    pipeline = Pipeline(transport, [policy])
+    assert pipeline.run(HttpRequest("GET", "https://bing.com")).http_response.body() == b'content'
+    assert policy.stats['revalidations'] == 1
+
+    store = FileCacheStore(str(tmpdir), max_entries=1)
+    store.set('https://other', {})
+    assert store.get('https://bing.com') is None
+    assert store.get('https://other') == {}
+    store.clear()
+    assert store.get('https://other') is None
@@ -0,0 +1,99 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the metrics policy."""
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import pytest
+
+from azure.core.exceptions import ServiceRequestError
+from azure.core.pipeline import Pipeline, PipelineContext
+from azure.core.pipeline.policies import MetricsPolicy, RetryPolicy, UserAgentPolicy
+from azure.core.pipeline.policies.metrics import CallbackMetricsSink, InMemoryMetricsSink
+from azure.core.pipeline.transport import HttpRequest, HttpResponse, HttpTransport
+
+
+class MockTransport(HttpTransport):
+    def __init__(self, status_codes):
+        self._status_codes = list(status_codes)
+
+    def send(self, request, **kwargs):
+        status_code = self._status_codes.pop(0)
+        if status_code is None:
+            raise ServiceRequestError("Unreachable")
+        response = HttpResponse(request, None)
+        response.status_code = status_code
+        response.headers = {"Content-Length": "42"}
+        return response
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_metrics_policy_records_request():
+    sink = InMemoryMetricsSink()
+    policies = [MetricsPolicy(sink), UserAgentPolicy("myagent"), RetryPolicy(retry_backoff_factor=0)]
+    pipeline = Pipeline(MockTransport([503, 200]), policies)
+
+    request = HttpRequest("PUT", "https://account.blob.core.windows.net/container")
+    request.set_bytes_body(b"12345")
+    response = pipeline.run(request)
+    assert response.http_response.status_code == 200
+    assert MetricsPolicy.CONTEXT_NAME not in response.context
+    assert PipelineContext.POLICY_TIMER not in response.context
+
+    assert sink.get_counter("azure_core_requests_total", method="PUT", status_code="200") == 1
+    assert sink.get_counter("azure_core_retries_total", host="account.blob.core.windows.net") == 1
+    assert sink.get_counter("azure_core_request_bytes_total") == 5
+    assert sink.get_counter("azure_core_response_bytes_total") == 42
+    assert sink.get_histogram("azure_core_request_duration_seconds")["count"] == 1
+    assert sink.get_histogram("azure_core_policy_duration_seconds", policy="UserAgentPolicy")["count"] == 1
+    assert sink.get_histogram("azure_core_policy_duration_seconds", policy="transport")["count"] == 1
+
+    text = sink.to_prometheus_text()
+    assert "# TYPE azure_core_requests_total counter" in text
+    assert ('azure_core_requests_total{host="account.blob.core.windows.net",method="PUT",status_code="200"} 1'
+            in text)
+    assert 'azure_core_request_duration_seconds_bucket{' in text
+    assert 'le="+Inf"} 1' in text
+
+    sink.clear()
+    assert sink.to_prometheus_text() == "\n"
+
+
+def test_metrics_policy_records_errors():
+    callback = mock.Mock()
+    policies = [MetricsPolicy(CallbackMetricsSink(callback)), RetryPolicy(retry_total=0)]
+    pipeline = Pipeline(MockTransport([None]), policies)
+
+    with pytest.raises(ServiceRequestError):
+        pipeline.run(HttpRequest("GET", "https://account.blob.core.windows.net"))
+
+    callback.assert_any_call(
+        "counter",
+        "azure_core_requests_total",
+        1,
+        {"method": "GET", "host": "account.blob.core.windows.net", "error": "ServiceRequestError"}
+    )
+
+
+def test_metrics_policy_disabled():
+    sink = mock.Mock()
+    pipeline = Pipeline(MockTransport([200, 200]), [MetricsPolicy(sink, metrics_enable=False)])
+    response = pipeline.run(HttpRequest("GET", "https://bing.com"))
+    assert MetricsPolicy.CONTEXT_NAME not in response.context
+    assert not sink.increment.called and not sink.observe.called
+
+    pipeline = Pipeline(MockTransport([200]), [MetricsPolicy(sink)])
+    pipeline.run(HttpRequest("GET", "https://bing.com"), metrics_enable=False)
+    assert not sink.increment.called and not sink.observe.called
@@ -23,6 +23,7 @@
 # THE SOFTWARE.
 #
 #--------------------------------------------------------------------------
+import time
 
 from azure.core.paging import ItemPaged
 
@@ -129,3 +130,83 @@ class TestPaging(object):
         pager = ItemPaged(get_next, extract_data)
         result_iterated = list(pager)
         assert len(result_iterated) == 0
+
+    def test_deferred_continuation_token(self):
+        pages = {
+            None: (['value1.0', 'value1.1'], 'page2'),
+            'page2': (['value2.0'], None),
+        }
+        consumed = []
+
+        def get_next(continuation_token=None):
+            return continuation_token
+
+        def extract_data(response):
+            values, next_link = pages[response]
+
+            def stream():
+                for value in values:
+                    consumed.append(value)
+                    yield value
+
+            def get_continuation_token():
+                # Only available once the page has been consumed
+                assert consumed[-1] == values[-1]
+                return next_link
+            return get_continuation_token, stream()
+
+        pager = ItemPaged(get_next, extract_data)
+        assert list(pager) == ['value1.0', 'value1.1', 'value2.0']
+
+        consumed = []
+        pages_iterator = ItemPaged(get_next, extract_data).by_page()
+        assert list(next(pages_iterator)) == ['value1.0', 'value1.1']
+        assert pages_iterator.continuation_token == 'page2'
+
+    def test_prefetch_paging(self):
+        fetched = []
+
+        def get_next(continuation_token=None):
+            fetched.append(continuation_token)
+            index = int(continuation_token or 0)
+            return {
+                'nextLink': str(index + 1) if index < 9 else None,
+                'value': ['value{}.0'.format(index), 'value{}.1'.format(index)]
+            }
+
+        def extract_data(response):
+            return response['nextLink'], iter(response['value'])
+
+        pager = ItemPaged(get_next, extract_data, prefetch_pages=2)
+        result_iterated = list(pager)
+        assert len(result_iterated) == 20
+        assert result_iterated[:3] == ['value0.0', 'value0.1', 'value1.0']
+
+        fetched = []
+        pages = ItemPaged(get_next, extract_data, prefetch_pages=3).by_page(continuation_token='4')
+        assert list(next(pages)) == ['value4.0', 'value4.1']
+        # The continuation token is the one of the next page to return, not the last fetched
+        assert pages.continuation_token == '5'
+        time.sleep(0.2)
+        assert 2 <= len(fetched) <= 5
+        assert list(next(pages)) == ['value5.0', 'value5.1']
+        assert pages.continuation_token == '6'
+        pages.close()
+
+        resumed = ItemPaged(get_next, extract_data, prefetch_pages=1).by_page(continuation_token='8')
+        assert [list(page) for page in resumed] == [['value8.0', 'value8.1'], ['value9.0', 'value9.1']]
+        assert resumed.continuation_token is None
+
+    def test_prefetch_paging_error(self):
+        def get_next(continuation_token=None):
+            if continuation_token:
+                raise ValueError("Broken")
+            return {'nextLink': 'page2', 'value': ['value1.0']}
+
+        def extract_data(response):
+            return response['nextLink'], iter(response['value'])
+
+        pager = ItemPaged(get_next, extract_data, prefetch_pages=2)
+        assert next(pager) == 'value1.0'
+        with pytest.raises(ValueError):
+            next(pager)
@@ -40,12 +40,15 @@ except ImportError:
     import mock
 import xml.etree.ElementTree as ET
 import sys
+import threading
+import time
 
 import requests
 import pytest
 
 from azure.core import Configuration
-from azure.core.pipeline import Pipeline
+from azure.core.exceptions import ResourceModifiedError, ServiceResponseError
+from azure.core.pipeline import Pipeline, PipelineContext
 from azure.core.pipeline.policies import (
     SansIOHTTPPolicy,
     UserAgentPolicy,
@@ -91,6 +94,199 @@ def test_sans_io_exception():
     with pytest.raises(NotImplementedError):
         pipeline.run(req)
 
+
+def test_policy_timer():
+    import contextlib
+
+    class Timer(object):
+        def __init__(self):
+            self.measured = []
+
+        @contextlib.contextmanager
+        def measure(self, name):
+            self.measured.append(name)
+            yield
+
+    class TimedPolicy(SansIOHTTPPolicy):
+        def on_request(self, request):
+            request.context[PipelineContext.POLICY_TIMER] = timer
+
+    class Sender(HttpTransport):
+        def send(self, request, **config):
+            return mock.Mock(status_code=200)
+
+        def open(self):
+            pass
+
+        def close(self):
+            pass
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            pass
+
+    timer = Timer()
+    pipeline = Pipeline(Sender(), [TimedPolicy(), UserAgentPolicy("myagent")])
+    pipeline.run(HttpRequest("GET", "/"))
+    # The policies are timed from the one following the policy setting the timer
+    assert timer.measured == ["UserAgentPolicy", "transport", "UserAgentPolicy"]
+
+def test_run_many():
+    class EchoSender(HttpTransport):
+        def __init__(self):
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.lock = threading.Lock()
+
+        def send(self, request, **config):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(0.01)
+            with self.lock:
+                self.in_flight -= 1
+            response = mock.Mock()
+            response.config = config
+            return response
+
+        def open(self):
+            pass
+
+        def close(self):
+            pass
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            pass
+
+    sender = EchoSender()
+    pipeline = Pipeline(sender, [SansIOHTTPPolicy()])
+    requests_to_send = [HttpRequest("GET", "/{}".format(i)) for i in range(20)]
+
+    responses = list(pipeline.run_many(requests_to_send, max_concurrency=4, custom="value"))
+
+    assert len(responses) == 20
+    assert set(r.http_request for r in responses) == set(requests_to_send)
+    assert len(set(id(r.context) for r in responses)) == 20
+    assert all(r.http_response.config == {"custom": "value"} for r in responses)
+    assert 1 < sender.max_in_flight <= 4
+
+    # Raised by the call, before the responses are iterated
+    with pytest.raises(ValueError):
+        pipeline.run_many(requests_to_send, max_concurrency=-1)
+    with pytest.raises(ValueError):
+        pipeline.run_many(requests_to_send, max_concurrency=0)
+
+
+def test_run_many_exception():
+    class BrokenSender(HttpTransport):
+        def send(self, request, **config):
+            if request.url == "/broken":
+                raise ValueError("Broken")
+            return mock.Mock()
+
+        def open(self):
+            pass
+
+        def close(self):
+            pass
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            pass
+
+    pipeline = Pipeline(BrokenSender())
+    requests_to_send = [HttpRequest("GET", "/"), HttpRequest("GET", "/broken")]
+    with pytest.raises(ValueError):
+        list(pipeline.run_many(requests_to_send, max_concurrency=1))
+
+
+def test_stream_download_resume():
+    from azure.core.pipeline.policies import RetryPolicy
+    from azure.core.pipeline.transport import RequestsTransportResponse
+
+    data = b"0123456789abcdefghij"
+
+    def build_response(request, body, status_code, interrupt_after=None):
+        def iter_content(block_size):
+            for i in range(0, len(body), block_size):
+                if interrupt_after is not None and i >= interrupt_after:
+                    raise requests.exceptions.ChunkedEncodingError("Connection broken")
+                yield body[i:i + block_size]
+        internal_response = mock.Mock(
+            status_code=status_code,
+            headers={'ETag': '"etag"', 'Content-Length': str(len(body))},
+            reason="OK"
+        )
+        internal_response.iter_content = iter_content
+        return RequestsTransportResponse(request, internal_response, block_size=4)
+
+    class Sender(HttpTransport):
+        # Sends the responses built by each function in turn
+        def __init__(self, *builders):
+            self.builders = list(builders)
+            self.requests = []
+
+        def send(self, request, **config):
+            self.requests.append(request)
+            return self.builders.pop(0)(request)
+
+        def open(self):
+            pass
+
+        def close(self):
+            pass
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            pass
+
+    def resumed(request):
+        assert request.headers['x-ms-range'] == 'bytes=18-29'
+        assert request.headers['If-Match'] == '"etag"'
+        return build_response(request, data[8:], 206)
+
+    sender = Sender(lambda request: build_response(request, data, 206, interrupt_after=8), resumed)
+    pipeline = Pipeline(sender, [RetryPolicy(retry_backoff_factor=0)])
+    request = HttpRequest("GET", "/", headers={'x-ms-range': 'bytes=10-29'})
+    stream = pipeline.run(request, stream=True).http_response.stream_download(pipeline)
+    assert b"".join(stream) == data
+    assert stream.downloaded == len(data)
+    assert len(sender.requests) == 2
+
+    # Interrupted connections are resumed at most retry_read times
+    broken = lambda request: build_response(request, data, 206, interrupt_after=0)
+    sender = Sender(*[broken] * 4)
+    pipeline = Pipeline(sender, [RetryPolicy(retry_read=2, retry_backoff_factor=0)])
+    with pytest.raises(ServiceResponseError):
+        list(pipeline.run(HttpRequest("GET", "/"), stream=True).http_response.stream_download(pipeline))
+    assert len(sender.requests) == 3
+
+    # Nor are they resumed by a pipeline without retry policy, or with retries disabled
+    for policies, options in (([], {}), ([RetryPolicy(retry_backoff_factor=0)], {'retry_total': 0})):
+        sender = Sender(broken, broken)
+        pipeline = Pipeline(sender, policies)
+        response = pipeline.run(HttpRequest("GET", "/"), stream=True, **options).http_response
+        with pytest.raises(ServiceResponseError):
+            list(response.stream_download(pipeline))
+        assert len(sender.requests) == 1
+
+    # The download fails if the resource changed in between
+    sender = Sender(lambda request: build_response(request, data, 200, interrupt_after=4),
+                    lambda request: build_response(request, b"", 412))
+    pipeline = Pipeline(sender, [RetryPolicy(retry_backoff_factor=0)])
+    with pytest.raises(ResourceModifiedError):
+        list(pipeline.run(HttpRequest("GET", "/"), stream=True).http_response.stream_download(pipeline))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Async transports are imported lazily on Python 3.7+")
+def test_lazy_async_transports():
+    import subprocess
+    code = (
+        "import sys, azure.core;"
+        "assert 'aiohttp' not in sys.modules and 'trio' not in sys.modules;"
+        "from azure.core.pipeline.transport import AioHttpTransport;"
+        "assert 'aiohttp' in sys.modules"
+    )
+    subprocess.check_call([sys.executable, '-c', code])
+
+
 class TestRequestsTransport(unittest.TestCase):
 
     def test_basic_requests(self):
@@ -126,6 +322,72 @@ class TestRequestsTransport(unittest.TestCase):
         transport.session.close()
 
 
+    def test_requests_pool_configuration(self):
+        transport = RequestsTransport(connection_pool_maxsize=32, connection_pool_block=True)
+        with transport:
+            adapter = transport.session.get_adapter("https://bing.com")
+            assert adapter._pool_maxsize == 32
+            assert adapter._pool_block
+
+    def test_requests_shared_session(self):
+        first = RequestsTransport(shared_session=True, connection_pool_maxsize=20)
+        second = RequestsTransport(shared_session=True, connection_pool_maxsize=20)
+        other = RequestsTransport(shared_session=True, connection_pool_maxsize=30)
+        first.open()
+        second.open()
+        other.open()
+        assert first.session is second.session
+        assert first.session is not other.session
+
+        shared = first.session
+        with mock.patch.object(shared, "close") as close:
+            first.close()
+            assert not close.called
+            second.close()
+            assert close.called
+        other.close()
+
+        third = RequestsTransport(shared_session=True, connection_pool_maxsize=20)
+        third.open()
+        assert third.session is not shared
+        third.close()
+
+    def test_requests_idle_timeout(self):
+        transport = RequestsTransport(connection_idle_timeout=5)
+        with transport:
+            adapter = transport.session.get_adapter("https://bing.com")
+            request = mock.Mock(url="https://bing.com")
+            other_request = mock.Mock(url="https://example.org")
+            pool = adapter._get_pool(request, {})
+            connection = mock.Mock()
+            pool.pool.get(block=False)
+            pool.pool.put(connection)
+            with mock.patch("requests.adapters.HTTPAdapter.send") as send:
+                adapter.send(request)
+                adapter.send(other_request)
+                assert not connection.close.called
+
+                # the pool of the other host isn't idle
+                adapter._pool_usage[pool][1] -= 10
+                adapter.send(other_request)
+                assert not connection.close.called
+
+                # the idle connections of the pool are closed, and kept in the pool to be reopened
+                adapter.send(request)
+                assert connection.close.call_count == 1
+                assert connection in pool.pool.queue
+                assert send.call_count == 4
+
+                # a pool with requests in flight isn't idle
+                def send_while_in_flight(*args, **kwargs):
+                    adapter._pool_usage[pool][1] -= 10
+                    send.side_effect = None
+                    adapter.send(request)
+                send.side_effect = send_while_in_flight
+                adapter.send(request)
+                assert connection.close.call_count == 1
+
+
 class TestClientPipelineURLFormatting(unittest.TestCase):
 
     def test_format_url_basic(self):
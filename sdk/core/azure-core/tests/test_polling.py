@@ -23,6 +23,7 @@
 # THE SOFTWARE.
 #
 #--------------------------------------------------------------------------
+import threading
 import time
 try:
     from unittest import mock
@@ -172,3 +173,112 @@ def test_broken_poller(client):
     with pytest.raises(ValueError) as excinfo:
         poller.result()
     assert "Something bad happened" in str(excinfo.value)
+
+
+class PollingThreeSteps(ScheduledPollingMethod):
+    """A scheduled poller finishing after three status updates.
+    """
+    def __init__(self, delay=0.01, fail=False):
+        self._delay = delay
+        self._fail = fail
+        self.polls = 0
+
+    def initialize(self, _, initial_response, deserialization_callback):
+        self._initial_response = initial_response
+        self._deserialization_callback = deserialization_callback
+
+    def update_status(self):
+        self.polls += 1
+        if self._fail:
+            raise ValueError("Something bad happened")
+
+    def get_delay(self):
+        return self._delay
+
+    def status(self):
+        return "succeeded" if self.finished() else "running"
+
+    def finished(self):
+        return self.polls >= 3
+
+    def resource(self):
+        return self._deserialization_callback(self._initial_response)
+
+
+def test_scheduled_polling_run():
+    method = PollingThreeSteps(delay=0)
+    method.initialize(None, "Initial response", lambda r: r)
+    method.run()
+    assert method.polls == 3
+
+
+def test_scheduled_poller(client):
+    initial_response = "Initial response"
+    def deserialization_callback(response):
+        return "Treated: "+response
+
+    scheduler = PollingScheduler(max_workers=2)
+    # The first operation is still pending when its done callback is added
+    methods = [PollingThreeSteps(delay=0.1)] + [PollingThreeSteps() for _ in range(19)]
+    threads_before = threading.active_count()
+    pollers = [
+        LROPoller(client, initial_response, deserialization_callback, method, polling_scheduler=scheduler)
+        for method in methods
+    ]
+    # One timer thread and at most two workers, whatever the number of operations
+    assert threading.active_count() <= threads_before + 3
+
+    callback_threads = []
+    done_cb = mock.MagicMock(side_effect=lambda _: callback_threads.append(threading.current_thread()))
+    pollers[0].add_done_callback(done_cb)
+    for poller in pollers:
+        assert poller.result(timeout=10) == "Treated: "+initial_response
+        assert poller.done()
+    assert all(method.polls == 3 for method in methods)
+    done_cb.assert_called_once_with(methods[0])
+    # Done callbacks run on a worker thread of the scheduler
+    assert callback_threads[0] is not threading.current_thread()
+    assert callback_threads[0].name != "PollingScheduler"
+
+    # The timer thread stops when there is nothing left to poll
+    for _ in range(100):
+        if scheduler._thread is None:
+            break
+        time.sleep(0.01)
+    assert scheduler._thread is None
+    assert len(scheduler) == 0
+
+
+def test_scheduled_poller_deadlines():
+    scheduler = PollingScheduler(max_workers=1)
+    calls = []
+    def step(name, delays):
+        def _step():
+            calls.append(name)
+            return delays.pop(0) if delays else None
+        return _step
+
+    scheduler.schedule(step("slow", []), 0.2)
+    scheduler.schedule(step("fast", [0.05]), 0)
+    for _ in range(100):
+        if len(calls) == 3:
+            break
+        time.sleep(0.01)
+    assert calls == ["fast", "fast", "slow"]
+
+    with pytest.raises(ValueError):
+        PollingScheduler(max_workers=0)
+
+
+def test_broken_scheduled_poller(client):
+    method = PollingThreeSteps(fail=True)
+    poller = LROPoller(client, "Initial response", lambda r: r, method, polling_scheduler=True)
+    with pytest.raises(ValueError) as excinfo:
+        poller.result(timeout=10)
+    assert "Something bad happened" in str(excinfo.value)
+    assert poller.done()
+
+    # Non scheduled polling methods still work with a scheduler
+    method = PollingTwoSteps()
+    poller = LROPoller(client, "Initial response", lambda r: r, method, polling_scheduler=True)
+    assert poller.result() == "Initial response"
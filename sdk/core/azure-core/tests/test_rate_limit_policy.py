@@ -0,0 +1,105 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the rate limit policy."""
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import RateLimitPolicy
+from azure.core.pipeline.policies.rate_limit import TokenBucket, subscription_key
+from azure.core.pipeline.transport import HttpRequest, HttpResponse, HttpTransport
+
+
+class MockTransport(HttpTransport):
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sleeps = []
+
+    def send(self, request, **kwargs):
+        status_code, headers = self._responses.pop(0)
+        response = HttpResponse(request, None)
+        response.status_code = status_code
+        response.headers = headers
+        return response
+
+    def sleep(self, duration):
+        self.sleeps.append(duration)
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_token_bucket():
+    with mock.patch("azure.core.pipeline.policies.rate_limit._clock", return_value=100.0) as now:
+        bucket = TokenBucket(rate=2, min_rate=1, max_rate=3, capacity=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0.5
+        assert bucket.reserve() == 1.0
+
+        now.return_value = 100.5
+        bucket.on_success()
+        assert bucket.rate == 2  # Less than an increase interval since the bucket was created
+
+        now.return_value = 101.0
+        bucket.on_success()
+        bucket.on_success()
+        assert bucket.rate == 3  # Once per increase interval, however many requests succeed
+        now.return_value = 102.0
+        bucket.on_success()
+        assert bucket.rate == 3  # Capped by max_rate
+
+        bucket.on_throttled(retry_after=5)
+        assert bucket.rate == 1.5
+        assert bucket.reserve() == 5
+        bucket.on_throttled()
+        assert bucket.rate == 1
+
+        # A decrease restarts the increase interval
+        now.return_value = 102.5
+        bucket.on_success()
+        assert bucket.rate == 1
+        now.return_value = 103.0
+        bucket.on_success()
+        assert bucket.rate == 2
+
+
+def test_rate_limit_policy():
+    transport = MockTransport([
+        (200, {}),
+        (429, {"Retry-After": "3"}),
+        (200, {"x-ms-ratelimit-remaining-subscription-reads": "2"}),
+        (200, {}),
+    ])
+    policy = RateLimitPolicy(rate_limit_initial=10, rate_limit_increase_interval=0, rate_limit_key=subscription_key)
+    pipeline = Pipeline(transport, [policy])
+    request = HttpRequest("GET", "https://management.azure.com/subscriptions/ABC/resourceGroups")
+    pipeline.run(request)
+    bucket = policy.get_bucket(mock.Mock(http_request=request))
+    assert bucket.rate == 11
+
+    pipeline.run(request)
+    assert bucket.rate == 5.5
+    pipeline.run(request)
+    assert transport.sleeps and 2.5 < transport.sleeps[-1] <= 3
+    assert bucket.rate == 2.75
+
+    other = HttpRequest("GET", "https://management.azure.com/subscriptions/DEF")
+    assert policy.get_bucket(mock.Mock(http_request=other)) is not bucket
+
+    # Buckets are shared process-wide unless a policy opts out
+    shared = RateLimitPolicy()
+    assert shared.get_bucket(mock.Mock(http_request=request)) is \
+        RateLimitPolicy(rate_limit_initial=1).get_bucket(mock.Mock(http_request=request))
+    assert RateLimitPolicy(rate_limit_shared=False).get_bucket(mock.Mock(http_request=request)) is not \
+        shared.get_bucket(mock.Mock(http_request=request))
@@ -28,6 +28,8 @@ try:
     from unittest import mock
 except ImportError:
     import mock
+from io import BytesIO
+import json
 
 import requests
 
@@ -177,3 +179,60 @@ def test_raw_deserializer():
     raw_deserializer.on_response(None, response)
     result = response.context["deserialized_data"]
     assert result["success"] is True
+
+
+def test_incremental_json_deserializer():
+    def chunked(data, size=3):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    payload = b'\xef\xbb\xbf{"odata": {"a": [1, 2]}, "value": [{"name": "caf\xc3\xa9"}, 12345, [true, null], "x"], "nextLink": "page2"}'
+    items = ContentDecodePolicy.iter_json_array(chunked(payload))
+    assert next(items) == {"name": u"café"}
+    assert items.document == {"odata": {"a": [1, 2]}, "nextLink": "page2"}
+    assert list(items) == [12345, [True, None], "x"]
+
+    items = ContentDecodePolicy.iter_json_array(BytesIO(b'[1, 2.5, {"b": []}]'), key=None)
+    assert list(items) == [1, 2.5, {"b": []}]
+
+    items = ContentDecodePolicy.iter_json_array([b'{"value": [], "nextLink": null}'])
+    assert list(items) == []
+    assert items.document == {"nextLink": None}
+
+    with pytest.raises(DecodeError):
+        list(ContentDecodePolicy.iter_json_array(chunked(b'{"value": [1, 2')))
+    with pytest.raises(DecodeError):
+        list(ContentDecodePolicy.iter_json_array(chunked(b'{"value": [1 2]}')))
+
+
+def test_incremental_json_deserializer_value_across_chunks():
+    # Strings holding brackets, quotes and escapes must not be mistaken for the end of the value
+    big = {"name": u'a]b}c\\"d\\\\' * 500, "tags": [[i, {"k": "]"}] for i in range(200)], "n": 123456789}
+    payload = json.dumps({"value": [big, 1234567, "x\\\"]", True, []]}).encode("utf-8")
+    chunks = [payload[i:i + 5] for i in range(0, len(payload), 5)]
+
+    raw_decode = json.JSONDecoder.raw_decode
+    with mock.patch.object(json.JSONDecoder, "raw_decode", autospec=True, side_effect=raw_decode) as decode:
+        items = list(ContentDecodePolicy.iter_json_array(chunks))
+    assert items == [big, 1234567, "x\\\"]", True, []]
+    # Each element is decoded once, however many chunks it spans
+    assert decode.call_count == len(items) + 1  # The trailing document after the array
+
+
+def test_incremental_xml_deserializer():
+    payload = (b'<?xml version="1.0" encoding="utf-8"?>'
+               b'<EnumerationResults><Blobs>'
+               b'<Blob><Name>a</Name></Blob><Blob><Name>b</Name></Blob>'
+               b'</Blobs><NextMarker>marker</NextMarker></EnumerationResults>')
+    chunks = [payload[i:i + 7] for i in range(0, len(payload), 7)]
+    elements = ContentDecodePolicy.iter_xml_elements(chunks, "Blob")
+    assert [e.find("Name").text for e in elements] == ["a", "b"]
+    assert elements.document.find("NextMarker").text == "marker"
+    assert len(elements.document.find("Blobs")) == 0
+
+    with pytest.raises(DecodeError):
+        list(ContentDecodePolicy.iter_xml_elements([b"<Blobs><Blob>"], "Blob"))
+
+    # The root element is the document, never an item
+    elements = ContentDecodePolicy.iter_xml_elements([b"<Blob><Blob>a</Blob></Blob>"], "Blob")
+    assert [e.text for e in elements] == ["a"]
+    assert elements.document.tag == "Blob"
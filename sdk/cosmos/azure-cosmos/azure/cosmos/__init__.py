@@ -19,6 +19,7 @@
 #OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #SOFTWARE.
 
+from .bulk_executor import BulkOperationResult, BulkResult
 from .container import Container
 from .cosmos_client import CosmosClient
 from .database import Database
@@ -32,6 +33,8 @@ from .scripts import Scripts
 from .user import User
 
 __all__ = (
+    'BulkOperationResult',
+    'BulkResult',
     'Container',
     'CosmosClient',
     'Database',
@@ -0,0 +1,186 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Asynchronous request in the Azure Cosmos database service.
+"""
+
+import json
+import ssl
+from urllib.parse import urlparse, urlencode
+
+import aiohttp
+
+from .. import errors
+from .. import http_constants
+from ..synchronized_request import _RequestBodyFromData
+from . import _retry_utility_async
+
+def _GetSSLContext(connection_policy, parse_result):
+    """Gets the ssl argument of the aiohttp request.
+
+    The SSL verification is disabled for the local emulator(localhost/127.0.0.1) or if the user
+    has explicitly specified to disable it.
+    """
+    if connection_policy.SSLConfiguration:
+        ssl_context = ssl.create_default_context(cafile=connection_policy.SSLConfiguration.SSLCaCerts)
+        if connection_policy.SSLConfiguration.SSLCertFile:
+            ssl_context.load_cert_chain(connection_policy.SSLConfiguration.SSLCertFile,
+                                        connection_policy.SSLConfiguration.SSLKeyFile)
+        return ssl_context
+
+    is_ssl_enabled = (parse_result.hostname != 'localhost' and parse_result.hostname != '127.0.0.1' and not connection_policy.DisableSSLVerification)
+    # None uses the default SSL verification of aiohttp
+    return None if is_ssl_enabled else False
+
+def _GetProxy(connection_policy):
+    """Gets the proxy url of the aiohttp request, or None.
+    """
+    if connection_policy.ProxyConfiguration and connection_policy.ProxyConfiguration.Host:
+        host = connection_policy.ProxyConfiguration.Host
+        url = urlparse(host)
+        return host if url.port else host + ":" + str(connection_policy.ProxyConfiguration.Port)
+    return None
+
+async def _Request(global_endpoint_manager, request, connection_policy, aiohttp_session, path, request_options, request_body):
+    """Makes one http request using the aiohttp module.
+
+    :param _GlobalEndpointManager global_endpoint_manager:
+    :param dict request:
+        contains the resourceType, operationType, endpointOverride,
+        useWriteEndpoint, useAlternateWriteEndpoint information
+    :param documents.ConnectionPolicy connection_policy:
+    :param aiohttp.ClientSession aiohttp_session:
+        Session object in aiohttp module
+    :param str resource_url:
+        The url for the resource
+    :param dict request_options:
+    :param bytes request_body:
+        Bytes or None
+
+    :return:
+        tuple of (result, headers)
+    :rtype:
+        tuple of (dict, dict)
+
+    """
+    is_media = request_options['path'].find('media') > -1
+    connection_timeout = (connection_policy.MediaRequestTimeout
+                          if is_media
+                          else connection_policy.RequestTimeout)
+
+    # Every request tries to perform a refresh
+    await global_endpoint_manager.refresh_endpoint_list(None)
+
+    if request.endpoint_override:
+        base_url = request.endpoint_override
+    else:
+        base_url = global_endpoint_manager.resolve_service_endpoint(request)
+
+    if path:
+        resource_url = base_url + path
+    else:
+        resource_url = base_url
+
+    parse_result = urlparse(resource_url)
+
+    # aiohttp expects header values to be strings, so casting all header values to strings.
+    request_options['headers'] = {header: str(value) for header, value in request_options['headers'].items()}
+
+    async with aiohttp_session.request(request_options['method'],
+                                       resource_url,
+                                       data=request_body,
+                                       headers=request_options['headers'],
+                                       timeout=aiohttp.ClientTimeout(total=connection_timeout / 1000.0),
+                                       ssl=_GetSSLContext(connection_policy, parse_result),
+                                       proxy=_GetProxy(connection_policy)) as response:
+        headers = dict(response.headers)
+        data = (await response.read()).decode('utf-8')
+
+    if response.status >= 400:
+        raise errors.HTTPFailure(response.status, data, headers)
+
+    result = None
+    if is_media:
+        result = data
+    else:
+        if len(data) > 0:
+            try:
+                result = json.loads(data)
+            except:
+                raise errors.JSONParseFailure(data)
+
+    return (result, headers)
+
+async def AsynchronousRequest(client,
+                              request,
+                              global_endpoint_manager,
+                              connection_policy,
+                              aiohttp_session,
+                              method,
+                              path,
+                              request_data,
+                              query_params,
+                              headers):
+    """Performs one asynchronous http request according to the parameters.
+
+    :param object client:
+        Document client instance
+    :param dict request:
+    :param _GlobalEndpointManager global_endpoint_manager:
+    :param documents.ConnectionPolicy connection_policy:
+    :param aiohttp.ClientSession aiohttp_session:
+        Session object in aiohttp module
+    :param str method:
+    :param str path:
+    :param (str, unicode, file-like stream object, dict, list or None) request_data:
+    :param dict query_params:
+    :param dict headers:
+
+    :return:
+        tuple of (result, headers)
+    :rtype:
+        tuple of (dict dict)
+
+    """
+    request_body = None
+    if request_data:
+        request_body = _RequestBodyFromData(request_data)
+        if not request_body:
+            raise errors.UnexpectedDataType(
+                'parameter data must be a JSON object, string or' +
+                ' readable stream.')
+
+    request_options = {}
+    request_options['path'] = path
+    request_options['method'] = method
+    if query_params:
+        request_options['path'] += '?' + urlencode(query_params)
+
+    request_options['headers'] = headers
+    if isinstance(request_body, str):
+        # the content length is the one of the encoded body
+        request_body = request_body.encode('utf-8')
+        request_options['headers'][http_constants.HttpHeaders.ContentLength] = len(request_body)
+    elif request_body is None:
+        request_options['headers'][http_constants.HttpHeaders.ContentLength] = 0
+
+    # Pass _Request coroutine function with it's parameters to _retry_utility_async's Execute method that wraps the call with retries
+    return await _retry_utility_async._Execute(client, global_endpoint_manager, _Request, request, connection_policy, aiohttp_session, path, request_options, request_body)
@@ -0,0 +1,1104 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Document client class for the Azure Cosmos database service, with asynchronous I/O.
+"""
+
+import aiohttp
+
+from .. import base
+from .. import constants
+from .. import documents
+from .. import errors
+from .. import http_constants
+from .. import request_object
+from .. import runtime_constants
+from .. import session
+from .. import utils
+from ..cosmos_client_connection import CosmosClientConnection as _CosmosClientConnection
+from . import _asynchronous_request
+from . import _global_endpoint_manager_async
+from . import _routing_map_provider_async
+from ._query_iterable_async import QueryIterable
+
+class CosmosClientConnection(object):
+    """Represents an asynchronous document client.
+
+    Provides a client-side logical representation of the Azure Cosmos
+    service. This client is used to configure and execute requests against the
+    service, with the coroutines of an aiohttp session.
+
+    The headers of the responses are passed to the response_hook of each operation,
+    as the client may run many operations at the same time.
+    """
+
+    def __init__(self,
+                 url_connection,
+                 auth,
+                 connection_policy=None,
+                 consistency_level=documents.ConsistencyLevel.Session):
+        """
+        :param str url_connection:
+            The URL for connecting to the DB server.
+        :param dict auth:
+            Contains 'masterKey' or 'resourceTokens', where
+            auth['masterKey'] is the default authorization key to use to
+            create the client, and auth['resourceTokens'] is the alternative
+            authorization key.
+        :param documents.ConnectionPolicy connection_policy:
+            The connection policy for the client.
+        :param documents.ConsistencyLevel consistency_level:
+            The default consistency policy for client operations.
+
+        """
+        self.url_connection = url_connection
+
+        self.master_key = None
+        self.resource_tokens = None
+        if auth != None:
+            self.master_key = auth.get('masterKey')
+            self.resource_tokens = auth.get('resourceTokens')
+
+            if auth.get('permissionFeed'):
+                self.resource_tokens = {}
+                for permission_feed in auth['permissionFeed']:
+                    resource_parts = permission_feed['resource'].split('/')
+                    id = resource_parts[-1]
+                    self.resource_tokens[id] = permission_feed['_token']
+
+        self.connection_policy = (connection_policy or
+                                  documents.ConnectionPolicy())
+
+        self.partition_key_definition_cache = {}
+
+        self.default_headers = {
+            http_constants.HttpHeaders.CacheControl: 'no-cache',
+            http_constants.HttpHeaders.Version:
+                http_constants.Versions.CurrentVersion,
+            http_constants.HttpHeaders.UserAgent:
+                utils._get_user_agent(),
+            # For single partition query with aggregate functions we would try to accumulate the results on the SDK.
+            # We need to set continuation as not expected.
+            http_constants.HttpHeaders.IsContinuationExpected: False
+        }
+
+        if consistency_level != None:
+            self.default_headers[
+                http_constants.HttpHeaders.ConsistencyLevel] = consistency_level
+
+        if consistency_level == documents.ConsistencyLevel.Session:
+            '''create a session - this is maintained only if the default consistency level
+            on the client is set to session, or if the user explicitly sets it as a property
+            via setter'''
+            self.session = session.Session(self.url_connection)
+        else:
+            self.session = None
+
+        self._useMultipleWriteLocations = False
+        self._global_endpoint_manager = _global_endpoint_manager_async._GlobalEndpointManager(self)
+
+        # the aiohttp session used for connection pooling, created on the first request
+        # as it must be created in a coroutine
+        self._aiohttp_session = None
+        self._initialized = False
+
+        # Routing map provider
+        self._routing_map_provider = _routing_map_provider_async._SmartRoutingMapProvider(self)
+
+    @property
+    def Session(self):
+        """ Gets the session object from the client """
+        return self.session
+
+    @Session.setter
+    def Session(self, session):
+        """ Sets a session object on the document client
+            This will override the existing session
+        """
+        self.session = session
+
+    async def _initialize(self):
+        """Reads the database account, and the endpoints of its locations, unless already done.
+        """
+        if self._initialized:
+            return
+        self._initialized = True
+        try:
+            database_account = await self._global_endpoint_manager._GetDatabaseAccount()
+            await self._global_endpoint_manager.force_refresh(database_account)
+        except BaseException:
+            self._initialized = False
+            raise
+
+    async def close(self):
+        """Closes the aiohttp session of the client."""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    async def GetDatabaseAccount(self, url_connection=None, response_hook=None):
+        """Gets database account info.
+
+        :return:
+            The Database Account.
+        :rtype:
+            documents.DatabaseAccount
+
+        """
+        if url_connection is None:
+            url_connection = self.url_connection
+
+        initial_headers = dict(self.default_headers)
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'get',
+                                  '',  # path
+                                  '',  # id
+                                  '',  # type
+                                  {})
+
+        request = request_object._RequestObject('databaseaccount', documents._OperationType.Read, url_connection)
+        result, response_headers = await self.__Get('',
+                                                    request,
+                                                    headers)
+        database_account = documents.DatabaseAccount()
+        database_account.DatabasesLink = '/dbs/'
+        database_account.MediaLink = '/media/'
+        if (http_constants.HttpHeaders.MaxMediaStorageUsageInMB in
+            response_headers):
+            database_account.MaxMediaStorageUsageInMB = (
+                response_headers[
+                    http_constants.HttpHeaders.MaxMediaStorageUsageInMB])
+        if (http_constants.HttpHeaders.CurrentMediaStorageUsageInMB in
+            response_headers):
+            database_account.CurrentMediaStorageUsageInMB = (
+                response_headers[
+                    http_constants.HttpHeaders.CurrentMediaStorageUsageInMB])
+        database_account.ConsistencyPolicy = result.get(constants._Constants.UserConsistencyPolicy)
+
+        # WritableLocations and ReadableLocations fields will be available only for geo-replicated database accounts
+        if constants._Constants.WritableLocations in result:
+            database_account._WritableLocations = result[constants._Constants.WritableLocations]
+        if constants._Constants.ReadableLocations in result:
+            database_account._ReadableLocations = result[constants._Constants.ReadableLocations]
+        if constants._Constants.EnableMultipleWritableLocations in result:
+            database_account._EnableMultipleWritableLocations = result[constants._Constants.EnableMultipleWritableLocations]
+
+        self._useMultipleWriteLocations = self.connection_policy.UseMultipleWriteLocations and database_account._EnableMultipleWritableLocations
+        if response_hook:
+            response_hook(response_headers, database_account)
+        return database_account
+
+    async def CreateDatabase(self, database, options=None, response_hook=None):
+        """Creates a database.
+
+        :param dict database:
+            The Azure Cosmos database to create.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The Database that was created.
+        :rtype: dict
+
+        """
+        if options is None:
+            options = {}
+
+        CosmosClientConnection._ValidateResource(database)
+        path = '/dbs'
+        return await self.Create(database, path, 'dbs', None, None, options, response_hook)
+
+    async def ReadDatabase(self, database_link, options=None, response_hook=None):
+        """Reads a database.
+
+        :param str database_link:
+            The link to the database.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The Database that was read.
+        :rtype: dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(database_link)
+        database_id = base.GetResourceIdOrFullNameFromLink(database_link)
+        return await self.Read(path, 'dbs', database_id, None, options, response_hook)
+
+    def ReadDatabases(self, options=None, response_hook=None):
+        """Reads all databases.
+
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            Query Iterable of Databases.
+        :rtype:
+            QueryIterable
+
+        """
+        if options is None:
+            options = {}
+
+        return self.QueryDatabases(None, options, response_hook)
+
+    def QueryDatabases(self, query, options=None, response_hook=None):
+        """Queries databases.
+
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+
+        :return: Query Iterable of Databases.
+        :rtype:
+            QueryIterable
+
+        """
+        if options is None:
+            options = {}
+
+        async def fetch_fn(options):
+            return await self.__QueryFeed('/dbs',
+                                          'dbs',
+                                          '',
+                                          lambda r: r['Databases'],
+                                          query,
+                                          options,
+                                          response_hook=response_hook)
+        return QueryIterable(self, query, options, fetch_fn)
+
+    async def DeleteDatabase(self, database_link, options=None, response_hook=None):
+        """Deletes a database.
+
+        :param str database_link:
+            The link to the database.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The deleted Database.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(database_link)
+        database_id = base.GetResourceIdOrFullNameFromLink(database_link)
+        return await self.DeleteResource(path, 'dbs', database_id, None, options, response_hook)
+
+    async def CreateContainer(self, database_link, collection, options=None, response_hook=None):
+        """Creates a collection in a database.
+
+        :param str database_link:
+            The link to the database.
+        :param dict collection:
+            The Azure Cosmos collection to create.
+        :param dict options:
+            The request options for the request.
+
+        :return: The Collection that was created.
+        :rtype: dict
+
+        """
+        if options is None:
+            options = {}
+
+        CosmosClientConnection._ValidateResource(collection)
+        path = base.GetPathFromLink(database_link, 'colls')
+        database_id = base.GetResourceIdOrFullNameFromLink(database_link)
+        return await self.Create(collection, path, 'colls', database_id, None, options, response_hook)
+
+    async def ReadContainer(self, collection_link, options=None, response_hook=None):
+        """Reads a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The read Collection.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(collection_link)
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        return await self.Read(path, 'colls', collection_id, None, options, response_hook)
+
+    def ReadContainers(self, database_link, options=None, response_hook=None):
+        """Reads all collections in a database.
+
+        :param str database_link:
+            The link to the database.
+        :param dict options:
+            The request options for the request.
+
+        :return: Query Iterable of Collections.
+        :rtype:
+            QueryIterable
+
+        """
+        if options is None:
+            options = {}
+
+        return self.QueryContainers(database_link, None, options, response_hook)
+
+    def QueryContainers(self, database_link, query, options=None, response_hook=None):
+        """Queries collections in a database.
+
+        :param str database_link:
+            The link to the database.
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+
+        :return: Query Iterable of Collections.
+        :rtype:
+            QueryIterable
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(database_link, 'colls')
+        database_id = base.GetResourceIdOrFullNameFromLink(database_link)
+        async def fetch_fn(options):
+            return await self.__QueryFeed(path,
+                                          'colls',
+                                          database_id,
+                                          lambda r: r['DocumentCollections'],
+                                          query,
+                                          options,
+                                          response_hook=response_hook)
+        return QueryIterable(self, query, options, fetch_fn)
+
+    async def DeleteContainer(self, collection_link, options=None, response_hook=None):
+        """Deletes a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The deleted Collection.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(collection_link)
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        return await self.DeleteResource(path, 'colls', collection_id, None, options, response_hook)
+
+    def ReadItems(self, collection_link, feed_options=None, response_hook=None):
+        """Reads all documents in a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict feed_options:
+
+        :return:
+            Query Iterable of Documents.
+        :rtype:
+            QueryIterable
+
+        """
+        if feed_options is None:
+            feed_options = {}
+
+        return self.QueryItems(collection_link, None, feed_options, response_hook=response_hook)
+
+    def QueryItems(self, collection_link, query, options=None, response_hook=None):
+        """Queries documents in a collection.
+
+        The cross partition queries which the gateway can't serve are run against all the
+        target partition key ranges at the same time, as in the synchronous client.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+        :param response_hook:
+            A callable invoked with the response metadata of each page
+
+        :return:
+            Query Iterable of Documents.
+        :rtype:
+            QueryIterable
+
+        """
+        collection_link = base.TrimBeginningAndEndingSlashes(collection_link)
+
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(collection_link, 'docs')
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        async def fetch_fn(options):
+            return await self.__QueryFeed(path,
+                                          'docs',
+                                          collection_id,
+                                          lambda r: r['Documents'],
+                                          query,
+                                          options,
+                                          response_hook=response_hook)
+        return QueryIterable(self, query, options, fetch_fn, collection_link)
+
+    async def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
+        """Reads Partition Key Ranges.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict feed_options:
+        :param response_hook:
+            A callable invoked with the response metadata of each page
+
+        :return:
+            List of PartitionKeyRanges.
+        :rtype:
+            list
+
+        """
+        if feed_options is None:
+            feed_options = {}
+
+        path = base.GetPathFromLink(collection_link, 'pkranges')
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        async def fetch_fn(options):
+            return await self.__QueryFeed(path,
+                                          'pkranges',
+                                          collection_id,
+                                          lambda r: r['PartitionKeyRanges'],
+                                          None,
+                                          options,
+                                          response_hook=response_hook)
+        partition_key_ranges = []
+        async for partition_key_range in QueryIterable(self, None, feed_options, fetch_fn):
+            partition_key_ranges.append(partition_key_range)
+        return partition_key_ranges
+
+    async def CreateItem(self, collection_link, document, options=None, response_hook=None):
+        """Creates a document in a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict document:
+            The Azure Cosmos document to create.
+        :param dict options:
+            The request options for the request.
+        :param bool options['disableAutomaticIdGeneration']:
+            Disables the automatic id generation. If id is missing in the body and this
+            option is true, an error will be returned.
+
+        :return:
+            The created Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        options = await self._AddPartitionKey(collection_link, document, options)
+        collection_id, document, path = self._GetContainerIdWithPathForItem(collection_link, document, options)
+        return await self.Create(document, path, 'docs', collection_id, None, options, response_hook)
+
+    async def UpsertItem(self, collection_link, document, options=None, response_hook=None):
+        """Upserts a document in a collection.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param dict document:
+            The Azure Cosmos document to upsert.
+        :param dict options:
+            The request options for the request.
+        :param bool options['disableAutomaticIdGeneration']:
+            Disables the automatic id generation. If id is missing in the body and this
+            option is true, an error will be returned.
+
+        :return:
+            The upserted Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        options = await self._AddPartitionKey(collection_link, document, options)
+        collection_id, document, path = self._GetContainerIdWithPathForItem(collection_link, document, options)
+        return await self.Upsert(document, path, 'docs', collection_id, None, options, response_hook)
+
+    # Gets the collection id and path for the document
+    def _GetContainerIdWithPathForItem(self, collection_link, document, options):
+
+        if not collection_link:
+            raise ValueError("collection_link is None or empty.")
+
+        if document is None:
+            raise ValueError("document is None.")
+
+        CosmosClientConnection._ValidateResource(document)
+        document = document.copy()
+        if (not document.get('id') and
+            not options.get('disableAutomaticIdGeneration')):
+            document['id'] = base.GenerateGuidId()
+
+        path = base.GetPathFromLink(collection_link, 'docs')
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        return collection_id, document, path
+
+    async def ReadItem(self, document_link, options=None, response_hook=None):
+        """Reads a document.
+
+        :param str document_link:
+            The link to the document.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The read Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(document_link)
+        document_id = base.GetResourceIdOrFullNameFromLink(document_link)
+        return await self.Read(path, 'docs', document_id, None, options, response_hook)
+
+    async def ReplaceItem(self, document_link, new_document, options=None, response_hook=None):
+        """Replaces a document and returns it.
+
+        :param str document_link:
+            The link to the document.
+        :param dict new_document:
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The new Document.
+        :rtype:
+            dict
+
+        """
+        CosmosClientConnection._ValidateResource(new_document)
+        path = base.GetPathFromLink(document_link)
+        document_id = base.GetResourceIdOrFullNameFromLink(document_link)
+
+        if options is None:
+            options = {}
+
+        # Extract the document collection link and add the partition key to options
+        collection_link = base.GetItemContainerLink(document_link)
+        options = await self._AddPartitionKey(collection_link, new_document, options)
+
+        return await self.Replace(new_document, path, 'docs', document_id, None, options, response_hook)
+
+    async def DeleteItem(self, document_link, options=None, response_hook=None):
+        """Deletes a document.
+
+        :param str document_link:
+            The link to the document.
+        :param dict options:
+            The request options for the request.
+
+        :return:
+            The deleted Document.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(document_link)
+        document_id = base.GetResourceIdOrFullNameFromLink(document_link)
+        return await self.DeleteResource(path, 'docs', document_id, None, options, response_hook)
+
+    async def Create(self, body, path, type, id, initial_headers, options=None, response_hook=None):
+        """Creates a Azure Cosmos resource and returns it.
+
+        :param dict body:
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+        :param response_hook:
+            A callable invoked with the response metadata
+
+        :return:
+            The created Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        initial_headers = initial_headers or self.default_headers
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'post',
+                                  path,
+                                  id,
+                                  type,
+                                  options)
+        # Create will use WriteEndpoint since it uses POST operation
+        request = request_object._RequestObject(type, documents._OperationType.Create)
+        result, response_headers = await self.__Post(path,
+                                                     request,
+                                                     body,
+                                                     headers)
+
+        # update session for write request
+        self._UpdateSessionIfRequired(headers, result, response_headers)
+        if response_hook:
+            response_hook(response_headers, result)
+        return result
+
+    async def Upsert(self, body, path, type, id, initial_headers, options=None, response_hook=None):
+        """Upserts a Azure Cosmos resource and returns it.
+
+        :param dict body:
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+        :param response_hook:
+            A callable invoked with the response metadata
+
+        :return:
+            The upserted Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        initial_headers = initial_headers or self.default_headers
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'post',
+                                  path,
+                                  id,
+                                  type,
+                                  options)
+
+        headers[http_constants.HttpHeaders.IsUpsert] = True
+
+        # Upsert will use WriteEndpoint since it uses POST operation
+        request = request_object._RequestObject(type, documents._OperationType.Upsert)
+        result, response_headers = await self.__Post(path,
+                                                     request,
+                                                     body,
+                                                     headers)
+        # update session for write request
+        self._UpdateSessionIfRequired(headers, result, response_headers)
+        if response_hook:
+            response_hook(response_headers, result)
+        return result
+
+    async def Replace(self, resource, path, type, id, initial_headers, options=None, response_hook=None):
+        """Replaces a Azure Cosmos resource and returns it.
+
+        :param dict resource:
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+        :param response_hook:
+            A callable invoked with the response metadata
+
+        :return:
+            The new Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        initial_headers = initial_headers or self.default_headers
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'put',
+                                  path,
+                                  id,
+                                  type,
+                                  options)
+        # Replace will use WriteEndpoint since it uses PUT operation
+        request = request_object._RequestObject(type, documents._OperationType.Replace)
+        result, response_headers = await self.__Put(path,
+                                                    request,
+                                                    resource,
+                                                    headers)
+
+        # update session for request mutates data on server side
+        self._UpdateSessionIfRequired(headers, result, response_headers)
+        if response_hook:
+            response_hook(response_headers, result)
+        return result
+
+    async def Read(self, path, type, id, initial_headers, options=None, response_hook=None):
+        """Reads a Azure Cosmos resource and returns it.
+
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+        :param response_hook:
+            A callable invoked with the response metadata
+
+        :return:
+            The read Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        initial_headers = initial_headers or self.default_headers
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'get',
+                                  path,
+                                  id,
+                                  type,
+                                  options)
+        # Read will use ReadEndpoint since it uses GET operation
+        request = request_object._RequestObject(type, documents._OperationType.Read)
+        result, response_headers = await self.__Get(path,
+                                                    request,
+                                                    headers)
+        if response_hook:
+            response_hook(response_headers, result)
+        return result
+
+    async def DeleteResource(self, path, type, id, initial_headers, options=None, response_hook=None):
+        """Deletes a Azure Cosmos resource and returns it.
+
+        :param str path:
+        :param str type:
+        :param str id:
+        :param dict initial_headers:
+        :param dict options:
+            The request options for the request.
+        :param response_hook:
+            A callable invoked with the response metadata
+
+        :return:
+            The deleted Azure Cosmos resource.
+        :rtype:
+            dict
+
+        """
+        if options is None:
+            options = {}
+
+        initial_headers = initial_headers or self.default_headers
+        headers = base.GetHeaders(self,
+                                  initial_headers,
+                                  'delete',
+                                  path,
+                                  id,
+                                  type,
+                                  options)
+        # Delete will use WriteEndpoint since it uses DELETE operation
+        request = request_object._RequestObject(type, documents._OperationType.Delete)
+        result, response_headers = await self.__Delete(path,
+                                                       request,
+                                                       headers)
+
+        # update session for request mutates data on server side
+        self._UpdateSessionIfRequired(headers, result, response_headers)
+        if response_hook:
+            response_hook(response_headers, result)
+        return result
+
+    async def __Request(self, method, path, request, body, headers):
+        """Azure Cosmos http request, sent once the database account has been read.
+
+        :return:
+            Tuple of (result, headers).
+        :rtype:
+            tuple of (dict, dict)
+
+        """
+        if request.resource_type != 'databaseaccount':
+            await self._initialize()
+        if self._aiohttp_session is None:
+            self._aiohttp_session = aiohttp.ClientSession()
+        return await _asynchronous_request.AsynchronousRequest(self,
+                                                               request,
+                                                               self._global_endpoint_manager,
+                                                               self.connection_policy,
+                                                               self._aiohttp_session,
+                                                               method,
+                                                               path,
+                                                               body,
+                                                               None,
+                                                               headers)
+
+    async def __Get(self, path, request, headers):
+        """Azure Cosmos 'GET' http request.
+
+        :return:
+            Tuple of (result, headers).
+        :rtype:
+            tuple of (dict, dict)
+
+        """
+        return await self.__Request('GET', path, request, None, headers)
+
+    async def __Post(self, path, request, body, headers):
+        """Azure Cosmos 'POST' http request.
+
+        :return:
+            Tuple of (result, headers).
+        :rtype:
+            tuple of (dict, dict)
+
+        """
+        return await self.__Request('POST', path, request, body, headers)
+
+    async def __Put(self, path, request, body, headers):
+        """Azure Cosmos 'PUT' http request.
+
+        :return:
+            Tuple of (result, headers).
+        :rtype:
+            tuple of (dict, dict)
+
+        """
+        return await self.__Request('PUT', path, request, body, headers)
+
+    async def __Delete(self, path, request, headers):
+        """Azure Cosmos 'DELETE' http request.
+
+        :return:
+            Tuple of (result, headers).
+        :rtype:
+            tuple of (dict, dict)
+
+        """
+        return await self.__Request('DELETE', path, request, None, headers)
+
+    async def QueryFeed(self, path, collection_id, query, options, partition_key_range_id=None):
+        """Query Feed for Document Collection resource.
+
+        :param str path:
+            Path to the document collection.
+        :param str collection_id:
+            Id of the document collection.
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+        :param str partition_key_range_id:
+            Partition key range id.
+        :return:
+            Tuple of (documents, headers).
+        :rtype:
+            tuple
+
+        """
+        return await self.__QueryFeed(path,
+                                      'docs',
+                                      collection_id,
+                                      lambda r: r['Documents'],
+                                      query,
+                                      options,
+                                      partition_key_range_id)
+
+    async def __QueryFeed(self,
+                          path,
+                          type,
+                          id,
+                          result_fn,
+                          query,
+                          options=None,
+                          partition_key_range_id=None,
+                          response_hook=None):
+        """Query for more than one Azure Cosmos resources.
+
+        :param str path:
+        :param str type:
+        :param str id:
+        :param function result_fn:
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+        :param str partition_key_range_id:
+            Specifies partition key range id.
+        :param response_hook:
+            A callable invoked with the response metadata
+
+        :return:
+            Tuple of (resources, headers).
+        :rtype:
+            tuple of (list, dict)
+
+        """
+        if options is None:
+            options = {}
+
+        # Copy to make sure that default_headers won't be changed.
+        initial_headers = self.default_headers.copy()
+        if query is None:
+            # Query operations will use ReadEndpoint even though it uses GET(for feed requests)
+            request = request_object._RequestObject(type, documents._OperationType.ReadFeed)
+            headers = base.GetHeaders(self,
+                                      initial_headers,
+                                      'get',
+                                      path,
+                                      id,
+                                      type,
+                                      options,
+                                      partition_key_range_id)
+            try:
+                result, response_headers = await self.__Get(path,
+                                                            request,
+                                                            headers)
+            except errors.HTTPFailure as e:
+                self._InvalidateRoutingMapIfPartitionKeyRangeGone(e, id)
+                raise
+        else:
+            query = CosmosClientConnection._CheckAndUnifyQueryFormat(query)
+
+            initial_headers[http_constants.HttpHeaders.IsQuery] = 'true'
+            initial_headers[http_constants.HttpHeaders.ContentType] = runtime_constants.MediaTypes.QueryJson
+
+            # Query operations will use ReadEndpoint even though it uses POST(for regular query operations)
+            request = request_object._RequestObject(type, documents._OperationType.SqlQuery)
+            headers = base.GetHeaders(self,
+                                      initial_headers,
+                                      'post',
+                                      path,
+                                      id,
+                                      type,
+                                      options,
+                                      partition_key_range_id)
+            try:
+                result, response_headers = await self.__Post(path,
+                                                             request,
+                                                             query,
+                                                             headers)
+            except errors.HTTPFailure as e:
+                self._InvalidateRoutingMapIfPartitionKeyRangeGone(e, id)
+                raise
+
+        if response_hook:
+            response_hook(response_headers, result)
+
+        # If there is no change feed, the result data is empty and result is None.
+        # This case should be interpreted as an empty array.
+        return (result_fn(result) if result is not None else []), response_headers
+
+    @staticmethod
+    def _CheckAndUnifyQueryFormat(query_body):
+        """Checks and unifies the format of the query body.
+
+        :raises TypeError: If query_body is not of expected type.
+        :raises ValueError: If query_body is a dict but doesn\'t have valid query text.
+
+        :param (str or dict) query_body:
+
+        :return:
+            The formatted query body.
+        :rtype:
+            dict
+        """
+        if not isinstance(query_body, dict) and not isinstance(query_body, str):
+            raise TypeError('query body must be a dict or string.')
+        if isinstance(query_body, dict) and not query_body.get('query'):
+            raise ValueError('query body must have valid query text with key "query".')
+        if isinstance(query_body, str):
+            return {'query': query_body}
+        return query_body
+
+    @staticmethod
+    def _ValidateResource(resource):
+        id = resource.get('id')
+        if id:
+            if id.find('/') != -1 or id.find('\\') != -1 or id.find('?') != -1 or id.find('#') != -1:
+                raise ValueError('Id contains illegal chars.')
+
+            if id[-1] == ' ':
+                raise ValueError('Id ends with a space.')
+
+    async def _GetPartitionKeyDefinition(self, collection_link):
+        collection_link = base.TrimBeginningAndEndingSlashes(collection_link)
+
+        # If the document collection link is present in the cache, then use the cached partitionkey definition
+        if collection_link in self.partition_key_definition_cache:
+            return self.partition_key_definition_cache.get(collection_link)
+        # Else read the collection from backend and add it to the cache
+        collection = await self.ReadContainer(collection_link)
+        partitionKeyDefinition = collection.get('partitionKey')
+        self.partition_key_definition_cache[collection_link] = partitionKeyDefinition
+        return partitionKeyDefinition
+
+    # Adds the partition key to options
+    async def _AddPartitionKey(self, collection_link, document, options):
+        partitionKeyDefinition = await self._GetPartitionKeyDefinition(collection_link)
+
+        # If the collection doesn't have a partition key definition, skip it as it's a legacy collection
+        if partitionKeyDefinition:
+            # If the user has passed in the partitionKey in options use that elase extract it from the document
+            if 'partitionKey' not in options:
+                partitionKeyValue = self._ExtractPartitionKey(partitionKeyDefinition, document)
+                options['partitionKey'] = partitionKeyValue
+
+        return options
+
+    # The partition key extraction, the session update and the routing map invalidation don't perform any I/O,
+    # and are the ones of the synchronous client
+    _ExtractPartitionKey = _CosmosClientConnection._ExtractPartitionKey
+    _retrieve_partition_key = _CosmosClientConnection._retrieve_partition_key
+    _UpdateSessionIfRequired = _CosmosClientConnection._UpdateSessionIfRequired
+    _InvalidateRoutingMapIfPartitionKeyRangeGone = _CosmosClientConnection._InvalidateRoutingMapIfPartitionKeyRangeGone
+    _return_undefined_or_empty_partition_key = staticmethod(_CosmosClientConnection._return_undefined_or_empty_partition_key)
@@ -0,0 +1,524 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Internal classes for asynchronous query execution context implementation in the Azure Cosmos database service.
+
+The execution contexts mirror the ones of azure.cosmos.execution_context, with coroutines
+returning the next query result, and raising StopAsyncIteration when no more result is left.
+"""
+
+import asyncio
+import heapq
+import json
+from collections import deque
+
+from .. import base
+from .. import http_constants
+from ..errors import HTTPFailure
+from ..execution_context import document_producer
+from ..execution_context import endpoint_component
+from ..execution_context.query_execution_info import _PartitionedQueryExecutionInfo
+from ..http_constants import StatusCodes, SubStatusCodes
+from ..routing import routing_range
+
+class _QueryExecutionContextBase(object):
+    """
+    This is the abstract base execution context class.
+    """
+    def __init__(self, client, options):
+        """
+        Constructor
+
+        :param CosmosClientConnection client:
+        :param dict options:
+            The request options for the request.
+
+        """
+        self._client = client
+        self._options = options
+        self._is_change_feed = 'changeFeed' in options and options['changeFeed'] is True
+        self._continuation = None
+        if 'continuation' in options and self._is_change_feed:
+            self._continuation = options['continuation']
+        self._has_started = False
+        self._has_finished = False
+        self._buffer = deque()
+
+    def _has_more_pages(self):
+        return not self._has_started or self._continuation
+
+    async def fetch_next_block(self):
+        """Returns a block of results.
+
+        :return:
+            List of results.
+        :rtype: list
+        """
+        if not self._has_more_pages():
+            return []
+
+        if len(self._buffer):
+            # if there is anything in the buffer returns that
+            res = list(self._buffer)
+            self._buffer.clear()
+            return res
+        # fetches the next block
+        return await self._fetch_next_block()
+
+    async def _fetch_next_block(self):
+        raise NotImplementedError
+
+    async def next(self):
+        """Returns the next query result.
+
+        :return:
+            The next query result.
+        :rtype: dict
+        :raises StopAsyncIteration: If no more result is left.
+        """
+        if self._has_finished:
+            raise StopAsyncIteration
+
+        if not len(self._buffer):
+            results = await self.fetch_next_block()
+            self._buffer.extend(results)
+
+        if not len(self._buffer):
+            raise StopAsyncIteration
+
+        return self._buffer.popleft()
+
+    async def _fetch_items_helper(self, fetch_function):
+        """Fetches more items. The requests of fetch_function are retried by the retry policies.
+
+        :return:
+            List of fetched items.
+        :rtype: list
+        """
+        fetched_items = []
+        # Continues pages till finds a non empty page or all results are exhausted
+        while self._continuation or not self._has_started:
+            if not self._has_started:
+                self._has_started = True
+            self._options['continuation'] = self._continuation
+            (fetched_items, response_headers) = await fetch_function(self._options)
+            continuation_key = http_constants.HttpHeaders.Continuation
+            # Use Etag as continuation token for change feed queries.
+            if self._is_change_feed:
+                continuation_key = http_constants.HttpHeaders.ETag
+            # In change feed queries, the continuation token is always populated. The hasNext() test is whether
+            # there is any items in the response or not.
+            if not self._is_change_feed or len(fetched_items) > 0:
+                self._continuation = response_headers.get(continuation_key)
+            else:
+                self._continuation = None
+            if fetched_items:
+                break
+        return fetched_items
+
+class _DefaultQueryExecutionContext(_QueryExecutionContextBase):
+    """
+    This is the default execution context.
+    """
+    def __init__(self, client, options, fetch_function):
+        """
+        Constructor
+
+        :param CosmosClientConnection client:
+        :param dict options:
+            The request options for the request.
+        :param method fetch_function:
+            Coroutine function invoked for retrieving each page, which returns a tuple of (items, headers).
+
+        """
+        super(_DefaultQueryExecutionContext, self).__init__(client, options)
+        self._fetch_function = fetch_function
+
+    async def _fetch_next_block(self):
+        if self._has_more_pages() and len(self._buffer) == 0:
+            return await self._fetch_items_helper(self._fetch_function)
+        return []
+
+class _ProxyQueryExecutionContext(_QueryExecutionContextBase):
+    '''
+    This class represents a proxy execution context wrapper:
+        - By default uses _DefaultQueryExecutionContext
+        - if backend responds a 400 error code with a Query Execution Info
+            it switches to _MultiExecutionContextAggregator
+    '''
+    def __init__(self, client, resource_link, query, options, fetch_function):
+        '''
+        Constructor
+        '''
+        super(_ProxyQueryExecutionContext, self).__init__(client, options)
+
+        self._execution_context = _DefaultQueryExecutionContext(client, options, fetch_function)
+        self._resource_link = resource_link
+        self._query = query
+        self._fetch_function = fetch_function
+
+    async def next(self):
+        """Returns the next query result.
+
+        :return:
+            The next query result.
+        :rtype: dict
+        :raises StopAsyncIteration: If no more result is left.
+
+        """
+        try:
+            return await self._execution_context.next()
+        except HTTPFailure as e:
+            if self._is_partitioned_execution_info(e):
+                query_execution_info = self._get_partitioned_execution_info(e)
+                self._execution_context = await self._create_pipelined_execution_context(query_execution_info)
+            else:
+                raise e
+
+        return await self._execution_context.next()
+
+    async def fetch_next_block(self):
+        """Returns a block of results.
+
+        :return:
+            List of results.
+        :rtype: list
+        """
+        try:
+            return await self._execution_context.fetch_next_block()
+        except HTTPFailure as e:
+            if self._is_partitioned_execution_info(e):
+                query_execution_info = self._get_partitioned_execution_info(e)
+                self._execution_context = await self._create_pipelined_execution_context(query_execution_info)
+            else:
+                raise e
+
+        return await self._execution_context.fetch_next_block()
+
+    def _is_partitioned_execution_info(self, e):
+        return e.status_code == StatusCodes.BAD_REQUEST and e.sub_status == SubStatusCodes.CROSS_PARTITION_QUERY_NOT_SERVABLE
+
+    def _get_partitioned_execution_info(self, e):
+        error_msg = json.loads(e._http_error_message)
+        return _PartitionedQueryExecutionInfo(json.loads(error_msg['additionalErrorInfo']))
+
+    async def _create_pipelined_execution_context(self, query_execution_info):
+
+        assert self._resource_link, "code bug, resource_link has is required."
+        execution_context_aggregator = _MultiExecutionContextAggregator(self._client, self._resource_link, self._query, self._options, query_execution_info)
+        await execution_context_aggregator._start()
+        return _PipelineExecutionContext(self._client, self._options, execution_context_aggregator, query_execution_info)
+
+class _PipelineExecutionContext(_QueryExecutionContextBase):
+    """Applies the order by, top and aggregate endpoint components to the results of an aggregator.
+
+    The aggregates are computed by the endpoint component of the synchronous client, once all
+    the results have been fetched.
+    """
+
+    DEFAULT_PAGE_SIZE = 1000
+
+    def __init__(self, client, options, execution_context, query_execution_info):
+        '''
+        Constructor
+        '''
+        super(_PipelineExecutionContext, self).__init__(client, options)
+
+        if options.get('maxItemCount'):
+            self._page_size = options['maxItemCount']
+        else:
+            self._page_size = _PipelineExecutionContext.DEFAULT_PAGE_SIZE
+
+        self._execution_context = execution_context
+        self._order_by = query_execution_info.get_order_by()
+        self._top = query_execution_info.get_top()
+        self._aggregates = query_execution_info.get_aggregates()
+        self._aggregate_endpoint = None
+
+    async def _next_result(self):
+        if self._top is not None:
+            if self._top <= 0:
+                raise StopAsyncIteration
+            self._top -= 1
+        res = await self._execution_context.next()
+        if self._order_by:
+            res = res['payload']
+        return res
+
+    async def next(self):
+        """Returns the next query result.
+
+        :return:
+            The next query result.
+        :rtype: dict
+        :raises StopAsyncIteration: If no more result is left.
+
+        """
+        if not self._aggregates:
+            return await self._next_result()
+
+        if self._aggregate_endpoint is None:
+            results = []
+            while True:
+                try:
+                    results.append(await self._next_result())
+                except StopAsyncIteration:
+                    break
+            self._aggregate_endpoint = endpoint_component._QueryExecutionAggregateEndpointComponent(
+                iter(results), self._aggregates)
+        try:
+            return next(self._aggregate_endpoint)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def fetch_next_block(self):
+        """Returns a block of results.
+
+        This method internally invokes next() as many times required to collect the
+        requested fetch size.
+
+        :return:
+            List of results.
+        :rtype: list
+        """
+        results = []
+        for _ in range(self._page_size):
+            try:
+                results.append(await self.next())
+            except StopAsyncIteration:
+                # no more results
+                break
+        return results
+
+class _DocumentProducer(object):
+    '''This class takes care of handling of the results for one single partition key range.
+
+    The pages of the partition key range are fetched in the background: the next page is
+    requested as soon as the current one is buffered, so that at most one page is buffered
+    and one is in flight for each partition key range. The semaphore, if any, is shared by the
+    document producers of a query, and bounds the number of pages fetched at the same time.
+    '''
+    def __init__(self, partition_key_target_range, client, collection_link, query, document_producer_comp,
+                 semaphore=None):
+        '''
+        Constructor
+        '''
+        self._options = {}
+        self._partition_key_target_range = partition_key_target_range
+        self._doc_producer_comp = document_producer_comp
+        self._client = client
+        self._buffer = deque()
+        self._is_finished = False
+        self._cur_item = None
+        self._semaphore = semaphore
+        self._prefetch = None
+
+        path = base.GetPathFromLink(collection_link, 'docs')
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        async def fetch_fn(options):
+            return await self._client.QueryFeed(path,
+                                                collection_id,
+                                                query,
+                                                options,
+                                                partition_key_target_range['id'])
+
+        self._ex_context = _DefaultQueryExecutionContext(client, self._options, fetch_fn)
+
+    def get_target_range(self):
+        """Returns the target partition key range.
+            :return:
+                Target partition key range.
+            :rtype: dict
+        """
+        return self._partition_key_target_range
+
+    async def _fetch_page(self):
+        if self._semaphore is None:
+            return await self._ex_context.fetch_next_block()
+        async with self._semaphore:
+            return await self._ex_context.fetch_next_block()
+
+    def start_prefetch(self):
+        """Starts fetching the next page in the background, unless a page is already in flight
+        or there are no more results.
+        """
+        if self._prefetch is not None or self._is_finished:
+            return
+        self._prefetch = asyncio.ensure_future(self._fetch_page())
+
+    def cancel_prefetch(self):
+        """Cancels the page in flight, if any."""
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+
+    async def _next_item(self):
+        if not self._buffer and not self._is_finished:
+            self.start_prefetch()
+            prefetch, self._prefetch = self._prefetch, None
+            page = await prefetch
+            if page:
+                self._buffer.extend(page)
+                self.start_prefetch()
+            else:
+                self._is_finished = True
+
+        if not self._buffer:
+            raise StopAsyncIteration
+        return self._buffer.popleft()
+
+    async def next(self):
+        """
+        :return: The next result item.
+        :rtype: dict
+        :raises StopAsyncIteration: If there is no more result.
+
+        """
+        if self._cur_item is not None:
+            res = self._cur_item
+            self._cur_item = None
+            return res
+
+        return await self._next_item()
+
+    async def load(self):
+        """Loads the current result item, which peek() returns.
+
+        :raises StopAsyncIteration: If there is no more result.
+        """
+        if self._cur_item is None:
+            self._cur_item = await self._next_item()
+
+    def peek(self):
+        """
+        :return: The current result item, loaded by load().
+        :rtype: dict
+        """
+        return self._cur_item
+
+    def __lt__(self, other):
+        return self._doc_producer_comp.compare(self, other) < 0
+
+class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
+    """This class is capable of queries which requires rewriting based on
+    backend's returned query execution info.
+
+    This class maintains a _DocumentProducer per target partition key range and
+    aggregates their results, in the order of the query if it has an order by clause,
+    else range after range.
+
+    The first pages of all the target partition key ranges are requested at once, and each
+    _DocumentProducer then prefetches its next page. A 'maxDegreeOfParallelism' option greater
+    than 0 bounds the number of pages fetched at the same time.
+    """
+
+    def __init__(self, client, resource_link, query, options, partitioned_query_ex_info):
+        '''
+        Constructor
+        '''
+        super(_MultiExecutionContextAggregator, self).__init__(client, options)
+
+        # use the routing provider in the client
+        self._routing_provider = client._routing_map_provider
+        self._resource_link = resource_link
+        self._query = query
+        self._partitioned_query_ex_info = partitioned_query_ex_info
+        self._sort_orders = partitioned_query_ex_info.get_order_by()
+
+        if self._sort_orders:
+            self._document_producer_comparator = document_producer._OrderByDocumentProducerComparator(self._sort_orders)
+        else:
+            self._document_producer_comparator = document_producer._PartitionKeyRangeDocumentProduerComparator()
+
+        self._semaphore = None
+        max_degree_of_parallelism = options.get('maxDegreeOfParallelism')
+        if max_degree_of_parallelism is not None and max_degree_of_parallelism > 0:
+            self._semaphore = asyncio.Semaphore(max_degree_of_parallelism)
+
+        self._orderByPQ = []
+
+    async def _start(self):
+        """Requests the first page of all the target ranges at once, and waits for them."""
+        target_partition_ranges = await self._get_target_partition_key_ranges()
+        document_producers = [self._create_target_partition_query_execution_context(target_partition_range)
+                              for target_partition_range in target_partition_ranges]
+        for target_document_producer in document_producers:
+            target_document_producer.start_prefetch()
+
+        try:
+            for target_document_producer in document_producers:
+                try:
+                    await target_document_producer.load()
+                    # if there are matching results in the target ex range add it to the priority queue
+                    heapq.heappush(self._orderByPQ, target_document_producer)
+                except StopAsyncIteration:
+                    continue
+        except BaseException:
+            for target_document_producer in document_producers:
+                target_document_producer.cancel_prefetch()
+            raise
+
+    async def next(self):
+        """returns the next result
+
+        :return:
+            The next result.
+        :rtype: dict
+        :raises StopAsyncIteration: If no more result is left.
+
+        """
+        if self._orderByPQ:
+            target_document_producer = heapq.heappop(self._orderByPQ)
+            res = await target_document_producer.next()
+
+            try:
+                await target_document_producer.load()
+                heapq.heappush(self._orderByPQ, target_document_producer)
+            except StopAsyncIteration:
+                pass
+
+            return res
+        raise StopAsyncIteration
+
+    async def fetch_next_block(self):
+        raise NotImplementedError("You should use pipeline's fetch_next_block.")
+
+    def _create_target_partition_query_execution_context(self, partition_key_target_range):
+
+        rewritten_query = self._partitioned_query_ex_info.get_rewritten_query()
+        if rewritten_query:
+            if isinstance(self._query, dict):
+                # this is a parameterized query, collect all the parameters
+                query = dict(self._query)
+                query["query"] = rewritten_query
+            else:
+                query = rewritten_query
+        else:
+            query = self._query
+
+        return _DocumentProducer(partition_key_target_range, self._client, self._resource_link, query,
+                                 self._document_producer_comparator, self._semaphore)
+
+    async def _get_target_partition_key_ranges(self):
+
+        query_ranges = self._partitioned_query_ex_info.get_query_ranges()
+        return await self._routing_provider.get_overlapping_ranges(
+            self._resource_link, [routing_range._Range.ParseFromDict(range_as_dict) for range_as_dict in query_ranges])
@@ -0,0 +1,93 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Internal class for asynchronous global endpoint manager implementation in the Azure Cosmos database service.
+"""
+
+import asyncio
+
+from .. import errors
+from .. import global_endpoint_manager
+
+class _GlobalEndpointManager(global_endpoint_manager._GlobalEndpointManager):
+    """
+    This internal class implements the logic for endpoint management for geo-replicated
+    database accounts, reading the database account with the asynchronous client.
+
+    The requests sent while the endpoint list is being refreshed, including the ones
+    reading the database account for the refresh, don't wait for the refresh to complete.
+    """
+    def __init__(self, client):
+        super(_GlobalEndpointManager, self).__init__(client)
+        self.refresh_lock = None
+
+    async def force_refresh(self, database_account):
+        self.refresh_needed = True
+        await self.refresh_endpoint_list(database_account)
+
+    async def refresh_endpoint_list(self, database_account):
+        # if refresh is not needed or refresh is already taking place, return
+        if not self.refresh_needed:
+            return
+        if self.refresh_lock is None:
+            self.refresh_lock = asyncio.Lock()
+        if self.refresh_lock.locked():
+            return
+        async with self.refresh_lock:
+            await self._refresh_endpoint_list_private(database_account)
+
+    async def _refresh_endpoint_list_private(self, database_account=None):
+        if database_account:
+            self.location_cache.perform_on_database_account_read(database_account)
+            self.refresh_needed = False
+
+        if self.location_cache.should_refresh_endpoints() and self.location_cache.current_time_millis() - self.last_refresh_time > self.refresh_time_interval_in_ms:
+            if not database_account:
+                database_account = await self._GetDatabaseAccount()
+                self.location_cache.perform_on_database_account_read(database_account)
+                self.last_refresh_time = self.location_cache.current_time_millis()
+                self.refresh_needed = False
+
+    async def _GetDatabaseAccount(self):
+        """Gets the database account first by using the default endpoint, and if that doesn't returns
+           use the endpoints for the preferred locations in the order they are specified to get
+           the database account.
+        """
+        try:
+            return await self._GetDatabaseAccountStub(self.DefaultEndpoint)
+        # If for any reason(non-globaldb related), we are not able to get the database account from the above call to GetDatabaseAccount,
+        # we would try to get this information from any of the preferred locations that the user might have specified(by creating a locational endpoint)
+        # and keeping eating the exception until we get the database account and return None at the end, if we are not able to get that info from any endpoints
+        except errors.HTTPFailure:
+            for location_name in self.PreferredLocations:
+                locational_endpoint = _GlobalEndpointManager.GetLocationalEndpoint(self.DefaultEndpoint, location_name)
+                try:
+                    return await self._GetDatabaseAccountStub(locational_endpoint)
+                except errors.HTTPFailure:
+                    pass
+
+            return None
+
+    async def _GetDatabaseAccountStub(self, endpoint):
+        """Stub for getting database account from the client
+           which can be used for mocking purposes as well.
+        """
+        return await self.Client.GetDatabaseAccount(endpoint)
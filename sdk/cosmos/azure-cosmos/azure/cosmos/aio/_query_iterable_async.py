@@ -0,0 +1,92 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Asynchronous iterable query results in the Azure Cosmos database service.
+"""
+from . import _execution_context_async
+
+class QueryIterable(object):
+    """Represents an asynchronous iterable object of the query results.
+    QueryIterable is a wrapper for query execution context.
+
+    The results are iterated with ``async for``, or fetched block by block with
+    :meth:`fetch_next_block`.
+    """
+
+    def __init__(self, client, query, options, fetch_function, collection_link=None):
+        """
+        Instantiates a QueryIterable. _ProxyQueryExecutionContext will be used as the internal query execution context
+
+        :param CosmosClientConnection client:
+            Instance of the asynchronous document client.
+        :param (str or dict) query:
+        :param dict options:
+            The request options for the request.
+        :param method fetch_function:
+            Coroutine function invoked for retrieving each page.
+        :param str collection_link:
+            If this is a Document query/feed collection_link is required.
+
+        """
+        self._client = client
+        self.retry_options = client.connection_policy.RetryOptions
+        self._query = query
+        self._options = options
+        self._fetch_function = fetch_function
+        self._collection_link = collection_link
+        self._ex_context = None
+
+    def _create_execution_context(self):
+        """instantiates the internal query execution context.
+        """
+        return _execution_context_async._ProxyQueryExecutionContext(
+            self._client, self._collection_link, self._query, self._options, self._fetch_function)
+
+    def __aiter__(self):
+        """Makes this class asynchronously iterable.
+        """
+        return self.Iterator(self)
+
+    class Iterator(object):
+        def __init__(self, iterable):
+            self._iterable = iterable
+            self._ex_context = iterable._create_execution_context()
+
+        def __aiter__(self):
+            # Always returns self
+            return self
+
+        async def __anext__(self):
+            return await self._ex_context.next()
+
+    async def fetch_next_block(self):
+        """Returns a block of results.
+
+        :return:
+            List of results.
+        :rtype:
+            list
+        """
+        if self._ex_context is None:
+            # initiates execution context for the first time
+            self._ex_context = self._create_execution_context()
+
+        return await self._ex_context.fetch_next_block()
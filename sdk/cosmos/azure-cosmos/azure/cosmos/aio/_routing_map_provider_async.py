@@ -0,0 +1,77 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Internal class for asynchronous partition key range cache implementation in the Azure Cosmos database service.
+"""
+
+from .. import base
+from ..routing import routing_map_provider
+
+class _SmartRoutingMapProvider(routing_map_provider._SmartRoutingMapProvider):
+    """
+    _SmartRoutingMapProvider reading the partition key ranges of the collections with the asynchronous client.
+
+    The collection routing map is loaded asynchronously before its overlapping ranges are looked up,
+    and the lookups are the ones of the synchronous provider.
+    """
+    def __init__(self, client):
+        super(_SmartRoutingMapProvider, self).__init__(client)
+
+    async def get_overlapping_ranges(self, collection_link, sorted_ranges):
+        '''
+        Given the sorted ranges and a collection,
+        Returns the list of overlapping partition key ranges
+
+        :param str collection_link:
+            The collection link.
+        :param (list of routing_range._Range) sorted_ranges: The sorted list of non-overlapping ranges.
+        :return:
+            List of partition key ranges.
+        :rtype: list of dict
+        :raises ValueError: If two ranges in sorted_ranges overlap or if the list is not sorted
+        '''
+        await self._load_routing_map(collection_link)
+        return super(_SmartRoutingMapProvider, self).get_overlapping_ranges(collection_link, sorted_ranges)
+
+    async def _load_routing_map(self, collection_link):
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        self._evict_unused_routing_maps()
+
+        if self._get_cached_routing_map(collection_id) is None:
+            previous_routing_map = self._collection_routing_map_by_item.get(collection_id)
+            collection_routing_map = await self._read_routing_map(collection_link, collection_id, previous_routing_map)
+            if collection_routing_map is None:
+                # some of the changes since the etag of the cached routing map are missing
+                self._record('full_refreshes')
+                await self._read_routing_map(collection_link, collection_id, None)
+
+    async def _read_routing_map(self, collection_link, collection_id, previous_routing_map):
+        response_headers = {}
+        collection_pk_ranges = await self._documentClient._ReadPartitionKeyRanges(
+            collection_link,
+            self._get_change_feed_options(previous_routing_map),
+            response_hook=lambda headers, _: response_headers.update(headers))
+        return self._update_routing_map(collection_id, previous_routing_map, collection_pk_ranges, response_headers)
+
+    def _get_routing_map(self, collection_link):
+        # the routing map is always loaded by _load_routing_map first
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        return self._collection_routing_map_by_item[collection_id]
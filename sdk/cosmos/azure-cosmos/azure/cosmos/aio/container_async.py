@@ -0,0 +1,495 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Create, read, update and delete items in the Azure Cosmos DB SQL API service, asynchronously.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+
+from ..partition_key import NonePartitionKeyValue
+from ._cosmos_client_connection_async import CosmosClientConnection
+from ._query_iterable_async import QueryIterable
+
+__all__ = (
+    'Container',
+)
+
+class Container(object):
+    """ An Azure Cosmos DB container, whose operations are performed asynchronously.
+
+    A container in an Azure Cosmos DB SQL API database is a collection of documents, each of which represented as an Item.
+
+    :ivar str id: ID (name) of the container
+
+    .. note::
+
+        To create a new container in an existing database, use :func:`Database.create_container`.
+
+    """
+
+    def __init__(self, client_connection, database_link, id, properties=None):
+        # type: (CosmosClientConnection, str, str, Dict[str, Any]) -> None
+        self.client_connection = client_connection
+        self.id = id
+        self._properties = properties
+        self.container_link = u"{}/colls/{}".format(database_link, self.id)
+        self._is_system_key = None
+
+    async def _get_properties(self):
+        # type: () -> Dict[str, Any]
+        if self._properties is None:
+            await self.read()
+        return self._properties
+
+    async def _get_is_system_key(self):
+        # type: () -> bool
+        if self._is_system_key is None:
+            properties = await self._get_properties()
+            self._is_system_key = (properties['partitionKey']['systemKey']
+                                   if 'systemKey' in properties['partitionKey'] else False)
+        return self._is_system_key
+
+    def _get_document_link(self, item_or_link):
+        # type: (Union[Dict[str, Any], str]) -> str
+        if isinstance(item_or_link, str):
+            return u"{}/docs/{}".format(self.container_link, item_or_link)
+        return item_or_link["_self"]
+
+    async def _set_partition_key(self, partition_key):
+        if partition_key == NonePartitionKeyValue:
+            return CosmosClientConnection._return_undefined_or_empty_partition_key(await self._get_is_system_key())
+        return partition_key
+
+    async def read(
+        self,
+        session_token=None,
+        initial_headers=None,
+        populate_query_metrics=None,
+        populate_partition_key_range_statistics=None,
+        populate_quota_info=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (str, Dict[str, str], bool, bool, bool, Dict[str, Any], Optional[Callable]) -> Dict[str, Any]
+        """ Read the container properties
+
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param populate_partition_key_range_statistics: Enable returning partition key range statistics in response headers.
+        :param populate_quota_info: Enable returning collection storage quota information in response headers.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :raise `HTTPFailure`: Raised if the container couldn't be retrieved. This includes if the container does not exist.
+        :returns: Dict representing the retrieved container.
+
+        """
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+        if populate_partition_key_range_statistics is not None:
+            request_options["populatePartitionKeyRangeStatistics"] = populate_partition_key_range_statistics
+        if populate_quota_info is not None:
+            request_options["populateQuotaInfo"] = populate_quota_info
+
+        self._properties = await self.client_connection.ReadContainer(
+            self.container_link, options=request_options, response_hook=response_hook
+        )
+        return self._properties
+
+    async def read_item(
+        self,
+        item,
+        partition_key,
+        session_token=None,
+        initial_headers=None,
+        populate_query_metrics=None,
+        post_trigger_include=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (Union[str, Dict[str, Any]], Any, str, Dict[str, str], bool, str, Dict[str, Any], Optional[Callable]) -> Dict[str, str]
+        """
+        Get the item identified by `id`.
+
+        :param item: The ID (name) or dict representing item to retrieve.
+        :param partition_key: Partition key for the item to retrieve.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param post_trigger_include: trigger id to be used as post operation trigger.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :returns: Dict representing the item to be retrieved.
+        :raise `HTTPFailure`: If the given item couldn't be retrieved.
+
+        """
+        doc_link = self._get_document_link(item)
+
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        if partition_key:
+            request_options["partitionKey"] = await self._set_partition_key(partition_key)
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+        if post_trigger_include:
+            request_options["postTriggerInclude"] = post_trigger_include
+
+        return await self.client_connection.ReadItem(
+            document_link=doc_link, options=request_options, response_hook=response_hook
+        )
+
+    def read_all_items(
+        self,
+        max_item_count=None,
+        session_token=None,
+        initial_headers=None,
+        populate_query_metrics=None,
+        feed_options=None,
+        response_hook=None
+    ):
+        # type: (int, str, Dict[str, str], bool, Dict[str, Any], Optional[Callable]) -> QueryIterable
+        """ List all items in the container.
+
+        :param max_item_count: Max number of items to be returned in the enumeration operation.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param feed_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata of each page
+        :returns: A :class:`QueryIterable` instance representing an asynchronous iterable of items (dicts).
+        """
+        if not feed_options:
+            feed_options = {} # type: Dict[str, Any]
+        if max_item_count is not None:
+            feed_options["maxItemCount"] = max_item_count
+        if session_token:
+            feed_options["sessionToken"] = session_token
+        if initial_headers:
+            feed_options["initialHeaders"] = initial_headers
+        if populate_query_metrics is not None:
+            feed_options["populateQueryMetrics"] = populate_query_metrics
+
+        return self.client_connection.ReadItems(
+            collection_link=self.container_link, feed_options=feed_options, response_hook=response_hook
+        )
+
+    def query_items(
+        self,
+        query,
+        parameters=None,
+        partition_key=None,
+        enable_cross_partition_query=None,
+        max_item_count=None,
+        session_token=None,
+        initial_headers=None,
+        enable_scan_in_query=None,
+        populate_query_metrics=None,
+        feed_options=None,
+        response_hook=None,
+        max_degree_of_parallelism=None
+    ):
+        # type: (str, List, Any, bool, int, str, Dict[str, str], bool, bool, Dict[str, Any], Optional[Callable], int) -> QueryIterable
+        """Return all results matching the given `query`.
+
+        The cross partition queries which the gateway can't serve, such as the ones with an order by
+        clause, are sent to all the target partition key ranges at the same time.
+
+        :param query: The Azure Cosmos DB SQL query to execute.
+        :param parameters: Optional array of parameters to the query. Ignored if no query is provided.
+        :param partition_key: Specifies the partition key value for the item. The partition key
+        :data:`azure.cosmos.partition_key.NonePartitionKeyValue` isn't supported, as no request is sent
+        before the results are iterated.
+        :param enable_cross_partition_query: Allows sending of more than one request to execute the query in the Azure Cosmos DB service.
+        More than one request is necessary if the query is not scoped to single partition key value.
+        :param max_item_count: Max number of items to be returned in the enumeration operation.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param enable_scan_in_query: Allow scan on the queries which couldn't be served as indexing was opted out on the requested paths.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param feed_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata of each page
+        :param max_degree_of_parallelism: The number of pages a cross partition query fetches at the same time.
+        By default, pages are fetched from all the target partition key ranges at once.
+        :returns: A :class:`QueryIterable` instance representing an asynchronous iterable of items (dicts).
+
+        """
+        if not feed_options:
+            feed_options = {} # type: Dict[str, Any]
+        if enable_cross_partition_query is not None:
+            feed_options["enableCrossPartitionQuery"] = enable_cross_partition_query
+        if max_item_count is not None:
+            feed_options["maxItemCount"] = max_item_count
+        if session_token:
+            feed_options["sessionToken"] = session_token
+        if initial_headers:
+            feed_options["initialHeaders"] = initial_headers
+        if populate_query_metrics is not None:
+            feed_options["populateQueryMetrics"] = populate_query_metrics
+        if partition_key is not None:
+            if partition_key == NonePartitionKeyValue:
+                raise ValueError("NonePartitionKeyValue isn't supported by the queries of the asynchronous client.")
+            feed_options["partitionKey"] = partition_key
+        if enable_scan_in_query is not None:
+            feed_options["enableScanInQuery"] = enable_scan_in_query
+        if max_degree_of_parallelism is not None:
+            feed_options["maxDegreeOfParallelism"] = max_degree_of_parallelism
+
+        return self.client_connection.QueryItems(
+            collection_link=self.container_link,
+            query=query
+            if parameters is None
+            else dict(query=query, parameters=parameters),
+            options=feed_options,
+            response_hook=response_hook
+        )
+
+    async def replace_item(
+        self,
+        item,
+        body,
+        session_token=None,
+        initial_headers=None,
+        access_condition=None,
+        populate_query_metrics=None,
+        pre_trigger_include=None,
+        post_trigger_include=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (Union[str, Dict[str, Any]], Dict[str, Any], str, Dict[str, str], Dict[str, str], bool, str, str, Dict[str, Any], Optional[Callable]) -> Dict[str, str]
+        """ Replaces the specified item if it exists in the container.
+
+        :param item: The ID (name) or dict representing item to be replaced.
+        :param body: A dict-like object representing the item to replace.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param access_condition: Conditions Associated with the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param pre_trigger_include: trigger id to be used as pre operation trigger.
+        :param post_trigger_include: trigger id to be used as post operation trigger.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :returns: A dict representing the item after replace went through.
+        :raise `HTTPFailure`: If the replace failed or the item with given id does not exist.
+
+        """
+        item_link = self._get_document_link(item)
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        request_options["disableIdGeneration"] = True
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if access_condition:
+            request_options["accessCondition"] = access_condition
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+        if pre_trigger_include:
+            request_options["preTriggerInclude"] = pre_trigger_include
+        if post_trigger_include:
+            request_options["postTriggerInclude"] = post_trigger_include
+
+        return await self.client_connection.ReplaceItem(
+            document_link=item_link,
+            new_document=body,
+            options=request_options,
+            response_hook=response_hook
+        )
+
+    async def upsert_item(
+        self,
+        body,
+        session_token=None,
+        initial_headers=None,
+        access_condition=None,
+        populate_query_metrics=None,
+        pre_trigger_include=None,
+        post_trigger_include=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (Dict[str, Any], str, Dict[str, str], Dict[str, str], bool, str, str, Dict[str, Any], Optional[Callable]) -> Dict[str, str]
+        """ Insert or update the specified item.
+
+        :param body: A dict-like object representing the item to update or insert.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param access_condition: Conditions Associated with the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param pre_trigger_include: trigger id to be used as pre operation trigger.
+        :param post_trigger_include: trigger id to be used as post operation trigger.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :returns: A dict representing the upserted item.
+        :raise `HTTPFailure`: If the given item could not be upserted.
+
+        If the item already exists in the container, it is replaced. If it does not, it is inserted.
+
+        """
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        request_options["disableIdGeneration"] = True
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if access_condition:
+            request_options["accessCondition"] = access_condition
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+        if pre_trigger_include:
+            request_options["preTriggerInclude"] = pre_trigger_include
+        if post_trigger_include:
+            request_options["postTriggerInclude"] = post_trigger_include
+
+        return await self.client_connection.UpsertItem(
+            collection_link=self.container_link,
+            document=body,
+            options=request_options,
+            response_hook=response_hook
+        )
+
+    async def create_item(
+        self,
+        body,
+        session_token=None,
+        initial_headers=None,
+        access_condition=None,
+        populate_query_metrics=None,
+        pre_trigger_include=None,
+        post_trigger_include=None,
+        indexing_directive=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (Dict[str, Any], str, Dict[str, str], Dict[str, str], bool, str, str, Any, Dict[str, Any], Optional[Callable]) -> Dict[str, str]
+        """ Create an item in the container.
+
+        :param body: A dict-like object representing the item to create.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param access_condition: Conditions Associated with the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param pre_trigger_include: trigger id to be used as pre operation trigger.
+        :param post_trigger_include: trigger id to be used as post operation trigger.
+        :param indexing_directive: Indicate whether the document should be omitted from indexing.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :returns: A dict representing the new item.
+        :raises `HTTPFailure`: If item with the given ID already exists.
+
+        To update or replace an existing item, use the :func:`Container.upsert_item` method.
+
+        """
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+
+        request_options["disableAutomaticIdGeneration"] = True
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if access_condition:
+            request_options["accessCondition"] = access_condition
+        if populate_query_metrics:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+        if pre_trigger_include:
+            request_options["preTriggerInclude"] = pre_trigger_include
+        if post_trigger_include:
+            request_options["postTriggerInclude"] = post_trigger_include
+        if indexing_directive:
+            request_options["indexingDirective"] = indexing_directive
+
+        return await self.client_connection.CreateItem(
+            collection_link=self.container_link,
+            document=body,
+            options=request_options,
+            response_hook=response_hook
+        )
+
+    async def delete_item(
+        self,
+        item,
+        partition_key,
+        session_token=None,
+        initial_headers=None,
+        access_condition=None,
+        populate_query_metrics=None,
+        pre_trigger_include=None,
+        post_trigger_include=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (Union[Dict[str, Any], str], Any, str, Dict[str, str], Dict[str, str], bool, str, str, Dict[str, Any], Optional[Callable]) -> None
+        """ Delete the specified item from the container.
+
+        :param item: The ID (name) or dict representing item to be deleted.
+        :param partition_key: Specifies the partition key value for the item.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param access_condition: Conditions Associated with the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param pre_trigger_include: trigger id to be used as pre operation trigger.
+        :param post_trigger_include: trigger id to be used as post operation trigger.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :raises `HTTPFailure`: The item wasn't deleted successfully. If the item does not exist in the container, a `404` error is returned.
+
+        """
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        if partition_key:
+            request_options["partitionKey"] = await self._set_partition_key(partition_key)
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if access_condition:
+            request_options["accessCondition"] = access_condition
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+        if pre_trigger_include:
+            request_options["preTriggerInclude"] = pre_trigger_include
+        if post_trigger_include:
+            request_options["postTriggerInclude"] = post_trigger_include
+
+        document_link = self._get_document_link(item)
+        await self.client_connection.DeleteItem(
+            document_link=document_link, options=request_options, response_hook=response_hook
+        )
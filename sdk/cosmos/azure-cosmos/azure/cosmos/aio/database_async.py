@@ -0,0 +1,321 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Create, read and delete containers in the Azure Cosmos DB SQL API service, asynchronously.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    cast
+)
+
+from ..partition_key import PartitionKey
+from ._cosmos_client_connection_async import CosmosClientConnection
+from ._query_iterable_async import QueryIterable
+from .container_async import Container
+
+__all__ = (
+    'Database',
+)
+
+class Database(object):
+    """ Represents an Azure Cosmos DB SQL API database, whose operations are performed asynchronously.
+
+    A database contains one or more containers.
+
+    :ivar id: The ID (name) of the database.
+
+    .. note::
+
+        To retrieve a database, use :func:`CosmosClient.get_database_client`.
+    """
+
+    def __init__(self, client_connection, id, properties=None):
+        # type: (CosmosClientConnection, str, Dict[str, Any]) -> None
+        """
+        :param CosmosClientConnection client_connection: Client from which this database was retrieved.
+        :param str id: ID (name) of the database.
+        """
+        self.client_connection = client_connection
+        self.id = id
+        self.database_link = u"dbs/{}".format(self.id)
+        self._properties = properties
+
+    @staticmethod
+    def _get_container_id(container_or_id):
+        # type: (Union[str, Container, Dict[str, Any]]) -> str
+        if isinstance(container_or_id, str):
+            return container_or_id
+        try:
+            return cast("Container", container_or_id).id
+        except AttributeError:
+            pass
+        return cast("Dict[str, str]", container_or_id)["id"]
+
+    def _get_container_link(self, container_or_id):
+        # type: (Union[str, Container, Dict[str, Any]]) -> str
+        return u"{}/colls/{}".format(self.database_link, self._get_container_id(container_or_id))
+
+    async def read(
+        self,
+        session_token=None,
+        initial_headers=None,
+        populate_query_metrics=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (str, Dict[str, str], bool, Dict[str, Any], Optional[Callable]) -> Dict[str, Any]
+        """
+        Read the database properties
+
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :returns: Dict[Str, Any]
+        :raise `HTTPFailure`: If the given database couldn't be retrieved.
+
+        """
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+
+        self._properties = await self.client_connection.ReadDatabase(
+            self.database_link, options=request_options, response_hook=response_hook
+        )
+        return self._properties
+
+    async def create_container(
+        self,
+        id,
+        partition_key,
+        indexing_policy=None,
+        default_ttl=None,
+        session_token=None,
+        initial_headers=None,
+        access_condition=None,
+        populate_query_metrics=None,
+        offer_throughput=None,
+        unique_key_policy=None,
+        conflict_resolution_policy=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (str, PartitionKey, Dict[str, Any], int, str, Dict[str, str], Dict[str, str], bool, int, Dict[str, Any], Dict[str, Any], Dict[str, Any], Optional[Callable]) -> Container
+        """
+        Create a new container with the given ID (name).
+
+        If a container with the given ID already exists, an HTTPFailure with status_code 409 is raised.
+
+        :param id: ID (name) of container to create.
+        :param partition_key: The partition key to use for the container.
+        :param indexing_policy: The indexing policy to apply to the container.
+        :param default_ttl: Default time to live (TTL) for items in the container. If unspecified, items do not expire.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param access_condition: Conditions Associated with the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param offer_throughput: The provisioned throughput for this offer.
+        :param unique_key_policy: The unique key policy to apply to the container.
+        :param conflict_resolution_policy: The conflict resolution policy to apply to the container.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :returns: A :class:`Container` instance representing the new container.
+        :raise HTTPFailure: The container creation failed.
+
+        """
+        definition = dict(id=id)  # type: Dict[str, Any]
+        if partition_key:
+            definition["partitionKey"] = partition_key
+        if indexing_policy:
+            definition["indexingPolicy"] = indexing_policy
+        if default_ttl:
+            definition["defaultTtl"] = default_ttl
+        if unique_key_policy:
+            definition["uniqueKeyPolicy"] = unique_key_policy
+        if conflict_resolution_policy:
+            definition["conflictResolutionPolicy"] = conflict_resolution_policy
+
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if access_condition:
+            request_options["accessCondition"] = access_condition
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+        if offer_throughput is not None:
+            request_options["offerThroughput"] = offer_throughput
+
+        data = await self.client_connection.CreateContainer(
+            database_link=self.database_link,
+            collection=definition,
+            options=request_options,
+            response_hook=response_hook
+        )
+
+        return Container(self.client_connection, self.database_link, data["id"], properties=data)
+
+    async def delete_container(
+        self,
+        container,
+        session_token=None,
+        initial_headers=None,
+        access_condition=None,
+        populate_query_metrics=None,
+        request_options=None,
+        response_hook=None
+    ):
+        # type: (Union[str, Container, Dict[str, Any]], str, Dict[str, str], Dict[str, str], bool, Dict[str, Any], Optional[Callable]) -> None
+        """ Delete the container
+
+        :param container: The ID (name) of the container to delete. You can either pass in the ID of the container to delete, a :class:`Container` instance or a dict representing the properties of the container.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param access_condition: Conditions Associated with the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param request_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata
+        :raise HTTPFailure: If the container couldn't be deleted.
+
+        """
+        if not request_options:
+            request_options = {} # type: Dict[str, Any]
+        if session_token:
+            request_options["sessionToken"] = session_token
+        if initial_headers:
+            request_options["initialHeaders"] = initial_headers
+        if access_condition:
+            request_options["accessCondition"] = access_condition
+        if populate_query_metrics is not None:
+            request_options["populateQueryMetrics"] = populate_query_metrics
+
+        collection_link = self._get_container_link(container)
+        await self.client_connection.DeleteContainer(collection_link, options=request_options, response_hook=response_hook)
+
+    def get_container_client(
+        self,
+        container,
+    ):
+        # type: (Union[str, Container, Dict[str, Any]]) -> Container
+        """ Get the specified `Container`, or a container with specified ID (name).
+
+        :param container: The ID (name) of the container, a :class:`Container` instance, or a dict representing the properties of the container to be retrieved.
+        :returns: A :class:`Container` instance representing the container.
+
+        """
+        return Container(self.client_connection, self.database_link, self._get_container_id(container))
+
+    def read_all_containers(
+        self,
+        max_item_count=None,
+        session_token=None,
+        initial_headers=None,
+        populate_query_metrics=None,
+        feed_options=None,
+        response_hook=None
+    ):
+        # type: (int, str, Dict[str, str], bool, Dict[str, Any], Optional[Callable]) -> QueryIterable
+        """ List the containers in the database.
+
+        :param max_item_count: Max number of items to be returned in the enumeration operation.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param feed_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata of each page
+        :returns: A :class:`QueryIterable` instance representing an asynchronous iterable of container properties (dicts).
+
+        """
+        if not feed_options:
+            feed_options = {} # type: Dict[str, Any]
+        if max_item_count is not None:
+            feed_options["maxItemCount"] = max_item_count
+        if session_token:
+            feed_options["sessionToken"] = session_token
+        if initial_headers:
+            feed_options["initialHeaders"] = initial_headers
+        if populate_query_metrics is not None:
+            feed_options["populateQueryMetrics"] = populate_query_metrics
+
+        return self.client_connection.ReadContainers(
+            database_link=self.database_link,
+            options=feed_options,
+            response_hook=response_hook
+        )
+
+    def query_containers(
+        self,
+        query=None,
+        parameters=None,
+        max_item_count=None,
+        session_token=None,
+        initial_headers=None,
+        populate_query_metrics=None,
+        feed_options=None,
+        response_hook=None
+    ):
+        # type: (str, List, int, str, Dict[str, str], bool, Dict[str, Any], Optional[Callable]) -> QueryIterable
+        """List properties for containers in the current database
+
+        :param query: The Azure Cosmos DB SQL query to execute.
+        :param parameters: Optional array of parameters to the query. Ignored if no query is provided.
+        :param max_item_count: Max number of items to be returned in the enumeration operation.
+        :param session_token: Token for use with Session consistency.
+        :param initial_headers: Initial headers to be sent as part of the request.
+        :param populate_query_metrics: Enable returning query metrics in response headers.
+        :param feed_options: Dictionary of additional properties to be used for the request.
+        :param response_hook: a callable invoked with the response metadata of each page
+        :returns: A :class:`QueryIterable` instance representing an asynchronous iterable of container properties (dicts).
+
+        """
+        if not feed_options:
+            feed_options = {} # type: Dict[str, Any]
+        if max_item_count is not None:
+            feed_options["maxItemCount"] = max_item_count
+        if session_token:
+            feed_options["sessionToken"] = session_token
+        if initial_headers:
+            feed_options["initialHeaders"] = initial_headers
+        if populate_query_metrics is not None:
+            feed_options["populateQueryMetrics"] = populate_query_metrics
+
+        return self.client_connection.QueryContainers(
+            database_link=self.database_link,
+            query=query
+            if parameters is None
+            else dict(query=query, parameters=parameters),
+            options=feed_options,
+            response_hook=response_hook
+        )
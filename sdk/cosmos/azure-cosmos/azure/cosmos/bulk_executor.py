@@ -0,0 +1,267 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Bulk execution of item operations in the Azure Cosmos database service.
+"""
+
+import threading
+import time
+from collections import deque
+
+from six.moves import queue
+
+from . import errors
+from .http_constants import HttpHeaders, StatusCodes
+
+class BulkOperationResult(object):
+    """The result of one operation of a bulk execution.
+
+    :ivar str operation_type: The type of the operation: 'create', 'upsert' or 'delete'.
+    :ivar dict resource: The item created or upserted, or None.
+    :ivar float request_charge: The request units consumed by the operation, including its retries.
+    :ivar Exception error: The error of the operation, or None if it succeeded.
+    """
+
+    def __init__(self, operation_type):
+        self.operation_type = operation_type
+        self.resource = None
+        self.request_charge = 0.0
+        self.error = None
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+class BulkResult(object):
+    """The results of a bulk execution, and its aggregate statistics.
+
+    :ivar list results: The :class:`BulkOperationResult` of each operation, in the order of the operations.
+    :ivar float request_charge: The request units consumed by all the operations.
+    :ivar int requests: The number of requests sent, not counting the retries of the client's retry policy.
+    :ivar int throttled_requests: The number of requests which were throttled at least once.
+    :ivar float elapsed: The duration of the bulk execution, in seconds.
+    """
+
+    def __init__(self):
+        self.results = []
+        self.request_charge = 0.0
+        self.requests = 0
+        self.throttled_requests = 0
+        self.elapsed = 0.0
+
+    @property
+    def failed(self):
+        """The results of the operations which failed."""
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def throughput(self):
+        """The number of operations completed per second."""
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def request_units_per_second(self):
+        """The request units consumed per second."""
+        return self.request_charge / self.elapsed if self.elapsed > 0 else 0.0
+
+class _BulkPartition(object):
+    """The pending operations of one partition, and the window of its congestion control.
+
+    The window is the number of operations of the partition allowed in flight. It grows
+    by one after each operation which isn't throttled, up to the maximum concurrency per
+    partition, and is halved when an operation is throttled, at which point the partition
+    is paused for the retry after time returned by the service.
+    """
+
+    def __init__(self, max_concurrency):
+        self.pending = deque()
+        self.in_flight = 0
+        self.window = 1.0
+        self.max_concurrency = max_concurrency
+        self.paused_until = 0.0
+
+    def can_dispatch(self, now):
+        return bool(self.pending) and self.in_flight < int(self.window) and self.paused_until <= now
+
+    def on_success(self):
+        self.window = min(self.window + 1, self.max_concurrency)
+
+    def on_throttled(self, now, retry_after):
+        self.window = max(self.window / 2, 1.0)
+        self.paused_until = max(self.paused_until, now + retry_after)
+
+class _BulkExecutor(object):
+    """Executes item operations concurrently, grouped by partition.
+
+    The operations are (operation_type, execute_fn) tuples, where execute_fn sends the
+    request of the operation and returns its result. The operations of each partition are
+    dispatched in order, within the window of the congestion control of the partition, on
+    up to max_connections worker threads. The headers of each response are read from the
+    last response headers of the client, which are kept per thread.
+
+    Operations still throttled once the retries of the client's retry policy are exhausted
+    are retried by the executor after the retry after time, up to _MaxThrottleRetries times.
+
+    :param CosmosClientConnection client_connection:
+    :param list operations:
+    :param function partition_fn: Returns the partition of an operation, from its index.
+    :param int max_connections: The number of operations in flight at the same time.
+    :param int max_concurrency_per_partition: The number of operations in flight at the same time in a partition.
+    :param float max_request_units_per_second: The request units to consume per second at most, or None.
+    """
+
+    _MaxThrottleRetries = 10
+
+    def __init__(self, client_connection, operations, partition_fn, max_connections,
+                 max_concurrency_per_partition, max_request_units_per_second=None):
+        self._client_connection = client_connection
+        self._operations = operations
+        self._partition_fn = partition_fn
+        self._max_connections = max_connections
+        self._max_concurrency_per_partition = max_concurrency_per_partition
+        self._max_request_units_per_second = max_request_units_per_second
+        self._condition = threading.Condition()
+        self._work = queue.Queue()
+        self._partitions = {}
+        self._attempts = [0] * len(operations)
+        self._in_flight = 0
+        self._completed = 0
+        self._clock = time.time
+        self._request_units = 0.0
+        self._request_units_updated = 0.0
+        self.result = BulkResult()
+        self.result.results = [BulkOperationResult(operation_type) for operation_type, _ in operations]
+
+    def execute(self):
+        """Executes all the operations.
+
+        :return: The result of the bulk execution.
+        :rtype: BulkResult
+        """
+        start = self._clock()
+        self._request_units_updated = start
+        if self._max_request_units_per_second:
+            self._request_units = float(self._max_request_units_per_second)
+
+        for index in range(len(self._operations)):
+            partition_id = self._partition_fn(index)
+            partition = self._partitions.get(partition_id)
+            if partition is None:
+                partition = _BulkPartition(self._max_concurrency_per_partition)
+                self._partitions[partition_id] = partition
+            partition.pending.append(index)
+
+        workers = [threading.Thread(target=self._run) for _ in range(min(self._max_connections, len(self._operations)))]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        try:
+            self._dispatch()
+        finally:
+            for _ in workers:
+                self._work.put(None)
+            for worker in workers:
+                worker.join()
+
+        self.result.elapsed = self._clock() - start
+        return self.result
+
+    def _dispatch(self):
+        with self._condition:
+            while self._completed < len(self._operations):
+                now = self._clock()
+                self._refill_request_units(now)
+                wait_time = None
+                for partition in self._partitions.values():
+                    while self._in_flight < self._max_connections and partition.can_dispatch(now):
+                        if self._max_request_units_per_second and self._request_units <= 0:
+                            # waits until the budget of request units is positive again
+                            wait_time = -self._request_units / self._max_request_units_per_second + 0.001
+                            break
+                        index = partition.pending.popleft()
+                        partition.in_flight += 1
+                        self._in_flight += 1
+                        self._work.put((partition, index))
+                    if partition.pending and partition.paused_until > now:
+                        pause = partition.paused_until - now
+                        wait_time = pause if wait_time is None else min(wait_time, pause)
+                if self._completed < len(self._operations):
+                    self._condition.wait(wait_time)
+
+    def _refill_request_units(self, now):
+        if not self._max_request_units_per_second:
+            return
+        elapsed = now - self._request_units_updated
+        self._request_units_updated = now
+        self._request_units = min(
+            self._request_units + elapsed * self._max_request_units_per_second,
+            float(self._max_request_units_per_second))
+
+    def _run(self):
+        while True:
+            work = self._work.get()
+            if work is None:
+                return
+            partition, index = work
+            self._execute_operation(partition, index)
+
+    def _execute_operation(self, partition, index):
+        _, execute_fn = self._operations[index]
+        result = self.result.results[index]
+        resource = None
+        error = None
+        self._client_connection.last_response_headers = None
+        try:
+            resource = execute_fn()
+        except Exception as e:  # pylint: disable=broad-except
+            error = e
+        headers = dict(self._client_connection.last_response_headers or {})
+        if isinstance(error, errors.HTTPFailure) and error.headers:
+            headers.update(error.headers)
+        request_charge = float(headers.get(HttpHeaders.RequestCharge) or 0)
+        throttled = bool(int(headers.get(HttpHeaders.ThrottleRetryCount) or 0))
+
+        with self._condition:
+            now = self._clock()
+            self._in_flight -= 1
+            partition.in_flight -= 1
+            self._request_units -= request_charge
+            self.result.requests += 1
+            self.result.request_charge += request_charge
+            result.request_charge += request_charge
+
+            is_throttled_error = (isinstance(error, errors.HTTPFailure)
+                                  and error.status_code == StatusCodes.TOO_MANY_REQUESTS)
+            if throttled or is_throttled_error:
+                self.result.throttled_requests += 1
+                retry_after = int(headers.get(HttpHeaders.RetryAfterInMilliseconds) or 0) / 1000.0
+                partition.on_throttled(now, retry_after)
+            else:
+                partition.on_success()
+
+            self._attempts[index] += 1
+            if is_throttled_error and self._attempts[index] <= self._MaxThrottleRetries:
+                partition.pending.appendleft(index)
+            else:
+                result.resource = resource
+                result.error = error
+                self._completed += 1
+            self._condition.notify_all()
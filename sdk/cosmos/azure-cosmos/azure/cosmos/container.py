@@ -22,7 +22,9 @@
 """Create, read, update and delete items in the Azure Cosmos DB SQL API service.
 """
 
+import functools
 import six
+from .bulk_executor import _BulkExecutor, BulkResult
 from .cosmos_client_connection import CosmosClientConnection
 from .errors import HTTPFailure
 from .http_constants import StatusCodes
@@ -30,6 +32,7 @@ from .offer import Offer
 from .scripts import Scripts
 from .query_iterable import QueryIterable
 from .partition_key import NonePartitionKeyValue
+from .routing import effective_partition_key
 from typing import (
     Any,
     Callable,
@@ -300,9 +303,10 @@ class Container:
         enable_scan_in_query=None,
         populate_query_metrics=None,
         feed_options=None, 
-        response_hook=None
+        response_hook=None,
+        max_degree_of_parallelism=None
     ):
-        # type: (str, List, Any, bool, int, str, Dict[str, str], bool, bool, Dict[str, Any, Optional[Callable]) -> QueryIterable
+        # type: (str, List, Any, bool, int, str, Dict[str, str], bool, bool, Dict[str, Any], Optional[Callable], int) -> QueryIterable
         """Return all results matching the given `query`.
 
         :param query: The Azure Cosmos DB SQL query to execute.
@@ -317,6 +321,9 @@ class Container:
         :param populate_query_metrics: Enable returning query metrics in response headers.
         :param feed_options: Dictionary of additional properties to be used for the request.
         :param response_hook: a callable invoked with the response metadata
+        :param max_degree_of_parallelism: The number of partition key ranges a cross partition query fetches
+        pages from concurrently. A negative value fetches from all the target partition key ranges at once.
+        By default, pages are fetched from one partition key range at a time.
         :returns: A :class:`QueryIterable` instance representing an iterable of items (dicts).
 
         You can use any value for the container name in the FROM clause, but typically the container name is used.
@@ -356,6 +363,8 @@ class Container:
             feed_options["partitionKey"] = self._set_partition_key(partition_key)
         if enable_scan_in_query is not None:
             feed_options["enableScanInQuery"] = enable_scan_in_query
+        if max_degree_of_parallelism is not None:
+            feed_options["maxDegreeOfParallelism"] = max_degree_of_parallelism
 
         if hasattr(response_hook, 'clear'):
             response_hook.clear()
@@ -594,7 +603,81 @@ class Container:
             document_link=document_link, options=request_options
         )
         if response_hook:
-            response_hook(self.client_connection.last_response_headers, result) 
+            response_hook(self.client_connection.last_response_headers, result)
+
+    def execute_bulk(
+        self,
+        operations,
+        max_connections=10,
+        max_concurrency_per_partition=None,
+        max_request_units_per_second=None,
+        request_options=None
+    ):
+        # type: (List[tuple], int, int, float, Dict[str, Any]) -> BulkResult
+        """ Create, upsert and delete items in bulk.
+
+        The operations are grouped by partition key range, from the effective partition key of
+        their partition key value, and sent concurrently. The concurrency of each partition adapts to throttling: it is halved whenever the service returns a `429` error,
+        after waiting for the time the service asks for, and grows again with each operation
+        which isn't throttled.
+
+        :param operations: The operations to execute, each one of ``("create", body)``,
+            ``("upsert", body)`` or ``("delete", item, partition_key)``.
+        :param max_connections: The number of operations sent at the same time.
+        :param max_concurrency_per_partition: The number of operations sent at the same time to one partition.
+            By default, up to max_connections.
+        :param max_request_units_per_second: The request units to consume per second at most.
+            By default, the operations are only slowed down by throttling.
+        :param request_options: Dictionary of additional properties to be used for each request.
+        :returns: A :class:`BulkResult` with the result of each operation, in the order of the
+            operations, and the request units and throughput of the whole execution.
+        :raises ValueError: If an operation isn't one of the above.
+
+        """
+        bulk_operations = []
+        partition_keys = []
+        for operation in operations:
+            operation_type = operation[0]
+            options = dict(request_options or {})
+            if operation_type in ("create", "upsert") and len(operation) == 2:
+                body = operation[1]
+                if operation_type == "create":
+                    options["disableAutomaticIdGeneration"] = True
+                    execute_fn = functools.partial(self.client_connection.CreateItem, self.container_link, body, options)
+                else:
+                    execute_fn = functools.partial(self.client_connection.UpsertItem, self.container_link, body, options)
+                options = self.client_connection._AddPartitionKey(self.container_link, body, options)
+            elif operation_type == "delete" and len(operation) == 3:
+                options["partitionKey"] = self._set_partition_key(operation[2])
+                execute_fn = functools.partial(
+                    self.client_connection.DeleteItem, self._get_document_link(operation[1]), options)
+            else:
+                raise ValueError("Unsupported bulk operation: {}".format(operation))
+            bulk_operations.append((operation_type, execute_fn))
+            partition_keys.append(options.get("partitionKey"))
+
+        partition_key_range_ids = self._get_partition_key_range_ids(partition_keys)
+        executor = _BulkExecutor(
+            self.client_connection,
+            bulk_operations,
+            lambda index: partition_key_range_ids[index],
+            max_connections,
+            max_concurrency_per_partition or max_connections,
+            max_request_units_per_second
+        )
+        return executor.execute()
+
+    def _get_partition_key_range_ids(self, partition_keys):
+        # type: (List[Any]) -> List[str]
+        partition_key_definition = self.client_connection._GetPartitionKeyDefinition(self.container_link)
+        if not partition_key_definition:
+            # a non partitioned container has a single partition key range
+            return ["0"] * len(partition_keys)
+        effective_partition_keys = effective_partition_key.GetEffectivePartitionKeys(
+            partition_key_definition, partition_keys)
+        partition_key_ranges = self.client_connection._routing_map_provider.get_ranges_by_effective_partition_keys(
+            self.container_link, effective_partition_keys)
+        return [partition_key_range["id"] for partition_key_range in partition_key_ranges]
 
     def read_offer(self, response_hook=None):
         # type: (Optional[Callable]) -> Offer
@@ -21,12 +21,14 @@
 
 """Document client class for the Azure Cosmos database service.
 """
+import threading
 import requests
 
 import six
 from typing import cast
 from . import base
 from . import documents
+from . import errors
 from . import constants
 from . import http_constants
 from . import query_iterable
@@ -120,7 +122,8 @@ class CosmosClientConnection(object):
             self.default_headers[
                 http_constants.HttpHeaders.ConsistencyLevel] = consistency_level
 
-        # Keeps the latest response headers from server.
+        # Keeps the latest response headers from server, per thread.
+        self._local = threading.local()
         self.last_response_headers = None
 
         if consistency_level == documents.ConsistencyLevel.Session:
@@ -155,6 +158,15 @@ class CosmosClientConnection(object):
         database_account = self._global_endpoint_manager._GetDatabaseAccount()
         self._global_endpoint_manager.force_refresh(database_account)
 
+    @property
+    def last_response_headers(self):
+        """Gets the headers of the latest response received on the current thread."""
+        return getattr(self._local, 'last_response_headers', None)
+
+    @last_response_headers.setter
+    def last_response_headers(self, headers):
+        self._local.last_response_headers = headers
+
     @property
     def Session(self):
         """ Gets the session object from the client """
@@ -946,12 +958,14 @@ class CosmosClientConnection(object):
                                     response_hook=response_hook), self.last_response_headers
         return query_iterable.QueryIterable(self, None, options, fetch_fn, collection_link)
 
-    def _ReadPartitionKeyRanges(self, collection_link, feed_options=None):
+    def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
         """Reads Partition Key Ranges.
 
         :param str collection_link:
             The link to the document collection.
         :param dict feed_options:
+        :param response_hook:
+            A callable invoked with the response metadata of each page
 
         :return:
             Query Iterable of PartitionKeyRanges.
@@ -962,9 +976,9 @@ class CosmosClientConnection(object):
         if feed_options is None:
             feed_options = {}
 
-        return self._QueryPartitionKeyRanges(collection_link, None, feed_options)
+        return self._QueryPartitionKeyRanges(collection_link, None, feed_options, response_hook)
 
-    def _QueryPartitionKeyRanges(self, collection_link, query, options=None):
+    def _QueryPartitionKeyRanges(self, collection_link, query, options=None, response_hook=None):
         """Queries Partition Key Ranges in a collection.
 
         :param str collection_link:
@@ -972,6 +986,8 @@ class CosmosClientConnection(object):
         :param (str or dict) query:
         :param dict options:
             The request options for the request.
+        :param response_hook:
+            A callable invoked with the response metadata of each page
 
         :return:
             Query Iterable of PartitionKeyRanges.
@@ -991,7 +1007,8 @@ class CosmosClientConnection(object):
                                     lambda r: r['PartitionKeyRanges'],
                                     lambda _, b: b,
                                     query,
-                                    options), self.last_response_headers
+                                    options,
+                                    response_hook=response_hook), self.last_response_headers
         return query_iterable.QueryIterable(self, query, options, fetch_fn)
 
     def CreateItem(self, database_or_Container_link, document, options=None):
@@ -2726,14 +2743,23 @@ class CosmosClientConnection(object):
             tuple
 
         """
-        return self.__QueryFeed(path,
-                                'docs',
-                                collection_id,
-                                lambda r: r['Documents'],
-                                lambda _, b: b,
-                                query,
-                                options,
-                                partition_key_range_id), self.last_response_headers
+        # The headers of this very response, as last_response_headers may be overwritten
+        # meanwhile by the queries of other partition key ranges run in parallel.
+        response_headers = {}
+
+        def set_response_headers(headers, _):
+            response_headers.update(headers)
+
+        result = self.__QueryFeed(path,
+                                  'docs',
+                                  collection_id,
+                                  lambda r: r['Documents'],
+                                  lambda _, b: b,
+                                  query,
+                                  options,
+                                  partition_key_range_id,
+                                  response_hook=set_response_headers)
+        return result, response_headers
     
     def __QueryFeed(self,
                     path,
@@ -2792,11 +2818,16 @@ class CosmosClientConnection(object):
                                       type,
                                       options,
                                       partition_key_range_id)
-            result, self.last_response_headers = self.__Get(path,
-                                                            request,
-                                                            headers)
+            try:
+                result, response_headers = self.__Get(path,
+                                                      request,
+                                                      headers)
+            except errors.HTTPFailure as e:
+                self._InvalidateRoutingMapIfPartitionKeyRangeGone(e, id)
+                raise
+            self.last_response_headers = response_headers
             if response_hook:
-                response_hook(self.last_response_headers, result)
+                response_hook(response_headers, result)
             return __GetBodiesFromQueryResult(result)
         else:
             query = self.__CheckAndUnifyQueryFormat(query)
@@ -2820,17 +2851,32 @@ class CosmosClientConnection(object):
                                       type,
                                       options,
                                       partition_key_range_id)
-            result, self.last_response_headers = self.__Post(path,
-                                                             request,
-                                                             query,
-                                                             headers)
-
+            try:
+                result, response_headers = self.__Post(path,
+                                                       request,
+                                                       query,
+                                                       headers)
+            except errors.HTTPFailure as e:
+                self._InvalidateRoutingMapIfPartitionKeyRangeGone(e, id)
+                raise
+            self.last_response_headers = response_headers
 
             if response_hook:
-                response_hook(self.last_response_headers, result)
+                response_hook(response_headers, result)
 
             return __GetBodiesFromQueryResult(result)
 
+    def _InvalidateRoutingMapIfPartitionKeyRangeGone(self, error, collection_id):
+        """Invalidates the routing map of a collection if the partition key range
+        targeted by a request is gone, so that its ranges are refreshed before the next request.
+
+        :param errors.HTTPFailure error:
+        :param str collection_id:
+        """
+        if (error.status_code == http_constants.StatusCodes.GONE
+                and error.sub_status == http_constants.SubStatusCodes.PARTITION_KEY_RANGE_GONE):
+            self._routing_map_provider.invalidate(collection_id)
+
     def __CheckAndUnifyQueryFormat(self, query_body):
         """Checks and unifies the format of the query body.
 
@@ -2872,19 +2918,22 @@ class CosmosClientConnection(object):
                 raise ValueError('Id ends with a space.')
 
     # Adds the partition key to options
-    def _AddPartitionKey(self, collection_link, document, options):
+    def _GetPartitionKeyDefinition(self, collection_link):
         collection_link = base.TrimBeginningAndEndingSlashes(collection_link)
-        
+
         #TODO: Refresh the cache if partition is extracted automatically and we get a 400.1001
 
         # If the document collection link is present in the cache, then use the cached partitionkey definition
         if collection_link in self.partition_key_definition_cache:
-            partitionKeyDefinition = self.partition_key_definition_cache.get(collection_link)
+            return self.partition_key_definition_cache.get(collection_link)
         # Else read the collection from backend and add it to the cache
-        else:
-            collection = self.ReadContainer(collection_link)
-            partitionKeyDefinition = collection.get('partitionKey')
-            self.partition_key_definition_cache[collection_link] = partitionKeyDefinition
+        collection = self.ReadContainer(collection_link)
+        partitionKeyDefinition = collection.get('partitionKey')
+        self.partition_key_definition_cache[collection_link] = partitionKeyDefinition
+        return partitionKeyDefinition
+
+    def _AddPartitionKey(self, collection_link, document, options):
+        partitionKeyDefinition = self._GetPartitionKeyDefinition(collection_link)
         
         # If the collection doesn't have a partition key definition, skip it as it's a legacy collection 
         if partitionKeyDefinition:
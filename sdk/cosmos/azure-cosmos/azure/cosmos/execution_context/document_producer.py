@@ -24,18 +24,97 @@
 
 import six
 import numbers
+import threading
 from collections import deque
 from azure.cosmos import base
 from azure.cosmos.execution_context.base_execution_context import _DefaultQueryExecutionContext
 from six.moves import xrange
 
+class _PrefetchExecutor(object):
+    '''Runs the page fetches of the document producers of a query on a bounded set of threads.
+
+    At most max_workers fetches run at the same time, the others wait for a thread in the
+    order they were submitted. A thread with no fetch to run exits after an idle timeout,
+    so an executor which is no longer used holds no thread.
+    '''
+    idle_timeout = 1.0
+
+    def __init__(self, max_workers):
+        self._max_workers = max_workers
+        self._workers = 0
+        self._idle = 0
+        self._pending = deque()
+        self._condition = threading.Condition()
+
+    def submit(self, fn):
+        with self._condition:
+            self._pending.append(fn)
+            if len(self._pending) <= self._idle or self._workers >= self._max_workers:
+                self._condition.notify()
+                return
+            self._workers += 1
+        thread = threading.Thread(target=self._work)
+        thread.daemon = True
+        thread.start()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                if not self._pending:
+                    self._idle += 1
+                    self._condition.wait(self.idle_timeout)
+                    self._idle -= 1
+                    if not self._pending:
+                        self._workers -= 1
+                        return
+                fn = self._pending.popleft()
+            fn()
+
+class _PagePrefetch(object):
+    '''Fetches the next page of results of a document producer on the threads of an executor.
+
+    The executor is shared by the document producers of a query, and bounds the number
+    of pages fetched at the same time to its degree of parallelism.
+    '''
+    def __init__(self, fetch_fn, executor):
+        self._fetch_fn = fetch_fn
+        self._done = threading.Event()
+        self._page = None
+        self._error = None
+        executor.submit(self._run)
+
+    def _run(self):
+        try:
+            self._page = self._fetch_fn()
+        except Exception as e:  # pylint: disable=broad-except
+            self._error = e
+        finally:
+            self._done.set()
+
+    def result(self):
+        """Waits for the page.
+
+        :return: The items of the page, or an empty list if the partition key range has no more results.
+        :rtype: list
+        :raises Exception: The error raised while fetching the page.
+        """
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._page
+
 class _DocumentProducer(object):
     '''This class takes care of handling of the results for one single partition key range.
     
     When handling an orderby query, MultiExecutionContextAggregator instantiates one instance of this class
     per target partition key range and aggregates the result of each.
+
+    Given a prefetch executor, the pages of the partition key range are fetched in the background:
+    the next page is requested as soon as the current one is buffered, so that at most one page
+    is buffered and one is in flight for each partition key range.
     '''
-    def __init__(self, partition_key_target_range, client, collection_link, query, document_producer_comp):
+    def __init__(self, partition_key_target_range, client, collection_link, query, document_producer_comp,
+                 prefetch_executor=None):
         '''
         Constructor
         '''
@@ -49,6 +128,8 @@ class _DocumentProducer(object):
         self._is_finished = False
         self._has_started = False
         self._cur_item = None
+        self._prefetch_executor = prefetch_executor
+        self._prefetch = None
         # initiate execution context
         
         path = base.GetPathFromLink(collection_link, 'docs')
@@ -70,6 +151,32 @@ class _DocumentProducer(object):
         """
         return self._partition_key_target_range
         
+    def start_prefetch(self):
+        """Starts fetching the next page in the background, unless the pages are fetched
+        on demand, a page is already in flight or there are no more results.
+        """
+        if self._prefetch_executor is None or self._prefetch is not None or self._is_finished:
+            return
+        self._prefetch = _PagePrefetch(self._ex_context.fetch_next_block, self._prefetch_executor)
+
+    def _next_item(self):
+        if self._prefetch_executor is None:
+            return next(self._ex_context)
+
+        if not self._buffer and not self._is_finished:
+            self.start_prefetch()
+            prefetch, self._prefetch = self._prefetch, None
+            page = prefetch.result()
+            if page:
+                self._buffer.extend(page)
+                self.start_prefetch()
+            else:
+                self._is_finished = True
+
+        if not self._buffer:
+            raise StopIteration
+        return self._buffer.popleft()
+
     def __iter__(self):
         return self
 
@@ -85,7 +192,7 @@ class _DocumentProducer(object):
             self._cur_item = None
             return res
         
-        return next(self._ex_context)
+        return self._next_item()
 
     def __next__(self):
         # supports python 3 iterator
@@ -100,7 +207,7 @@ class _DocumentProducer(object):
             
         """
         if self._cur_item is None:
-            self._cur_item = next(self._ex_context)
+            self._cur_item = self._next_item()
 
         return self._cur_item
 
@@ -36,8 +36,11 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
     
     When handling an orderby query, _MultiExecutionContextAggregator instantiates one instance of 
     DocumentProducer per target partition key range and aggregates the result of each.
-    
-    TODO improvement: this class needs to be parallelized
+
+    With a 'maxDegreeOfParallelism' option greater than 1, the DocumentProducers prefetch
+    the pages of their partition key ranges concurrently, up to that many requests at a time,
+    or one per target partition key range if the option is negative. The results are still
+    merged in order, as each DocumentProducer returns the results of its range in order.
     """
 
     class PriorityQueue:
@@ -80,6 +83,13 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
         # will be a list of (parition_min, partition_max) tuples
         targetPartitionRanges = self._get_target_parition_key_range()
 
+        self._prefetch_executor = None
+        max_degree_of_parallelism = options.get('maxDegreeOfParallelism')
+        if max_degree_of_parallelism is not None and max_degree_of_parallelism < 0:
+            max_degree_of_parallelism = len(targetPartitionRanges)
+        if max_degree_of_parallelism is not None and max_degree_of_parallelism > 1:
+            self._prefetch_executor = document_producer._PrefetchExecutor(max_degree_of_parallelism)
+
         targetPartitionQueryExecutionContextList = []
         for partitionTargetRange in targetPartitionRanges:
             # create and add the child execution context for the target range
@@ -87,6 +97,10 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
 
         self._orderByPQ = _MultiExecutionContextAggregator.PriorityQueue()
 
+        # requests the first page of all the target ranges at once, before waiting for any of them
+        for targetQueryExContext in targetPartitionQueryExecutionContextList:
+            targetQueryExContext.start_prefetch()
+
         for targetQueryExContext in targetPartitionQueryExecutionContextList:
             
             try:
@@ -142,7 +156,7 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
         else:
             query = self._query            
 
-        return document_producer._DocumentProducer(partition_key_target_range, self._client, self._resource_link, query, self._document_producer_comparator)
+        return document_producer._DocumentProducer(partition_key_target_range, self._client, self._resource_link, query, self._document_producer_comparator, self._prefetch_executor)
     
     def _get_target_parition_key_range(self):
 
@@ -119,7 +119,112 @@ class _MurmurHash(object):
         return fmix( h1 ^ length )
 
 
+class _MurmurHash128(object):
+    """ The 128 bit x64 version of MurmurHash3 implementation.
+    """
+    def ComputeHash(self, key, seed = 0x0):
+        """
+        Computes the hash of the value passed using MurmurHash3 algorithm.
+
+        :param bytearray key:
+            Byte array representing the key to be hashed.
+        :param int seed:
+            The seed of both 64 bit halves of the hash.
+
+        :return:
+            128 bit hash value, as the 8 bytes of the low half then the 8 bytes of the high half,
+            both little endian.
+        :rtype: bytearray
+        """
+        if key is None:
+            raise ValueError("key is None.")
+
+        h1, h2 = self._ComputeHash(key, seed)
+        return bytearray(pack('<QQ', h1, h2))
+
+    @staticmethod
+    def _ComputeHash( key, seed = 0x0 ):
+        """Computes the low and high 64 bit halves of the hash of the value passed with the seed value.
+        """
+        mask = 0xFFFFFFFFFFFFFFFF
+
+        def rotl64( x, r ):
+            return ( ( x << r ) | ( x >> ( 64 - r ) ) ) & mask
+
+        def fmix( k ):
+            k ^= k >> 33
+            k  = ( k * 0xff51afd7ed558ccd ) & mask
+            k ^= k >> 33
+            k  = ( k * 0xc4ceb9fe1a85ec53 ) & mask
+            k ^= k >> 33
+            return k
+
+        key = bytearray( key )
+        length = len( key )
+        nblocks = int( length / 16 )
+
+        h1 = seed
+        h2 = seed
+
+        c1 = 0x87c37b91114253d5
+        c2 = 0x4cf5ad432745937f
+
+        # body
+        for block_start in xrange( 0, nblocks * 16, 16 ):
+            k1, k2 = unpack( '<QQ', bytes( key[ block_start : block_start + 16 ] ) )
+
+            k1  = ( c1 * k1 ) & mask
+            k1  = rotl64( k1, 31 )
+            k1  = ( c2 * k1 ) & mask
+            h1 ^= k1
+
+            h1  = rotl64( h1, 27 )
+            h1  = ( h1 + h2 ) & mask
+            h1  = ( h1 * 5 + 0x52dce729 ) & mask
+
+            k2  = ( c2 * k2 ) & mask
+            k2  = rotl64( k2, 33 )
+            k2  = ( c1 * k2 ) & mask
+            h2 ^= k2
+
+            h2  = rotl64( h2, 31 )
+            h2  = ( h1 + h2 ) & mask
+            h2  = ( h2 * 5 + 0x38495ab5 ) & mask
+
+        # tail
+        tail_index = nblocks * 16
+        tail_size = length & 15
+        k1 = 0
+        k2 = 0
+
+        for i in xrange( tail_size - 1, 7, -1 ):
+            k2 ^= key[ tail_index + i ] << ( ( i - 8 ) * 8 )
+        if tail_size > 8:
+            k2  = ( k2 * c2 ) & mask
+            k2  = rotl64( k2, 33 )
+            k2  = ( k2 * c1 ) & mask
+            h2 ^= k2
+
+        for i in xrange( min( tail_size, 8 ) - 1, -1, -1 ):
+            k1 ^= key[ tail_index + i ] << ( i * 8 )
+        if tail_size > 0:
+            k1  = ( k1 * c1 ) & mask
+            k1  = rotl64( k1, 31 )
+            k1  = ( k1 * c2 ) & mask
+            h1 ^= k1
+
+        # finalization
+        h1 ^= length
+        h2 ^= length
+
+        h1  = ( h1 + h2 ) & mask
+        h2  = ( h1 + h2 ) & mask
 
+        h1  = fmix( h1 )
+        h2  = fmix( h2 )
 
+        h1  = ( h1 + h2 ) & mask
+        h2  = ( h1 + h2 ) & mask
 
+        return h1, h2
 
@@ -35,17 +35,20 @@ class _CollectionRoutingMap(object):
     MinimumInclusiveEffectivePartitionKey = ""
     MaximumExclusiveEffectivePartitionKey = "FF"
 
-    def __init__(self, range_by_id, range_by_info, ordered_partition_key_ranges, ordered_partition_info, collection_unique_id):
+    def __init__(self, range_by_id, range_by_info, ordered_partition_key_ranges, ordered_partition_info, collection_unique_id, change_feed_next_if_none_match=None):
         self._rangeById = range_by_id
         self._rangeByInfo = range_by_info
         self._orderedPartitionKeyRanges = ordered_partition_key_ranges
         
         self._orderedRanges = [routing_range._Range(pkr[_PartitionKeyRange.MinInclusive], pkr[_PartitionKeyRange.MaxExclusive], True, False) for pkr in ordered_partition_key_ranges]
+        self._sortedLow = [(r.min, not r.isMinInclusive) for r in self._orderedRanges]
         self._orderedPartitionInfo = ordered_partition_info
         self._collectionUniqueId = collection_unique_id
+        # the etag of the partition key ranges change feed, from which the changes following this map are read
+        self.change_feed_next_if_none_match = change_feed_next_if_none_match
 
     @classmethod
-    def CompleteRoutingMap(cls, partition_key_range_info_tupple_list, collection_unique_id):
+    def CompleteRoutingMap(cls, partition_key_range_info_tupple_list, collection_unique_id, change_feed_next_if_none_match=None):
         rangeById = {}
         rangeByInfo = {}
 
@@ -60,7 +63,36 @@ class _CollectionRoutingMap(object):
         orderedPartitionInfo = [r[1] for r in sortedRanges]
 
         if not _CollectionRoutingMap.is_complete_set_of_range(partitionKeyOrderedRange): return None
-        return cls(rangeById, rangeByInfo, partitionKeyOrderedRange, orderedPartitionInfo, collection_unique_id)
+        return cls(rangeById, rangeByInfo, partitionKeyOrderedRange, orderedPartitionInfo, collection_unique_id, change_feed_next_if_none_match)
+
+    def try_combine(self, partition_key_range_info_tupple_list, change_feed_next_if_none_match):
+        """Combines the partition key ranges changed since this routing map was built with its ranges.
+
+        The parent ranges of the changed ranges, which were split or merged, are replaced by them.
+
+        :param list partition_key_range_info_tupple_list:
+            The changed partition key ranges, with their information.
+        :param str change_feed_next_if_none_match:
+            The etag of the partition key ranges change feed following the changes.
+        :return:
+            The combined routing map, or None if the ranges don't form a complete set of ranges,
+            such as when some of the changes are missing.
+        :rtype: _CollectionRoutingMap
+        """
+        goneRangeIds = set()
+        for r in partition_key_range_info_tupple_list:
+            goneRangeIds.update(r[0].get(_PartitionKeyRange.Parents) or [])
+
+        rangeById = dict((rangeId, r) for rangeId, r in self._rangeById.items() if rangeId not in goneRangeIds)
+        for r in partition_key_range_info_tupple_list:
+            if r[0][_PartitionKeyRange.Id] not in goneRangeIds:
+                rangeById[r[0][_PartitionKeyRange.Id]] = r
+
+        try:
+            return self.CompleteRoutingMap(list(rangeById.values()), self._collectionUniqueId, change_feed_next_if_none_match)
+        except ValueError:
+            # the ranges overlap, as the split of some of them was missed
+            return None
 
     def get_ordered_partition_key_ranges(self):
         """Gets the ordered partition key ranges
@@ -85,14 +117,23 @@ class _CollectionRoutingMap(object):
         
         if _CollectionRoutingMap.MaximumExclusiveEffectivePartitionKey == effective_partition_key_value:
             return None
-        
-        sortedLow = [(r.min, not r.isMinInclusive) for r in self._orderedRanges]
 
-        index = bisect.bisect_right(sortedLow, (effective_partition_key_value, True))
+        index = bisect.bisect_right(self._sortedLow, (effective_partition_key_value, True))
         if (index > 0):
             index = index -1
         return self._orderedPartitionKeyRanges[index]
 
+    def get_ranges_by_effective_partition_keys(self, effective_partition_key_values):
+        """Gets the ranges containing the given effective partition keys
+
+        :param list effective_partition_key_values:
+            The effective partition keys.
+        :return:
+            The partition key range of each effective partition key.
+        :rtype: list of dict
+        """
+        return [self.get_range_by_effective_partition_key(value) for value in effective_partition_key_values]
+
     def get_range_by_partition_key_range_id(self, partition_key_range_id):
         """Gets the partition key range given the partition key range id
 
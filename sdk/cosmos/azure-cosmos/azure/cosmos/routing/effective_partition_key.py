@@ -0,0 +1,208 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+"""Internal methods for computing effective partition keys in the Azure Cosmos database service.
+
+The effective partition key of a partition key value is the point of the ["", "FF") range
+of the partition key ranges of a container where its items are stored. For hash partitioning,
+it is computed from the MurmurHash3 of the binary encoding of the value: the 32 bit hash
+for version 1 of the partition key definition, and the 128 bit hash for version 2.
+"""
+
+import binascii
+import numbers
+from struct import pack, unpack
+
+import six
+
+from ..murmur_hash import _MurmurHash, _MurmurHash128
+from ..partition_key import _Empty, _Undefined, NonePartitionKeyValue
+from .collection_routing_map import _CollectionRoutingMap
+
+class _PartitionKeyComponentType(object):
+    """The type markers of the components of a partition key."""
+    Undefined = 0x0
+    Null = 0x1
+    PFalse = 0x2
+    PTrue = 0x3
+    Number = 0x5
+    String = 0x8
+    Infinity = 0xFF
+
+# the prefix of strings hashed with version 1, in characters, and of strings binary encoded, in bytes
+_MaxStringChars = 100
+_MaxStringBytesToAppend = 100
+
+def _get_components(partition_key_value):
+    if partition_key_value is _Empty:
+        return []
+    if isinstance(partition_key_value, (list, tuple)):
+        return list(partition_key_value)
+    return [partition_key_value]
+
+def _write_for_hashing(value, string_suffix, buffer):
+    if value is True:
+        buffer.append(_PartitionKeyComponentType.PTrue)
+    elif value is False:
+        buffer.append(_PartitionKeyComponentType.PFalse)
+    elif value is None or value is NonePartitionKeyValue:
+        buffer.append(_PartitionKeyComponentType.Null)
+    elif value is _Undefined or value == {}:
+        buffer.append(_PartitionKeyComponentType.Undefined)
+    elif isinstance(value, numbers.Number):
+        buffer.append(_PartitionKeyComponentType.Number)
+        buffer.extend(pack('<d', float(value)))
+    elif isinstance(value, six.string_types):
+        buffer.append(_PartitionKeyComponentType.String)
+        buffer.extend(value.encode('utf-8'))
+        buffer.append(string_suffix)
+    else:
+        raise TypeError("Unexpected type for partition key component: {}".format(type(value)))
+
+def _encode_double_as_uint64(value):
+    # orders the doubles as unsigned integers: positive doubles get their sign bit set,
+    # negative ones are negated
+    value_as_uint64 = unpack('<Q', pack('<d', float(value)))[0]
+    mask = 0x8000000000000000
+    if value_as_uint64 < mask:
+        return value_as_uint64 ^ mask
+    return (~value_as_uint64 + 1) & 0xFFFFFFFFFFFFFFFF
+
+def _write_for_binary_encoding(value, buffer):
+    if value is True:
+        buffer.append(_PartitionKeyComponentType.PTrue)
+    elif value is False:
+        buffer.append(_PartitionKeyComponentType.PFalse)
+    elif value is None or value is NonePartitionKeyValue:
+        buffer.append(_PartitionKeyComponentType.Null)
+    elif value is _Undefined or value == {}:
+        buffer.append(_PartitionKeyComponentType.Undefined)
+    elif isinstance(value, numbers.Number):
+        buffer.append(_PartitionKeyComponentType.Number)
+        payload = _encode_double_as_uint64(value)
+
+        # the first chunk holds 8 bits of the payload, the next ones 7 bits followed by a 1 bit,
+        # except for the last one, which ends with a 0 bit
+        buffer.append(payload >> 56)
+        payload = (payload << 8) & 0xFFFFFFFFFFFFFFFF
+        byte_to_write = (payload >> 56) | 0x01
+        payload = (payload << 7) & 0xFFFFFFFFFFFFFFFF
+        while payload != 0:
+            buffer.append(byte_to_write)
+            byte_to_write = (payload >> 56) | 0x01
+            payload = (payload << 7) & 0xFFFFFFFFFFFFFFFF
+        buffer.append(byte_to_write & 0xFE)
+    elif isinstance(value, six.string_types):
+        buffer.append(_PartitionKeyComponentType.String)
+        utf8_value = bytearray(value.encode('utf-8'))
+        short_string = len(utf8_value) <= _MaxStringBytesToAppend
+        for char_byte in utf8_value[:_MaxStringBytesToAppend + 1]:
+            buffer.append(char_byte + 1 if char_byte < 0xFF else char_byte)
+        if short_string:
+            buffer.append(0x00)
+    else:
+        raise TypeError("Unexpected type for partition key component: {}".format(type(value)))
+
+def _to_hex_string(buffer):
+    return binascii.hexlify(bytes(buffer)).decode('utf-8').upper()
+
+def _get_effective_partition_key_for_hash_partitioning(components):
+    truncated_components = [
+        component[:_MaxStringChars] if isinstance(component, six.string_types) else component
+        for component in components]
+    buffer = bytearray()
+    for component in truncated_components:
+        _write_for_hashing(component, 0x00, buffer)
+    hash_value = _MurmurHash._ComputeHash(buffer)
+
+    encoded = bytearray()
+    for component in [float(hash_value)] + truncated_components:
+        _write_for_binary_encoding(component, encoded)
+    return _to_hex_string(encoded)
+
+def _get_effective_partition_key_for_hash_partitioning_v2(components):
+    buffer = bytearray()
+    for component in components:
+        _write_for_hashing(component, 0xFF, buffer)
+    low, high = _MurmurHash128._ComputeHash(buffer)
+
+    # the bytes of the hash, most significant first, without the 2 most significant bits,
+    # so that the effective partition key is always below "FF"
+    hash_bytes = bytearray(pack('>QQ', high, low))
+    hash_bytes[0] &= 0x3F
+    return _to_hex_string(hash_bytes)
+
+def GetEffectivePartitionKey(partition_key_definition, partition_key_value):
+    """Gets the effective partition key of a partition key value.
+
+    :param dict partition_key_definition:
+        The partition key definition of the container, with its 'kind' and 'version'.
+        The version defaults to 1, as for the containers created without one.
+    :param partition_key_value:
+        The partition key value, as sent in the request options.
+    :return:
+        The effective partition key, as an upper case hexadecimal string.
+    :rtype: str
+    """
+    components = _get_components(partition_key_value)
+    if not components:
+        return _CollectionRoutingMap.MinimumInclusiveEffectivePartitionKey
+
+    if partition_key_definition.get('kind', 'Hash') == 'Hash':
+        if partition_key_definition.get('version', 1) == 2:
+            return _get_effective_partition_key_for_hash_partitioning_v2(components)
+        return _get_effective_partition_key_for_hash_partitioning(components)
+
+    encoded = bytearray()
+    for component in components:
+        _write_for_binary_encoding(component, encoded)
+    return _to_hex_string(encoded)
+
+def GetEffectivePartitionKeys(partition_key_definition, partition_key_values):
+    """Gets the effective partition keys of partition key values.
+
+    Each distinct value is hashed once, as bulk operations usually share their partition key
+    values across many items.
+
+    :param dict partition_key_definition:
+        The partition key definition of the container.
+    :param list partition_key_values:
+        The partition key values.
+    :return:
+        The effective partition key of each value, in the order of the values.
+    :rtype: list of str
+    """
+    effective_partition_keys = []
+    by_value = {}
+    for partition_key_value in partition_key_values:
+        try:
+            # the type tells apart True from 1 and 1.0
+            key = (type(partition_key_value), partition_key_value)
+            effective_partition_key = by_value.get(key)
+        except TypeError:
+            key = None
+            effective_partition_key = None
+        if effective_partition_key is None:
+            effective_partition_key = GetEffectivePartitionKey(partition_key_definition, partition_key_value)
+            if key is not None:
+                by_value[key] = effective_partition_key
+        effective_partition_keys.append(effective_partition_key)
+    return effective_partition_keys
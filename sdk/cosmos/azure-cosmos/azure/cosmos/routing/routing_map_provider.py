@@ -22,7 +22,11 @@
 """Internal class for partition key range cache implementation in the Azure Cosmos database service.
 """
 
+import threading
+import time
+
 from .. import base
+from .. import http_constants
 from .collection_routing_map import _CollectionRoutingMap
 from . import routing_range
 from .routing_range import _PartitionKeyRange
@@ -32,8 +36,15 @@ class _PartitionKeyRangeCache(object):
     _PartitionKeyRangeCache provides list of effective partition key ranges for a collection.
     This implementation loads and caches the collection routing map per collection on demand.
 
+    The partition key ranges are read from the partition key ranges change feed. Once a routing map
+    is invalidated, after a split of its ranges, only the changes since its etag are read, and combined
+    with the cached ranges. The routing maps of the collections unused for collection_ttl seconds are evicted.
     '''
-    def __init__(self, client):
+
+    # the seconds after which the routing map of an unused collection is evicted
+    DefaultCollectionTtl = 3600
+
+    def __init__(self, client, collection_ttl=None):
         '''
         Constructor
         '''
@@ -42,6 +53,58 @@ class _PartitionKeyRangeCache(object):
         
         # keeps the cached collection routing map by collection id
         self._collection_routing_map_by_item = {}
+
+        # the collections whose routing map must be refreshed before its next use
+        self._stale_items = set()
+        self._last_access_by_item = {}
+        self._collection_ttl = collection_ttl if collection_ttl is not None else _PartitionKeyRangeCache.DefaultCollectionTtl
+        self._next_eviction = 0
+        self._clock = time.time
+        self._refresh_lock = threading.Lock()
+
+        # guards the counters, which are updated by the lookups and invalidations that don't take the refresh lock
+        self._statistics_lock = threading.Lock()
+        self._statistics = {
+            'hits': 0,
+            'misses': 0,
+            'incremental_refreshes': 0,
+            'full_refreshes': 0,
+            'invalidations': 0,
+            'evictions': 0
+        }
+
+    def get_statistics(self):
+        '''
+        Returns the counters of the cache: the lookups served by a cached routing map (hits),
+        the routing maps loaded or refreshed (misses), of which the ones refreshed from the
+        partition key ranges changed since their etag (incremental_refreshes) or by reading
+        all the partition key ranges (full_refreshes), the routing maps invalidated and
+        the ones evicted.
+
+        :return:
+            The counters, by name.
+        :rtype: dict
+        '''
+        with self._statistics_lock:
+            return dict(self._statistics)
+
+    def _record(self, counter):
+        with self._statistics_lock:
+            self._statistics[counter] += 1
+
+    def invalidate(self, collection_id):
+        '''
+        Marks the routing map of a collection as stale, for example after a request
+        to a partition key range which was split. It is refreshed before its next use.
+
+        :param str collection_id:
+            The id or full name of the collection.
+        '''
+        # not under the refresh lock, which is held while the partition key ranges are read
+        with self._statistics_lock:
+            if collection_id in self._collection_routing_map_by_item and collection_id not in self._stale_items:
+                self._stale_items.add(collection_id)
+                self._statistics['invalidations'] += 1
         
     def get_overlapping_ranges(self, collection_link, partition_key_ranges):
         '''
@@ -57,20 +120,117 @@ class _PartitionKeyRangeCache(object):
             List of overlapping partition key ranges.
         :rtype: list
         '''
-        cl = self._documentClient
-        
+        return self._get_routing_map(collection_link).get_overlapping_ranges(partition_key_ranges)
+
+    def get_ranges_by_effective_partition_keys(self, collection_link, effective_partition_keys):
+        '''
+        Given effective partition keys and a collection,
+        returns the partition key range of each effective partition key
+
+        :param str collection_link:
+            The name of the collection.
+        :param list effective_partition_keys:
+            List of effective partition keys.
+
+        :return:
+            List of partition key ranges.
+        :rtype: list
+        '''
+        return self._get_routing_map(collection_link).get_ranges_by_effective_partition_keys(effective_partition_keys)
+
+    def _get_routing_map(self, collection_link):
         collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
-        
-        collection_routing_map = self._collection_routing_map_by_item.get(collection_id)
+        self._evict_unused_routing_maps()
+
+        collection_routing_map = self._get_cached_routing_map(collection_id)
         if collection_routing_map is None:
-            collection_pk_ranges = list(cl._ReadPartitionKeyRanges(collection_link))
-            # for large collections, a split may complete between the read partition key ranges query page responses, 
-            # causing the partitionKeyRanges to have both the children ranges and their parents. Therefore, we need 
-            # to discard the parent ranges to have a valid routing map.
-            collection_pk_ranges = _PartitionKeyRangeCache._discard_parent_ranges(collection_pk_ranges)
-            collection_routing_map = _CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in collection_pk_ranges], collection_id)
-            self._collection_routing_map_by_item[collection_id] = collection_routing_map
-        return collection_routing_map.get_overlapping_ranges(partition_key_ranges)
+            with self._refresh_lock:
+                # another thread may have refreshed the routing map meanwhile
+                collection_routing_map = self._get_cached_routing_map(collection_id, record_hit=False)
+                if collection_routing_map is None:
+                    previous_routing_map = self._collection_routing_map_by_item.get(collection_id)
+                    collection_routing_map = self._read_routing_map(collection_link, collection_id, previous_routing_map)
+                    if collection_routing_map is None:
+                        # some of the changes since the etag of the cached routing map are missing
+                        self._record('full_refreshes')
+                        collection_routing_map = self._read_routing_map(collection_link, collection_id, None)
+        return collection_routing_map
+
+    def _read_routing_map(self, collection_link, collection_id, previous_routing_map):
+        response_headers = {}
+        collection_pk_ranges = list(self._documentClient._ReadPartitionKeyRanges(
+            collection_link,
+            self._get_change_feed_options(previous_routing_map),
+            response_hook=lambda headers, _: response_headers.update(headers)))
+        return self._update_routing_map(collection_id, previous_routing_map, collection_pk_ranges, response_headers)
+
+    def _get_cached_routing_map(self, collection_id, record_hit=True):
+        if collection_id in self._stale_items:
+            return None
+        collection_routing_map = self._collection_routing_map_by_item.get(collection_id)
+        if collection_routing_map is not None:
+            self._last_access_by_item[collection_id] = self._clock()
+            if record_hit:
+                self._record('hits')
+        return collection_routing_map
+
+    @staticmethod
+    def _get_change_feed_options(previous_routing_map):
+        feed_options = {'changeFeed': True}
+        if previous_routing_map is not None and previous_routing_map.change_feed_next_if_none_match:
+            feed_options['continuation'] = previous_routing_map.change_feed_next_if_none_match
+        return feed_options
+
+    def _update_routing_map(self, collection_id, previous_routing_map, collection_pk_ranges, response_headers):
+        '''
+        Caches the routing map of a collection built from the partition key ranges read
+        from the change feed, or None if they can't be combined with the previous routing map.
+        '''
+        change_feed_next_if_none_match = response_headers.get(http_constants.HttpHeaders.ETag)
+        if previous_routing_map is None or not previous_routing_map.change_feed_next_if_none_match:
+            collection_routing_map = _PartitionKeyRangeCache._create_routing_map(
+                collection_pk_ranges, collection_id, change_feed_next_if_none_match)
+            if previous_routing_map is not None:
+                self._record('full_refreshes')
+        elif not collection_pk_ranges:
+            # the partition key ranges haven't changed
+            collection_routing_map = previous_routing_map
+            self._record('incremental_refreshes')
+        else:
+            collection_routing_map = previous_routing_map.try_combine(
+                [(r, True) for r in collection_pk_ranges],
+                change_feed_next_if_none_match or previous_routing_map.change_feed_next_if_none_match)
+            if collection_routing_map is None:
+                return None
+            self._record('incremental_refreshes')
+
+        self._record('misses')
+        self._collection_routing_map_by_item[collection_id] = collection_routing_map
+        self._last_access_by_item[collection_id] = self._clock()
+        self._stale_items.discard(collection_id)
+        return collection_routing_map
+
+    def _evict_unused_routing_maps(self):
+        now = self._clock()
+        if now < self._next_eviction:
+            return
+        with self._refresh_lock:
+            self._next_eviction = now + self._collection_ttl
+            for collection_id, last_access in list(self._last_access_by_item.items()):
+                if now - last_access >= self._collection_ttl:
+                    del self._last_access_by_item[collection_id]
+                    self._collection_routing_map_by_item.pop(collection_id, None)
+                    self._stale_items.discard(collection_id)
+                    self._record('evictions')
+
+    @staticmethod
+    def _create_routing_map(collection_pk_ranges, collection_id, change_feed_next_if_none_match=None):
+        # for large collections, a split may complete between the read partition key ranges query page responses, 
+        # causing the partitionKeyRanges to have both the children ranges and their parents. Therefore, we need 
+        # to discard the parent ranges to have a valid routing map.
+        collection_pk_ranges = _PartitionKeyRangeCache._discard_parent_ranges(collection_pk_ranges)
+        return _CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in collection_pk_ranges], collection_id,
+                                                        change_feed_next_if_none_match)
 
     @staticmethod
     def _discard_parent_ranges(partitionKeyRanges):
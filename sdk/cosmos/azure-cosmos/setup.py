@@ -70,6 +70,7 @@ setup(
     ],
     extras_require={
       ":python_version<'3.0'": ["azure-nspkg"],
-      ":python_version<'3.5'": ["typing"]
+      ":python_version<'3.5'": ["typing"],
+      "aio:python_version>='3.5'": ["aiohttp>=3.0"]
     },
 )
\ No newline at end of file
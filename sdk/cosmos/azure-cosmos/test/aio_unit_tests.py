@@ -0,0 +1,228 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import asyncio
+import json
+import unittest
+from urllib.parse import urlparse
+import pytest
+import azure.cosmos.errors as errors
+from azure.cosmos.aio import CosmosClient
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+
+pytestmark = pytest.mark.cosmosEmulator
+
+class AioUnitTests(unittest.TestCase):
+    """Tests the asynchronous client against a mocked aiohttp session, which serves a container
+    with 3 partition key ranges.
+    """
+
+    class MockedResponse(object):
+
+        def __init__(self, status, headers, body):
+            self.status = status
+            self.headers = headers
+            self.body = body
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            pass
+
+        async def read(self):
+            return self.body
+
+    class MockedRequest(object):
+
+        def __init__(self, session, method, url, data, headers):
+            self.session = session
+            self.method = method
+            self.path = '/' + urlparse(url).path.strip('/')
+            self.body = json.loads(data.decode('utf-8')) if data else None
+            self.headers = headers
+
+        async def __aenter__(self):
+            self.session.in_flight += 1
+            self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+            try:
+                # holds the requests briefly, so that concurrent requests overlap
+                await asyncio.sleep(0.01)
+                status, headers, body = self.session.handle(self)
+            finally:
+                self.session.in_flight -= 1
+            return AioUnitTests.MockedResponse(status, headers, json.dumps(body).encode('utf-8') if body is not None else b'')
+
+        async def __aexit__(self, *args):
+            pass
+
+    class MockedSession(object):
+
+        def __init__(self):
+            self.requests = []
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.throttled_requests = 0
+            self.gone_partition_key_range_id = None
+            self.items = {}
+            self.partition_key_ranges = [{'id': '0', 'minInclusive': '', 'maxExclusive': '1F'},
+                                         {'id': '1', 'minInclusive': '1F', 'maxExclusive': '3F'},
+                                         {'id': '2', 'minInclusive': '3F', 'maxExclusive': 'FF'}]
+
+        def request(self, method, url, data=None, headers=None, **kwargs):
+            request = AioUnitTests.MockedRequest(self, method, url, data, headers)
+            self.requests.append(request)
+            return request
+
+        async def close(self):
+            pass
+
+        def handle(self, request):
+            if request.path == '/':
+                return 200, {}, {'id': 'account'}
+            if request.path == '/dbs/db/colls/coll':
+                return 200, {}, {'id': 'coll', '_rid': 'coll', 'partitionKey': {'paths': ['/pk'], 'kind': 'Hash'}}
+            if request.path == '/dbs/db/colls/coll/pkranges':
+                # the partition key ranges change feed, where the split ranges are followed by their children,
+                # and whose etag is the number of ranges
+                etag = '"{}"'.format(len(self.partition_key_ranges))
+                if_none_match = request.headers.get(HttpHeaders.IfNoneMatch)
+                if if_none_match == etag:
+                    return 304, {HttpHeaders.ETag: etag}, None
+                changed_ranges = self.partition_key_ranges[int(if_none_match.strip('"')) if if_none_match else 0:]
+                return 200, {HttpHeaders.ETag: etag}, {'PartitionKeyRanges': changed_ranges}
+            if request.path == '/dbs/db/colls/coll/docs' and request.headers.get(HttpHeaders.IsQuery) == 'true':
+                return self._query(request)
+            if request.path == '/dbs/db/colls/coll/docs':
+                if self.throttled_requests < 2:
+                    self.throttled_requests += 1
+                    return 429, {HttpHeaders.RetryAfterInMilliseconds: '10'}, {'message': 'Request rate is large'}
+                self.items[request.body['id']] = request.body
+                return 201, {HttpHeaders.RequestCharge: '5.0'}, request.body
+            item_id = request.path.split('/')[-1]
+            if item_id not in self.items:
+                return 404, {}, {'message': 'Not Found'}
+            if request.method == 'DELETE':
+                return 204, {}, self.items.pop(item_id)
+            return 200, {}, self.items[item_id]
+
+        def _query(self, request):
+            partition_key_range_id = request.headers.get(HttpHeaders.PartitionKeyRangeID)
+            if partition_key_range_id is not None and partition_key_range_id == self.gone_partition_key_range_id:
+                return (StatusCodes.GONE,
+                        {HttpHeaders.SubStatus: str(SubStatusCodes.PARTITION_KEY_RANGE_GONE)},
+                        {'message': 'Partition key range is gone'})
+            if partition_key_range_id is None:
+                query_execution_info = {
+                    'queryInfo': {'orderBy': ['Ascending'], 'rewrittenQuery': 'SELECT * FROM root r ORDER BY r.value'},
+                    'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]}
+                return (StatusCodes.BAD_REQUEST,
+                        {HttpHeaders.SubStatus: str(SubStatusCodes.CROSS_PARTITION_QUERY_NOT_SERVABLE)},
+                        {'additionalErrorInfo': json.dumps(query_execution_info)})
+
+            # the values of each partition key range, in order, by pages of 2 documents
+            values = list(range(int(partition_key_range_id), 30, 3))
+            index = int(request.headers.get(HttpHeaders.Continuation) or 0)
+            headers = {HttpHeaders.Continuation: str(index + 2)} if index + 2 < len(values) else {}
+            documents = [{'orderByItems': [{'item': value}], 'payload': {'value': value}}
+                         for value in values[index:index + 2]]
+            return 200, headers, {'Documents': documents, '_count': len(documents)}
+
+    def setUp(self):
+        self.session = AioUnitTests.MockedSession()
+        self.client = CosmosClient('https://localhost:8081/', {'masterKey': 'C2y6yDjf5/R+ob0N8A7Cgv30VRDJIWEHLM+4QDU5DE2nQ9nDuVTqobD4b8mGGyPMbIZnqyMsEcaGQy67XIw/Jw=='})
+        self.client.client_connection._aiohttp_session = self.session
+        self.container = self.client.get_database_client('db').get_container_client('coll')
+
+    def _run(self, coroutine):
+        return asyncio.get_event_loop().run_until_complete(coroutine)
+
+    def test_item_operations(self):
+        async def run():
+            headers = []
+            created = await self.container.create_item({'id': 'item', 'pk': 'pk'},
+                                                       response_hook=lambda h, r: headers.append(h))
+            self.assertEqual(created['id'], 'item')
+            # the requests throttled twice were retried after the retry after time
+            self.assertEqual(headers[0][HttpHeaders.ThrottleRetryCount], 2)
+            self.assertEqual(headers[0][HttpHeaders.RequestCharge], '5.0')
+
+            item = await self.container.read_item('item', partition_key='pk')
+            self.assertEqual(item, {'id': 'item', 'pk': 'pk'})
+            await self.container.delete_item('item', partition_key='pk')
+            with self.assertRaises(errors.HTTPFailure) as context:
+                await self.container.read_item('item', partition_key='pk')
+            self.assertEqual(context.exception.status_code, StatusCodes.NOT_FOUND)
+            await self.client.close()
+
+        self._run(run())
+        # the database account is read once, before the first request
+        self.assertEqual(self.session.requests[0].path, '/')
+        self.assertEqual(len([r for r in self.session.requests if r.path == '/']), 1)
+        self.assertEqual(self.session.requests[-1].headers[HttpHeaders.PartitionKey], '["pk"]')
+
+    def test_cross_partition_query(self):
+        async def query(max_degree_of_parallelism=None):
+            values = []
+            query_iterable = self.container.query_items('SELECT * FROM root r ORDER BY r.value',
+                                                        enable_cross_partition_query=True,
+                                                        max_degree_of_parallelism=max_degree_of_parallelism)
+            async for result in query_iterable:
+                values.append(result['value'])
+            return values
+
+        # the pages of the partition key ranges are requested at the same time, and merged in order
+        self.assertEqual(self._run(query()), list(range(30)))
+        self.assertEqual(self.session.max_in_flight, 3)
+        self.assertEqual(len([r for r in self.session.requests if HttpHeaders.PartitionKeyRangeID in r.headers]), 15)
+
+        self.session.max_in_flight = 0
+        self.assertEqual(self._run(query(max_degree_of_parallelism=1)), list(range(30)))
+        self.assertEqual(self.session.max_in_flight, 1)
+
+    def test_partition_key_range_gone(self):
+        async def query():
+            values = []
+            async for result in self.container.query_items('SELECT * FROM root r ORDER BY r.value',
+                                                           enable_cross_partition_query=True):
+                values.append(result['value'])
+            return values
+
+        self._run(query())
+        # the range 2 is split, which the first query to it finds out
+        self.session.gone_partition_key_range_id = '2'
+        self.session.partition_key_ranges.extend([
+            {'id': '3', 'minInclusive': '3F', 'maxExclusive': '7F', 'parents': ['2']},
+            {'id': '4', 'minInclusive': '7F', 'maxExclusive': 'FF', 'parents': ['2']}])
+        with self.assertRaises(errors.HTTPFailure) as context:
+            self._run(query())
+        self.assertEqual(context.exception.status_code, StatusCodes.GONE)
+
+        # the routing map is refreshed from the ranges changed since its etag
+        del self.session.requests[:]
+        self.assertEqual(self._run(query()), sorted(v for i in [0, 1, 3, 4] for v in range(i, 30, 3)))
+        pkranges_requests = [r for r in self.session.requests if r.path.endswith('/pkranges')]
+        self.assertEqual([r.headers.get(HttpHeaders.IfNoneMatch) for r in pkranges_requests], ['"3"', '"5"'])
+        self.assertEqual(self.client.client_connection._routing_map_provider.get_statistics(), {
+            'hits': 1, 'misses': 2, 'incremental_refreshes': 1, 'full_refreshes': 0, 'invalidations': 1, 'evictions': 0})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import threading
+import time
+import unittest
+import pytest
+import azure.cosmos.errors as errors
+from azure.cosmos.container import Container
+from azure.cosmos.bulk_executor import _BulkPartition
+from azure.cosmos.routing.routing_map_provider import _SmartRoutingMapProvider
+
+pytestmark = pytest.mark.cosmosEmulator
+
+class BulkExecutorUnitTests(unittest.TestCase):
+    """Tests the bulk execution of item operations against a mocked client connection,
+    which throttles the partitions with too many requests in flight.
+    """
+
+    class MockedCosmosClientConnection(object):
+
+        def __init__(self, max_in_flight_per_partition):
+            self.max_in_flight_per_partition = max_in_flight_per_partition
+            self.items = {}
+            self.lock = threading.Lock()
+            self.in_flight = {}
+            self.max_in_flight = 0
+            self._local = threading.local()
+            self._routing_map_provider = _SmartRoutingMapProvider(self)
+            self.partition_key_ranges = [{'id': '0', 'minInclusive': '', 'maxExclusive': '1F'},
+                                         {'id': '1', 'minInclusive': '1F', 'maxExclusive': '3F'},
+                                         {'id': '2', 'minInclusive': '3F', 'maxExclusive': 'FF'}]
+
+        @property
+        def last_response_headers(self):
+            return getattr(self._local, 'last_response_headers', None)
+
+        @last_response_headers.setter
+        def last_response_headers(self, headers):
+            self._local.last_response_headers = headers
+
+        def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
+            return self.partition_key_ranges
+
+        def _GetPartitionKeyDefinition(self, collection_link):
+            return {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+
+        def _AddPartitionKey(self, collection_link, document, options):
+            options['partitionKey'] = document['pk']
+            return options
+
+        def _send(self, partition_key, request_charge, fn):
+            with self.lock:
+                in_flight = self.in_flight.get(partition_key, 0) + 1
+                self.in_flight[partition_key] = in_flight
+                self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+            try:
+                if in_flight > self.max_in_flight_per_partition:
+                    self.last_response_headers = {'x-ms-throttle-retry-count': 0}
+                    raise errors.HTTPFailure(429, 'Request rate is large', {'x-ms-retry-after-ms': '5'})
+                time.sleep(0.005)
+                self.last_response_headers = {'x-ms-request-charge': str(request_charge)}
+                with self.lock:
+                    return fn()
+            finally:
+                with self.lock:
+                    self.in_flight[partition_key] -= 1
+
+        def CreateItem(self, database_or_Container_link, document, options):
+            def create():
+                if document['id'] in self.items:
+                    raise errors.HTTPFailure(409, 'Conflict', {'x-ms-request-charge': '1.0'})
+                self.items[document['id']] = document
+                return document
+            return self._send(options['partitionKey'], 5.0, create)
+
+        def UpsertItem(self, database_or_Container_link, document, options):
+            def upsert():
+                self.items[document['id']] = document
+                return document
+            return self._send(options['partitionKey'], 6.0, upsert)
+
+        def DeleteItem(self, document_link, options):
+            def delete():
+                del self.items[document_link.split('/')[-1]]
+            return self._send(options['partitionKey'], 4.0, delete)
+
+    def setUp(self):
+        self.client_connection = BulkExecutorUnitTests.MockedCosmosClientConnection(max_in_flight_per_partition=2)
+        self.container = Container(self.client_connection, 'dbs/db', 'coll')
+
+    def test_partition_window(self):
+        partition = _BulkPartition(max_concurrency=4)
+        partition.pending.extend([0, 1])
+
+        self.assertTrue(partition.can_dispatch(0.0))
+        partition.in_flight = 1
+        self.assertFalse(partition.can_dispatch(0.0))
+        for _ in range(5):
+            partition.on_success()
+        self.assertEqual(partition.window, 4)
+
+        partition.on_throttled(10.0, 0.5)
+        self.assertEqual(partition.window, 2)
+        self.assertFalse(partition.can_dispatch(10.4))
+        self.assertTrue(partition.can_dispatch(10.5))
+
+    def test_partition_key_range_ids(self):
+        self.assertEqual(self.container._get_partition_key_range_ids(['partitionKey', 'redmond', 'partitionKey']),
+                         ['0', '1', '0'])
+
+    def test_execute_bulk(self):
+        operations = [('create', {'id': str(i), 'pk': 'pk{}'.format(i % 3)}) for i in range(30)]
+        result = self.container.execute_bulk(operations, max_connections=6)
+
+        self.assertEqual(result.failed, [])
+        self.assertEqual(len(self.client_connection.items), 30)
+        self.assertEqual([r.resource['id'] for r in result.results], [str(i) for i in range(30)])
+        self.assertEqual(result.request_charge, 150.0)
+        self.assertEqual(result.results[0].request_charge, 5.0)
+        self.assertLessEqual(self.client_connection.max_in_flight, 6)
+        self.assertGreater(result.throughput, 0)
+        self.assertGreater(result.request_units_per_second, 0)
+
+        operations = ([('delete', str(i), 'pk{}'.format(i % 3)) for i in range(10)]
+                      + [('upsert', {'id': '0', 'pk': 'pk0', 'value': 1}), ('create', {'id': '15', 'pk': 'pk0'})])
+        result = self.container.execute_bulk(operations, max_connections=6, max_concurrency_per_partition=1)
+
+        self.assertEqual(len(self.client_connection.items), 21)
+        self.assertEqual([r.operation_type for r in result.failed], ['create'])
+        self.assertEqual(result.failed[0].error.status_code, 409)
+        self.assertEqual(result.results[-1].request_charge, 1.0)
+        self.assertEqual(result.throttled_requests, 0)
+
+        with self.assertRaises(ValueError):
+            self.container.execute_bulk([('replace', {'id': '0'})])
+
+    def test_execute_bulk_throttled(self):
+        self.client_connection.max_in_flight_per_partition = 1
+        operations = [('upsert', {'id': str(i), 'pk': 'pk{}'.format(i % 2)}) for i in range(40)]
+        result = self.container.execute_bulk(operations, max_connections=8)
+
+        # throttled operations are retried after the retry after time
+        self.assertEqual(result.failed, [])
+        self.assertEqual(len(self.client_connection.items), 40)
+        self.assertGreater(result.throttled_requests, 0)
+        self.assertEqual(result.requests, 40 + result.throttled_requests)
+        self.assertEqual(result.request_charge, 240.0)
+
+    def test_execute_bulk_with_request_unit_budget(self):
+        operations = [('upsert', {'id': str(i), 'pk': 'pk{}'.format(i % 4)}) for i in range(40)]
+        result = self.container.execute_bulk(operations, max_connections=8, max_request_units_per_second=100)
+
+        # 240 request units are consumed with a budget of 100 per second, which starts full,
+        # and is exceeded by the request units of the operations in flight at most
+        self.assertEqual(result.failed, [])
+        self.assertGreaterEqual(result.elapsed, (240 - 100 - 8 * 6) / 100.0)
+        self.assertLessEqual(result.request_units_per_second, 240)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,7 @@
 
 # pytest fixture 'teardown' is called at the end of a test run to clean up resources
 
+import sys
 import pytest
 import test_config
 import azure.cosmos.cosmos_client as cosmos_client
@@ -29,6 +30,11 @@ from azure.cosmos.http_constants import StatusCodes
 
 database_ids_to_delete = []
 
+# Ignore the tests of the asynchronous client for Python < 3.5
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.append("aio_unit_tests.py")
+
 @pytest.fixture(scope="session")
 def teardown(request):
 
@@ -0,0 +1,128 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import threading
+import time
+import unittest
+import pytest
+import azure.cosmos.documents as documents
+import azure.cosmos.errors as errors
+from azure.cosmos.execution_context.multi_execution_aggregator import _MultiExecutionContextAggregator
+from azure.cosmos.execution_context.query_execution_info import _PartitionedQueryExecutionInfo
+
+pytestmark = pytest.mark.cosmosEmulator
+
+class ParallelQueryUnitTests(unittest.TestCase):
+    """Tests the parallel prefetch of the pages of the partition key ranges of a cross partition query,
+    against a mocked client.
+    """
+
+    class MockedRoutingMapProvider(object):
+
+        def __init__(self, partition_key_ranges):
+            self.partition_key_ranges = partition_key_ranges
+
+        def get_overlapping_ranges(self, collection_link, ranges):
+            return self.partition_key_ranges
+
+    class MockedCosmosClientConnection(object):
+
+        def __init__(self, pages_by_range, error_range_id=None):
+            self.pages_by_range = pages_by_range
+            self.error_range_id = error_range_id
+            self.connection_policy = documents.ConnectionPolicy()
+            self._global_endpoint_manager = None
+            self.last_response_headers = {}
+            self._routing_map_provider = ParallelQueryUnitTests.MockedRoutingMapProvider(
+                [{'id': range_id, 'minInclusive': range_id, 'maxExclusive': range_id + 'FF'}
+                 for range_id in sorted(pages_by_range)])
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.requests = 0
+            self.threads = set()
+
+        def QueryFeed(self, path, collection_id, query, options, partition_key_range_id):
+            with self.lock:
+                self.requests += 1
+                self.threads.add(threading.current_thread().name)
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                # holds the requests briefly, so that concurrent requests overlap
+                time.sleep(0.02)
+                if partition_key_range_id == self.error_range_id:
+                    raise errors.HTTPFailure(500, 'Internal Server Error')
+                pages = self.pages_by_range[partition_key_range_id]
+                index = int(options.get('continuation') or 0)
+                headers = {'x-ms-continuation': str(index + 1)} if index + 1 < len(pages) else {}
+                return pages[index], headers
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+
+    def setUp(self):
+        # the values of each partition key range, in order, by pages of 2 documents
+        self.pages_by_range = {}
+        for i, range_id in enumerate(['0', '1', '2', '3', '4', '5']):
+            values = list(range(i, 60, 6))
+            self.pages_by_range[range_id] = [
+                [{'orderByItems': [{'item': value}], 'payload': {'value': value}} for value in values[j:j + 2]]
+                for j in range(0, len(values), 2)]
+        self.query_execution_info = _PartitionedQueryExecutionInfo({
+            'queryInfo': {'orderBy': ['Ascending'], 'rewrittenQuery': 'SELECT * FROM root r ORDER BY r.value'},
+            'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]})
+
+    def _query(self, client, options):
+        aggregator = _MultiExecutionContextAggregator(
+            client, 'dbs/db/colls/coll', 'SELECT * FROM root r ORDER BY r.value', options,
+            self.query_execution_info)
+        return [result['payload']['value'] for result in aggregator]
+
+    def test_sequential_query(self):
+        client = ParallelQueryUnitTests.MockedCosmosClientConnection(self.pages_by_range)
+
+        self.assertEqual(self._query(client, {}), list(range(60)))
+        self.assertEqual(client.max_in_flight, 1)
+        self.assertEqual(client.requests, 30)
+
+    def test_parallel_query_stays_ordered(self):
+        client = ParallelQueryUnitTests.MockedCosmosClientConnection(self.pages_by_range)
+
+        self.assertEqual(self._query(client, {'maxDegreeOfParallelism': 3}), list(range(60)))
+        self.assertEqual(client.max_in_flight, 3)
+        self.assertEqual(client.requests, 30)
+        # the pages are fetched by the same threads rather than a thread per page
+        self.assertLessEqual(len(client.threads), 3)
+
+        client = ParallelQueryUnitTests.MockedCosmosClientConnection(self.pages_by_range)
+
+        self.assertEqual(self._query(client, {'maxDegreeOfParallelism': -1}), list(range(60)))
+        self.assertEqual(client.max_in_flight, 6)
+
+    def test_parallel_query_error(self):
+        client = ParallelQueryUnitTests.MockedCosmosClientConnection(self.pages_by_range, error_range_id='3')
+
+        with self.assertRaises(errors.HTTPFailure):
+            self._query(client, {'maxDegreeOfParallelism': 6})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -204,5 +204,35 @@ class CollectionRoutingMapTests(unittest.TestCase):
 
         self.assertIsNotNone(crm)
 
+    def test_try_combine(self):
+        crm = _CollectionRoutingMap.CompleteRoutingMap(
+                    [
+                        ({ 'id' : "0", 'minInclusive' : "", 'maxExclusive' : "0000000030"}, True),
+                        ({ 'id' : "1", 'minInclusive' : "0000000030", 'maxExclusive' : "FF"}, True),
+                    ]
+            , "", '"1"')
+
+        # the children of a split range replace it
+        combined = crm.try_combine(
+                    [
+                        ({ 'id' : "2", 'minInclusive' : "0000000030", 'maxExclusive' : "0000000070", 'parents' : ["1"]}, True),
+                        ({ 'id' : "3", 'minInclusive' : "0000000070", 'maxExclusive' : "FF", 'parents' : ["1"]}, True),
+                    ]
+            , '"2"')
+        self.assertEqual([r['id'] for r in combined.get_ordered_partition_key_ranges()], ["0", "2", "3"])
+        self.assertIsNone(combined.get_range_by_partition_key_range_id("1"))
+        self.assertEqual(combined.change_feed_next_if_none_match, '"2"')
+        self.assertEqual(crm.change_feed_next_if_none_match, '"1"')
+
+        # some of the children are missing
+        self.assertIsNone(crm.try_combine(
+                    [({ 'id' : "2", 'minInclusive' : "0000000030", 'maxExclusive' : "0000000070", 'parents' : ["1"]}, True)]
+            , '"2"'))
+
+        # the parent of a range is unknown
+        self.assertIsNone(crm.try_combine(
+                    [({ 'id' : "5", 'minInclusive' : "0000000020", 'maxExclusive' : "0000000070", 'parents' : ["4"]}, True)]
+            , '"2"'))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,102 @@
+#The MIT License (MIT)
+#Copyright (c) 2019 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import unittest
+import pytest
+from azure.cosmos.murmur_hash import _MurmurHash128
+from azure.cosmos.partition_key import PartitionKey, _Empty, _Undefined
+from azure.cosmos.routing.collection_routing_map import _CollectionRoutingMap
+from azure.cosmos.routing import effective_partition_key
+
+pytestmark = pytest.mark.cosmosEmulator
+
+class EffectivePartitionKeyTests(unittest.TestCase):
+
+    def test_murmur_hash_128(self):
+        self.assertEqual(_MurmurHash128._ComputeHash(bytearray(b'')), (0, 0))
+        self.assertEqual(_MurmurHash128._ComputeHash(bytearray(b'hello')), (0xcbd8a7b341bd9b02, 0x5b1e906a48ae1d19))
+        self.assertEqual(_MurmurHash128._ComputeHash(bytearray(b'The quick brown fox jumps over the lazy dog')),
+                         (0xe34bbc7bbc071b6c, 0x7a433ca9c49a9347))
+        self.assertEqual(_MurmurHash128().ComputeHash(bytearray(b'hello')),
+                         bytearray(b'\x02\x9b\xbdA\xb3\xa7\xd8\xcb\x19\x1d\xaeHj\x90\x1e['))
+
+    def test_hash_v1(self):
+        definition = {'paths': ['/pk'], 'kind': 'Hash'}
+        for value, expected in [
+                ('', '05C1CF33970FF80800'),
+                ('partitionKey', '05C1E1B3D9CD2608716273756A756A706F4C667A00'),
+                ('redmond', '05C1EFE313830C087366656E706F6500'),
+                (True, '05C1D7C5A903D803'),
+                (False, '05C1DB857D857C02'),
+                (None, '05C1ED45D7475601'),
+                (5.0, '05C1D9C1C5517C05C014'),
+                (-1, '05C1D1A5BDDF9C054010')]:
+            self.assertEqual(effective_partition_key.GetEffectivePartitionKey(definition, value), expected)
+
+        # strings are hashed and encoded on their first 100 characters
+        self.assertEqual(effective_partition_key.GetEffectivePartitionKey(definition, 'x' * 101),
+                         effective_partition_key.GetEffectivePartitionKey(definition, 'x' * 100))
+
+    def test_hash_v2(self):
+        definition = PartitionKey(path='/pk', kind='Hash', version=2)
+        self.assertEqual(definition.version, 2)
+        for value, expected in [
+                ('', '32E9366E637A71B4E710384B2F4970A0'),
+                ('partitionKey', '013AEFCF77FA271571CF665A58C933F1'),
+                ('redmond', '22E342F38A486A088463DFF7838A5963'),
+                (True, '0E711127C5B5A8E4726AC6DD306A3E59'),
+                (False, '2FE1BE91E90A3439635E0E9E37361EF2'),
+                (None, '378867E4430E67857ACE5C908374FE16'),
+                (_Undefined, '11622DAA78F835834610ABE56EFF5CB5'),
+                (5.5, '0E2EE47829D1AF775EEFB6540FD1D0ED'),
+                (5, '19C08621B135968252FB34B4CF66F811'),
+                (5.0, '19C08621B135968252FB34B4CF66F811')]:
+            self.assertEqual(effective_partition_key.GetEffectivePartitionKey(definition, value), expected)
+
+        self.assertEqual(effective_partition_key.GetEffectivePartitionKey(definition, _Empty), '')
+
+    def test_range_partitioning(self):
+        definition = {'paths': ['/pk'], 'kind': 'Range'}
+        self.assertEqual(effective_partition_key.GetEffectivePartitionKey(definition, 'abc'), '0862636400')
+        self.assertEqual(effective_partition_key.GetEffectivePartitionKey(definition, 'x' * 150),
+                         '08' + '79' * 101)
+
+    def test_batch(self):
+        definition = {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+        values = ['redmond', True, 1, 1.0, 'redmond', None, [1, 2]]
+        self.assertEqual(effective_partition_key.GetEffectivePartitionKeys(definition, values),
+                         [effective_partition_key.GetEffectivePartitionKey(definition, value) for value in values])
+
+    def test_range_by_effective_partition_key(self):
+        partition_key_ranges = [{u'id': u'0', u'minInclusive': u'', u'maxExclusive': u'1F'},
+                                {u'id': u'1', u'minInclusive': u'1F', u'maxExclusive': u'3F'},
+                                {u'id': u'2', u'minInclusive': u'3F', u'maxExclusive': u'FF'}]
+        collection_routing_map = _CollectionRoutingMap.CompleteRoutingMap(
+            [(r, True) for r in partition_key_ranges], 'sample collection id')
+        definition = {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+        effective_partition_keys = effective_partition_key.GetEffectivePartitionKeys(
+            definition, ['partitionKey', 'redmond', '', _Empty])
+
+        ranges = collection_routing_map.get_ranges_by_effective_partition_keys(effective_partition_keys)
+        self.assertEqual([r['id'] for r in ranges], ['0', '1', '1', '0'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,6 +19,7 @@
 #OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 #SOFTWARE.
 
+import threading
 import unittest
 import pytest
 from azure.cosmos.routing.routing_map_provider import _SmartRoutingMapProvider
@@ -34,8 +35,18 @@ class RoutingMapProviderTests(unittest.TestCase):
         
         def __init__(self, partition_key_ranges):
             self.partition_key_ranges = partition_key_ranges
+            # the partition key ranges changed since each etag of the change feed
+            self.changes_by_etag = {}
+            self.etag = '"1"'
+            self.continuations = []
             
-        def _ReadPartitionKeyRanges(self, collection_link):
+        def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
+            continuation = (feed_options or {}).get('continuation')
+            self.continuations.append(continuation)
+            if response_hook:
+                response_hook({'etag': self.etag}, None)
+            if continuation:
+                return self.changes_by_etag.get(continuation, [])
             return self.partition_key_ranges
 
     def setUp(self):
@@ -180,6 +191,75 @@ class RoutingMapProviderTests(unittest.TestCase):
         self.assertEqual(overlapping_partition_key_ranges, self.cached_collection_routing_map.get_overlapping_ranges(queryRanges))
 
         
+    def test_incremental_refresh(self):
+        provider = self.smart_routing_map_provider
+        client = provider._documentClient
+        pkRange = routing_range._Range("", "FF", True, False)
+        provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange])
+        provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange])
+        self.assertEqual(client.continuations, [None])
+
+        # the last range is split, and only the changes since the etag of the routing map are read
+        children = [{u'id': u'5', u'minInclusive': u'05C1E9CD673398', u'maxExclusive': u'05C1F0', u'parents': [u'4']},
+                    {u'id': u'6', u'minInclusive': u'05C1F0', u'maxExclusive': u'FF', u'parents': [u'4']}]
+        client.changes_by_etag['"1"'] = children
+        client.etag = '"2"'
+        provider.invalidate('dbs/db/colls/coll')
+        self.assertEqual(provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange]), self.partition_key_ranges[:4] + children)
+        self.assertEqual(client.continuations, [None, '"1"'])
+
+        # the ranges haven't changed
+        provider.invalidate('dbs/db/colls/coll')
+        self.assertEqual(provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange]), self.partition_key_ranges[:4] + children)
+        self.assertEqual(client.continuations, [None, '"1"', '"2"'])
+
+        # the change of a range whose split was missed overlaps the cached ranges, so they are all read again
+        client.changes_by_etag['"2"'] = [{u'id': u'8', u'minInclusive': u'05C1E9CD673398', u'maxExclusive': u'FF', u'parents': [u'7']}]
+        client.partition_key_ranges = self.partition_key_ranges[:4] + client.changes_by_etag['"2"']
+        provider.invalidate('dbs/db/colls/coll')
+        self.assertEqual(provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange]), client.partition_key_ranges)
+        self.assertEqual(client.continuations, [None, '"1"', '"2"', '"2"', None])
+
+        self.assertEqual(provider.get_statistics(), {
+            'hits': 1, 'misses': 4, 'incremental_refreshes': 2, 'full_refreshes': 1, 'invalidations': 3, 'evictions': 0})
+
+    def test_eviction(self):
+        provider = self.smart_routing_map_provider
+        now = [0]
+        provider._clock = lambda: now[0]
+        provider._collection_ttl = 10
+        pkRange = routing_range._Range("", "FF", True, False)
+        provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange])
+
+        now[0] = 5
+        provider.get_overlapping_ranges('dbs/db/colls/other', [pkRange])
+        now[0] = 12
+        provider.get_overlapping_ranges('dbs/db/colls/other', [pkRange])
+
+        # the routing map unused for the collection ttl was evicted, and is read again on its next use
+        self.assertEqual(provider.get_statistics()['evictions'], 1)
+        provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange])
+        self.assertEqual(provider._documentClient.continuations, [None, None, None])
+
+    def test_concurrent_statistics(self):
+        provider = self.smart_routing_map_provider
+        pkRange = routing_range._Range("", "FF", True, False)
+        provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange])
+
+        def lookup():
+            for _ in range(500):
+                provider.get_overlapping_ranges('dbs/db/colls/coll', [pkRange])
+                provider.invalidate('dbs/db/colls/other')
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # no update of the counters is lost to a concurrent one
+        statistics = provider.get_statistics()
+        self.assertEqual((statistics['hits'], statistics['misses'], statistics['invalidations']), (4000, 1, 0))
+
     def validate_overlapping_ranges_results(self, queryRanges, expected_overlapping_partition_key_ranges):    
         overlapping_partition_key_ranges = self.get_overlapping_ranges(queryRanges)
         self.assertEqual(overlapping_partition_key_ranges, expected_overlapping_partition_key_ranges)
@@ -5,48 +5,16 @@
 # --------------------------------------------------------------------------
 
 import os
+import sys
 
 from typing import Union, Iterable, AnyStr, IO, Any # pylint: disable=unused-import
 from .version import VERSION
-from .blob_client import BlobClient
-from .container_client import ContainerClient
-from .blob_service_client import BlobServiceClient
-from .lease import LeaseClient
-from .polling import CopyStatusPoller
-from ._shared.policies import ExponentialRetry, LinearRetry, NoRetry
 from ._shared.models import(
     LocationMode,
     ResourceTypes,
     AccountPermissions,
     StorageErrorCode
 )
-from ._blob_utils import StorageStreamDownloader
-from .models import (
-    BlobType,
-    BlockState,
-    StandardBlobTier,
-    PremiumPageBlobTier,
-    SequenceNumberAction,
-    PublicAccess,
-    Logging,
-    Metrics,
-    RetentionPolicy,
-    StaticWebsite,
-    CorsRule,
-    ContainerProperties,
-    ContainerPropertiesPaged,
-    BlobProperties,
-    BlobPropertiesPaged,
-    BlobPrefix,
-    LeaseProperties,
-    ContentSettings,
-    CopyProperties,
-    BlobBlock,
-    PageRange,
-    AccessPolicy,
-    ContainerPermissions,
-    BlobPermissions,
-)
 
 __version__ = VERSION
 
@@ -82,6 +50,7 @@ __all__ = [
     'CopyProperties',
     'BlobBlock',
     'PageRange',
+    'BulkCopyResult',
     'AccessPolicy',
     'ContainerPermissions',
     'BlobPermissions',
@@ -89,8 +58,102 @@ __all__ = [
     'AccountPermissions',
     'CopyStatusPoller',
     'StorageStreamDownloader',
+    'PartialBatchErrorException',
 ]
 
+# The clients and models import the generated code, the most expensive import of this package:
+# on Python 3.7+, they are imported on first access instead (PEP 562).
+_LAZY_MODULES = {
+    '.blob_client': ['BlobClient'],
+    '.container_client': ['ContainerClient'],
+    '.blob_service_client': ['BlobServiceClient'],
+    '.lease': ['LeaseClient'],
+    '.polling': ['CopyStatusPoller'],
+    '._shared.policies': ['ExponentialRetry', 'LinearRetry', 'NoRetry'],
+    '._blob_utils': ['StorageStreamDownloader'],
+    '._blob_batch': ['PartialBatchErrorException'],
+    '.models': [
+        'BlobType',
+        'BlockState',
+        'StandardBlobTier',
+        'PremiumPageBlobTier',
+        'SequenceNumberAction',
+        'PublicAccess',
+        'Logging',
+        'Metrics',
+        'RetentionPolicy',
+        'StaticWebsite',
+        'CorsRule',
+        'ContainerProperties',
+        'ContainerPropertiesPaged',
+        'BlobProperties',
+        'BlobPropertiesPaged',
+        'BlobPrefix',
+        'LeaseProperties',
+        'ContentSettings',
+        'CopyProperties',
+        'BlobBlock',
+        'PageRange',
+        'BulkCopyResult',
+        'AccessPolicy',
+        'ContainerPermissions',
+        'BlobPermissions',
+    ],
+}
+_LAZY_ATTRIBUTES = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+if sys.version_info >= (3, 7):
+    import importlib
+
+    def __getattr__(name):
+        try:
+            module_name = _LAZY_ATTRIBUTES[name]
+        except KeyError:
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+else:
+    # pylint: disable=unused-import
+    from .blob_client import BlobClient
+    from .container_client import ContainerClient
+    from .blob_service_client import BlobServiceClient
+    from .lease import LeaseClient
+    from .polling import CopyStatusPoller
+    from ._shared.policies import ExponentialRetry, LinearRetry, NoRetry
+    from ._blob_utils import StorageStreamDownloader
+    from ._blob_batch import PartialBatchErrorException
+    from .models import (
+        BlobType,
+        BlockState,
+        StandardBlobTier,
+        PremiumPageBlobTier,
+        SequenceNumberAction,
+        PublicAccess,
+        Logging,
+        Metrics,
+        RetentionPolicy,
+        StaticWebsite,
+        CorsRule,
+        ContainerProperties,
+        ContainerPropertiesPaged,
+        BlobProperties,
+        BlobPropertiesPaged,
+        BlobPrefix,
+        LeaseProperties,
+        ContentSettings,
+        CopyProperties,
+        BlobBlock,
+        PageRange,
+        BulkCopyResult,
+        AccessPolicy,
+        ContainerPermissions,
+        BlobPermissions,
+    )
+
 
 def upload_blob_to_url(
         blob_url,  # type: str
@@ -122,6 +185,8 @@ def upload_blob_to_url(
     :returns: Blob-updated property dict (Etag and last modified)
     :rtype: dict(str, Any)
     """
+    from .blob_client import BlobClient
+    from .models import BlobType
     with BlobClient(blob_url, credential=credential) as client:
         return client.upload_blob(
             data=data,
@@ -166,6 +231,7 @@ def download_blob_from_url(
         If the URL already has a SAS token, specifying an explicit credential will take priority.
     :rtype: None
     """
+    from .blob_client import BlobClient
     with BlobClient(blob_url, credential=credential) as client:
         if hasattr(output, 'write'):
             _download_to_stream(client, output, max_connections, **kwargs)
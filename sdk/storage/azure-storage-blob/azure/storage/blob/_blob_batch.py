@@ -0,0 +1,180 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import re
+import uuid
+from typing import (  # pylint: disable=unused-import
+    Any, List, Optional, TYPE_CHECKING
+)
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse  # type: ignore
+
+from requests.structures import CaseInsensitiveDict
+from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline import PipelineRequest, PipelineContext
+from azure.core.pipeline.transport import HttpRequest, HttpResponse
+
+from ._shared.authentication import SharedKeyCredentialPolicy
+from ._shared.policies import StorageHeadersPolicy
+from ._shared.utils import process_storage_error
+
+# The largest number of sub-requests in a batch, and the first service version supporting batches.
+MAX_BATCH_SIZE = 256
+_BATCH_VERSION = '2018-11-09'
+_BLANK_LINE = re.compile(b'\r?\n\r?\n')
+
+
+class PartialBatchErrorException(HttpResponseError):
+    """Raised when some of the sub-requests of a batch operation failed.
+
+    :param str message: The message of the error.
+    :param response: The response of the batch request in which a sub-request failed first.
+    :type response: ~azure.core.pipeline.transport.HttpResponse
+    :param parts: The responses of all the sub-requests, in the order of the requests.
+    :type parts: list(~azure.core.pipeline.transport.HttpResponse)
+    """
+
+    def __init__(self, message, response, parts):
+        self.parts = parts
+        super(PartialBatchErrorException, self).__init__(message=message, response=response)
+
+
+class BatchSubResponse(HttpResponse):
+    """The response to a sub-request, read from the body of a batch response.
+
+    :param request: The sub-request.
+    :type request: ~azure.core.pipeline.transport.HttpRequest
+    :param int status_code: The status code of the sub-request.
+    :param str reason: The status reason of the sub-request.
+    :param dict headers: The headers of the sub-response.
+    :param bytes body: The body of the sub-response, e.g. the error details.
+    :param batch_response: The response of the batch request.
+    :type batch_response: ~azure.core.pipeline.transport.HttpResponse
+    """
+
+    def __init__(self, request, status_code, reason, headers, body, batch_response):
+        super(BatchSubResponse, self).__init__(request, None)
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = CaseInsensitiveDict(headers)
+        self.content_type = self.headers.get('content-type')
+        self.batch_response = batch_response
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+def build_batch_request(url, sub_requests, credential, token=None):
+    # type: (str, List[HttpRequest], Any, Optional[str]) -> HttpRequest
+    """Sign the sub-requests and serialize them in a multipart/mixed batch request.
+
+    Each sub-request is dated and signed like any request of the client pipeline,
+    so this is done right before the batch is sent: the SharedKey credential signs
+    each of them, a token credential authorizes them with the given token, and a
+    SAS is in the query of their URL already.
+
+    :param str url: The URL of the batch request.
+    :param sub_requests: The sub-requests, with a Content-Length of 0.
+    :param credential: The credential of the client.
+    :param str token: The bearer token for a token credential.
+    :rtype: ~azure.core.pipeline.transport.HttpRequest
+    """
+    boundary = 'batch_{}'.format(uuid.uuid4())
+    headers_policy = StorageHeadersPolicy()
+    lines = []
+    for index, sub_request in enumerate(sub_requests):
+        sub_request.headers['Content-Length'] = '0'
+        pipeline_request = PipelineRequest(sub_request, PipelineContext(None))
+        headers_policy.on_request(pipeline_request)
+        if isinstance(credential, SharedKeyCredentialPolicy):
+            credential.on_request(pipeline_request)
+        elif token:
+            sub_request.headers['Authorization'] = 'Bearer {}'.format(token)
+
+        parsed = urlparse(sub_request.url)
+        target = parsed.path + ('?' + parsed.query if parsed.query else '')
+        lines.extend([
+            '--' + boundary,
+            'Content-Type: application/http',
+            'Content-Transfer-Encoding: binary',
+            'Content-ID: {}'.format(index),
+            '',
+            '{} {} HTTP/1.1'.format(sub_request.method, target)])
+        lines.extend('{}: {}'.format(name, value) for name, value in sub_request.headers.items())
+        lines.append('')
+    lines.extend(['--' + boundary + '--', ''])
+
+    request = HttpRequest('POST', url, headers={
+        'Content-Type': 'multipart/mixed; boundary=' + boundary,
+        'x-ms-version': _BATCH_VERSION})
+    request.format_parameters({'comp': 'batch'})
+    request.set_bytes_body('\r\n'.join(lines).encode('utf-8'))
+    return request
+
+
+def _split_message(data):
+    parts = _BLANK_LINE.split(data, 1)
+    head = [line.strip() for line in parts[0].decode('utf-8').splitlines() if line.strip()]
+    return head, parts[1] if len(parts) > 1 else b''
+
+
+def _parse_headers(lines):
+    headers = {}
+    for line in lines:
+        name, _, value = line.partition(':')
+        headers[name.strip()] = value.strip()
+    return headers
+
+
+def parse_batch_response(response, sub_requests):
+    # type: (HttpResponse, List[HttpRequest]) -> List[BatchSubResponse]
+    """Parse the response of each sub-request from the body of a batch response.
+
+    :param response: The batch response, with its body loaded.
+    :type response: ~azure.core.pipeline.transport.HttpResponse
+    :param sub_requests: The sub-requests of the batch.
+    :returns: The response of each sub-request, in the order of the sub-requests.
+    :rtype: list(~azure.storage.blob._blob_batch.BatchSubResponse)
+    """
+    if response.status_code != 202:
+        process_storage_error(HttpResponseError(response=response))
+    match = re.search(r'boundary="?([^";]+)"?', response.headers.get('Content-Type', ''))
+    if not match:
+        raise HttpResponseError(message="The batch response is not multipart/mixed.", response=response)
+
+    results = [None] * len(sub_requests)  # type: List[Any]
+    delimiter = b'--' + match.group(1).encode('utf-8')
+    for position, part in enumerate(response.body().split(delimiter)[1:]):
+        if part.startswith(b'--'):
+            break
+        mime_headers, message = _split_message(part.lstrip(b'\r\n'))
+        index = int(_parse_headers(mime_headers).get('Content-ID', position))
+        head, body = _split_message(message)
+        _, status_code, reason = (head[0].split(' ', 2) + [''])[:3]
+        if body.endswith(b'\r\n'):
+            body = body[:-2]
+        results[index] = BatchSubResponse(
+            sub_requests[index], int(status_code), reason, _parse_headers(head[1:]), body, response)
+
+    if any(result is None for result in results):
+        raise HttpResponseError(
+            message="The batch response is missing the response of some sub-requests.", response=response)
+    return results
+
+
+def raise_on_failures(parts):
+    # type: (List[BatchSubResponse]) -> None
+    """Raise a PartialBatchErrorException if any of the sub-requests failed."""
+    failed = [part for part in parts if part.status_code >= 400]
+    if failed:
+        raise PartialBatchErrorException(
+            message="{} of the {} sub-requests of the batch operation failed.".format(len(failed), len(parts)),
+            response=failed[0].batch_response,
+            parts=parts)
@@ -0,0 +1,161 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import time
+from threading import Lock
+from typing import (  # pylint: disable=unused-import
+    Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+)
+
+from .models import BlobType, BulkCopyResult
+
+if TYPE_CHECKING:
+    from .models import BlobProperties
+
+# Put Block From URL takes blocks of at most 100MB.
+MAX_COPY_BLOCK_SIZE = 100 * 1024 * 1024
+_COPY_ENDED = ('success', 'aborted', 'failed')
+
+
+def get_copy_status(status):
+    # type: (Any) -> str
+    """The status of a copy operation, as a lower case string."""
+    return str(getattr(status, 'value', status) or '').lower()
+
+
+class BulkCopyTracker(object):  # pylint: disable=too-many-instance-attributes
+    """Follows the copies of a bulk copy, and aggregates their results.
+
+    Block blobs of at least min_staged_copy_size are copied by staging their blocks
+    from the source URL, as these copies complete in a time proportional to their
+    size and the blocks can be staged in parallel. The other blobs are copied by an
+    asynchronous copy of the service, which costs a single request to start, and are
+    pending until a poll of the destination finds their copy ended.
+
+    Staged copies complete on the threads staging their blocks, so the state is
+    guarded by a lock.
+
+    :param int min_staged_copy_size: The size from which block blobs are staged.
+    :param int block_size: The size of the blocks staged.
+    :param float polling_interval: The seconds between two polls of a pending copy.
+    """
+
+    def __init__(self, min_staged_copy_size, block_size, polling_interval):
+        self.min_staged_copy_size = min_staged_copy_size
+        self.block_size = max(1, min(block_size, MAX_COPY_BLOCK_SIZE))
+        self.polling_interval = polling_interval
+        self.result = BulkCopyResult()
+        self._pending = {}  # type: Dict[str, Tuple[Any, int]]
+        self._blocks_left = {}  # type: Dict[str, int]
+        self._lock = Lock()
+        self._clock = time.time
+        self._start = self._clock()
+        self._next_poll = None  # type: Optional[float]
+
+    def plan(self, blob):
+        # type: (BlobProperties) -> Optional[List[Tuple[str, int, int]]]
+        """Choose how to copy a source blob.
+
+        :returns: The block ID, offset and length of each block to stage, or None
+            if the blob is copied by the service.
+        """
+        size = blob.size or 0
+        if blob.blob_type != BlobType.BlockBlob or size < self.min_staged_copy_size:
+            return None
+        blocks = [('{0:032d}'.format(offset), offset, min(self.block_size, size - offset))
+                  for offset in range(0, size, self.block_size)]
+        with self._lock:
+            self._blocks_left[blob.name] = len(blocks)
+        return blocks
+
+    def block_staged(self, name):
+        # type: (str) -> bool
+        """Record a block staged.
+
+        :returns: Whether it was the last block of the blob, the blocks are then ready to commit.
+        """
+        with self._lock:
+            if name not in self._blocks_left:
+                return False
+            self._blocks_left[name] -= 1
+            if self._blocks_left[name]:
+                return False
+            del self._blocks_left[name]
+            return True
+
+    def started(self, name, client, size, copy_status):
+        # type: (str, Any, int, Any) -> None
+        """Record an asynchronous copy started, with the BlobClient of its destination."""
+        if get_copy_status(copy_status) == 'success':
+            self.succeeded(name, size, staged=False)
+            return
+        with self._lock:
+            if not self._pending:
+                self._next_poll = self._clock() + self.polling_interval
+            self._pending[name] = (client, size)
+
+    def polled(self, name, properties):
+        # type: (str, BlobProperties) -> None
+        """Update a pending copy from the properties of its destination."""
+        status = get_copy_status(properties.copy.status)
+        if status not in _COPY_ENDED:
+            return
+        with self._lock:
+            _, size = self._pending.pop(name, (None, 0))
+        if status == 'success':
+            self.succeeded(name, size, staged=False)
+        else:
+            self.failed(name, ValueError("Copy operation {}: {}".format(
+                status, properties.copy.status_description)))
+
+    def succeeded(self, name, size, staged):
+        # type: (str, int, bool) -> None
+        with self._lock:
+            self.result.succeeded.append(name)
+            self.result.bytes_copied += size or 0
+            if staged:
+                self.result.staged_copies += 1
+            else:
+                self.result.server_copies += 1
+
+    def failed(self, name, error):
+        # type: (str, Exception) -> None
+        with self._lock:
+            self._blocks_left.pop(name, None)
+            self._pending.pop(name, None)
+            self.result.failed.setdefault(name, error)
+
+    @property
+    def pending(self):
+        # type: () -> bool
+        """Whether asynchronous copies are still pending."""
+        return bool(self._pending)
+
+    def time_to_poll(self):
+        # type: () -> Optional[float]
+        """The seconds left until the next poll of the pending copies, or None if none is pending."""
+        with self._lock:
+            if not self._pending:
+                return None
+            return max(0.0, self._next_poll - self._clock())
+
+    def due(self):
+        # type: () -> List[Tuple[str, Any]]
+        """The pending copies to poll now, with the BlobClient of their destination."""
+        with self._lock:
+            now = self._clock()
+            if not self._pending or now < self._next_poll:
+                return []
+            self._next_poll = now + self.polling_interval
+            return [(name, client) for name, (client, _) in self._pending.items()]
+
+    def finish(self):
+        # type: () -> BulkCopyResult
+        """The result, once all the copies have ended."""
+        self.result.elapsed = self._clock() - self._start
+        if self.result.elapsed > 0:
+            self.result.throughput = self.result.bytes_copied / self.result.elapsed
+        return self.result
@@ -5,6 +5,7 @@
 # --------------------------------------------------------------------------
 # pylint: disable=no-self-use
 
+import os
 import sys
 from io import BytesIO, SEEK_SET, UnsupportedOperation
 from typing import Optional, Union, Any, TypeVar, TYPE_CHECKING # pylint: disable=unused-import
@@ -19,18 +20,24 @@ from ._shared.utils import (
     return_response_headers)
 from ._shared.models import StorageErrorCode, ModifiedAccessConditions
 from ._shared.upload_chunking import (
+    MemoryMappedFile,
     upload_blob_chunks,
     upload_blob_substream_blocks,
     BlockBlobChunkUploader,
     PageBlobChunkUploader,
     AppendBlobChunkUploader)
 from ._shared.download_chunking import (
+    get_blob_decryptor,
     process_content,
     process_range_and_offset,
     ParallelBlobChunkDownloader,
-    SequentialBlobChunkDownloader
+    SequentialBlobChunkDownloader,
+    PositionalBlobChunkDownloader,
+    RangeFileWriter,
+    DownloadCheckpoint
 )
 from ._shared.encryption import _generate_blob_encryption_data, _encrypt_blob
+from ._shared.transfer_tuning import get_transfer_tuner, run_adaptive
 from ._generated.models import (
     StorageErrorException,
     BlockLookupList,
@@ -46,6 +53,7 @@ if TYPE_CHECKING:
 
 _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
 _ERROR_VALUE_SHOULD_BE_SEEKABLE_STREAM = '{0} should be a seekable file-like/io.IOBase type stream object.'
+_CHECKPOINT_SUFFIX = '.checkpoint'
 
 
 def _convert_mod_error(error):
@@ -129,12 +137,15 @@ def upload_block_blob(  # pylint: disable=too-many-locals
 
         # Do single put if the size is smaller than config.max_single_put_size
         if adjusted_count is not None and (adjusted_count < blob_settings.max_single_put_size):
-            try:
-                data = data.read(length)
-                if not isinstance(data, six.binary_type):
-                    raise TypeError('Blob data should be of type bytes.')
-            except AttributeError:
-                pass
+            if isinstance(data, MemoryMappedFile):
+                data = data.view(data.tell(), length)
+            else:
+                try:
+                    data = data.read(length)
+                    if not isinstance(data, six.binary_type):
+                        raise TypeError('Blob data should be of type bytes.')
+                except AttributeError:
+                    pass
             if key_encryption_key:
                 encryption_data, data = _encrypt_blob(data, key_encryption_key)
                 headers['x-ms-meta-encryptiondata'] = encryption_data
@@ -157,8 +168,13 @@ def upload_block_blob(  # pylint: disable=too-many-locals
             validate_content or require_encryption or \
             blob_settings.max_block_size < blob_settings.min_large_block_upload_threshold or \
             hasattr(stream, 'seekable') and not stream.seekable() or \
-            not hasattr(stream, 'seek') or not hasattr(stream, 'tell')
+            not hasattr(stream, 'seek') or not hasattr(stream, 'tell') or \
+            isinstance(stream, MemoryMappedFile)
 
+        # The sub-stream blocks are laid out up front, only their concurrency is tuned
+        tuner = get_transfer_tuner(
+            blob_settings, max_connections, blob_settings.max_block_size,
+            max_block_size=blob_settings.max_adaptive_block_size if use_original_upload_path else None)
         if use_original_upload_path:
             if key_encryption_key:
                 cek, iv, encryption_data = _generate_blob_encryption_data(key_encryption_key)
@@ -175,6 +191,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
                 timeout=timeout,
                 content_encryption_key=cek,
                 initialization_vector=iv,
+                transfer_tuner=tuner,
                 **kwargs
             )
         else:
@@ -188,6 +205,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
                 access_conditions=access_conditions,
                 uploader_class=BlockBlobChunkUploader,
                 timeout=timeout,
+                transfer_tuner=tuner,
                 **kwargs
             )
 
@@ -274,6 +292,7 @@ def upload_page_blob(
             timeout=timeout,
             content_encryption_key=cek,
             initialization_vector=iv,
+            transfer_tuner=get_transfer_tuner(blob_settings, max_connections, blob_settings.max_page_size),
             **kwargs)
     except StorageErrorException as error:
         try:
@@ -464,9 +483,16 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             self.key_encryption_key,
             self.key_resolver_function)
 
+        # The chunks start after the content of the first download, which ends before its
+        # range when the range was aligned to the cipher blocks of an encrypted blob.
+        self.chunks_start = self.initial_range[1] + 1 - self.initial_offset[1]
+
         self.download_size = None
         self.blob_size = None
         self.blob = self._initial_request()
+        # The encryption metadata and key are shared by all the chunks of the download
+        self._decryptor = get_blob_decryptor(
+            self.blob, self.require_encryption, self.key_encryption_key, self.key_resolver_function)
         self.properties = self.blob.properties
         self.properties.name = name
         self.properties.container = container
@@ -495,7 +521,9 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
                 self.initial_offset[1],
                 self.require_encryption,
                 self.key_encryption_key,
-                self.key_resolver_function)
+                self.key_resolver_function,
+                validate_content=self.validate_content,
+                decryptor=self._decryptor)
 
         if content is not None:
             yield content
@@ -512,7 +540,7 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             download_size=self.download_size,
             chunk_size=self.config.max_chunk_get_size,
             progress=self.first_get_size,
-            start_range=self.initial_range[1] + 1,  # start where the first download ended
+            start_range=self.chunks_start,
             end_range=end_blob,
             stream=None,
             validate_content=self.validate_content,
@@ -522,6 +550,7 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             require_encryption=self.require_encryption,
             key_encryption_key=self.key_encryption_key,
             key_resolver_function=self.key_resolver_function,
+            decryptor=self._decryptor,
             use_location=self.location_mode,
             cls=deserialize_blob_stream,
             **self.request_options)
@@ -658,7 +687,9 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
                 self.initial_offset[1],
                 self.require_encryption,
                 self.key_encryption_key,
-                self.key_resolver_function)
+                self.key_resolver_function,
+                validate_content=self.validate_content,
+                decryptor=self._decryptor)
         # Write the content to the user stream
         # Clear blob content since output has been written to user stream
         if content is not None:
@@ -671,13 +702,17 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             # Use the length unless it is over the end of the blob
             end_blob = min(self.blob_size, self.length + 1)
 
+        # Ranges validated with MD5 are limited to 4MB, only their concurrency is tuned
+        tuner = get_transfer_tuner(
+            self.config, max_connections, self.config.max_chunk_get_size,
+            max_block_size=None if self.validate_content else self.config.max_adaptive_block_size)
         downloader_class = ParallelBlobChunkDownloader if max_connections > 1 else SequentialBlobChunkDownloader
         downloader = downloader_class(
             blob_service=self.service,
             download_size=self.download_size,
             chunk_size=self.config.max_chunk_get_size,
             progress=self.first_get_size,
-            start_range=self.initial_range[1] + 1,  # start where the first download ended
+            start_range=self.chunks_start,
             end_range=end_blob,
             stream=stream,
             validate_content=self.validate_content,
@@ -687,11 +722,15 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             require_encryption=self.require_encryption,
             key_encryption_key=self.key_encryption_key,
             key_resolver_function=self.key_resolver_function,
+            decryptor=self._decryptor,
             use_location=self.location_mode,
             cls=deserialize_blob_stream,
+            transfer_tuner=tuner,
             **self.request_options)
 
-        if max_connections > 1:
+        if tuner is not None:
+            run_adaptive(downloader.process_chunk, downloader.get_chunk_offsets(), tuner)
+        elif max_connections > 1:
             import concurrent.futures
             executor = concurrent.futures.ThreadPoolExecutor(max_connections)
             list(executor.map(downloader.process_chunk, downloader.get_chunk_offsets()))
@@ -700,3 +739,97 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
                 downloader.process_chunk(chunk)
 
         return self.properties
+
+    def download_to_path(self, file_path, max_connections=1, resume=True):
+        """Download the contents of this blob to a local file.
+
+        The file is preallocated to the size of the download and the chunks are
+        written at their offsets as they arrive, so parallel connections do not
+        wait on each other to write. The chunks written so far are recorded in a
+        '.checkpoint' file next to the target, which is removed once the download
+        completes.
+
+        :param str file_path:
+            The path of the file to download to. An existing file is overwritten.
+        :param int max_connections:
+            The number of parallel connections with which to download.
+        :param bool resume:
+            Whether to resume an interrupted download of the same blob content to
+            the same path, skipping the chunks recorded in its checkpoint.
+            The default value is True.
+        :returns: The properties of the downloaded blob.
+        :rtype: ~azure.storage.blob.models.BlobProperties
+        """
+        checkpoint = DownloadCheckpoint(file_path + _CHECKPOINT_SUFFIX, {
+            'etag': self.properties.etag,
+            'offset': self.offset,
+            'size': self.download_size,
+            'start': self.chunks_start,
+            'chunk_size': self.config.max_chunk_get_size})
+        resumed = resume and os.path.exists(file_path) and checkpoint.load()
+        if self.download_size == 0:
+            content = b""
+        else:
+            content = process_content(
+                self.blob,
+                self.initial_offset[0],
+                self.initial_offset[1],
+                self.require_encryption,
+                self.key_encryption_key,
+                self.key_resolver_function,
+                validate_content=self.validate_content,
+                decryptor=self._decryptor)
+
+        with RangeFileWriter(file_path, self.download_size, keep=resumed) as target:
+            if content:
+                target.write_at(0, content)
+            if self._download_complete:
+                checkpoint.remove()
+                return self.properties
+
+            end_blob = self.blob_size
+            if self.length is not None:
+                # Use the length unless it is over the end of the blob
+                end_blob = min(self.blob_size, self.length + 1)
+
+            # The checkpoint records chunks of a fixed size, only the concurrency is tuned
+            tuner = get_transfer_tuner(self.config, max_connections, self.config.max_chunk_get_size)
+            checkpoint.open(resumed, target)
+            try:
+                downloader = PositionalBlobChunkDownloader(
+                    blob_service=self.service,
+                    download_size=self.download_size,
+                    chunk_size=self.config.max_chunk_get_size,
+                    progress=self.first_get_size,
+                    start_range=self.chunks_start,
+                    end_range=end_blob,
+                    stream=target,
+                    validate_content=self.validate_content,
+                    access_conditions=self.access_conditions,
+                    mod_conditions=self.mod_conditions,
+                    timeout=self.timeout,
+                    require_encryption=self.require_encryption,
+                    key_encryption_key=self.key_encryption_key,
+                    key_resolver_function=self.key_resolver_function,
+                    decryptor=self._decryptor,
+                    use_location=self.location_mode,
+                    cls=deserialize_blob_stream,
+                    checkpoint=checkpoint,
+                    stream_start=len(content),
+                    transfer_tuner=tuner,
+                    **self.request_options)
+
+                if tuner is not None:
+                    run_adaptive(downloader.process_chunk, downloader.get_chunk_offsets(), tuner)
+                elif max_connections > 1:
+                    import concurrent.futures
+                    executor = concurrent.futures.ThreadPoolExecutor(max_connections)
+                    list(executor.map(downloader.process_chunk, downloader.get_chunk_offsets()))
+                else:
+                    for chunk in downloader.get_chunk_offsets():
+                        downloader.process_chunk(chunk)
+            finally:
+                checkpoint.close()
+
+        checkpoint.remove()
+        return self.properties
@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import struct
+
+# The CRC64 of the storage service: the reflected ECMA-182 polynomial variant used by the
+# service, with the register and the result inverted. The value sent in x-ms-content-crc64
+# is the base64 of its 8 bytes, in little-endian order.
+CRC64_POLYNOMIAL = 0x9A6C9329AC4BC9B5
+_MASK = 0xFFFFFFFFFFFFFFFF
+
+# The 64-bit words read at once by the table-driven implementation.
+_WORDS_PER_READ = 8192
+
+_TABLES = None
+_C_CRC64 = None
+
+
+def _get_tables():
+    # The slicing-by-8 tables: table[k][b] is the CRC of byte b followed by k zero bytes.
+    global _TABLES  # pylint: disable=global-statement
+    if _TABLES is None:
+        table = []
+        for byte in range(256):
+            crc = byte
+            for _ in range(8):
+                crc = (crc >> 1) ^ CRC64_POLYNOMIAL if crc & 1 else crc >> 1
+            table.append(crc)
+        tables = [table]
+        for _ in range(7):
+            previous = tables[-1]
+            tables.append([(previous[byte] >> 8) ^ table[previous[byte] & 0xFF] for byte in range(256)])
+        _TABLES = tables
+    return _TABLES
+
+
+def _get_c_crc64():
+    # crcmod computes the CRC in C when its extension is built. Without it, the pure
+    # Python fallback of crcmod is slower than slicing-by-8, so it is not used.
+    global _C_CRC64  # pylint: disable=global-statement
+    if _C_CRC64 is None:
+        try:
+            from crcmod import mkCrcFun
+            from crcmod.crcmod import _usingExtension  # pylint: disable=no-name-in-module
+        except ImportError:
+            _usingExtension = False
+        if _usingExtension:
+            # crcmod takes the polynomial unreflected, with its x^64 term.
+            _C_CRC64 = mkCrcFun((1 << 64) | _reflect(CRC64_POLYNOMIAL), initCrc=0, rev=True, xorOut=_MASK)
+        else:
+            _C_CRC64 = False
+    return _C_CRC64
+
+
+def _reflect(value):
+    return int('{0:064b}'.format(value)[::-1], 2)
+
+
+def _compute_sliced(data, crc):
+    t0, t1, t2, t3, t4, t5, t6, t7 = _get_tables()
+    crc ^= _MASK
+    aligned = len(data) - len(data) % 8
+    for start in range(0, aligned, 8 * _WORDS_PER_READ):
+        count = min(_WORDS_PER_READ, (aligned - start) // 8)
+        for word in struct.unpack_from('<{}Q'.format(count), data, start):
+            crc ^= word
+            crc = (t7[crc & 0xFF] ^ t6[(crc >> 8) & 0xFF] ^ t5[(crc >> 16) & 0xFF] ^ t4[(crc >> 24) & 0xFF] ^
+                   t3[(crc >> 32) & 0xFF] ^ t2[(crc >> 40) & 0xFF] ^ t1[(crc >> 48) & 0xFF] ^ t0[crc >> 56])
+    for byte in bytearray(data[aligned:]):
+        crc = t0[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ _MASK
+
+
+def compute_crc64(data, crc=0, use_c_extension=True):
+    """Compute the CRC64 of data, continuing from the CRC64 of the data before it.
+
+    :param data: The data.
+    :type data: bytes or bytearray or memoryview
+    :param int crc: The CRC64 of the preceding data, 0 to start.
+    :param bool use_c_extension: Whether to compute the CRC64 with crcmod, when it is
+        installed with its C extension. Otherwise a table-driven slicing-by-8 is used.
+    :rtype: int
+    """
+    c_crc64 = _get_c_crc64() if use_c_extension else None
+    if c_crc64:
+        return c_crc64(bytes(data), crc)
+    return _compute_sliced(data, crc)
+
+
+class Crc64(object):
+    """Computes a CRC64 incrementally, like the hash objects of hashlib.
+
+    :param data: The first data to compute the CRC64 of.
+    """
+    digest_size = 8
+
+    def __init__(self, data=None):
+        self.crc = 0
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        self.crc = compute_crc64(data, self.crc)
+
+    def digest(self):
+        return struct.pack('<Q', self.crc)
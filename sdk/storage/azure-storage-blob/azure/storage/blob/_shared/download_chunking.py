@@ -3,13 +3,18 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import json
+import mmap
+import os
 import threading
+import time
 
-from azure.core.exceptions import HttpResponseError
+from azure.core.exceptions import AzureError, HttpResponseError
 
 from .models import ModifiedAccessConditions
-from .utils import validate_and_format_range_headers, process_storage_error
-from .encryption import _decrypt_blob
+from .utils import validate_and_format_range_headers, process_storage_error, encode_base64
+from .crc64 import Crc64
+from .encryption import _BlobDecryptor
 
 
 def process_range_and_offset(start_range, end_range, length, key_encryption_key, key_resolver_function):
@@ -35,16 +40,50 @@ def process_range_and_offset(start_range, end_range, length, key_encryption_key,
     return (start_range, end_range), (start_offset, end_offset)
 
 
-def process_content(blob, start_offset, end_offset, require_encryption, key_encryption_key, key_resolver_function):
+def validate_content_crc64(crc64, response):
+    expected_crc64 = response.headers.get('x-ms-content-crc64')
+    if expected_crc64:
+        computed_crc64 = encode_base64(crc64.digest())
+        if expected_crc64 != computed_crc64:
+            raise AzureError(
+                'CRC64 mismatch. Expected value is \'{0}\', computed value is \'{1}\'.'.format(
+                    expected_crc64, computed_crc64),
+                response=response
+            )
+
+
+class _ValidatedContent(object):
+    """Iterates the chunks of a download, validating their CRC64 once the last one is read."""
+
+    def __init__(self, chunks, response):
+        self.response = response
+        self._chunks = chunks
+
+    def __iter__(self):
+        crc64 = Crc64()
+        for chunk in self._chunks:
+            crc64.update(chunk)
+            yield chunk
+        validate_content_crc64(crc64, self.response)
+
+
+def get_blob_decryptor(blob, require_encryption, key_encryption_key, key_resolver_function):
+    """The decryptor shared by the ranges of a download, from its first response, if it uses encryption."""
+    if key_encryption_key is not None or key_resolver_function is not None:
+        return _BlobDecryptor(require_encryption, key_encryption_key, key_resolver_function, blob.response.headers)
+    return None
+
+
+def process_content(blob, start_offset, end_offset, require_encryption, key_encryption_key, key_resolver_function,
+                    validate_content=False, decryptor=None):
+    # The MD5 of a download is validated by the pipeline, its CRC64 while the chunks are read.
+    if validate_content == 'crc64':
+        blob = _ValidatedContent(blob, blob.response)
     if key_encryption_key is not None or key_resolver_function is not None:
         try:
-            return _decrypt_blob(
-                require_encryption,
-                key_encryption_key,
-                key_resolver_function,
-                blob,
-                start_offset,
-                end_offset)
+            if decryptor is None:
+                decryptor = get_blob_decryptor(blob, require_encryption, key_encryption_key, key_resolver_function)
+            return decryptor.decrypt(blob, start_offset, end_offset)
         except Exception as error:
             raise HttpResponseError(
                 message="Decryption failed.",
@@ -79,6 +118,7 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
         self.require_encryption = require_encryption
         self.key_encryption_key = key_encryption_key
         self.key_resolver_function = key_resolver_function
+        self.decryptor = kwargs.pop('decryptor', None)
 
         # parameters for each get blob operation
         self.timeout = timeout
@@ -87,26 +127,38 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
         self.mod_conditions = mod_conditions
         self.request_options = kwargs
 
+        # adaptive transfers tune the chunk size as the offsets are generated,
+        # so the size of each chunk is noted down for the worker downloading it
+        self.tuner = kwargs.get('transfer_tuner')
+        self.chunk_sizes = {}
+
     def _calculate_range(self, chunk_start):
-        if chunk_start + self.chunk_size > self.blob_end:
+        chunk_size = self.chunk_sizes.get(chunk_start, self.chunk_size)
+        if chunk_start + chunk_size > self.blob_end:
             chunk_end = self.blob_end
         else:
-            chunk_end = chunk_start + self.chunk_size
+            chunk_end = chunk_start + chunk_size
         return chunk_start, chunk_end
 
     def get_chunk_offsets(self):
         index = self.start_index
         while index < self.blob_end:
+            if self.tuner is not None:
+                self.chunk_size = self.tuner.block_size
+                self.chunk_sizes[index] = self.chunk_size
             yield index
             index += self.chunk_size
 
     def process_chunk(self, chunk_start):
+        started = time.time()
         chunk_start, chunk_end = self._calculate_range(chunk_start)
         chunk_data = self._download_chunk(chunk_start, chunk_end)
         length = chunk_end - chunk_start
         if length > 0:
             self._write_to_stream(chunk_data, chunk_start)
             self._update_progress(length)
+        if self.tuner is not None:
+            self.tuner.record(length, time.time() - started)
 
     def yield_chunk(self, chunk_start):
         chunk_start, chunk_end = self._calculate_range(chunk_start)
@@ -121,16 +173,17 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
         pass
 
     def _download_chunk(self, chunk_start, chunk_end):
+        # The end of the chunk is exclusive, the range aligned to the cipher blocks is inclusive.
         download_range, offset = process_range_and_offset(
             chunk_start,
-            chunk_end,
+            chunk_end - 1,
             chunk_end,
             self.key_encryption_key,
             self.key_resolver_function,
         )
         range_header, range_validation = validate_and_format_range_headers(
             download_range[0],
-            download_range[1] - 1,
+            download_range[1],
             check_content_md5=self.validate_content)
 
         try:
@@ -153,7 +206,9 @@ class _BlobChunkDownloader(object):  # pylint: disable=too-many-instance-attribu
             offset[1],
             self.require_encryption,
             self.key_encryption_key,
-            self.key_resolver_function)
+            self.key_resolver_function,
+            validate_content=self.validate_content,
+            decryptor=self.decryptor)
 
         # This makes sure that if_match is set so that we can validate
         # that subsequent downloads are to an unmodified blob
@@ -201,3 +256,187 @@ class SequentialBlobChunkDownloader(_BlobChunkDownloader):
     def _write_to_stream(self, chunk_data, chunk_start):
         # chunk_start is ignored in the case of sequential download since we cannot seek the destination stream
         self.stream.write(chunk_data)
+
+
+class PositionalBlobChunkDownloader(_BlobChunkDownloader):
+    """Downloads chunks into a RangeFileWriter, writing each one at its own offset.
+
+    Unlike ParallelBlobChunkDownloader, chunk writes are not serialized behind a
+    stream lock, and each chunk written is recorded in the checkpoint, if any, so
+    the chunks already on disk are skipped when a download is resumed.
+    """
+    def __init__(self, *args, **kwargs):
+        self.checkpoint = kwargs.pop('checkpoint', None)
+        self.stream_start = kwargs.pop('stream_start', 0)
+        super(PositionalBlobChunkDownloader, self).__init__(*args, **kwargs)
+        self.progress_lock = threading.Lock()
+        if self.checkpoint is not None:
+            for chunk_start in self.checkpoint.completed:
+                chunk_start, chunk_end = self._calculate_range(chunk_start)
+                self.progress_total += chunk_end - chunk_start
+
+    def get_chunk_offsets(self):
+        for chunk_start in super(PositionalBlobChunkDownloader, self).get_chunk_offsets():
+            if self.checkpoint is None or chunk_start not in self.checkpoint.completed:
+                yield chunk_start
+
+    def _update_progress(self, length):
+        with self.progress_lock:
+            self.progress_total += length
+
+    def _write_to_stream(self, chunk_data, chunk_start):
+        self.stream.write_at(self.stream_start + (chunk_start - self.start_index), chunk_data)
+        if self.checkpoint is not None:
+            self.checkpoint.add(chunk_start)
+
+
+class RangeFileWriter(object):
+    """A local file, preallocated to its final size, written at arbitrary offsets.
+
+    Writes use os.pwrite where it is available and a writable memory map of the
+    file otherwise, so concurrent writes to different ranges need no lock.
+
+    :param str path: The path of the file.
+    :param int size: The final size of the file.
+    :param bool keep: Whether to keep the current content of an existing file.
+    """
+    def __init__(self, path, size, keep=False):
+        self._file = open(path, 'r+b' if keep and os.path.exists(path) else 'w+b')
+        self._mmap = None
+        try:
+            self._file.truncate(size)
+            if size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(self._file.fileno(), 0, size)
+                except OSError:
+                    # Not supported by every file system, the file is then sparse.
+                    pass
+            if size and not hasattr(os, 'pwrite'):
+                self._mmap = mmap.mmap(self._file.fileno(), 0)
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write_at(self, offset, data):
+        if self._mmap is not None:
+            self._mmap[offset:offset + len(data)] = data
+            return
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(self._file.fileno(), view, offset)
+            view = view[written:]
+            offset += written
+
+    def sync(self):
+        """Flush the chunks written so far to the disk."""
+        if self._mmap is not None:
+            self._mmap.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+
+class DownloadCheckpoint(object):
+    """A sidecar file logging the chunks of a download that have been written.
+
+    The first line identifies the download (blob etag, range and chunking) and
+    each following line is the start of a chunk written to the target file. A
+    download is only resumed from a checkpoint whose identity matches.
+
+    The chunks are recorded by batches of `sync_interval`, and only once the target
+    file has been flushed to the disk, so that the checkpoint never lists a chunk lost
+    by a power failure.
+
+    :param str path: The path of the checkpoint file.
+    :param dict identity: The values identifying the download.
+    """
+    # The number of chunks recorded at once, after the target file is synced
+    sync_interval = 16
+
+    def __init__(self, path, identity):
+        self.path = path
+        self.identity = identity
+        self.completed = set()
+        self._file = None
+        self._target = None
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Read the chunks written by a previous attempt at the same download.
+
+        :returns: Whether a matching checkpoint was found.
+        :rtype: bool
+        """
+        try:
+            with open(self.path, 'r') as checkpoint:
+                if json.loads(checkpoint.readline()) != self.identity:
+                    return False
+                for line in checkpoint:
+                    if line.endswith('\n'):  # The last line may have been cut short.
+                        self.completed.add(int(line))
+        except (IOError, OSError, ValueError):
+            self.completed = set()
+            return False
+        return True
+
+    def open(self, resume, target=None):
+        """Start recording the chunks written.
+
+        :param bool resume: Whether to append to the checkpoint loaded.
+        :param target: The RangeFileWriter the chunks are written to, synced before they are recorded.
+        """
+        self._target = target
+        self._pending = []
+        if resume:
+            self._file = open(self.path, 'a')
+        else:
+            self.completed = set()
+            self._file = open(self.path, 'w')
+            self._file.write(json.dumps(self.identity) + '\n')
+            self._sync_file()
+
+    def add(self, chunk_start):
+        with self._lock:
+            self.completed.add(chunk_start)
+            self._pending.append(chunk_start)
+            if len(self._pending) >= self.sync_interval:
+                self._record_pending()
+
+    def _sync_file(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _record_pending(self):
+        if not self._pending:
+            return
+        if self._target is not None:
+            self._target.sync()
+        self._file.write(''.join('{}\n'.format(chunk_start) for chunk_start in self._pending))
+        self._sync_file()
+        self._pending = []
+
+    def close(self):
+        if self._file is not None:
+            with self._lock:
+                self._record_pending()
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,151 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import time
+
+from azure.core.exceptions import AzureError, HttpResponseError
+
+from .models import ModifiedAccessConditions
+from .utils import validate_and_format_range_headers, process_storage_error, encode_base64
+from .policies import StorageContentValidation
+from .crc64 import Crc64
+from .download_chunking import (
+    get_blob_decryptor,
+    process_range_and_offset,
+    validate_content_crc64,
+    ParallelBlobChunkDownloader as SyncParallelBlobChunkDownloader,
+    SequentialBlobChunkDownloader as SyncSequentialBlobChunkDownloader,
+    PositionalBlobChunkDownloader as SyncPositionalBlobChunkDownloader)
+
+
+class _DownloadedContent(list):
+    """The chunks read from an async download, exposing the response like the stream they came from."""
+
+    def __init__(self, chunks, response):
+        super(_DownloadedContent, self).__init__(chunks)
+        self.response = response
+
+
+def validate_content_md5(content, response):
+    expected_md5 = response.headers.get('content-md5')
+    if expected_md5:
+        computed_md5 = encode_base64(StorageContentValidation.get_content_md5(content))
+        if expected_md5 != computed_md5:
+            raise AzureError(
+                'MD5 mismatch. Expected value is \'{0}\', computed value is \'{1}\'.'.format(
+                    expected_md5, computed_md5),
+                response=response
+            )
+
+
+async def process_content(blob, start_offset, end_offset, require_encryption, key_encryption_key,
+                          key_resolver_function, validate_content=False, decryptor=None):
+    chunks = []
+    crc64 = Crc64() if validate_content == 'crc64' else None
+    async for chunk in blob:
+        chunks.append(chunk)
+        if crc64 is not None:
+            crc64.update(chunk)
+    if crc64 is not None:
+        validate_content_crc64(crc64, blob.response)
+    elif validate_content:
+        validate_content_md5(b"".join(chunks), blob.response)
+    if key_encryption_key is not None or key_resolver_function is not None:
+        try:
+            if decryptor is None:
+                decryptor = get_blob_decryptor(blob, require_encryption, key_encryption_key, key_resolver_function)
+            return decryptor.decrypt(_DownloadedContent(chunks, blob.response), start_offset, end_offset)
+        except Exception as error:
+            raise HttpResponseError(
+                message="Decryption failed.",
+                response=blob.response,
+                error=error)
+    else:
+        return b"".join(chunks)
+
+
+class _AsyncBlobChunkDownloader(object):
+    """Mixin awaiting the async generated download operation for each chunk."""
+
+    async def process_chunk(self, chunk_start):
+        started = time.time()
+        chunk_start, chunk_end = self._calculate_range(chunk_start)
+        chunk_data = await self._download_chunk(chunk_start, chunk_end)
+        length = chunk_end - chunk_start
+        if length > 0:
+            await self._write_chunk(chunk_data, chunk_start)
+            self._update_progress(length)
+        if self.tuner is not None:
+            self.tuner.record(length, time.time() - started)
+
+    async def _write_chunk(self, chunk_data, chunk_start):
+        self._write_to_stream(chunk_data, chunk_start)
+
+    async def yield_chunk(self, chunk_start):
+        chunk_start, chunk_end = self._calculate_range(chunk_start)
+        return await self._download_chunk(chunk_start, chunk_end)
+
+    async def _download_chunk(self, chunk_start, chunk_end):
+        # The end of the chunk is exclusive, the range aligned to the cipher blocks is inclusive.
+        download_range, offset = process_range_and_offset(
+            chunk_start,
+            chunk_end - 1,
+            chunk_end,
+            self.key_encryption_key,
+            self.key_resolver_function,
+        )
+        range_header, range_validation = validate_and_format_range_headers(
+            download_range[0],
+            download_range[1],
+            check_content_md5=self.validate_content)
+
+        try:
+            _, response = await self.blob_service.download(
+                timeout=self.timeout,
+                range=range_header,
+                range_get_content_md5=range_validation,
+                lease_access_conditions=self.access_conditions,
+                modified_access_conditions=self.mod_conditions,
+                validate_content=self.validate_content,
+                data_stream_total=self.download_size,
+                download_stream_current=self.progress_total,
+                **self.request_options)
+        except HttpResponseError as error:
+            process_storage_error(error)
+
+        chunk_data = await process_content(
+            response,
+            offset[0],
+            offset[1],
+            self.require_encryption,
+            self.key_encryption_key,
+            self.key_resolver_function,
+            validate_content=self.validate_content,
+            decryptor=self.decryptor)
+
+        # This makes sure that if_match is set so that we can validate
+        # that subsequent downloads are to an unmodified blob
+        if not self.mod_conditions:
+            self.mod_conditions = ModifiedAccessConditions()
+        self.mod_conditions.if_match = response.properties.etag
+        return chunk_data
+
+
+class ParallelBlobChunkDownloader(_AsyncBlobChunkDownloader, SyncParallelBlobChunkDownloader):
+    pass
+
+
+class SequentialBlobChunkDownloader(_AsyncBlobChunkDownloader, SyncSequentialBlobChunkDownloader):
+    pass
+
+
+class PositionalBlobChunkDownloader(_AsyncBlobChunkDownloader, SyncPositionalBlobChunkDownloader):
+    """Writes each chunk, and records it in the checkpoint, on the default executor of the loop."""
+
+    async def _write_chunk(self, chunk_data, chunk_start):
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._write_to_stream, chunk_data, chunk_start)
@@ -11,6 +11,7 @@ from json import (
     loads,
 )
 from collections import OrderedDict
+from threading import Lock
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher
@@ -286,15 +287,8 @@ def _encrypt_blob(blob, key_encryption_key):
     content_encryption_key = urandom(32)
     initialization_vector = urandom(16)
 
-    cipher = _generate_AES_CBC_cipher(content_encryption_key, initialization_vector)
-
-    # PKCS7 with 16 byte blocks ensures compatibility with AES.
-    padder = PKCS7(128).padder()
-    padded_data = padder.update(blob) + padder.finalize()
-
-    # Encrypt the data.
-    encryptor = cipher.encryptor()
-    encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
+    encryptor = _BlobEncryptor(content_encryption_key, initialization_vector)
+    encrypted_data = encryptor.update(blob) + encryptor.finalize()
     encryption_data = _generate_encryption_data_dict(key_encryption_key, content_encryption_key,
                                                      initialization_vector)
     encryption_data['EncryptionMode'] = 'FullBlob'
@@ -348,75 +342,192 @@ def _decrypt_blob(require_encryption, key_encryption_key, key_resolver,
     '''
     if response is None:
         raise ValueError("Response cannot be None.")
-    content = b"".join(list(response))
-    if not content:
-        return content
+    decryptor = _BlobDecryptor(require_encryption, key_encryption_key, key_resolver, response.response.headers)
+    return decryptor.decrypt(response, start_offset, end_offset)
 
-    try:
-        encryption_data = _dict_to_encryption_data(loads(response.response.headers['x-ms-meta-encryptiondata']))
-    except:  # pylint: disable=bare-except
-        if require_encryption:
-            raise ValueError(_ERROR_DATA_NOT_ENCRYPTED)
 
-        return content
+def _get_blob_encryptor(cek, iv, should_pad):
+    if cek is not None and iv is not None:
+        return _BlobEncryptor(cek, iv, pad=should_pad)
+    return None
 
-    if encryption_data.encryption_agent.encryption_algorithm != _EncryptionAlgorithm.AES_CBC_256:
-        raise ValueError(_ERROR_UNSUPPORTED_ENCRYPTION_ALGORITHM)
 
-    blob_type = response.response.headers['x-ms-blob-type']
+class _BlobEncryptor(object):
+    '''
+    Encrypts the content of a blob chunk by chunk, using AES256 in CBC mode with 128 bit padding.
 
-    iv = None
-    unpad = False
-    if 'content-range' in response.response.headers:
-        content_range = response.response.headers['content-range']
-        # Format: 'bytes x-y/size'
+    Each cipher block is chained to the one before it, so the chunks must be encrypted in order,
+    but only that block and the bytes of an incomplete block are kept between two chunks.
+    '''
 
-        # Ignore the word 'bytes'
-        content_range = content_range.split(' ')
+    def __init__(self, content_encryption_key, initialization_vector, pad=True):
+        '''
+        :param bytes content_encryption_key:
+            The content encryption key.
+        :param bytes initialization_vector:
+            The initialization vector.
+        :param bool pad:
+            Whether to pad the content with PKCS7. Page blobs are aligned and not padded.
+        '''
+        self._encryptor = _generate_AES_CBC_cipher(content_encryption_key, initialization_vector).encryptor()
+        self._padder = PKCS7(128).padder() if pad else None
 
-        content_range = content_range[1].split('-')
-        content_range = content_range[1].split('/')
-        end_range = int(content_range[0])
-        blob_size = int(content_range[1])
+    def update(self, data):
+        if self._padder:
+            data = self._padder.update(data)
+        return self._encryptor.update(data)
 
-        if start_offset >= 16:
-            iv = content[:16]
-            content = content[16:]
-            start_offset -= 16
-        else:
-            iv = encryption_data.content_encryption_IV
+    def finalize(self):
+        data = self._padder.finalize() if self._padder else b''
+        return self._encryptor.update(data) + self._encryptor.finalize()
 
-        if end_range == blob_size - 1:
-            unpad = True
-    else:
-        unpad = True
-        iv = encryption_data.content_encryption_IV
 
-    if blob_type == 'PageBlob':
+class _BlobDecryptor(object):
+    '''
+    Decrypts the ranges of a blob, as the chunks of their bodies are read.
+
+    The encryption metadata is read from the first response of a download, and the
+    content-encryption-key is unwrapped when the first range is decrypted. Both are then
+    shared by the other ranges of the download, whether they are downloaded in parallel or not.
+    '''
+
+    def __init__(self, require_encryption, key_encryption_key, key_resolver, headers):
+        '''
+        :param bool require_encryption:
+            Whether or not the calling blob service requires objects to be decrypted.
+        :param object key_encryption_key:
+            The user-provided key-encryption-key. See _decrypt_blob for more information.
+        :param key_resolver(kid):
+            The user-provided key resolver. See _decrypt_blob for more information.
+        :param dict headers:
+            The headers of a response of the download, with the encryption metadata.
+        '''
+        self.require_encryption = require_encryption
+        self.key_encryption_key = key_encryption_key
+        self.key_resolver = key_resolver
+        self._content_encryption_key = None
+        self._lock = Lock()
+        try:
+            self.encryption_data = _dict_to_encryption_data(loads(headers['x-ms-meta-encryptiondata']))
+        except:  # pylint: disable=bare-except
+            self.encryption_data = None
+
+    def get_content_encryption_key(self):
+        with self._lock:
+            if self._content_encryption_key is None:
+                if self.encryption_data.encryption_agent.encryption_algorithm != _EncryptionAlgorithm.AES_CBC_256:
+                    raise ValueError(_ERROR_UNSUPPORTED_ENCRYPTION_ALGORITHM)
+                self._content_encryption_key = _validate_and_unwrap_cek(
+                    self.encryption_data, self.key_encryption_key, self.key_resolver)
+            return self._content_encryption_key
+
+    def decrypt_range(self, headers, start_offset, end_offset):
+        '''
+        Starts decrypting a downloaded range.
+
+        :param dict headers:
+            The headers of the response of the range.
+        :param int start_offset:
+            The number of bytes to drop from the start of the range.
+        :param int end_offset:
+            The number of bytes to drop from the end of the range.
+        :rtype: _RangeDecryptor
+        '''
+        if self.encryption_data is None:
+            return _RangeDecryptor(None, None, False, 0, 0, self.require_encryption)
+
+        iv = None
         unpad = False
+        if 'content-range' in headers:
+            # Format: 'bytes x-y/size'
+            content_range = headers['content-range'].split(' ')[1]
+            end_range, blob_size = content_range.split('-')[1].split('/')
+
+            # A range that does not start the blob starts with the cipher block before it, its IV.
+            if start_offset >= 16:
+                start_offset -= 16
+            else:
+                iv = self.encryption_data.content_encryption_IV
+
+            if int(end_range) == int(blob_size) - 1:
+                unpad = True
+        else:
+            unpad = True
+            iv = self.encryption_data.content_encryption_IV
 
-    content_encryption_key = _validate_and_unwrap_cek(encryption_data, key_encryption_key, key_resolver)
-    cipher = _generate_AES_CBC_cipher(content_encryption_key, iv)
-    decryptor = cipher.decryptor()
+        if headers['x-ms-blob-type'] == 'PageBlob':
+            unpad = False
 
-    content = decryptor.update(content) + decryptor.finalize()
-    if unpad:
-        unpadder = PKCS7(128).unpadder()
-        content = unpadder.update(content) + unpadder.finalize()
+        return _RangeDecryptor(self, iv, unpad, start_offset, end_offset, self.require_encryption)
 
-    return content[start_offset: len(content) - end_offset]
+    def decrypt(self, chunks, start_offset, end_offset):
+        '''
+        Decrypts a downloaded range and returns only the requested part of it.
 
+        :param chunks:
+            The downloaded range, iterating its chunks, with its response.
+        :rtype: bytes
+        '''
+        decryptor = self.decrypt_range(chunks.response.headers, start_offset, end_offset)
+        content = [decryptor.update(chunk) for chunk in chunks]
+        content.append(decryptor.finalize())
+        return decryptor.trim(b"".join(content))
 
-def _get_blob_encryptor_and_padder(cek, iv, should_pad):
-    encryptor = None
-    padder = None
 
-    if cek is not None and iv is not None:
-        cipher = _generate_AES_CBC_cipher(cek, iv)
-        encryptor = cipher.encryptor()
-        padder = PKCS7(128).padder() if should_pad else None
+class _RangeDecryptor(object):
+    '''
+    Decrypts a range of a blob chunk by chunk.
+
+    Only the last cipher block and the bytes of an incomplete block are kept between two
+    chunks, so the encrypted range is never held in memory as a whole.
+    '''
 
-    return encryptor, padder
+    def __init__(self, blob_decryptor, iv, unpad, start_offset, end_offset, require_encryption):
+        self._blob_decryptor = blob_decryptor
+        self._iv = iv
+        self._unpad = unpad
+        self._start_offset = start_offset
+        self._end_offset = end_offset
+        self._require_encryption = require_encryption
+        self._head = b''
+        self._decryptor = None
+        self._unpadder = None
+
+    def update(self, data):
+        if self._blob_decryptor is None:
+            # The blob is not encrypted.
+            if data and self._require_encryption:
+                raise ValueError(_ERROR_DATA_NOT_ENCRYPTED)
+            return data
+        if self._decryptor is None:
+            if self._iv is None:
+                self._head += data
+                if len(self._head) < 16:
+                    return b''
+                self._iv, data = self._head[:16], self._head[16:]
+                self._head = b''
+            cipher = _generate_AES_CBC_cipher(self._blob_decryptor.get_content_encryption_key(), self._iv)
+            self._decryptor = cipher.decryptor()
+            self._unpadder = PKCS7(128).unpadder() if self._unpad else None
+        data = self._decryptor.update(data)
+        if self._unpadder:
+            data = self._unpadder.update(data)
+        return data
+
+    def finalize(self):
+        if self._decryptor is None:
+            if self._head:
+                raise ValueError("The encrypted range is shorter than a cipher block.")
+            return b''
+        data = self._decryptor.finalize()
+        if self._unpadder:
+            data = self._unpadder.update(data) + self._unpadder.finalize()
+        return data
+
+    def trim(self, content):
+        if self._blob_decryptor is None:
+            return content
+        return content[self._start_offset: len(content) - self._end_offset]
 
 
 def _encrypt_queue_message(message, key_encryption_key):
@@ -41,6 +41,7 @@ from azure.core.exceptions import AzureError, ServiceRequestError, ServiceRespon
 
 from ..version import VERSION
 from .models import LocationMode
+from .crc64 import Crc64
 
 try:
     _unicode_type = unicode # type: ignore
@@ -122,6 +123,14 @@ class StorageBlobSettings(object):
         self.max_single_get_size = kwargs.get('max_single_get_size', 32 * 1024 * 1024)
         self.max_chunk_get_size = kwargs.get('max_chunk_get_size', 4 * 1024 * 1024)
 
+        # Adaptive transfers, tuning the concurrency up to max_connections and the block size
+        self.adaptive_transfer = kwargs.get('adaptive_transfer', False)
+        self.max_adaptive_block_size = kwargs.get('max_adaptive_block_size', 32 * 1024 * 1024)
+
+        # Bulk copies, staging the blocks of block blobs above the threshold from the source URL
+        self.min_staged_copy_size = kwargs.get('min_staged_copy_size', 256 * 1024 * 1024)
+        self.max_copy_block_size = kwargs.get('max_copy_block_size', 32 * 1024 * 1024)
+
 
 class StorageHeadersPolicy(HeadersPolicy):
 
@@ -298,6 +307,8 @@ class StorageResponseHook(HTTPPolicy):
             request.context.options.pop('download_stream_current', None)
         upload_stream_current = request.context.get('upload_stream_current') or \
             request.context.options.pop('upload_stream_current', None)
+        transfer_tuner = request.context.get('transfer_tuner') or \
+            request.context.options.pop('transfer_tuner', None)
         response_callback = request.context.get('response_callback') or \
             request.context.options.pop('raw_response_hook', self._response_callback)
 
@@ -317,6 +328,8 @@ class StorageResponseHook(HTTPPolicy):
             pipeline_obj.context['data_stream_total'] = data_stream_total
             pipeline_obj.context['download_stream_current'] = download_stream_current
             pipeline_obj.context['upload_stream_current'] = upload_stream_current
+            pipeline_obj.context['transfer_tuner'] = transfer_tuner
+            pipeline_obj.context['transfer_tuning'] = transfer_tuner.snapshot() if transfer_tuner else None
         if response_callback:
             response_callback(response)
             request.context['response_callback'] = response_callback
@@ -328,17 +341,24 @@ class StorageContentValidation(SansIOHTTPPolicy):
     with the request.
 
     This will overwrite any headers already defined in the request.
+
+    The content is validated with its MD5 when validate_content is True (or 'md5'), or with
+    its CRC64 when it is 'crc64'. The CRC64 of a download is computed by the downloader as
+    the chunks of the body are read, so the body is not read again here.
     """
     header_name = 'Content-MD5'
+    crc64_header_name = 'x-ms-content-crc64'
+
+    # The first version of the service with transactional CRC64.
+    crc64_version = '2019-02-02'
 
     def __init__(self, **kwargs):  # pylint: disable=unused-argument
         super(StorageContentValidation, self).__init__()
 
     @staticmethod
-    def get_content_md5(data):
-        md5 = hashlib.md5()
-        if isinstance(data, bytes):
-            md5.update(data)
+    def _get_content_hash(content_hash, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            content_hash.update(data)
         elif hasattr(data, 'read'):
             pos = 0
             try:
@@ -346,7 +366,7 @@ class StorageContentValidation(SansIOHTTPPolicy):
             except:  # pylint: disable=bare-except
                 pass
             for chunk in iter(lambda: data.read(4096), b""):
-                md5.update(chunk)
+                content_hash.update(chunk)
             try:
                 data.seek(pos, SEEK_SET)
             except (AttributeError, IOError):
@@ -354,19 +374,46 @@ class StorageContentValidation(SansIOHTTPPolicy):
         else:
             raise ValueError("Data should be bytes or a seekable file-like object.")
 
-        return md5.digest()
+        return content_hash.digest()
+
+    @staticmethod
+    def get_content_md5(data):
+        return StorageContentValidation._get_content_hash(hashlib.md5(), data)
+
+    @staticmethod
+    def get_content_crc64(data):
+        return StorageContentValidation._get_content_hash(Crc64(), data)
 
     def on_request(self, request, **kwargs):
         # type: (PipelineRequest, Any) -> None
         validate_content = request.context.options.pop('validate_content', False)
-        if validate_content and request.http_request.method != 'GET':
+        if validate_content == 'crc64':
+            http_request = request.http_request
+            http_request.headers['x-ms-version'] = self.crc64_version
+            if http_request.method == 'GET':
+                if http_request.headers.pop('x-ms-range-get-content-md5', None):
+                    http_request.headers['x-ms-range-get-content-crc64'] = 'true'
+            else:
+                computed_crc64 = encode_base64(StorageContentValidation.get_content_crc64(http_request.data))
+                http_request.headers[self.crc64_header_name] = computed_crc64
+                request.context['validate_content_crc64'] = computed_crc64
+        elif validate_content and request.http_request.method != 'GET':
             computed_md5 = encode_base64(StorageContentValidation.get_content_md5(request.http_request.data))
             request.http_request.headers[self.header_name] = computed_md5
             request.context['validate_content_md5'] = computed_md5
         request.context['validate_content'] = validate_content
 
     def on_response(self, request, response, **kwargs):
-        if response.context.get('validate_content', False) and response.http_response.headers.get('content-md5'):
+        if response.context.get('validate_content', False) == 'crc64':
+            computed_crc64 = request.context.get('validate_content_crc64')
+            expected_crc64 = response.http_response.headers.get(self.crc64_header_name)
+            if computed_crc64 and expected_crc64 and expected_crc64 != computed_crc64:
+                raise AzureError(
+                    'CRC64 mismatch. Expected value is \'{0}\', computed value is \'{1}\'.'.format(
+                        expected_crc64, computed_crc64),
+                    response=response.http_response
+                )
+        elif response.context.get('validate_content', False) and response.http_response.headers.get('content-md5'):
             computed_md5 = request.context.get('validate_content_md5') or \
                 encode_base64(StorageContentValidation.get_content_md5(response.http_response.body()))
             if response.http_response.headers['content-md5'] != computed_md5:
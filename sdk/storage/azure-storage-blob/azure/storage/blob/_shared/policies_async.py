@@ -0,0 +1,132 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import logging
+from typing import Any, TYPE_CHECKING # pylint: disable=unused-import
+
+from azure.core.pipeline.policies import AsyncHTTPPolicy
+from azure.core.exceptions import AzureError
+
+from .policies import (
+    is_retry,
+    StorageContentValidation,
+    StorageRetryPolicy,
+    ExponentialRetry as SyncExponentialRetry,
+    LinearRetry as SyncLinearRetry)
+
+if TYPE_CHECKING:
+    from azure.core.pipeline import PipelineRequest, PipelineResponse
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncStorageResponseHook(AsyncHTTPPolicy):
+
+    def __init__(self, **kwargs):  # pylint: disable=unused-argument
+        self._response_callback = kwargs.get('raw_response_hook')
+        super(AsyncStorageResponseHook, self).__init__()
+
+    async def send(self, request: 'PipelineRequest') -> 'PipelineResponse':
+        data_stream_total = request.context.get('data_stream_total') or \
+            request.context.options.pop('data_stream_total', None)
+        download_stream_current = request.context.get('download_stream_current') or \
+            request.context.options.pop('download_stream_current', None)
+        upload_stream_current = request.context.get('upload_stream_current') or \
+            request.context.options.pop('upload_stream_current', None)
+        transfer_tuner = request.context.get('transfer_tuner') or \
+            request.context.options.pop('transfer_tuner', None)
+        response_callback = request.context.get('response_callback') or \
+            request.context.options.pop('raw_response_hook', self._response_callback)
+
+        response = await self.next.send(request)
+        will_retry = is_retry(response, request.context.options.get('mode'))
+        if not will_retry and download_stream_current is not None:
+            download_stream_current += int(response.http_response.headers.get('Content-Length', 0))
+            if data_stream_total is None:
+                content_range = response.http_response.headers.get('Content-Range')
+                if content_range:
+                    data_stream_total = int(content_range.split(' ', 1)[1].split('/', 1)[1])
+                else:
+                    data_stream_total = download_stream_current
+        elif not will_retry and upload_stream_current is not None:
+            upload_stream_current += int(response.http_request.headers.get('Content-Length', 0))
+        for pipeline_obj in [request, response]:
+            pipeline_obj.context['data_stream_total'] = data_stream_total
+            pipeline_obj.context['download_stream_current'] = download_stream_current
+            pipeline_obj.context['upload_stream_current'] = upload_stream_current
+            pipeline_obj.context['transfer_tuner'] = transfer_tuner
+            pipeline_obj.context['transfer_tuning'] = transfer_tuner.snapshot() if transfer_tuner else None
+        if response_callback:
+            if asyncio.iscoroutinefunction(response_callback):
+                await response_callback(response)
+            else:
+                response_callback(response)
+            request.context['response_callback'] = response_callback
+        return response
+
+
+class AsyncStorageContentValidation(StorageContentValidation):
+    """Content validation for async pipelines.
+
+    The body of a streamed download is not loaded yet when the response goes through
+    the pipeline: its MD5 is validated by the downloader once the content is read.
+    """
+
+    def on_response(self, request, response, **kwargs):
+        if response.context.options.get('stream', False) and response.context.get('validate_content', False) != 'crc64':
+            return
+        super(AsyncStorageContentValidation, self).on_response(request, response, **kwargs)
+
+
+class AsyncStorageRetryPolicy(StorageRetryPolicy, AsyncHTTPPolicy):
+    """
+    The base class for async Exponential and Linear retries containing shared code.
+    Backoff is awaited on the transport, so retries never block the event loop.
+    """
+
+    async def sleep(self, settings, transport):  # pylint: disable=invalid-overridden-method
+        backoff = self.get_backoff_time(settings)
+        if not backoff or backoff < 0:
+            return
+        await transport.sleep(backoff)
+
+    async def send(self, request):  # pylint: disable=invalid-overridden-method
+        retries_remaining = True
+        response = None
+        retry_settings = self.configure_retries(request)
+        while retries_remaining:
+            try:
+                response = await self.next.send(request)
+                if is_retry(response, retry_settings['mode']):
+                    retries_remaining = self.increment(
+                        retry_settings,
+                        request=request.http_request,
+                        response=response.http_response)
+                    if retries_remaining:
+                        await self.sleep(retry_settings, request.context.transport)
+                        continue
+                break
+            except AzureError as err:
+                retries_remaining = self.increment(
+                    retry_settings, request=request.http_request, error=err)
+                if retries_remaining:
+                    await self.sleep(retry_settings, request.context.transport)
+                    continue
+                raise err
+        if retry_settings['history']:
+            response.context['history'] = retry_settings['history']
+        response.http_response.location_mode = retry_settings['mode']
+        return response
+
+
+class ExponentialRetry(AsyncStorageRetryPolicy, SyncExponentialRetry):
+    """Exponential retry, backing off without blocking the event loop."""
+
+
+class LinearRetry(AsyncStorageRetryPolicy, SyncLinearRetry):
+    """Linear retry, backing off without blocking the event loop."""
@@ -0,0 +1,165 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import time
+from threading import Lock
+
+# The largest block accepted by Put Block. Put Page and Append Block take at most 4MB,
+# so page and append uploads, and ranged downloads validated with MD5, keep their chunk size.
+MAX_TUNED_BLOCK_SIZE = 100 * 1024 * 1024
+
+# A setting is kept when the throughput it gives is at least this much better than the
+# best seen so far, and the concurrency is halved when it drops below the given fraction.
+_IMPROVEMENT = 0.05
+_CONGESTION = 0.6
+_MIN_WINDOW = 4
+
+
+def get_transfer_tuner(blob_settings, max_connections, block_size, max_block_size=None):
+    """Create the tuner of a chunked transfer, if adaptive transfers are enabled.
+
+    :param blob_settings: The StorageBlobSettings of the client.
+    :param int max_connections: The largest number of chunks to transfer at once.
+    :param int block_size: The chunk size the transfer starts with.
+    :param int max_block_size: The largest chunk size to tune up to. If not set,
+        only the concurrency of the transfer is tuned.
+    :rtype: ~azure.storage.blob._shared.transfer_tuning.AdaptiveTransferTuner or None
+    """
+    if not blob_settings.adaptive_transfer or max_connections <= 1:
+        return None
+    return AdaptiveTransferTuner(max_connections, block_size, max_block_size=max_block_size)
+
+
+class AdaptiveTransferTuner(object):  # pylint: disable=too-many-instance-attributes
+    """Tunes the concurrency and chunk size of a transfer from the throughput observed.
+
+    The transfer reports each chunk completed with :func:`record`. Once a window of
+    chunks is complete, the throughput of the window is compared to the best one seen:
+    while it improves, the tuner keeps adding a connection (or doubling the chunk
+    size). When it stops improving, the tuner goes back to the best settings and
+    probes the other dimension instead. A sharp drop in throughput, e.g. when the
+    account is throttled and requests are retried, halves the concurrency.
+
+    Chunk sizes stay a power of two multiple of the initial size, so page alignment
+    and block boundaries are preserved.
+
+    :param int max_concurrency: The largest number of chunks to transfer at once.
+    :param int block_size: The initial chunk size, also the smallest one used.
+    :param int max_block_size: The largest chunk size to tune up to.
+    """
+
+    def __init__(self, max_concurrency, block_size, max_block_size=None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_block_size = block_size
+        self.max_block_size = max(block_size, min(max_block_size or block_size, MAX_TUNED_BLOCK_SIZE))
+        self.concurrency = min(2, self.max_concurrency)
+        self.block_size = block_size
+        self.throughput = None
+        self.latency = None
+        self._lock = Lock()
+        self._clock = time.time
+        self._best = None
+        self._tune_block_size = False
+        self._window_start = None
+        self._window_bytes = 0
+        self._window_chunks = 0
+        self._window_latency = 0.0
+
+    def start(self):
+        """Start measuring, when the first chunk is sent."""
+        with self._lock:
+            if self._window_start is None:
+                self._window_start = self._clock()
+
+    def record(self, length, duration):
+        """Record a chunk transferred.
+
+        :param int length: The size of the chunk.
+        :param float duration: The time taken to transfer the chunk, in seconds.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._window_start is None:
+                self._window_start = now - duration
+            self._window_bytes += length
+            self._window_chunks += 1
+            self._window_latency += duration
+            if self._window_chunks < max(_MIN_WINDOW, 2 * self.concurrency):
+                return
+            elapsed = max(now - self._window_start, 1e-6)
+            self.throughput = self._window_bytes / elapsed
+            self.latency = self._window_latency / self._window_chunks
+            self._window_start = now
+            self._window_bytes = 0
+            self._window_chunks = 0
+            self._window_latency = 0.0
+            self._adjust(self.throughput)
+
+    def snapshot(self):
+        """The current settings and the last throughput measured.
+
+        :returns: A dict with the 'concurrency', 'block_size', 'throughput' (in
+            bytes per second, None until measured) and 'latency' (the mean seconds
+            per chunk) of the transfer.
+        :rtype: dict(str, Any)
+        """
+        return {
+            'concurrency': self.concurrency,
+            'block_size': self.block_size,
+            'throughput': self.throughput,
+            'latency': self.latency,
+        }
+
+    def _adjust(self, throughput):
+        if self._best is None or throughput >= self._best[0] * (1 + _IMPROVEMENT):
+            self._best = (throughput, self.concurrency, self.block_size)
+            self._step()
+        elif throughput < self._best[0] * _CONGESTION:
+            # Start over from fewer connections, conditions have changed.
+            self.concurrency = max(1, self.concurrency // 2)
+            self._best = (throughput, self.concurrency, self.block_size)
+            self._tune_block_size = False
+        else:
+            _, self.concurrency, self.block_size = self._best
+            self._tune_block_size = not self._tune_block_size
+            self._step()
+
+    def _step(self):
+        for _ in range(2):
+            if self._tune_block_size and self.block_size * 2 <= self.max_block_size:
+                self.block_size *= 2
+                return
+            if not self._tune_block_size and self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+                return
+            self._tune_block_size = not self._tune_block_size
+
+
+def run_adaptive(func, work, tuner):
+    """Call func(item) for each item of work from a thread pool, with as many calls in
+    flight as the tuner allows.
+
+    Like the async run_bounded, the next item is only read from the work iterator once
+    a slot is free, so chunks are buffered in step with the tuned concurrency. The
+    first failure is raised once the calls in flight are complete.
+
+    :return: The results, in the order of the work items.
+    """
+    import concurrent.futures
+    futures = []
+    running = set()
+    with concurrent.futures.ThreadPoolExecutor(tuner.max_concurrency) as executor:
+        for item in work:
+            while len(running) >= tuner.concurrency:
+                done, running = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            tuner.start()
+            future = executor.submit(func, item)
+            futures.append(future)
+            running.add(future)
+    return [f.result() for f in futures]
@@ -5,6 +5,8 @@
 # --------------------------------------------------------------------------
 # pylint: disable=no-self-use
 
+import mmap
+import time
 from io import (BytesIO, IOBase, SEEK_CUR, SEEK_END, SEEK_SET, UnsupportedOperation)
 from threading import Lock
 
@@ -18,7 +20,8 @@ from .utils import (
     url_quote,
     get_length,
     return_response_headers)
-from .encryption import _get_blob_encryptor_and_padder
+from .encryption import _get_blob_encryptor
+from .transfer_tuning import run_adaptive
 
 
 _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
@@ -29,7 +32,7 @@ def upload_blob_chunks(blob_service, blob_size, block_size, stream, max_connecti
                        access_conditions, uploader_class, append_conditions=None, modified_access_conditions=None,
                        timeout=None, content_encryption_key=None, initialization_vector=None, **kwargs):
 
-    encryptor, padder = _get_blob_encryptor_and_padder(
+    encryptor = _get_blob_encryptor(
         content_encryption_key,
         initialization_vector,
         uploader_class is not PageBlobChunkUploader)
@@ -45,7 +48,6 @@ def upload_blob_chunks(blob_service, blob_size, block_size, stream, max_connecti
         append_conditions,
         timeout,
         encryptor,
-        padder,
         **kwargs
     )
 
@@ -55,7 +57,9 @@ def upload_blob_chunks(blob_service, blob_size, block_size, stream, max_connecti
     else:
         uploader.modified_access_conditions = modified_access_conditions
 
-    if max_connections > 1:
+    if uploader.tuner is not None:
+        range_ids = run_adaptive(uploader.process_chunk, uploader.get_chunk_streams(), uploader.tuner)
+    elif max_connections > 1:
         import concurrent.futures
         from threading import BoundedSemaphore
 
@@ -111,7 +115,6 @@ def upload_blob_substream_blocks(blob_service, blob_size, block_size, stream, ma
         append_conditions,
         timeout,
         None,
-        None,
         **kwargs
     )
     # ETag matching does not work with parallelism as a ranged upload may start
@@ -121,7 +124,9 @@ def upload_blob_substream_blocks(blob_service, blob_size, block_size, stream, ma
     else:
         uploader.modified_access_conditions = modified_access_conditions
 
-    if max_connections > 1:
+    if uploader.tuner is not None:
+        range_ids = run_adaptive(uploader.process_substream_block, uploader.get_substream_blocks(), uploader.tuner)
+    elif max_connections > 1:
         import concurrent.futures
         executor = concurrent.futures.ThreadPoolExecutor(max_connections)
         range_ids = list(executor.map(uploader.process_substream_block, uploader.get_substream_blocks()))
@@ -134,7 +139,7 @@ def upload_blob_substream_blocks(blob_service, blob_size, block_size, stream, ma
 class _BlobChunkUploader(object):  # pylint: disable=too-many-instance-attributes
 
     def __init__(self, blob_service, blob_size, chunk_size, stream, parallel, validate_content,
-                 access_conditions, append_conditions, timeout, encryptor, padder, **kwargs):
+                 access_conditions, append_conditions, timeout, encryptor, **kwargs):
         self.blob_service = blob_service
         self.blob_size = blob_size
         self.chunk_size = chunk_size
@@ -149,16 +154,24 @@ class _BlobChunkUploader(object):  # pylint: disable=too-many-instance-attribute
         self.modified_access_conditions = None
         self.append_conditions = append_conditions
         self.timeout = timeout
+        # Encrypts the chunks in order as they are read, keeping a cipher block between them
         self.encryptor = encryptor
-        self.padder = padder
         self.response_headers = None
         self.etag = None
         self.last_modified = None
         self.request_options = kwargs
+        # Set for adaptive transfers, it is also passed on to the response hook for progress reports
+        self.tuner = kwargs.get('transfer_tuner')
 
     def get_chunk_streams(self):
+        if isinstance(self.stream, MemoryMappedFile):
+            for chunk in self._get_mapped_chunks():
+                yield chunk
+            return
         index = 0
         while True:
+            if self.tuner is not None:
+                self.chunk_size = self.tuner.block_size
             data = b''
             read_size = self.chunk_size
 
@@ -177,14 +190,10 @@ class _BlobChunkUploader(object):  # pylint: disable=too-many-instance-attribute
                     break
 
             if len(data) == self.chunk_size:
-                if self.padder:
-                    data = self.padder.update(data)
                 if self.encryptor:
                     data = self.encryptor.update(data)
                 yield index, data
             else:
-                if self.padder:
-                    data = self.padder.update(data) + self.padder.finalize()
                 if self.encryptor:
                     data = self.encryptor.update(data) + self.encryptor.finalize()
                 if data:
@@ -192,6 +201,26 @@ class _BlobChunkUploader(object):  # pylint: disable=too-many-instance-attribute
                 break
             index += len(data)
 
+    def _get_mapped_chunks(self):
+        # Each chunk is a view of the mapped file: nothing is read or copied here, the pages
+        # are faulted in by the worker sending the chunk, and no stream lock is needed.
+        start = self.stream.tell()
+        end = len(self.stream)
+        if self.blob_size:
+            end = min(end, start + self.blob_size)
+        offset = start
+        while offset < end:
+            if self.tuner is not None:
+                self.chunk_size = self.tuner.block_size
+            data = self.stream.view(offset, min(self.chunk_size, end - offset))
+            last = offset + self.chunk_size >= end
+            if self.encryptor:
+                data = self.encryptor.update(data) + (self.encryptor.finalize() if last else b'')
+            if data:
+                yield offset - start, data
+            offset += self.chunk_size
+        self.stream.seek(end)
+
     def process_chunk(self, chunk_data):
         chunk_bytes = chunk_data[1]
         chunk_offset = chunk_data[0]
@@ -208,8 +237,11 @@ class _BlobChunkUploader(object):  # pylint: disable=too-many-instance-attribute
         raise NotImplementedError("Must be implemented by child class.")
 
     def _upload_chunk_with_progress(self, chunk_offset, chunk_data):
+        started = time.time()
         range_id = self._upload_chunk(chunk_offset, chunk_data)
         self._update_progress(len(chunk_data))
+        if self.tuner is not None:
+            self.tuner.record(len(chunk_data), time.time() - started)
         return range_id
 
     def get_substream_blocks(self):
@@ -237,7 +269,10 @@ class _BlobChunkUploader(object):  # pylint: disable=too-many-instance-attribute
         raise NotImplementedError("Must be implemented by child class.")
 
     def _upload_substream_block_with_progress(self, block_id, block_stream):
+        started, length = time.time(), len(block_stream)
         range_id = self._upload_substream_block(block_id, block_stream)
+        if self.tuner is not None:
+            self.tuner.record(length, time.time() - started)
         return range_id
 
     def set_response_properties(self, resp):
@@ -499,6 +534,101 @@ class _SubStream(IOBase):
         return False
 
 
+class MemoryMappedFile(IOBase):
+    """A read-only stream over a memory-mapped local file.
+
+    Besides the usual stream interface, ranges of the file can be taken as
+    zero-copy memoryview slices with :func:`view`, which is what the chunk
+    uploaders send when uploading from a path.
+
+    :param str path: The path of the file to map.
+    """
+    def __init__(self, path):
+        super(MemoryMappedFile, self).__init__()
+        self._file = open(path, 'rb')
+        self._position = 0
+        self._mmap = None
+        try:
+            self._length = get_length(self._file)
+            if self._length:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    self._view = memoryview(self._mmap)
+                except TypeError:
+                    # Python 2.7: mmap does not support the new buffer protocol, slices are copies.
+                    self._view = self._mmap
+            else:
+                self._view = b''
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self):
+        return self._length
+
+    def close(self):
+        if self.closed:
+            return
+        if isinstance(self._view, memoryview):
+            self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Chunks of the mapping are still referenced, e.g. by a request kept for a retry.
+                # The mapping is then released when the last of them is garbage collected.
+                pass
+        self._file.close()
+        IOBase.close(self)
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def view(self, offset, length):
+        """Return the given range of the file without copying it.
+
+        :param int offset: The start of the range.
+        :param int length: The number of bytes in the range.
+        :rtype: memoryview
+        """
+        if self.closed:
+            raise ValueError("Stream is closed.")
+        return self._view[offset:offset + length]
+
+    def read(self, n=-1):
+        if self.closed:
+            raise ValueError("Stream is closed.")
+        if n is None or n < 0:
+            n = self._length - self._position
+        data = bytes(self.view(self._position, n))
+        self._position += len(data)
+        return data
+
+    def readable(self):
+        return True
+
+    def seek(self, offset, whence=0):
+        if whence == SEEK_SET:
+            pos = offset
+        elif whence == SEEK_CUR:
+            pos = self._position + offset
+        elif whence == SEEK_END:
+            pos = self._length + offset
+        else:
+            raise ValueError("Invalid argument for the 'whence' parameter.")
+        self._position = max(0, min(pos, self._length))
+        return self._position
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def writable(self):
+        return False
+
+
 class IterStreamer(object):
     """
     File-like streaming iterator.
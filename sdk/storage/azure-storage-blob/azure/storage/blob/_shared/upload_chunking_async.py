@@ -0,0 +1,227 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+# pylint: disable=no-self-use
+
+import time
+
+from .models import ModifiedAccessConditions
+from .utils import (
+    encode_base64,
+    url_quote,
+    return_response_headers)
+from .utils_async import run_bounded
+from .encryption import _get_blob_encryptor
+from .upload_chunking import (
+    _BlobChunkUploader,
+    PageBlobChunkUploader as SyncPageBlobChunkUploader)
+
+
+async def upload_blob_chunks(blob_service, blob_size, block_size, stream, max_connections, validate_content,  # pylint: disable=too-many-locals
+                             access_conditions, uploader_class, append_conditions=None, modified_access_conditions=None,
+                             timeout=None, content_encryption_key=None, initialization_vector=None, **kwargs):
+
+    encryptor = _get_blob_encryptor(
+        content_encryption_key,
+        initialization_vector,
+        uploader_class is not PageBlobChunkUploader)
+
+    uploader = uploader_class(
+        blob_service,
+        blob_size,
+        block_size,
+        stream,
+        max_connections > 1,
+        validate_content,
+        access_conditions,
+        append_conditions,
+        timeout,
+        encryptor,
+        **kwargs
+    )
+
+    # Access conditions do not work with parallelism
+    if max_connections > 1:
+        uploader.modified_access_conditions = None
+        range_ids = await run_bounded(
+            uploader.process_chunk, uploader.get_chunk_streams(), max_connections, tuner=uploader.tuner)
+    else:
+        uploader.modified_access_conditions = modified_access_conditions
+        range_ids = []
+        for chunk in uploader.get_chunk_streams():
+            range_ids.append(await uploader.process_chunk(chunk))
+
+    if any(range_ids):
+        return range_ids
+    return uploader.response_headers
+
+
+async def upload_blob_substream_blocks(blob_service, blob_size, block_size, stream, max_connections,
+                                       validate_content, access_conditions, uploader_class,
+                                       append_conditions=None, modified_access_conditions=None, timeout=None, **kwargs):
+
+    uploader = uploader_class(
+        blob_service,
+        blob_size,
+        block_size,
+        stream,
+        max_connections > 1,
+        validate_content,
+        access_conditions,
+        append_conditions,
+        timeout,
+        None,
+        **kwargs
+    )
+    # ETag matching does not work with parallelism as a ranged upload may start
+    # before the previous finishes and provides an etag
+    if max_connections > 1:
+        uploader.modified_access_conditions = None
+        range_ids = await run_bounded(
+            uploader.process_substream_block, uploader.get_substream_blocks(), max_connections, tuner=uploader.tuner)
+    else:
+        uploader.modified_access_conditions = modified_access_conditions
+        range_ids = []
+        for block in uploader.get_substream_blocks():
+            range_ids.append(await uploader.process_substream_block(block))
+    return range_ids
+
+
+class _AsyncBlobChunkUploader(_BlobChunkUploader):  # pylint: disable=abstract-method
+    """Chunk uploader awaiting the async generated operations.
+
+    Sub-stream blocks keep the stream lock of the sync uploader when parallel, as the
+    transport reads file-like bodies from an executor thread.
+    """
+
+    async def process_chunk(self, chunk_data):
+        chunk_bytes = chunk_data[1]
+        chunk_offset = chunk_data[0]
+        return await self._upload_chunk_with_progress(chunk_offset, chunk_bytes)
+
+    async def _upload_chunk(self, chunk_offset, chunk_data):
+        raise NotImplementedError("Must be implemented by child class.")
+
+    async def _upload_chunk_with_progress(self, chunk_offset, chunk_data):
+        started = time.time()
+        range_id = await self._upload_chunk(chunk_offset, chunk_data)
+        self._update_progress(len(chunk_data))
+        if self.tuner is not None:
+            self.tuner.record(len(chunk_data), time.time() - started)
+        return range_id
+
+    async def process_substream_block(self, block_data):
+        return await self._upload_substream_block_with_progress(block_data[0], block_data[1])
+
+    async def _upload_substream_block(self, block_id, block_stream):
+        raise NotImplementedError("Must be implemented by child class.")
+
+    async def _upload_substream_block_with_progress(self, block_id, block_stream):
+        started, length = time.time(), len(block_stream)
+        range_id = await self._upload_substream_block(block_id, block_stream)
+        if self.tuner is not None:
+            self.tuner.record(length, time.time() - started)
+        return range_id
+
+
+class BlockBlobChunkUploader(_AsyncBlobChunkUploader):
+
+    async def _upload_chunk(self, chunk_offset, chunk_data):
+        block_id = encode_base64(url_quote(encode_base64('{0:032d}'.format(chunk_offset))))
+        await self.blob_service.stage_block(
+            block_id,
+            len(chunk_data),
+            chunk_data,
+            timeout=self.timeout,
+            lease_access_conditions=self.lease_access_conditions,
+            validate_content=self.validate_content,
+            data_stream_total=self.blob_size,
+            upload_stream_current=self.progress_total,
+            **self.request_options)
+        return block_id
+
+    async def _upload_substream_block(self, block_id, block_stream):
+        try:
+            await self.blob_service.stage_block(
+                block_id,
+                len(block_stream),
+                block_stream,
+                validate_content=self.validate_content,
+                lease_access_conditions=self.lease_access_conditions,
+                timeout=self.timeout,
+                data_stream_total=self.blob_size,
+                upload_stream_current=self.progress_total,
+                **self.request_options)
+        finally:
+            block_stream.close()
+        return block_id
+
+
+class PageBlobChunkUploader(_AsyncBlobChunkUploader):  # pylint: disable=abstract-method
+
+    _is_chunk_empty = SyncPageBlobChunkUploader._is_chunk_empty  # pylint: disable=protected-access
+
+    async def _upload_chunk(self, chunk_offset, chunk_data):
+        # avoid uploading the empty pages
+        if not self._is_chunk_empty(chunk_data):
+            chunk_end = chunk_offset + len(chunk_data) - 1
+            content_range = 'bytes={0}-{1}'.format(chunk_offset, chunk_end)
+            computed_md5 = None
+            self.response_headers = await self.blob_service.upload_pages(
+                chunk_data,
+                content_length=len(chunk_data),
+                transactional_content_md5=computed_md5,
+                timeout=self.timeout,
+                range=content_range,
+                lease_access_conditions=self.lease_access_conditions,
+                modified_access_conditions=self.modified_access_conditions,
+                validate_content=self.validate_content,
+                cls=return_response_headers,
+                data_stream_total=self.blob_size,
+                upload_stream_current=self.progress_total,
+                **self.request_options)
+
+            if not self.parallel:
+                self.modified_access_conditions = ModifiedAccessConditions(
+                    if_match=self.response_headers['etag'])
+
+
+class AppendBlobChunkUploader(_AsyncBlobChunkUploader):  # pylint: disable=abstract-method
+
+    def __init__(self, *args, **kwargs):
+        super(AppendBlobChunkUploader, self).__init__(*args, **kwargs)
+        self.current_length = None
+
+    async def _upload_chunk(self, chunk_offset, chunk_data):
+        if self.current_length is None:
+            self.response_headers = await self.blob_service.append_block(
+                chunk_data,
+                content_length=len(chunk_data),
+                timeout=self.timeout,
+                lease_access_conditions=self.lease_access_conditions,
+                modified_access_conditions=self.modified_access_conditions,
+                validate_content=self.validate_content,
+                append_position_access_conditions=self.append_conditions,
+                cls=return_response_headers,
+                data_stream_total=self.blob_size,
+                upload_stream_current=self.progress_total,
+                **self.request_options
+            )
+            self.current_length = int(self.response_headers['blob_append_offset'])
+        else:
+            self.append_conditions.append_position = self.current_length + chunk_offset
+            self.response_headers = await self.blob_service.append_block(
+                chunk_data,
+                content_length=len(chunk_data),
+                timeout=self.timeout,
+                lease_access_conditions=self.lease_access_conditions,
+                modified_access_conditions=self.modified_access_conditions,
+                validate_content=self.validate_content,
+                append_position_access_conditions=self.append_conditions,
+                cls=return_response_headers,
+                data_stream_total=self.blob_size,
+                upload_stream_current=self.progress_total,
+                **self.request_options
+            )
@@ -154,7 +154,11 @@ class StorageAccountHostsMixin(object):
         self.key_encryption_key = kwargs.get('key_encryption_key')
         self.key_resolver_function = kwargs.get('key_resolver_function')
 
-        self._config, self._pipeline = create_pipeline(self.credential, hosts=self._hosts, **kwargs)
+        self._config, self._pipeline = self._create_pipeline(self.credential, hosts=self._hosts, **kwargs)
+
+    def _create_pipeline(self, credential, **kwargs):  # pylint: disable=no-self-use
+        # type: (Any, **Any) -> Tuple[Configuration, Pipeline]
+        return create_pipeline(credential, **kwargs)
 
     def __enter__(self):
         self._client.__enter__()
@@ -0,0 +1,127 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from typing import (  # pylint: disable=unused-import
+    Any, Optional, Tuple, TYPE_CHECKING
+)
+import asyncio
+import logging
+
+from azure.core import Configuration
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.policies import (
+    ContentDecodePolicy,
+    AsyncBearerTokenCredentialPolicy,
+    AsyncRedirectPolicy)
+
+from .constants import STORAGE_OAUTH_SCOPE, DEFAULT_SOCKET_TIMEOUT
+from .authentication import SharedKeyCredentialPolicy
+from .policies import (
+    StorageRequestHook,
+    StorageHosts,
+    QueueMessagePolicy)
+from .policies_async import AsyncStorageContentValidation, AsyncStorageResponseHook, ExponentialRetry
+from .utils import StorageAccountHostsMixin, create_configuration
+
+if TYPE_CHECKING:
+    from azure.core.pipeline.transport import AsyncHttpTransport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncStorageAccountHostsMixin(StorageAccountHostsMixin):
+
+    def __enter__(self):
+        raise TypeError("Async client only supports 'async with'.")
+
+    def __exit__(self, *args):
+        pass
+
+    async def __aenter__(self):
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *args):
+        await self._client.__aexit__(*args)
+
+    def _create_pipeline(self, credential, **kwargs):
+        # type: (Any, **Any) -> Tuple[Configuration, AsyncPipeline]
+        return create_pipeline(credential, **kwargs)
+
+
+def create_pipeline(credential, **kwargs):
+    # type: (Any, **Any) -> Tuple[Configuration, AsyncPipeline]
+    credential_policy = None
+    if hasattr(credential, 'get_token'):
+        credential_policy = AsyncBearerTokenCredentialPolicy(credential, STORAGE_OAUTH_SCOPE)
+    elif isinstance(credential, SharedKeyCredentialPolicy):
+        credential_policy = credential
+    elif credential is not None:
+        raise TypeError("Unsupported credential: {}".format(credential))
+
+    if not kwargs.get('retry_policy'):
+        kwargs['retry_policy'] = ExponentialRetry(**kwargs)
+    config = kwargs.get('_configuration')
+    if not config:
+        config = create_configuration(**kwargs)
+        config.redirect_policy = AsyncRedirectPolicy(**kwargs)
+    if kwargs.get('_pipeline'):
+        return config, kwargs['_pipeline']
+    transport = kwargs.get('transport')  # type: Optional[AsyncHttpTransport]
+    if 'connection_timeout' not in kwargs:
+        kwargs['connection_timeout'] = DEFAULT_SOCKET_TIMEOUT
+    if not transport:
+        from azure.core.pipeline.transport import AioHttpTransport  # Imported on demand, see pipeline.transport
+        transport = AioHttpTransport(**kwargs)
+    policies = [
+        QueueMessagePolicy(),
+        config.headers_policy,
+        config.user_agent_policy,
+        AsyncStorageContentValidation(),
+        StorageRequestHook(**kwargs),
+        credential_policy,
+        ContentDecodePolicy(),
+        config.redirect_policy,
+        StorageHosts(**kwargs),
+        config.retry_policy,
+        config.logging_policy,
+        AsyncStorageResponseHook(**kwargs),
+    ]
+    return config, AsyncPipeline(transport, policies=policies)
+
+
+async def run_bounded(func, work, max_connections, tuner=None):
+    """Await func(item) for each item of work with at most max_connections in flight.
+
+    The next item is only read from the work iterator once a slot is free, so no
+    more than max_connections chunks are buffered at any time. The first failure
+    cancels the tasks still running and is raised. With an AdaptiveTransferTuner,
+    the number of items in flight follows its current concurrency instead.
+
+    :return: The results, in the order of the work items.
+    """
+    tasks = []
+    running = set()
+    try:
+        for item in work:
+            while len(running) >= (tuner.concurrency if tuner else max_connections):
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            if tuner:
+                tuner.start()
+            task = asyncio.ensure_future(func(item))
+            tasks.append(task)
+            running.add(task)
+        if running:
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        return [task.result() for task in tasks]
+    finally:
+        for task in running:
+            task.cancel()
@@ -0,0 +1,31 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from .blob_client_async import BlobClient
+from .container_client_async import ContainerClient
+from .blob_service_client_async import BlobServiceClient
+from .lease_async import LeaseClient
+from ._blob_utils_async import StorageStreamDownloader
+from .._shared.policies_async import ExponentialRetry, LinearRetry
+from .models import (
+    ContainerPropertiesPaged,
+    BlobPropertiesPaged,
+    BlobPrefix
+)
+
+
+__all__ = [
+    'BlobServiceClient',
+    'ContainerClient',
+    'BlobClient',
+    'LeaseClient',
+    'ExponentialRetry',
+    'LinearRetry',
+    'StorageStreamDownloader',
+    'ContainerPropertiesPaged',
+    'BlobPropertiesPaged',
+    'BlobPrefix',
+]
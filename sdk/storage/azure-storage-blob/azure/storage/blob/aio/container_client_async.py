@@ -0,0 +1,927 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+# pylint: disable=invalid-overridden-method
+
+import asyncio
+import functools
+from typing import (  # pylint: disable=unused-import
+    Union, Optional, Any, Iterable, AnyStr, Dict, List, Set, Tuple, IO,
+    TYPE_CHECKING
+)
+
+import six
+from azure.core.async_paging import AsyncItemPaged
+from azure.core.exceptions import AzureError
+
+from .._shared.utils import (
+    process_storage_error,
+    return_response_headers,
+    add_metadata_headers,
+    serialize_iso,
+    return_headers_and_deserialized)
+from .._shared.constants import STORAGE_OAUTH_SCOPE
+from .._shared.utils_async import AsyncStorageAccountHostsMixin, run_bounded
+from .._generated.aio import AzureBlobStorage
+from .._generated.models import (
+    StorageErrorException,
+    SignedIdentifier)
+from .._blob_utils import (
+    get_access_conditions,
+    get_modification_conditions,
+    deserialize_container_properties)
+from .._blob_batch import MAX_BATCH_SIZE, build_batch_request, parse_batch_response, raise_on_failures
+from .._blob_copy import BulkCopyTracker
+from ..models import ( # pylint: disable=unused-import
+    ContainerProperties,
+    BlobProperties,
+    BlobType,
+    BulkCopyResult)
+from ..container_client import ContainerClient as ContainerClientBase
+from .models import BlobPropertiesPaged, BlobPrefix
+from .lease_async import LeaseClient
+from .blob_client_async import BlobClient
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from ..models import ( # pylint: disable=unused-import
+        ContainerPermissions,
+        PublicAccess,
+        AccessPolicy,
+        ContentSettings,
+        PremiumPageBlobTier,
+        StandardBlobTier)
+    from azure.core.pipeline.transport import HttpRequest, HttpResponse
+
+
+class ContainerClient(AsyncStorageAccountHostsMixin, ContainerClientBase):
+    """An async client to interact with a specific container, although that container
+    may not yet exist.
+
+    Requests are sent over an async transport, aiohttp by default.
+
+    For operations relating to a specific blob within this container, a blob client can be
+    retrieved using the :func:`~get_blob_client` function.
+
+    :ivar str url:
+        The full endpoint URL to the Container, including SAS token if used. This could be
+        either the primary endpoint, or the secondard endpoint depending on the current `location_mode`.
+    :ivar str primary_endpoint:
+        The full primary endpoint URL.
+    :ivar str primary_hostname:
+        The hostname of the primary endpoint.
+    :ivar str secondary_endpoint:
+        The full secondard endpoint URL if configured. If not available
+        a ValueError will be raised. To explicitly specify a secondary hostname, use the optional
+        `secondary_hostname` keyword argument on instantiation.
+    :ivar str secondary_hostname:
+        The hostname of the secondary endpoint. If not available this
+        will be None. To explicitly specify a secondary hostname, use the optional
+        `secondary_hostname` keyword argument on instantiation.
+    :ivar str location_mode:
+        The location mode that the client is currently using. By default
+        this will be "primary". Options include "primary" and "secondary".
+    :param str container_url:
+        The full URI to the container. This can also be a URL to the storage
+        account, in which case the blob container must also be specified.
+    :param container:
+        The container for the blob.
+    :type container: str or ~azure.storage.blob.models.ContainerProperties
+    :param credential:
+        The credentials with which to authenticate. This is optional if the
+        account URL already has a SAS token. The value can be a SAS token string, and account
+        shared access key, or an instance of a TokenCredentials class from azure.identity.
+        If the URL already has a SAS token, specifying an explicit credential will take priority.
+    """
+
+    def __init__(
+            self, container_url,  # type: str
+            container=None,  # type: Optional[Union[ContainerProperties, str]]
+            credential=None,  # type: Optional[Any]
+            **kwargs  # type: Any
+        ):
+        # type: (...) -> None
+        super(ContainerClient, self).__init__(
+            container_url,
+            container=container,
+            credential=credential,
+            **kwargs)
+        self._client = AzureBlobStorage(self.url, pipeline=self._pipeline)
+
+    async def create_container(self, metadata=None, public_access=None, timeout=None, **kwargs):
+        # type: (Optional[Dict[str, str]], Optional[Union[PublicAccess, str]], Optional[int], **Any) -> None
+        """
+        Creates a new container under the specified account. If the container
+        with the same name already exists, the operation fails.
+
+        :param metadata:
+            A dict with name_value pairs to associate with the
+            container as metadata. Example:{'Category':'test'}
+        :type metadata: dict[str, str]
+        :param ~azure.storage.blob.models.PublicAccess public_access:
+            Possible values include: container, blob.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :rtype: None
+        """
+        headers = kwargs.pop('headers', {})
+        headers.update(add_metadata_headers(metadata)) # type: ignore
+        try:
+            return await self._client.container.create( # type: ignore
+                timeout=timeout,
+                access=public_access,
+                cls=return_response_headers,
+                headers=headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+
+    async def delete_container(
+            self, lease=None,  # type: Optional[Union[LeaseClient, str]]
+            if_modified_since=None,  # type: Optional[datetime]
+            if_unmodified_since=None,  # type: Optional[datetime]
+            if_match=None,  # type: Optional[str]
+            if_none_match=None,  # type: Optional[str]
+            timeout=None,  # type: Optional[int]
+            **kwargs
+        ):
+        # type: (...) -> None
+        """
+        Marks the specified container for deletion. The container and any blobs
+        contained within it are later deleted during garbage collection.
+
+        :param ~azure.storage.blob.lease.LeaseClient lease:
+            If specified, delete_container only succeeds if the
+            container's lease is active and matches this ID.
+            Required if the container has an active lease.
+        :param datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :param datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :param str if_match:
+            An ETag value, or the wildcard character (*). Specify this header to perform
+            the operation only if the resource's ETag matches the value specified.
+        :param str if_none_match:
+            An ETag value, or the wildcard character (*). Specify this header
+            to perform the operation only if the resource's ETag does not match
+            the value specified. Specify the wildcard character (*) to perform
+            the operation only if the resource does not exist, and fail the
+            operation if it does exist.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :rtype: None
+        """
+        access_conditions = get_access_conditions(lease)
+        mod_conditions = get_modification_conditions(
+            if_modified_since, if_unmodified_since, if_match, if_none_match)
+        try:
+            await self._client.container.delete(
+                timeout=timeout,
+                lease_access_conditions=access_conditions,
+                modified_access_conditions=mod_conditions,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+
+    async def acquire_lease(
+            self, lease_duration=-1,  # type: int
+            lease_id=None,  # type: Optional[str]
+            if_modified_since=None,  # type: Optional[datetime]
+            if_unmodified_since=None,  # type: Optional[datetime]
+            if_match=None,  # type: Optional[str]
+            if_none_match=None,  # type: Optional[str]
+            timeout=None,  # type: Optional[int]
+            **kwargs):
+        # type: (...) -> LeaseClient
+        """
+        Requests a new lease. If the container does not have an active lease,
+        the Blob service creates a lease on the container and returns a new
+        lease ID.
+
+        :param int lease_duration:
+            Specifies the duration of the lease, in seconds, or negative one
+            (-1) for a lease that never expires. A non-infinite lease can be
+            between 15 and 60 seconds. A lease duration cannot be changed
+            using renew or change. Default is -1 (infinite lease).
+        :param str lease_id:
+            Proposed lease ID, in a GUID string format. The Blob service returns
+            400 (Invalid request) if the proposed lease ID is not in the correct format.
+        :param datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :param datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :param str if_match:
+            An ETag value, or the wildcard character (*). Specify this header to perform
+            the operation only if the resource's ETag matches the value specified.
+        :param str if_none_match:
+            An ETag value, or the wildcard character (*). Specify this header
+            to perform the operation only if the resource's ETag does not match
+            the value specified. Specify the wildcard character (*) to perform
+            the operation only if the resource does not exist, and fail the
+            operation if it does exist.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: A LeaseClient object, that can be run in a context manager.
+        :rtype: ~azure.storage.blob.aio.LeaseClient
+        """
+        lease = LeaseClient(self, lease_id=lease_id) # type: ignore
+        await lease.acquire(
+            lease_duration=lease_duration,
+            if_modified_since=if_modified_since,
+            if_unmodified_since=if_unmodified_since,
+            if_match=if_match,
+            if_none_match=if_none_match,
+            timeout=timeout,
+            **kwargs)
+        return lease
+
+    async def get_account_information(self, **kwargs): # type: ignore
+        # type: (**Any) -> Dict[str, str]
+        """Gets information related to the storage account.
+
+        The information can also be retrieved if the user has a SAS to a container or blob.
+        The keys in the returned dictionary include 'sku_name' and 'account_kind'.
+
+        :returns: A dict of account information (SKU and account type).
+        :rtype: dict(str, str)
+        """
+        try:
+            return await self._client.container.get_account_info(cls=return_response_headers, **kwargs) # type: ignore
+        except StorageErrorException as error:
+            process_storage_error(error)
+
+    async def get_container_properties(self, lease=None, timeout=None, **kwargs):
+        # type: (Optional[Union[LeaseClient, str]], Optional[int], **Any) -> ContainerProperties
+        """Returns all user-defined metadata and system properties for the specified
+        container. The data returned does not include the container's list of blobs.
+
+        :param ~azure.storage.blob.lease.LeaseClient lease:
+            If specified, get_container_properties only succeeds if the
+            container's lease is active and matches this ID.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :return: Properties for the specified container within a container object.
+        :rtype: ~azure.storage.blob.models.ContainerProperties
+        """
+        access_conditions = get_access_conditions(lease)
+        try:
+            response = await self._client.container.get_properties(
+                timeout=timeout,
+                lease_access_conditions=access_conditions,
+                cls=deserialize_container_properties,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        response.name = self.container_name
+        return response # type: ignore
+
+    async def set_container_metadata( # type: ignore
+            self, metadata=None,  # type: Optional[Dict[str, str]]
+            lease=None,  # type: Optional[Union[str, LeaseClient]]
+            if_modified_since=None,  # type: Optional[datetime]
+            timeout=None,  # type: Optional[int]
+            **kwargs
+        ):
+        # type: (...) -> Dict[str, Union[str, datetime]]
+        """Sets one or more user-defined name-value pairs for the specified
+        container. Each call to this operation replaces all existing metadata
+        attached to the container. To remove all metadata from the container,
+        call this operation with no metadata dict.
+
+        :param metadata:
+            A dict containing name-value pairs to associate with the container as
+            metadata. Example: {'category':'test'}
+        :type metadata: dict[str, str]
+        :param str lease:
+            If specified, set_container_metadata only succeeds if the
+            container's lease is active and matches this ID.
+        :param datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: Container-updated property dict (Etag and last modified).
+        """
+        headers = kwargs.pop('headers', {})
+        headers.update(add_metadata_headers(metadata))
+        access_conditions = get_access_conditions(lease)
+        mod_conditions = get_modification_conditions(if_modified_since=if_modified_since)
+        try:
+            return await self._client.container.set_metadata( # type: ignore
+                timeout=timeout,
+                lease_access_conditions=access_conditions,
+                modified_access_conditions=mod_conditions,
+                cls=return_response_headers,
+                headers=headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+
+    async def get_container_access_policy(self, lease=None, timeout=None, **kwargs):
+        # type: (Optional[Union[LeaseClient, str]], Optional[int], **Any) -> Dict[str, Any]
+        """Gets the permissions for the specified container.
+        The permissions indicate whether container data may be accessed publicly.
+
+        :param str lease:
+            If specified, get_container_access_policy only succeeds if the
+            container's lease is active and matches this ID.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: Access policy information in a dict.
+        :rtype: dict[str, str]
+        """
+        access_conditions = get_access_conditions(lease)
+        try:
+            response, identifiers = await self._client.container.get_access_policy(
+                timeout=timeout,
+                lease_access_conditions=access_conditions,
+                cls=return_headers_and_deserialized,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        return {
+            'public_access': response.get('blob_public_access'),
+            'signed_identifiers': identifiers or []
+        }
+
+    async def set_container_access_policy(
+            self, signed_identifiers=None,  # type: Optional[Dict[str, Optional[AccessPolicy]]]
+            public_access=None,  # type: Optional[Union[str, PublicAccess]]
+            lease=None,  # type: Optional[Union[str, LeaseClient]]
+            if_modified_since=None,  # type: Optional[datetime]
+            if_unmodified_since=None,  # type: Optional[datetime]
+            timeout=None,  # type: Optional[int]
+            **kwargs
+        ):
+        """Sets the permissions for the specified container or stored access
+        policies that may be used with Shared Access Signatures. The permissions
+        indicate whether blobs in a container may be accessed publicly.
+
+        :param signed_identifiers:
+            A dictionary of access policies to associate with the container. The
+            dictionary may contain up to 5 elements. An empty dictionary
+            will clear the access policies set on the service.
+        :type signed_identifiers: dict(str, :class:`~azure.storage.blob.models.AccessPolicy`)
+        :param ~azure.storage.blob.models.PublicAccess public_access:
+            Possible values include: container, blob.
+        :param lease:
+            Required if the container has an active lease. Value can be a LeaseClient object
+            or the lease ID as a string.
+        :type lease: ~azure.storage.blob.lease.LeaseClient or str
+        :param datetime if_modified_since:
+            A datetime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified date/time.
+        :param datetime if_unmodified_since:
+            A datetime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: Container-updated property dict (Etag and last modified).
+        """
+        if signed_identifiers:
+            if len(signed_identifiers) > 5:
+                raise ValueError(
+                    'Too many access policies provided. The server does not support setting '
+                    'more than 5 access policies on a single resource.')
+            identifiers = []
+            for key, value in signed_identifiers.items():
+                if value:
+                    value.start = serialize_iso(value.start)
+                    value.expiry = serialize_iso(value.expiry)
+                identifiers.append(SignedIdentifier(id=key, access_policy=value)) # type: ignore
+            signed_identifiers = identifiers # type: ignore
+
+        mod_conditions = get_modification_conditions(
+            if_modified_since, if_unmodified_since)
+        access_conditions = get_access_conditions(lease)
+        try:
+            return await self._client.container.set_access_policy(
+                container_acl=signed_identifiers or None,
+                timeout=timeout,
+                access=public_access,
+                lease_access_conditions=access_conditions,
+                modified_access_conditions=mod_conditions,
+                cls=return_response_headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+
+    def list_blobs(self, name_starts_with=None, include=None, timeout=None, **kwargs):
+        # type: (Optional[str], Optional[Any], Optional[int], **Any) -> AsyncItemPaged[BlobProperties]
+        """Returns an async generator to list the blobs under the specified container.
+        The generator will lazily follow the continuation tokens returned by
+        the service.
+
+        :param str name_starts_with:
+            Filters the results to return only blobs whose names
+            begin with the specified prefix.
+        :param list[str] include:
+            Specifies one or more additional datasets to include in the response.
+            Options include: 'snapshots', 'metadata', 'uncommittedblobs', 'copy', 'deleted'.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: An async iterable (auto-paging) response of BlobProperties.
+        :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.storage.blob.models.BlobProperties]
+        """
+        if include and not isinstance(include, list):
+            include = [include]
+
+        results_per_page = kwargs.pop('results_per_page', None)
+        command = functools.partial(
+            self._client.container.list_blob_flat_segment,
+            include=include,
+            timeout=timeout,
+            **kwargs)
+        return AsyncItemPaged(
+            command, prefix=name_starts_with, results_per_page=results_per_page,
+            page_iterator_class=BlobPropertiesPaged)
+
+    def walk_blobs(
+            self, name_starts_with=None, # type: Optional[str]
+            include=None, # type: Optional[Any]
+            delimiter="/", # type: str
+            timeout=None, # type: Optional[int]
+            **kwargs # type: Optional[Any]
+        ):
+        # type: (...) -> AsyncItemPaged[BlobProperties]
+        """Returns an async generator to list the blobs under the specified container.
+        The generator will lazily follow the continuation tokens returned by
+        the service. This operation will list blobs in accordance with a hierarchy,
+        as delimited by the specified delimiter character.
+
+        :param str name_starts_with:
+            Filters the results to return only blobs whose names
+            begin with the specified prefix.
+        :param list[str] include:
+            Specifies one or more additional datasets to include in the response.
+            Options include: 'snapshots', 'metadata', 'uncommittedblobs', 'copy', 'deleted'.
+        :param str delimiter:
+            When the request includes this parameter, the operation returns a BlobPrefix
+            element in the response body that acts as a placeholder for all blobs whose
+            names begin with the same substring up to the appearance of the delimiter
+            character. The delimiter may be a single character or a string.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: An async iterable (auto-paging) response of BlobProperties.
+        :rtype: ~azure.core.async_paging.AsyncItemPaged[~azure.storage.blob.models.BlobProperties]
+        """
+        if include and not isinstance(include, list):
+            include = [include]
+
+        results_per_page = kwargs.pop('results_per_page', None)
+        command = functools.partial(
+            self._client.container.list_blob_hierarchy_segment,
+            delimiter=delimiter,
+            include=include,
+            timeout=timeout,
+            **kwargs)
+        return BlobPrefix(
+            command,
+            prefix=name_starts_with,
+            results_per_page=results_per_page,
+            delimiter=delimiter)
+
+    async def upload_blob(
+            self, name,  # type: Union[str, BlobProperties]
+            data,  # type: Union[Iterable[AnyStr], IO[AnyStr]]
+            blob_type=BlobType.BlockBlob,  # type: Union[str, BlobType]
+            overwrite=False,  # type: bool
+            length=None,  # type: Optional[int]
+            metadata=None,  # type: Optional[Dict[str, str]]
+            content_settings=None,  # type: Optional[ContentSettings]
+            validate_content=False,  # type: Optional[bool]
+            lease=None,  # type: Optional[Union[LeaseClient, str]]
+            if_modified_since=None,  # type: Optional[datetime]
+            if_unmodified_since=None,  # type: Optional[datetime]
+            if_match=None,  # type: Optional[str]
+            if_none_match=None,  # type: Optional[str]
+            timeout=None,  # type: Optional[int]
+            premium_page_blob_tier=None,  # type: Optional[Union[str, PremiumPageBlobTier]]
+            maxsize_condition=None,  # type: Optional[int]
+            max_connections=1,  # type: int
+            encoding='UTF-8', # type: str
+            **kwargs
+        ):
+        # type: (...) -> BlobClient
+        """Creates a new blob from a data source with automatic chunking.
+
+        :param name: The blob with which to interact. If specified, this value will override
+            a blob value specified in the blob URL.
+        :type name: str or ~azure.storage.blob.models.BlobProperties
+        :param ~azure.storage.blob.models.BlobType blob_type: The type of the blob. This can be
+            either BlockBlob, PageBlob or AppendBlob. The default value is BlockBlob.
+        :param bool overwrite: Whether the blob to be uploaded should overwrite the current data.
+            If True, upload_blob will silently overwrite the existing data. If set to False, the
+            operation will fail with ResourceExistsError. The exception to the above is with Append
+            blob types. In this case, if data already exists, an error will not be raised and
+            the data will be appended to the existing blob. If you set overwrite=True, then the existing
+            blob will be deleted, and a new one created.
+        :param int length:
+            Number of bytes to read from the stream. This is optional, but
+            should be supplied for optimal performance.
+        :param metadata:
+            Name-value pairs associated with the blob as metadata.
+        :type metadata: dict(str, str)
+        :param ~azure.storage.blob.models.ContentSettings content_settings:
+            ContentSettings object used to set blob properties.
+        :param bool validate_content:
+            If true, calculates an MD5 hash for each chunk of the blob. The storage
+            service checks the hash of the content that has arrived with the hash
+            that was sent. This is primarily valuable for detecting bitflips on
+            the wire if using http instead of https as https (the default) will
+            already validate. Note that this MD5 hash is not stored with the
+            blob. Also note that if enabled, the memory-efficient upload algorithm
+            will not be used, because computing the MD5 hash requires buffering
+            entire blocks, and doing so defeats the purpose of the memory-efficient algorithm.
+        :param lease:
+            Required if the container has an active lease. Value can be a LeaseClient object
+            or the lease ID as a string.
+        :type lease: ~azure.storage.blob.lease.LeaseClient or str
+        :param datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :param datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :param str if_match:
+            An ETag value, or the wildcard character (*). Specify this header to perform
+            the operation only if the resource's ETag matches the value specified.
+        :param str if_none_match:
+            An ETag value, or the wildcard character (*). Specify this header
+            to perform the operation only if the resource's ETag does not match
+            the value specified. Specify the wildcard character (*) to perform
+            the operation only if the resource does not exist, and fail the
+            operation if it does exist.
+        :param int timeout:
+            The timeout parameter is expressed in seconds. This method may make
+            multiple calls to the Azure service and the timeout will apply to
+            each call individually.
+        :param ~azure.storage.blob.models.PremiumPageBlobTier premium_page_blob_tier:
+            A page blob tier value to set the blob to. The tier correlates to the size of the
+            blob and number of allowed IOPS. This is only applicable to page blobs on
+            premium storage accounts.
+        :param int maxsize_condition:
+            Optional conditional header. The max length in bytes permitted for
+            the append blob. If the Append Block operation would cause the blob
+            to exceed that limit or if the blob size is already greater than the
+            value specified in this header, the request will fail with
+            MaxBlobSizeConditionNotMet error (HTTP status code 412 - Precondition Failed).
+        :param int max_connections:
+            Maximum number of parallel connections to use when the blob size exceeds
+            64MB.
+        :param str encoding:
+            Defaults to UTF-8.
+        :returns: A BlobClient to interact with the newly uploaded blob.
+        :rtype: ~azure.storage.blob.aio.BlobClient
+        """
+        blob = self.get_blob_client(name)
+        await blob.upload_blob(
+            data,
+            blob_type=blob_type,
+            overwrite=overwrite,
+            length=length,
+            metadata=metadata,
+            content_settings=content_settings,
+            validate_content=validate_content,
+            lease=lease,
+            if_modified_since=if_modified_since,
+            if_unmodified_since=if_unmodified_since,
+            if_match=if_match,
+            if_none_match=if_none_match,
+            timeout=timeout,
+            premium_page_blob_tier=premium_page_blob_tier,
+            maxsize_condition=maxsize_condition,
+            max_connections=max_connections,
+            encoding=encoding,
+            **kwargs
+        )
+        return blob
+
+    async def delete_blob(
+            self, blob,  # type: Union[str, BlobProperties]
+            delete_snapshots=None,  # type: Optional[str]
+            lease=None,  # type: Optional[Union[str, LeaseClient]]
+            if_modified_since=None,  # type: Optional[datetime]
+            if_unmodified_since=None,  # type: Optional[datetime]
+            if_match=None,  # type: Optional[str]
+            if_none_match=None,  # type: Optional[str]
+            timeout=None,  # type: Optional[int]
+            **kwargs
+        ):
+        # type: (...) -> None
+        """Marks the specified blob or snapshot for deletion.
+
+        The blob is later deleted during garbage collection.
+        Note that in order to delete a blob, you must delete all of its
+        snapshots. You can delete both at the same time with the Delete
+        Blob operation.
+
+        If a delete retention policy is enabled for the service, then this operation soft deletes the blob or snapshot
+        and retains the blob or snapshot for specified number of days.
+        After specified number of days, blob's data is removed from the service during garbage collection.
+        Soft deleted blob or snapshot is accessible through List Blobs API specifying `include="deleted"` option.
+        Soft-deleted blob or snapshot can be restored using Undelete API.
+
+        :param blob: The blob with which to interact. If specified, this value will override
+         a blob value specified in the blob URL.
+        :type blob: str or ~azure.storage.blob.models.BlobProperties
+        :param str delete_snapshots:
+            Required if the blob has associated snapshots. Values include:
+             - "only": Deletes only the blobs snapshots.
+             - "include": Deletes the blob along with all snapshots.
+        :param lease:
+            Required if the blob has an active lease. Value can be a Lease object
+            or the lease ID as a string.
+        :type lease: ~azure.storage.blob.lease.LeaseClient or str
+        :param str delete_snapshots:
+            Required if the blob has associated snapshots. Values include:
+             - "only": Deletes only the blobs snapshots.
+             - "include": Deletes the blob along with all snapshots.
+        :param datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :param datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :param str if_match:
+            An ETag value, or the wildcard character (*). Specify this header to perform
+            the operation only if the resource's ETag matches the value specified.
+        :param str if_none_match:
+            An ETag value, or the wildcard character (*). Specify this header
+            to perform the operation only if the resource's ETag does not match
+            the value specified. Specify the wildcard character (*) to perform
+            the operation only if the resource does not exist, and fail the
+            operation if it does exist.
+        :param int timeout:
+            The timeout parameter is expressed in seconds.
+        :rtype: None
+        """
+        blob = self.get_blob_client(blob) # type: ignore
+        await blob.delete_blob( # type: ignore
+            delete_snapshots=delete_snapshots,
+            lease=lease,
+            if_modified_since=if_modified_since,
+            if_unmodified_since=if_unmodified_since,
+            if_match=if_match,
+            if_none_match=if_none_match,
+            timeout=timeout,
+            **kwargs)
+
+    async def _batch_send(self, sub_requests, max_connections=1, raise_on_any_failure=True, timeout=None, **kwargs):
+        # type: (List[HttpRequest], int, bool, Optional[int], **Any) -> List[HttpResponse]
+        async def send_batch(batch):
+            token = None
+            if hasattr(self.credential, 'get_token'):
+                token = (await self.credential.get_token(STORAGE_OAUTH_SCOPE)).token
+            request = build_batch_request(self._batch_url(timeout), batch, self.credential, token)
+            response = await self._pipeline.run(request, stream=True, **kwargs)
+            await response.http_response.load_body()
+            return parse_batch_response(response.http_response, batch)
+
+        batches = [sub_requests[i:i + MAX_BATCH_SIZE] for i in range(0, len(sub_requests), MAX_BATCH_SIZE)]
+        results = await run_bounded(send_batch, batches, max(1, max_connections))
+        parts = [part for result in results for part in result]
+        if raise_on_any_failure:
+            raise_on_failures(parts)
+        return parts
+
+    async def delete_blobs(self, *blobs, **kwargs):
+        # type: (*Union[str, BlobProperties], **Any) -> List[HttpResponse]
+        """Marks the specified blobs or snapshots for deletion, in batch requests.
+
+        The blobs are deleted by batches of up to 256 sub-requests, each sent as a single
+        multipart/mixed request, with up to `max_connections` batches in flight.
+
+        :param blobs:
+            The blobs to delete. This can either be the name of the blob,
+            or an instance of BlobProperties, in which case a snapshot is deleted
+            if the properties are those of a snapshot.
+        :type blobs: str or ~azure.storage.blob.models.BlobProperties
+        :param str delete_snapshots:
+            Required if the blobs have associated snapshots. Values include:
+             - "only": Deletes only the blobs snapshots.
+             - "include": Deletes the blob along with all snapshots.
+        :param datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :param datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :param int max_connections:
+            The number of batch requests to send concurrently. The default value is 1.
+        :param bool raise_on_any_failure:
+            Whether to raise a PartialBatchErrorException, holding the response of each
+            sub-request, if any of the blobs could not be deleted. The default value is True.
+        :param int timeout:
+            The timeout parameter is expressed in seconds, for each batch request.
+        :returns: The response of each sub-request, in the order of the blobs.
+        :rtype: list(~azure.core.pipeline.transport.HttpResponse)
+        :raises: ~azure.storage.blob.PartialBatchErrorException
+        """
+        sub_requests = self._batch_delete_requests(
+            blobs,
+            delete_snapshots=kwargs.pop('delete_snapshots', None),
+            if_modified_since=kwargs.pop('if_modified_since', None),
+            if_unmodified_since=kwargs.pop('if_unmodified_since', None))
+        return await self._batch_send(sub_requests, **kwargs)
+
+    async def set_standard_blob_tier_blobs(self, standard_blob_tier, *blobs, **kwargs):
+        # type: (Union[str, StandardBlobTier], *Union[str, BlobProperties], **Any) -> List[HttpResponse]
+        """Sets the tier of the specified block blobs, in batch requests.
+
+        The tiers are set by batches of up to 256 sub-requests, each sent as a single
+        multipart/mixed request, with up to `max_connections` batches in flight.
+        This operation does not update the ETag of the blobs.
+
+        :param standard_blob_tier:
+            Indicates the tier to be set on the blobs. Options include 'Hot', 'Cool',
+            'Archive'.
+        :type standard_blob_tier: str or ~azure.storage.blob.models.StandardBlobTier
+        :param blobs:
+            The blobs to set the tier of. This can either be the name of the blob,
+            or an instance of BlobProperties.
+        :type blobs: str or ~azure.storage.blob.models.BlobProperties
+        :param int max_connections:
+            The number of batch requests to send concurrently. The default value is 1.
+        :param bool raise_on_any_failure:
+            Whether to raise a PartialBatchErrorException, holding the response of each
+            sub-request, if the tier of any of the blobs could not be set. The default value is True.
+        :param int timeout:
+            The timeout parameter is expressed in seconds, for each batch request.
+        :returns: The response of each sub-request, in the order of the blobs.
+        :rtype: list(~azure.core.pipeline.transport.HttpResponse)
+        :raises: ~azure.storage.blob.PartialBatchErrorException
+        """
+        return await self._batch_send(self._batch_tier_requests(standard_blob_tier, blobs), **kwargs)
+
+    async def _run_copy_step(self, tracker, name, step, *args):
+        try:
+            await step(*args)
+        except (AzureError, ValueError) as error:
+            tracker.failed(name, error)
+
+    async def _start_server_copy(self, tracker, destination, blob, source_url, timeout):
+        try:
+            copy = await destination._client.blob.start_copy_from_url(  # pylint: disable=protected-access
+                source_url, timeout=timeout, cls=return_response_headers)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        tracker.started(blob.name, destination, blob.size, copy['copy_status'])
+
+    async def _stage_copy_block(self, tracker, destination, blob, source_url, block, block_ids, timeout):
+        block_id, offset, length = block
+        # The source length of stage_block_from_url is the offset of the last byte of the range.
+        await destination.stage_block_from_url(
+            block_id, source_url, source_offset=offset, source_length=offset + length - 1, timeout=timeout)
+        if tracker.block_staged(blob.name):
+            await destination.commit_block_list(
+                block_ids, content_settings=blob.content_settings, metadata=blob.metadata, timeout=timeout)
+            tracker.succeeded(blob.name, blob.size, staged=True)
+
+    async def _poll_copy(self, tracker, name, destination, timeout):
+        tracker.polled(name, await destination.get_blob_properties(timeout=timeout))
+
+    async def _wait_copy_steps(self, running, tracker, timeout=None):
+        # One turn of the polling loop: wait for a step to complete, or for the next poll of the pending copies.
+        wait = tracker.time_to_poll()
+        if running:
+            done, running = await asyncio.wait(running, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        elif wait:
+            await asyncio.sleep(wait)
+        for name, destination in tracker.due():
+            await self._run_copy_step(tracker, name, self._poll_copy, tracker, name, destination, timeout)
+        return running
+
+    async def copy_blobs_from_container(self, source_container, name_starts_with=None, **kwargs):
+        # type: (Union[ContainerClient, str], Optional[str], **Any) -> BulkCopyResult
+        """Copies the blobs of another container, or the blobs under a prefix, to this container.
+
+        Each blob keeps its name, and an existing destination blob is overwritten.
+        Block blobs of at least `min_staged_copy_size` are copied synchronously: their blocks
+        are staged concurrently from the URL of the source blob, then committed. The other blobs
+        are copied asynchronously by the service, and a single loop polls the properties of
+        every pending destination.
+
+        Failed copies do not stop the other copies: the error of each one is reported in the
+        result, along with the number of bytes copied and the throughput of the bulk copy.
+
+        :param source_container:
+            The container to copy the blobs of. This can either be a ContainerClient, or the
+            URL of the container. If the source is in another account, it must either be public
+            or the URL (or the client) must include a shared access signature.
+        :type source_container: ~azure.storage.blob.aio.ContainerClient or str
+        :param str name_starts_with:
+            Copies only the blobs whose names begin with the specified prefix.
+        :param int max_connections:
+            The number of requests to start copies and stage blocks concurrently.
+            The default value is 1.
+        :param int min_staged_copy_size:
+            The size from which block blobs are copied by staging their blocks. Defaults to
+            the min_staged_copy_size setting of the client, 256MB.
+        :param int block_size:
+            The size of the blocks staged, up to 100MB. Defaults to the max_copy_block_size
+            setting of the client, 32MB.
+        :param int polling_interval:
+            The seconds between two polls of the pending copies. Defaults to the
+            copy_polling_interval setting of the client.
+        :param int timeout:
+            The timeout parameter is expressed in seconds, for each request.
+        :returns: The blobs copied, the errors of the blobs not copied, and the statistics of the copy.
+        :rtype: ~azure.storage.blob.models.BulkCopyResult
+        """
+        if isinstance(source_container, six.string_types):
+            source_container = ContainerClient(source_container, _configuration=self._config)
+        timeout = kwargs.pop('timeout', None)
+        max_connections = kwargs.pop('max_connections', 1)
+        tracker = BulkCopyTracker(
+            kwargs.pop('min_staged_copy_size', self._config.blob_settings.min_staged_copy_size),
+            kwargs.pop('block_size', self._config.blob_settings.max_copy_block_size),
+            kwargs.pop('polling_interval', self._config.blob_settings.copy_polling_interval))
+        blobs = source_container.list_blobs(
+            name_starts_with=name_starts_with, include='metadata', timeout=timeout, **kwargs)
+
+        running = set()  # type: Set[Any]
+        try:
+            async for blob in blobs:
+                for name, step, args in self._copy_steps(source_container, [blob], tracker, timeout):
+                    while len(running) >= max_connections:
+                        running = await self._wait_copy_steps(running, tracker, timeout)
+                    running.add(asyncio.ensure_future(self._run_copy_step(tracker, name, step, *args)))
+            while running or tracker.pending:
+                running = await self._wait_copy_steps(running, tracker, timeout)
+        finally:
+            for task in running:
+                task.cancel()
+        return tracker.finish()
+
+    def get_blob_client(
+            self, blob,  # type: Union[str, BlobProperties]
+            snapshot=None  # type: str
+        ):
+        # type: (...) -> BlobClient
+        """Get a client to interact with the specified blob.
+
+        The blob need not already exist.
+
+        :param blob:
+            The blob with which to interact. If specified, this value will override
+            a blob value specified in the blob URL.
+        :type blob: str or ~azure.storage.blob.models.BlobProperties
+        :param str snapshot:
+            The optional blob snapshot on which to operate.
+        :returns: A BlobClient.
+        :rtype: ~azure.storage.blob.aio.BlobClient
+        """
+        return BlobClient(
+            self.url, container=self.container_name, blob=blob, snapshot=snapshot,
+            credential=self.credential, _configuration=self._config,
+            _pipeline=self._pipeline, _location_mode=self._location_mode, _hosts=self._hosts,
+            require_encryption=self.require_encryption, key_encryption_key=self.key_encryption_key,
+            key_resolver_function=self.key_resolver_function)
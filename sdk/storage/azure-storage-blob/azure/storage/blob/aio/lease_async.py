@@ -0,0 +1,198 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from typing import (  # pylint: disable=unused-import
+    Union, Optional, Any, TypeVar, TYPE_CHECKING
+)
+
+from .._shared.utils import return_response_headers, process_storage_error
+from .._generated.models import StorageErrorException
+from .._blob_utils import get_modification_conditions
+from ..lease import LeaseClient as LeaseClientBase
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    BlobClient = TypeVar("BlobClient")
+    ContainerClient = TypeVar("ContainerClient")
+
+
+class LeaseClient(LeaseClientBase):
+    """Creates a new LeaseClient.
+
+    This client provides lease operations on an async BlobClient or ContainerClient.
+
+    :ivar str id:
+        The ID of the lease currently being maintained. This will be `None` if no
+        lease has yet been acquired.
+    :ivar str etag:
+        The ETag of the lease currently being maintained. This will be `None` if no
+        lease has yet been acquired or modified.
+    :ivar datetime last_modified:
+        The last modified timestampt of the lease currently being maintained.
+        This will be `None` if no lease has yet been acquired or modified.
+
+    :param client:
+        The client of the blob or container to lease.
+    :type client: ~azure.storage.blob.aio.BlobClient or
+        ~azure.storage.blob.aio.ContainerClient
+    :param str lease_id:
+        A string representing the lease ID of an existing lease. This value does not
+        need to be specified in order to acquire a new lease, or break one.
+    """
+
+    def __enter__(self):
+        raise TypeError("Async lease must use 'async with'.")
+
+    def __exit__(self, *args):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.release()
+
+    async def acquire(
+            self, lease_duration: int = -1,
+            if_modified_since: Optional['datetime'] = None,
+            if_unmodified_since: Optional['datetime'] = None,
+            if_match: Optional[str] = None,
+            if_none_match: Optional[str] = None,
+            timeout: Optional[int] = None,
+            **kwargs: Any) -> None:
+        """Requests a new lease.
+
+        The parameters are those of :func:`azure.storage.blob.lease.LeaseClient.acquire`.
+
+        :rtype: None
+        """
+        mod_conditions = get_modification_conditions(
+            if_modified_since, if_unmodified_since, if_match, if_none_match)
+        try:
+            response = await self._client.acquire_lease(
+                timeout=timeout,
+                duration=lease_duration,
+                proposed_lease_id=self.id,
+                modified_access_conditions=mod_conditions,
+                cls=return_response_headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        self.id = response.get('lease_id')
+        self.last_modified = response.get('last_modified')
+        self.etag = kwargs.get('etag')
+
+    async def renew(
+            self, if_modified_since: Optional['datetime'] = None,
+            if_unmodified_since: Optional['datetime'] = None,
+            if_match: Optional[str] = None,
+            if_none_match: Optional[str] = None,
+            timeout: Optional[int] = None,
+            **kwargs: Any) -> None:
+        """Renews the lease.
+
+        The parameters are those of :func:`azure.storage.blob.lease.LeaseClient.renew`.
+
+        :return: None
+        """
+        mod_conditions = get_modification_conditions(
+            if_modified_since, if_unmodified_since, if_match, if_none_match)
+        try:
+            response = await self._client.renew_lease(
+                lease_id=self.id,
+                timeout=timeout,
+                modified_access_conditions=mod_conditions,
+                cls=return_response_headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        self.etag = response.get('etag')
+        self.id = response.get('lease_id')
+        self.last_modified = response.get('last_modified')
+
+    async def release(
+            self, if_modified_since: Optional['datetime'] = None,
+            if_unmodified_since: Optional['datetime'] = None,
+            if_match: Optional[str] = None,
+            if_none_match: Optional[str] = None,
+            timeout: Optional[int] = None,
+            **kwargs: Any) -> None:
+        """Release the lease.
+
+        The parameters are those of :func:`azure.storage.blob.lease.LeaseClient.release`.
+
+        :return: None
+        """
+        mod_conditions = get_modification_conditions(
+            if_modified_since, if_unmodified_since, if_match, if_none_match)
+        try:
+            response = await self._client.release_lease(
+                lease_id=self.id,
+                timeout=timeout,
+                modified_access_conditions=mod_conditions,
+                cls=return_response_headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        self.etag = response.get('etag')
+        self.id = response.get('lease_id')
+        self.last_modified = response.get('last_modified')
+
+    async def change(
+            self, proposed_lease_id: str,
+            if_modified_since: Optional['datetime'] = None,
+            if_unmodified_since: Optional['datetime'] = None,
+            if_match: Optional[str] = None,
+            if_none_match: Optional[str] = None,
+            timeout: Optional[int] = None,
+            **kwargs: Any) -> None:
+        """Change the lease ID of an active lease.
+
+        The parameters are those of :func:`azure.storage.blob.lease.LeaseClient.change`.
+
+        :return: None
+        """
+        mod_conditions = get_modification_conditions(
+            if_modified_since, if_unmodified_since, if_match, if_none_match)
+        try:
+            response = await self._client.change_lease(
+                lease_id=self.id,
+                proposed_lease_id=proposed_lease_id,
+                timeout=timeout,
+                modified_access_conditions=mod_conditions,
+                cls=return_response_headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        self.etag = response.get('etag')
+        self.id = response.get('lease_id')
+        self.last_modified = response.get('last_modified')
+
+    async def break_lease(
+            self, lease_break_period: Optional[int] = None,
+            if_modified_since: Optional['datetime'] = None,
+            if_unmodified_since: Optional['datetime'] = None,
+            timeout: Optional[int] = None,
+            **kwargs: Any) -> int:
+        """Break the lease, if the container or blob has an active lease.
+
+        The parameters are those of :func:`azure.storage.blob.lease.LeaseClient.break_lease`.
+
+        :return: Approximate time remaining in the lease period, in seconds.
+        :rtype: int
+        """
+        mod_conditions = get_modification_conditions(
+            if_modified_since, if_unmodified_since)
+        try:
+            response = await self._client.break_lease(
+                timeout=timeout,
+                break_period=lease_break_period,
+                modified_access_conditions=mod_conditions,
+                cls=return_response_headers,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        return response.get('lease_time')
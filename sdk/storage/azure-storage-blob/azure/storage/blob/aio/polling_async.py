@@ -0,0 +1,90 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import logging
+from typing import Any, Callable # pylint: disable=unused-import
+
+from azure.core.polling import AsyncPollingMethod
+
+from .._shared.utils import process_storage_error
+from .._generated.models import StorageErrorException
+from .._blob_utils import deserialize_blob_properties
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCopyBlobPolling(AsyncPollingMethod):
+    """Polls the properties of the destination blob until the copy operation ends.
+
+    The wait between two polls is awaited, so many copies can be followed from
+    a single event loop.
+    """
+    def __init__(self, interval, **kwargs):
+        self._client = None
+        self._status = None
+        self.id = None
+        self.etag = None
+        self.last_modified = None
+        self.polling_interval = interval
+        self.kwargs = kwargs
+        self.blob = None
+
+    async def _update_status(self):
+        try:
+            self.blob = await self._client._client.blob.get_properties(  # pylint: disable=protected-access
+                cls=deserialize_blob_properties, **self.kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        self._status = self.blob.copy.status
+        self.etag = self.blob.etag
+        self.last_modified = self.blob.last_modified
+
+    def initialize(self, client, initial_status, _):  # pylint: disable=arguments-differ
+        # type: (Any, Any, Callable) -> None
+        self._client = client
+        self._status = initial_status['copy_status']
+        self.id = initial_status['copy_id']
+        self.etag = initial_status['etag']
+        self.last_modified = initial_status['last_modified']
+
+    async def run(self):
+        # type: () -> None
+        try:
+            while not self.finished():
+                await asyncio.sleep(self.polling_interval)
+                await self._update_status()
+            if self.blob is None:
+                await self._update_status()
+            if self.status().lower() == 'aborted':
+                raise ValueError("Copy operation aborted.")
+            if self.status().lower() == 'failed':
+                raise ValueError("Copy operation failed: {}".format(self.blob.copy.status_description))
+        except Exception as e:
+            logger.warning(str(e))
+            raise
+
+    def status(self):
+        # type: () -> str
+        """Return the current status as a string.
+        :rtype: str
+        """
+        try:
+            return self._status.value # type: ignore
+        except AttributeError:
+            return str(self._status)
+
+    def finished(self):
+        # type: () -> bool
+        """Is this polling finished?
+        :rtype: bool
+        """
+        return self.status().lower() in ['success', 'aborted', 'failed']
+
+    def resource(self):
+        # type: () -> Any
+        return self.blob
@@ -20,7 +20,7 @@ import six
 
 from ._shared.shared_access_signature import BlobSharedAccessSignature
 from ._shared.encryption import _generate_blob_encryption_data
-from ._shared.upload_chunking import IterStreamer
+from ._shared.upload_chunking import IterStreamer, MemoryMappedFile
 from ._shared.utils import (
     StorageAccountHostsMixin,
     return_response_headers,
@@ -370,7 +370,7 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         :type metadata: dict(str, str)
         :param ~azure.storage.blob.models.ContentSettings content_settings:
             ContentSettings object used to set blob properties.
-        :param bool validate_content:
+        :param validate_content:
             If true, calculates an MD5 hash for each chunk of the blob. The storage
             service checks the hash of the content that has arrived with the hash
             that was sent. This is primarily valuable for detecting bitflips on
@@ -379,6 +379,10 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             blob. Also note that if enabled, the memory-efficient upload algorithm
             will not be used, because computing the MD5 hash requires buffering
             entire blocks, and doing so defeats the purpose of the memory-efficient algorithm.
+            Set to 'crc64' to validate the content with the CRC64 of the service instead
+            of an MD5 hash. The CRC64 is computed in C when the crcmod package is
+            installed with its extension, and much more slowly in Python otherwise.
+        :type validate_content: bool or str
         :param ~azure.storage.blob.lease.LeaseClient lease:
             If specified, upload_blob only succeeds if the
             blob's lease is active and matches this ID.
@@ -420,7 +424,8 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             MaxBlobSizeConditionNotMet error (HTTP status code 412 - Precondition Failed).
         :param int max_connections:
             Maximum number of parallel connections to use when the blob size exceeds
-            64MB.
+            64MB. When the client is created with `adaptive_transfer=True`, this is the
+            upper bound of a concurrency tuned from the throughput observed.
         :param str encoding:
             Defaults to UTF-8.
         :returns: Blob-updated property dict (Etag and last modified)
@@ -529,6 +534,31 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
                 **kwargs)
         raise ValueError("Unsupported BlobType: {}".format(blob_type))
 
+    def upload_blob_from_path(
+            self, file_path,  # type: str
+            blob_type=BlobType.BlockBlob,  # type: Union[str, BlobType]
+            **kwargs
+        ):
+        # type: (...) -> Any
+        """Creates a new blob from a local file.
+
+        The file is memory-mapped and each chunk is sent as a view of the mapping,
+        so the data is not copied into intermediate buffers, and parallel uploads
+        read their ranges independently rather than through a shared stream.
+        The other keyword arguments are those of :func:`~azure.storage.blob.blob_client.BlobClient.upload_blob`.
+
+        :param str file_path: The path of the file to upload.
+        :param ~azure.storage.blob.models.BlobType blob_type: The type of the blob. This can be
+            either BlockBlob, PageBlob or AppendBlob. The default value is BlockBlob.
+        :param int max_connections:
+            Maximum number of parallel connections to use when the blob size exceeds
+            64MB.
+        :returns: Blob-updated property dict (Etag and last modified)
+        :rtype: dict[str, Any]
+        """
+        with MemoryMappedFile(file_path) as stream:
+            return self.upload_blob(stream, blob_type=blob_type, length=len(stream), **kwargs)
+
     def download_blob(
             self, offset=None,  # type: Optional[int]
             length=None,  # type: Optional[int]
@@ -550,7 +580,7 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         :param int length:
             Number of bytes to read from the stream. This is optional, but
             should be supplied for optimal performance.
-        :param bool validate_content:
+        :param validate_content:
             If true, calculates an MD5 hash for each chunk of the blob. The storage
             service checks the hash of the content that has arrived with the hash
             that was sent. This is primarily valuable for detecting bitflips on
@@ -559,6 +589,10 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             blob. Also note that if enabled, the memory-efficient upload algorithm
             will not be used, because computing the MD5 hash requires buffering
             entire blocks, and doing so defeats the purpose of the memory-efficient algorithm.
+            Set to 'crc64' to validate the content with the CRC64 of the service instead
+            of an MD5 hash. The CRC64 is computed in C when the crcmod package is
+            installed with its extension, and much more slowly in Python otherwise.
+        :type validate_content: bool or str
         :param lease:
             If specified, download_blob only succeeds if the blob's lease is active
             and matches this ID. Required if the blob has an active lease.
@@ -1339,9 +1373,15 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         :param bool requires_sync:
             Enforces that the service will not return a response until the copy is complete.
         :param bool polling: A poller will be used for this operation. Defaults to True.
+        :param polling_scheduler:
+            Poll the copy status with this scheduler, or with the process-wide scheduler if True,
+            instead of a thread per copy. The done callbacks of the poller then run on the
+            scheduler's worker threads.
+        :type polling_scheduler: ~azure.core.polling.PollingScheduler or bool
         :returns: A pollable object to check copy operation status (and abort).
         :rtype: :class:`~azure.storage.blob.polling.CopyStatusPoller`
         """
+        polling_scheduler = kwargs.pop('polling_scheduler', None)
         headers = kwargs.pop('headers', {})
         headers.update(add_metadata_headers(metadata))
         if source_lease:
@@ -1391,6 +1431,7 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             self, start_copy,
             polling=polling,
             configuration=self._config,
+            polling_scheduler=polling_scheduler,
             lease_access_conditions=destination_lease,
             timeout=timeout)
         return poller
@@ -1518,7 +1559,7 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
              the block_id parameter must be the same size for each block.
         :param data: The blob data.
         :param int length: Size of the block.
-        :param bool validate_content:
+        :param validate_content:
             If true, calculates an MD5 hash for each chunk of the blob. The storage
             service checks the hash of the content that has arrived with the hash
             that was sent. This is primarily valuable for detecting bitflips on
@@ -1527,6 +1568,10 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             blob. Also note that if enabled, the memory-efficient upload algorithm
             will not be used, because computing the MD5 hash requires buffering
             entire blocks, and doing so defeats the purpose of the memory-efficient algorithm.
+            Set to 'crc64' to validate the content with the CRC64 of the service instead
+            of an MD5 hash. The CRC64 is computed in C when the crcmod package is
+            installed with its extension, and much more slowly in Python otherwise.
+        :type validate_content: bool or str
         :param lease:
             Required if the blob has an active lease. Value can be a LeaseClient object
             or the lease ID as a string.
@@ -1756,6 +1801,7 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
                 modified_access_conditions=mod_conditions,
                 cls=return_response_headers,
                 validate_content=validate_content,
+                headers=headers,
                 **kwargs)
         except StorageErrorException as error:
             process_storage_error(error)
@@ -2073,13 +2119,17 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             Required if the blob has an active lease. Value can be a LeaseClient object
             or the lease ID as a string.
         :type lease: ~azure.storage.blob.lease.LeaseClient or str
-        :param bool validate_content:
+        :param validate_content:
             If true, calculates an MD5 hash of the page content. The storage
             service checks the hash of the content that has arrived
             with the hash that was sent. This is primarily valuable for detecting
             bitflips on the wire if using http instead of https as https (the default)
             will already validate. Note that this MD5 hash is not stored with the
             blob.
+            Set to 'crc64' to validate the content with the CRC64 of the service instead
+            of an MD5 hash. The CRC64 is computed in C when the crcmod package is
+            installed with its extension, and much more slowly in Python otherwise.
+        :type validate_content: bool or str
         :param int if_sequence_number_lte:
             If the blob's sequence number is less than or equal to
             the specified value, the request proceeds; otherwise it fails.
@@ -2271,13 +2321,17 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             Content of the block.
         :param int length:
             Size of the block in bytes.
-        :param bool validate_content:
+        :param validate_content:
             If true, calculates an MD5 hash of the block content. The storage
             service checks the hash of the content that has arrived
             with the hash that was sent. This is primarily valuable for detecting
             bitflips on the wire if using http instead of https as https (the default)
             will already validate. Note that this MD5 hash is not stored with the
             blob.
+            Set to 'crc64' to validate the content with the CRC64 of the service instead
+            of an MD5 hash. The CRC64 is computed in C when the crcmod package is
+            installed with its extension, and much more slowly in Python otherwise.
+        :type validate_content: bool or str
         :param int maxsize_condition:
             Optional conditional header. The max length in bytes permitted for
             the append blob. If the Append Block operation would cause the blob
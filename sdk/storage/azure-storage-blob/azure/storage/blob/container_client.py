@@ -5,8 +5,9 @@
 # --------------------------------------------------------------------------
 
 import functools
+import time
 from typing import (  # pylint: disable=unused-import
-    Union, Optional, Any, Iterable, AnyStr, Dict, List, Tuple, IO,
+    Union, Optional, Any, Iterable, AnyStr, Dict, List, Set, Tuple, IO, Callable,
     TYPE_CHECKING
 )
 
@@ -16,11 +17,17 @@ except ImportError:
     from urlparse import urlparse # type: ignore
     from urllib2 import quote, unquote # type: ignore
 
+from azure.core.exceptions import AzureError
 from azure.core.paging import ItemPaged
+from azure.core.pipeline.policies import ContentDecodePolicy
+from azure.core.pipeline.transport import HttpRequest
 
 import six
+from msrest import Serializer
 
 from ._shared.shared_access_signature import BlobSharedAccessSignature
+from ._shared.constants import STORAGE_OAUTH_SCOPE
+from ._shared.models import LocationMode
 from ._shared.utils import (
     StorageAccountHostsMixin,
     process_storage_error,
@@ -38,12 +45,16 @@ from ._blob_utils import (
     get_access_conditions,
     get_modification_conditions,
     deserialize_container_properties)
+from ._blob_batch import MAX_BATCH_SIZE, build_batch_request, parse_batch_response, raise_on_failures
+from ._blob_copy import BulkCopyTracker
 from .models import ( # pylint: disable=unused-import
     ContainerProperties,
     BlobProperties,
     BlobPropertiesPaged,
+    _StreamedBlobPropertiesPaged,
     BlobType,
-    BlobPrefix)
+    BlobPrefix,
+    BulkCopyResult)
 from .lease import LeaseClient
 from .blob_client import BlobClient
 
@@ -55,7 +66,9 @@ if TYPE_CHECKING:
     from .models import ( # pylint: disable=unused-import
         AccessPolicy,
         ContentSettings,
-        PremiumPageBlobTier)
+        PremiumPageBlobTier,
+        StandardBlobTier)
+    from azure.core.pipeline.transport import HttpResponse
 
 
 class ContainerClient(StorageAccountHostsMixin):
@@ -690,13 +703,59 @@ class ContainerClient(StorageAccountHostsMixin):
 
         results_per_page = kwargs.pop('results_per_page', None)
         command = functools.partial(
-            self._client.container.list_blob_flat_segment,
+            self._list_blob_flat_segment_streamed,
             include=include,
             timeout=timeout,
             **kwargs)
         return ItemPaged(
             command, prefix=name_starts_with, results_per_page=results_per_page,
-            page_iterator_class=BlobPropertiesPaged)
+            container=self.container_name,
+            deserializer=self._client._deserialize,  # pylint: disable=protected-access
+            page_iterator_class=_StreamedBlobPropertiesPaged)
+
+    def _list_blob_flat_segment_streamed(
+            self, prefix=None,  # type: Optional[str]
+            marker=None,  # type: Optional[str]
+            maxresults=None,  # type: Optional[int]
+            include=None,  # type: Optional[List[str]]
+            timeout=None,  # type: Optional[int]
+            cls=None,  # type: Optional[Callable]
+            **kwargs
+        ):
+        # type: (...) -> Any
+        """Send the request of the generated `list_blob_flat_segment`, with a streamed response.
+
+        The `Blob` elements of the response are decoded as they are downloaded, instead of
+        loading and deserializing the whole page at once.
+        """
+        serialize = self._client._serialize  # pylint: disable=protected-access
+        query_parameters = {
+            'restype': serialize.query("restype", "container", 'str'),
+            'comp': serialize.query("comp", "list", 'str'),
+        }
+        if prefix is not None:
+            query_parameters['prefix'] = serialize.query("prefix", prefix, 'str')
+        if marker is not None:
+            query_parameters['marker'] = serialize.query("marker", marker, 'str')
+        if maxresults is not None:
+            query_parameters['maxresults'] = serialize.query("maxresults", maxresults, 'int', minimum=1)
+        if include is not None:
+            query_parameters['include'] = serialize.query("include", include, '[ListBlobsIncludeItem]', div=',')
+        if timeout is not None:
+            query_parameters['timeout'] = serialize.query("timeout", timeout, 'int', minimum=0)
+        request = HttpRequest('GET', self.url, headers={
+            'Accept': 'application/xml',
+            'x-ms-version': serialize.header(
+                "version", self._client._config.version, 'str')})  # pylint: disable=protected-access
+        request.format_parameters(query_parameters)
+
+        response = self._pipeline.run(request, stream=True, **kwargs).http_response
+        if response.status_code != 200:
+            raise StorageErrorException(response, self._client._deserialize)  # pylint: disable=protected-access
+        blobs = ContentDecodePolicy.iter_xml_elements(response.stream_download(self._pipeline), 'Blob')
+        if cls:
+            return cls(response, blobs, {})
+        return blobs
 
 
     def walk_blobs(
@@ -950,6 +1009,276 @@ class ContainerClient(StorageAccountHostsMixin):
             timeout=timeout,
             **kwargs)
 
+    def _batch_sub_request(self, method, blob, params=None, headers=None):
+        # type: (str, Union[str, BlobProperties], Optional[Dict[str, str]], Optional[Dict[str, str]]) -> HttpRequest
+        try:
+            blob_name, snapshot = blob.name, blob.snapshot  # type: ignore
+        except AttributeError:
+            blob_name, snapshot = blob, None
+        container_name = self.container_name
+        if isinstance(container_name, six.text_type):
+            container_name = container_name.encode('UTF-8')
+        if isinstance(blob_name, six.text_type):
+            blob_name = blob_name.encode('UTF-8')
+        request = HttpRequest(method, "{}://{}/{}/{}{}".format(
+            self.scheme,
+            self._hosts[LocationMode.PRIMARY],
+            quote(container_name),
+            quote(blob_name, safe='~'),
+            self._query_str), headers={k: v for k, v in (headers or {}).items() if v is not None})
+        params = dict(params or {})
+        if snapshot:
+            params['snapshot'] = quote(snapshot)
+        if params:
+            request.format_parameters(params)
+        return request
+
+    def _batch_delete_requests(
+            self, blobs,  # type: Iterable[Union[str, BlobProperties]]
+            delete_snapshots=None,  # type: Optional[str]
+            if_modified_since=None,  # type: Optional[datetime]
+            if_unmodified_since=None  # type: Optional[datetime]
+        ):
+        # type: (...) -> List[HttpRequest]
+        headers = {
+            'x-ms-delete-snapshots': delete_snapshots,
+            'If-Modified-Since': Serializer.serialize_rfc(if_modified_since) if if_modified_since else None,
+            'If-Unmodified-Since': Serializer.serialize_rfc(if_unmodified_since) if if_unmodified_since else None,
+        }
+        return [self._batch_sub_request('DELETE', blob, headers=headers) for blob in blobs]
+
+    def _batch_tier_requests(self, standard_blob_tier, blobs):
+        # type: (Union[str, StandardBlobTier], Iterable[Union[str, BlobProperties]]) -> List[HttpRequest]
+        if standard_blob_tier is None:
+            raise ValueError("A StandardBlobTier must be specified")
+        headers = {'x-ms-access-tier': getattr(standard_blob_tier, 'value', standard_blob_tier)}
+        return [self._batch_sub_request('PUT', blob, params={'comp': 'tier'}, headers=headers) for blob in blobs]
+
+    def _batch_url(self, timeout=None):
+        # type: (Optional[int]) -> str
+        url = "{}://{}/{}".format(self.scheme, self._hosts[LocationMode.PRIMARY], self._query_str)
+        if timeout:
+            url += ('&' if self._query_str else '?') + 'timeout={}'.format(timeout)
+        return url
+
+    def _batch_send(self, sub_requests, max_connections=1, raise_on_any_failure=True, timeout=None, **kwargs):
+        # type: (List[HttpRequest], int, bool, Optional[int], **Any) -> List[HttpResponse]
+        def send_batch(batch):
+            token = None
+            if hasattr(self.credential, 'get_token'):
+                token = self.credential.get_token(STORAGE_OAUTH_SCOPE).token
+            request = build_batch_request(self._batch_url(timeout), batch, self.credential, token)
+            response = self._pipeline.run(request, stream=True, **kwargs)
+            return parse_batch_response(response.http_response, batch)
+
+        batches = [sub_requests[i:i + MAX_BATCH_SIZE] for i in range(0, len(sub_requests), MAX_BATCH_SIZE)]
+        if max_connections > 1:
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(max_connections) as executor:
+                results = list(executor.map(send_batch, batches))
+        else:
+            results = [send_batch(batch) for batch in batches]
+
+        parts = [part for result in results for part in result]
+        if raise_on_any_failure:
+            raise_on_failures(parts)
+        return parts
+
+    def delete_blobs(self, *blobs, **kwargs):
+        # type: (*Union[str, BlobProperties], **Any) -> List[HttpResponse]
+        """Marks the specified blobs or snapshots for deletion, in batch requests.
+
+        The blobs are deleted by batches of up to 256 sub-requests, each sent as a single
+        multipart/mixed request, so deleting many blobs does not cost a round trip per blob.
+        The sub-requests of a batch are run by the service independently of each other.
+
+        :param blobs:
+            The blobs to delete. This can either be the name of the blob,
+            or an instance of BlobProperties, in which case a snapshot is deleted
+            if the properties are those of a snapshot.
+        :type blobs: str or ~azure.storage.blob.models.BlobProperties
+        :param str delete_snapshots:
+            Required if the blobs have associated snapshots. Values include:
+             - "only": Deletes only the blobs snapshots.
+             - "include": Deletes the blob along with all snapshots.
+        :param datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :param datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :param int max_connections:
+            The number of batch requests to send in parallel. The default value is 1.
+        :param bool raise_on_any_failure:
+            Whether to raise a PartialBatchErrorException, holding the response of each
+            sub-request, if any of the blobs could not be deleted. The default value is True.
+        :param int timeout:
+            The timeout parameter is expressed in seconds, for each batch request.
+        :returns: The response of each sub-request, in the order of the blobs.
+        :rtype: list(~azure.core.pipeline.transport.HttpResponse)
+        :raises: ~azure.storage.blob.PartialBatchErrorException
+        """
+        sub_requests = self._batch_delete_requests(
+            blobs,
+            delete_snapshots=kwargs.pop('delete_snapshots', None),
+            if_modified_since=kwargs.pop('if_modified_since', None),
+            if_unmodified_since=kwargs.pop('if_unmodified_since', None))
+        return self._batch_send(sub_requests, **kwargs)
+
+    def set_standard_blob_tier_blobs(self, standard_blob_tier, *blobs, **kwargs):
+        # type: (Union[str, StandardBlobTier], *Union[str, BlobProperties], **Any) -> List[HttpResponse]
+        """Sets the tier of the specified block blobs, in batch requests.
+
+        The tiers are set by batches of up to 256 sub-requests, each sent as a single
+        multipart/mixed request. This operation does not update the ETag of the blobs.
+
+        :param standard_blob_tier:
+            Indicates the tier to be set on the blobs. Options include 'Hot', 'Cool',
+            'Archive'. The hot tier is optimized for storing data that is accessed
+            frequently. The cool storage tier is optimized for storing data that
+            is infrequently accessed and stored for at least a month. The archive
+            tier is optimized for storing data that is rarely accessed and stored
+            for at least six months with flexible latency requirements.
+        :type standard_blob_tier: str or ~azure.storage.blob.models.StandardBlobTier
+        :param blobs:
+            The blobs to set the tier of. This can either be the name of the blob,
+            or an instance of BlobProperties.
+        :type blobs: str or ~azure.storage.blob.models.BlobProperties
+        :param int max_connections:
+            The number of batch requests to send in parallel. The default value is 1.
+        :param bool raise_on_any_failure:
+            Whether to raise a PartialBatchErrorException, holding the response of each
+            sub-request, if the tier of any of the blobs could not be set. The default value is True.
+        :param int timeout:
+            The timeout parameter is expressed in seconds, for each batch request.
+        :returns: The response of each sub-request, in the order of the blobs.
+        :rtype: list(~azure.core.pipeline.transport.HttpResponse)
+        :raises: ~azure.storage.blob.PartialBatchErrorException
+        """
+        return self._batch_send(self._batch_tier_requests(standard_blob_tier, blobs), **kwargs)
+
+    def _copy_steps(self, source_container, blobs, tracker, timeout=None):
+        # Yields the requests starting each copy: the asynchronous copy of a blob, or the staging of each of its blocks
+        for blob in blobs:
+            source_url = source_container.get_blob_client(blob).url
+            destination = self.get_blob_client(blob.name)
+            blocks = tracker.plan(blob)
+            if blocks is None:
+                yield blob.name, self._start_server_copy, (tracker, destination, blob, source_url, timeout)
+                continue
+            block_ids = [block[0] for block in blocks]
+            for block in blocks:
+                yield blob.name, self._stage_copy_block, (
+                    tracker, destination, blob, source_url, block, block_ids, timeout)
+
+    def _run_copy_step(self, tracker, name, step, *args):
+        try:
+            step(*args)
+        except (AzureError, ValueError) as error:
+            tracker.failed(name, error)
+
+    def _start_server_copy(self, tracker, destination, blob, source_url, timeout):  # pylint: disable=no-self-use
+        try:
+            copy = destination._client.blob.start_copy_from_url(  # pylint: disable=protected-access
+                source_url, timeout=timeout, cls=return_response_headers)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        tracker.started(blob.name, destination, blob.size, copy['copy_status'])
+
+    def _stage_copy_block(  # pylint: disable=no-self-use
+            self, tracker, destination, blob, source_url, block, block_ids, timeout):
+        block_id, offset, length = block
+        # The source length of stage_block_from_url is the offset of the last byte of the range.
+        destination.stage_block_from_url(
+            block_id, source_url, source_offset=offset, source_length=offset + length - 1, timeout=timeout)
+        if tracker.block_staged(blob.name):
+            destination.commit_block_list(
+                block_ids, content_settings=blob.content_settings, metadata=blob.metadata, timeout=timeout)
+            tracker.succeeded(blob.name, blob.size, staged=True)
+
+    def _poll_copy(self, tracker, name, destination, timeout):  # pylint: disable=no-self-use
+        tracker.polled(name, destination.get_blob_properties(timeout=timeout))
+
+    def _wait_copy_steps(self, running, tracker, timeout=None):
+        # One turn of the polling loop: wait for a step to complete, or for the next poll of the pending copies.
+        import concurrent.futures
+        wait = tracker.time_to_poll()
+        if running:
+            done, running = concurrent.futures.wait(
+                running, timeout=wait, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        elif wait:
+            time.sleep(wait)
+        for name, destination in tracker.due():
+            self._run_copy_step(tracker, name, self._poll_copy, tracker, name, destination, timeout)
+        return running
+
+    def copy_blobs_from_container(self, source_container, name_starts_with=None, **kwargs):
+        # type: (Union[ContainerClient, str], Optional[str], **Any) -> BulkCopyResult
+        """Copies the blobs of another container, or the blobs under a prefix, to this container.
+
+        Each blob keeps its name, and an existing destination blob is overwritten.
+        Block blobs of at least `min_staged_copy_size` are copied synchronously: their blocks
+        are staged in parallel from the URL of the source blob, then committed. The other blobs
+        are copied asynchronously by the service, and a single loop polls the properties of
+        every pending destination, rather than a CopyStatusPoller per blob.
+
+        Failed copies do not stop the other copies: the error of each one is reported in the
+        result, along with the number of bytes copied and the throughput of the bulk copy.
+
+        :param source_container:
+            The container to copy the blobs of. This can either be a ContainerClient, or the
+            URL of the container. If the source is in another account, it must either be public
+            or the URL (or the client) must include a shared access signature.
+        :type source_container: ~azure.storage.blob.container_client.ContainerClient or str
+        :param str name_starts_with:
+            Copies only the blobs whose names begin with the specified prefix.
+        :param int max_connections:
+            The number of requests to start copies and stage blocks in parallel.
+            The default value is 1.
+        :param int min_staged_copy_size:
+            The size from which block blobs are copied by staging their blocks. Defaults to
+            the min_staged_copy_size setting of the client, 256MB.
+        :param int block_size:
+            The size of the blocks staged, up to 100MB. Defaults to the max_copy_block_size
+            setting of the client, 32MB.
+        :param int polling_interval:
+            The seconds between two polls of the pending copies. Defaults to the
+            copy_polling_interval setting of the client.
+        :param int timeout:
+            The timeout parameter is expressed in seconds, for each request.
+        :returns: The blobs copied, the errors of the blobs not copied, and the statistics of the copy.
+        :rtype: ~azure.storage.blob.models.BulkCopyResult
+        """
+        if isinstance(source_container, six.string_types):
+            source_container = ContainerClient(source_container, _configuration=self._config)
+        timeout = kwargs.pop('timeout', None)
+        max_connections = kwargs.pop('max_connections', 1)
+        tracker = BulkCopyTracker(
+            kwargs.pop('min_staged_copy_size', self._config.blob_settings.min_staged_copy_size),
+            kwargs.pop('block_size', self._config.blob_settings.max_copy_block_size),
+            kwargs.pop('polling_interval', self._config.blob_settings.copy_polling_interval))
+        blobs = source_container.list_blobs(
+            name_starts_with=name_starts_with, include='metadata', timeout=timeout, **kwargs)
+
+        import concurrent.futures
+        running = set()  # type: Set[Any]
+        with concurrent.futures.ThreadPoolExecutor(max_connections) as executor:
+            for name, step, args in self._copy_steps(source_container, blobs, tracker, timeout):
+                while len(running) >= max_connections:
+                    running = self._wait_copy_steps(running, tracker, timeout)
+                running.add(executor.submit(self._run_copy_step, tracker, name, step, *args))
+            while running or tracker.pending:
+                running = self._wait_copy_steps(running, tracker, timeout)
+        return tracker.finish()
+
     def get_blob_client(
             self, blob,  # type: Union[str, BlobProperties]
             snapshot=None  # type: str
@@ -7,7 +7,7 @@
 # pylint: disable=super-init-not-called, too-many-lines
 
 from enum import Enum
-from typing import List, Any, TYPE_CHECKING # pylint: disable=unused-import
+from typing import List, Dict, Any, TYPE_CHECKING # pylint: disable=unused-import
 
 from azure.core.paging import PageIterator, ItemPaged
 
@@ -546,6 +546,41 @@ class BlobPropertiesPaged(PageIterator):
         return item
 
 
+class _StreamedBlobPropertiesPaged(BlobPropertiesPaged):
+    """An Iterable of Blob properties, decoded as the list responses are streamed.
+
+    The items of a page are deserialized one by one while the response is downloaded.
+    The page attributes (`prefix`, `marker`, `results_per_page`...) and the continuation
+    token follow the items in the payload, so they are only set once the page has been
+    consumed. `current_page` is an iterator instead of a list.
+
+    :param callable command: Function to retrieve the next page of items, returning the
+        location mode and the streamed `Blob` XML elements.
+    :param deserializer: The deserializer of the generated models.
+    """
+    def __init__(self, command, deserializer=None, **kwargs):
+        super(_StreamedBlobPropertiesPaged, self).__init__(command, **kwargs)
+        self._deserializer = deserializer
+
+    def _extract_data_cb(self, get_next_return):
+        self.location_mode, blobs = get_next_return
+        self.current_page = (self._build_item(self._deserializer('BlobItem', blob)) for blob in blobs)
+
+        def get_continuation_token():
+            for _ in blobs:  # The rest of the page, if it was not consumed, is in the way
+                pass
+            self._response = self._deserializer('ListBlobsFlatSegmentResponse', blobs.document)
+            self.service_endpoint = self._response.service_endpoint
+            self.prefix = self._response.prefix
+            self.marker = self._response.marker
+            self.results_per_page = self._response.max_results
+            self.container = self._response.container_name
+            self.delimiter = self._response.delimiter
+            return self._response.next_marker or None
+
+        return get_continuation_token, self.current_page
+
+
 class BlobPrefix(ItemPaged, DictMixin):
     """An Iterable of Blob properties.
 
@@ -793,6 +828,35 @@ class PageRange(DictMixin):
         self.end = end
 
 
+class BulkCopyResult(DictMixin):
+    """The outcome of a bulk copy of blobs between containers.
+
+    :ivar list(str) succeeded:
+        The names of the blobs copied.
+    :ivar dict(str, Exception) failed:
+        The error of each blob that could not be copied, by blob name.
+    :ivar int bytes_copied:
+        The total size of the blobs copied.
+    :ivar int staged_copies:
+        The number of blobs copied by staging their blocks from the source URL.
+    :ivar int server_copies:
+        The number of blobs copied by an asynchronous copy of the service.
+    :ivar float elapsed:
+        The seconds from the listing of the source blobs to the end of the last copy.
+    :ivar float throughput:
+        The bytes copied per second.
+    """
+
+    def __init__(self):
+        self.succeeded = []  # type: List[str]
+        self.failed = {}  # type: Dict[str, Exception]
+        self.bytes_copied = 0
+        self.staged_copies = 0
+        self.server_copies = 0
+        self.elapsed = 0.0
+        self.throughput = 0.0
+
+
 class AccessPolicy(GenAccessPolicy):
     """Access Policy class used by the set and get acl methods in each service.
 
@@ -7,7 +7,7 @@
 import logging
 import time
 from typing import Callable, Any # pylint: disable=unused-import
-from azure.core.polling import PollingMethod, LROPoller
+from azure.core.polling import PollingMethod, ScheduledPollingMethod, LROPoller
 
 from ._shared.utils import process_storage_error
 from ._generated.models import StorageErrorException
@@ -18,16 +18,22 @@ logger = logging.getLogger(__name__)
 
 
 class CopyStatusPoller(LROPoller):
-    """Poller for a long-running copy operation."""
+    """Poller for a long-running copy operation.
+
+    With a `polling_scheduler`, the copy status is polled by the scheduler's worker
+    threads instead of a thread per copy, and the done callbacks run on those threads.
+    """
 
     def __init__(self, client, copy_id, polling=True, configuration=None, **kwargs):
         if configuration:
             polling_interval = configuration.blob_settings.copy_polling_interval
         else:
             polling_interval = 2
+        polling_scheduler = kwargs.pop('polling_scheduler', None)
         polling_method = CopyBlobPolling if polling else CopyBlob
         poller = polling_method(polling_interval, **kwargs)
-        super(CopyStatusPoller, self).__init__(client, copy_id, None, poller)
+        super(CopyStatusPoller, self).__init__(
+            client, copy_id, None, poller, polling_scheduler=polling_scheduler)
 
     def copy_id(self):
         # type: () -> str
@@ -134,7 +140,7 @@ class CopyBlob(PollingMethod):
         return self.blob
 
 
-class CopyBlobPolling(CopyBlob):
+class CopyBlobPolling(CopyBlob, ScheduledPollingMethod):
 
     def run(self):
         # type: () -> None
@@ -142,14 +148,32 @@ class CopyBlobPolling(CopyBlob):
             while not self.finished():
                 self._update_status()
                 time.sleep(self.polling_interval)
-            if str(self.status()).lower() == 'aborted':
-                raise ValueError("Copy operation aborted.")
-            if str(self.status()).lower() == 'failed':
-                raise ValueError("Copy operation failed: {}".format(self.blob.copy.status_description))
+            self._check_status()
+        except Exception as e:
+            logger.warning(str(e))
+            raise
+
+    def _check_status(self):
+        # type: () -> None
+        if str(self.status()).lower() == 'aborted':
+            raise ValueError("Copy operation aborted.")
+        if str(self.status()).lower() == 'failed':
+            raise ValueError("Copy operation failed: {}".format(self.blob.copy.status_description))
+
+    def update_status(self):
+        # type: () -> None
+        """Get the copy status once, raising if the copy was aborted or failed."""
+        try:
+            self._update_status()
+            self._check_status()
         except Exception as e:
             logger.warning(str(e))
             raise
 
+    def get_delay(self):
+        # type: () -> float
+        return self.polling_interval
+
     def status(self):
         # type: () -> str
         """Return the current status as a string.
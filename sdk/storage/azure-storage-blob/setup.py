@@ -98,6 +98,7 @@ setup(
     extras_require={
         ":python_version<'3.0'": ['futures', 'azure-storage-nspkg<4.0.0,>=3.0.0'],
         ":python_version<'3.4'": ['enum34>=1.0.4'],
-        ":python_version<'3.5'": ["typing"]
+        ":python_version<'3.5'": ["typing"],
+        "crc64": ["crcmod>=1.7"]
     },
 )
@@ -0,0 +1,660 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import base64
+import hashlib
+import os
+import re
+import tempfile
+import threading
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock  # type: ignore
+
+try:
+    from urllib.parse import urlparse, parse_qs, unquote
+except ImportError:
+    from urlparse import urlparse, parse_qs  # type: ignore
+    from urllib2 import unquote  # type: ignore
+
+from azure.core.exceptions import AzureError
+from azure.core.pipeline import PipelineContext, PipelineRequest, PipelineResponse
+from azure.core.pipeline.transport import AsyncHttpTransport, AsyncHttpResponse, HttpRequest
+from azure.storage.blob import PartialBatchErrorException
+from azure.storage.blob._shared.crc64 import Crc64
+from azure.storage.blob._shared.download_chunking import RangeFileWriter
+from azure.storage.blob._shared.policies_async import AsyncStorageContentValidation
+from azure.storage.blob.aio import BlobServiceClient, BlobClient, StorageStreamDownloader
+
+# ------------------------------------------------------------------------------
+
+ACCOUNT_URL = 'https://storagename.blob.core.windows.net'
+CREDENTIAL = {'account_name': 'storagename', 'account_key': base64.b64encode(b'key').decode()}
+ETAG = '"0x8D6A5A0E1D2B3C4"'
+LAST_MODIFIED = 'Mon, 01 Jul 2019 00:00:00 GMT'
+
+
+class _FakeStream(object):
+
+    def __init__(self, response, body):
+        self.response = response
+        self._chunks = [body[i:i + 1024] for i in range(0, len(body), 1024)]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration()
+        return self._chunks.pop(0)
+
+
+class _FakeResponse(AsyncHttpResponse):
+
+    def __init__(self, request, status_code, headers=None, body=b''):
+        super(_FakeResponse, self).__init__(request, None)
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.headers.setdefault('ETag', ETAG)
+        self.headers.setdefault('Last-Modified', LAST_MODIFIED)
+        self.headers.setdefault('x-ms-request-id', 'id')
+        self.content_type = self.headers.get('Content-Type')
+        self._body = body
+
+    def body(self):
+        return self._body
+
+    async def load_body(self):
+        pass
+
+    def stream_download(self, pipeline):
+        return _FakeStream(self, self._body)
+
+
+def _metadata_headers(request):
+    return {k: v for k, v in request.headers.items() if k.lower().startswith('x-ms-meta-')}
+
+
+class FakeBlockBlobTransport(AsyncHttpTransport):
+    """An in-memory block blob service counting the requests in flight."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.metadata = {}
+        self.blocks = {}
+        self.tiers = {}
+        self.copies = {}
+        self.copy_polls = 0
+        self.failing_copies = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def sleep(self, duration):
+        pass
+
+    async def send(self, request, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            self.requests.append(request)
+            return self._handle(request)
+        finally:
+            self.in_flight -= 1
+
+    def _handle(self, request):
+        parsed = urlparse(request.url)
+        path = unquote(parsed.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        comp = query.get('comp')
+        if request.method == 'POST' and comp == 'batch':
+            return self._handle_batch(request)
+        if request.method == 'DELETE' or (request.method == 'PUT' and comp == 'tier'):
+            if path not in self.blobs:
+                error = b'<?xml version="1.0" encoding="utf-8"?><Error><Code>BlobNotFound</Code></Error>'
+                return _FakeResponse(request, 404, {
+                    'x-ms-error-code': 'BlobNotFound', 'Content-Type': 'application/xml'}, error)
+            if request.method == 'DELETE':
+                del self.blobs[path]
+                return _FakeResponse(request, 202)
+            self.tiers[path] = request.headers['x-ms-access-tier']
+            return _FakeResponse(request, 200)
+        if request.method == 'GET' and comp == 'list':
+            return self._handle_list(request, path, query.get('prefix', ''))
+        source = request.headers.get('x-ms-copy-source')
+        if source:
+            source = self.blobs[unquote(urlparse(source).path)]
+        if request.method == 'PUT' and comp == 'block':
+            data = bytes(request.data or b'')
+            if source is not None:
+                start, end = [int(x) for x in request.headers['x-ms-source-range'][len('bytes='):].split('-')]
+                data = source[start:end + 1]
+            self.blocks.setdefault(path, {})[query['blockid']] = data
+            return _FakeResponse(request, 201)
+        if request.method == 'PUT' and comp == 'blocklist':
+            ids = re.findall(r'<Latest>([^<]*)</Latest>', request.data.decode('utf-8'))
+            staged = self.blocks.pop(path, {})
+            self.blobs[path] = b''.join(staged[i] for i in ids)
+            self.metadata[path] = _metadata_headers(request)
+            return _FakeResponse(request, 201)
+        if request.method == 'PUT' and source is not None:
+            # The copy ends after as many polls of its status as copy_polls.
+            self.blobs[path] = source
+            self.copies[path] = self.copy_polls
+            status = 'pending' if self.copy_polls else 'success'
+            return _FakeResponse(request, 202, {'x-ms-copy-id': 'copy', 'x-ms-copy-status': status})
+        if request.method == 'PUT':
+            self.blobs[path] = bytes(request.data or b'')
+            self.metadata[path] = _metadata_headers(request)
+            return _FakeResponse(request, 201)
+        if request.method in ('GET', 'HEAD'):
+            content = self.blobs[path]
+            headers = {'x-ms-blob-type': 'BlockBlob'}
+            headers.update(self.metadata.get(path, {}))
+            if path in self.copies:
+                self.copies[path] -= 1
+                headers['x-ms-copy-id'] = 'copy'
+                headers['x-ms-copy-status'] = 'pending' if self.copies[path] > 0 else 'success'
+                if path in self.failing_copies:
+                    headers['x-ms-copy-status'] = 'failed'
+                    headers['x-ms-copy-status-description'] = '500 InternalError'
+            range_header = request.headers.get('x-ms-range')
+            if range_header is None:
+                headers['Content-Length'] = str(len(content))
+                return _FakeResponse(request, 200, headers, content if request.method == 'GET' else b'')
+            start, end = [int(x) for x in range_header[len('bytes='):].split('-')]
+            end = min(end, len(content) - 1)
+            body = content[start:end + 1]
+            headers['Content-Length'] = str(len(body))
+            headers['Content-Range'] = 'bytes {}-{}/{}'.format(start, end, len(content))
+            if request.headers.get('x-ms-range-get-content-md5') == 'true':
+                headers['Content-MD5'] = base64.b64encode(hashlib.md5(body).digest()).decode()
+            if request.headers.get('x-ms-range-get-content-crc64') == 'true':
+                headers['x-ms-content-crc64'] = base64.b64encode(Crc64(body).digest()).decode()
+            return _FakeResponse(request, 206, headers, body)
+        raise AssertionError("Unexpected request {} {}".format(request.method, request.url))
+
+    def _handle_list(self, request, path, prefix):
+        container = path.strip('/') + '/'
+        blobs = ''.join(
+            '<Blob><Name>{}</Name><Properties><Last-Modified>{}</Last-Modified><Etag>{}</Etag>'
+            '<Content-Length>{}</Content-Length><Content-Type>text/plain</Content-Type>'
+            '<BlobType>BlockBlob</BlobType></Properties><Metadata><origin>{}</origin></Metadata></Blob>'.format(
+                name[len(container) + 1:], LAST_MODIFIED, ETAG, len(content), container.strip('/'))
+            for name, content in sorted(self.blobs.items())
+            if name.startswith('/' + container + prefix))
+        body = ('<?xml version="1.0" encoding="utf-8"?><EnumerationResults ServiceEndpoint="{}/" '
+                'ContainerName="{}"><Blobs>{}</Blobs><NextMarker /></EnumerationResults>').format(
+                    ACCOUNT_URL, container.strip('/'), blobs)
+        return _FakeResponse(request, 200, {'Content-Type': 'application/xml'}, body.encode('utf-8'))
+
+    def _handle_batch(self, request):
+        assert request.headers['x-ms-version'] == '2018-11-09'
+        boundary = request.headers['Content-Type'].split('boundary=')[1]
+        parts = []
+        for part in request.data.split(('--' + boundary).encode('utf-8'))[1:-1]:
+            mime, message = part.strip(b'\r\n').split(b'\r\n\r\n', 1)
+            content_id = re.search(br'Content-ID: (\d+)', mime).group(1).decode('utf-8')
+            lines = message.decode('utf-8').split('\r\n')
+            method, target, _ = lines[0].split(' ')
+            headers = dict(line.split(': ', 1) for line in lines[1:] if line)
+            assert headers['Authorization'].startswith('SharedKey storagename:')
+            assert headers['x-ms-date'] and headers['Content-Length'] == '0'
+            response = self._handle(HttpRequest(method, ACCOUNT_URL + target, headers=headers))
+            parts.append('--batchresponse_1\r\nContent-Type: application/http\r\nContent-ID: {}\r\n\r\n'
+                         'HTTP/1.1 {} Status\r\n{}\r\n'.format(
+                             content_id, response.status_code,
+                             ''.join('{}: {}\r\n'.format(k, v) for k, v in response.headers.items())).encode('utf-8')
+                         + response.body() + b'\r\n')
+        # The sub-responses are not necessarily in the order of the sub-requests.
+        body = b''.join(reversed(parts)) + b'--batchresponse_1--\r\n'
+        return _FakeResponse(request, 202, {'Content-Type': 'multipart/mixed; boundary=batchresponse_1'}, body)
+
+
+def _blob_client(transport, **kwargs):
+    service = BlobServiceClient(
+        ACCOUNT_URL,
+        credential=CREDENTIAL,
+        transport=transport,
+        max_single_put_size=4 * 1024,
+        max_block_size=4 * 1024,
+        max_single_get_size=4 * 1024,
+        max_chunk_get_size=4 * 1024,
+        **kwargs)
+    return service.get_blob_client('container', 'blob')
+
+
+@pytest.mark.asyncio
+async def test_get_blob_client_is_async():
+    blob = _blob_client(FakeBlockBlobTransport())
+    assert isinstance(blob, BlobClient)
+    with pytest.raises(TypeError):
+        with blob:
+            pass
+
+
+@pytest.mark.asyncio
+async def test_upload_blob_bounds_concurrency():
+    transport = FakeBlockBlobTransport()
+    blob = _blob_client(transport)
+    data = os.urandom(40 * 1024)
+
+    await blob.upload_blob(data, max_connections=3)
+
+    assert transport.blobs['/container/blob'] == data
+    staged = [r for r in transport.requests if 'comp=block&' in r.url or r.url.endswith('comp=block')]
+    assert len(staged) == 10
+    assert transport.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_upload_blob_sequential_with_one_connection():
+    transport = FakeBlockBlobTransport()
+    blob = _blob_client(transport)
+    data = os.urandom(10 * 1024)
+
+    await blob.upload_blob(data, max_connections=1)
+
+    assert transport.blobs['/container/blob'] == data
+    assert transport.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_blob_from_path():
+    transport = FakeBlockBlobTransport()
+    blob = _blob_client(transport)
+    data = os.urandom(18 * 1024)
+    temp = tempfile.NamedTemporaryFile(delete=False)
+    try:
+        temp.write(data)
+        temp.close()
+        await blob.upload_blob_from_path(temp.name, max_connections=3, validate_content=True)
+    finally:
+        os.remove(temp.name)
+
+    assert transport.blobs['/container/blob'] == data
+    staged = [r for r in transport.requests if 'comp=block&' in r.url or r.url.endswith('comp=block')]
+    assert len(staged) == 5
+    assert all(isinstance(r.data, memoryview) for r in staged)
+    assert all(r.headers['Content-MD5'] for r in staged)
+
+
+@pytest.mark.asyncio
+async def test_upload_blob_reports_progress():
+    transport = FakeBlockBlobTransport()
+    blob = _blob_client(transport)
+    data = os.urandom(16 * 1024)
+    progress = []
+
+    def callback(response):
+        current = response.context['upload_stream_current']
+        total = response.context['data_stream_total']
+        if current is not None:
+            progress.append((current, total))
+
+    await blob.upload_blob(data, max_connections=2, raw_response_hook=callback)
+
+    # Parallel chunks report the progress made when each of them was sent.
+    assert len(progress) == 4
+    assert all(current % (4 * 1024) == 0 and current < len(data) for current, _ in progress)
+    assert all(total == len(data) for _, total in progress)
+
+
+@pytest.mark.asyncio
+async def test_download_blob_to_stream_in_parallel():
+    transport = FakeBlockBlobTransport()
+    data = os.urandom(33 * 1024)
+    transport.blobs['/container/blob'] = data
+    blob = _blob_client(transport)
+
+    downloader = await blob.download_blob()
+    assert isinstance(downloader, StorageStreamDownloader)
+    assert downloader.properties.size == len(data)
+
+    class Stream(object):
+        def __init__(self):
+            self.buffer = bytearray(len(data))
+            self.position = 0
+
+        def seekable(self):
+            return True
+
+        def tell(self):
+            return self.position
+
+        def seek(self, position):
+            self.position = position
+
+        def write(self, chunk):
+            self.buffer[self.position:self.position + len(chunk)] = chunk
+            self.position += len(chunk)
+
+    stream = Stream()
+    await downloader.download_to_stream(stream, max_connections=4)
+
+    assert bytes(stream.buffer) == data
+    assert transport.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_download_blob_iterates_chunks_with_md5():
+    transport = FakeBlockBlobTransport()
+    data = os.urandom(9 * 1024)
+    transport.blobs['/container/blob'] = data
+    blob = _blob_client(transport)
+
+    downloader = await blob.download_blob(validate_content=True)
+    chunks = []
+    async for chunk in downloader:
+        chunks.append(chunk)
+
+    assert b''.join(chunks) == data
+    assert all(r.headers.get('x-ms-range-get-content-md5') == 'true'
+               for r in transport.requests if r.method == 'GET')
+
+
+@pytest.mark.asyncio
+async def test_download_blob_md5_mismatch_raises():
+    transport = FakeBlockBlobTransport()
+    transport.blobs['/container/blob'] = os.urandom(2 * 1024)
+    original = transport._handle
+
+    def corrupt(request):
+        response = original(request)
+        response._body = b'x' * len(response._body)
+        return response
+    transport._handle = corrupt
+    blob = _blob_client(transport)
+
+    with pytest.raises(Exception) as error:
+        downloader = await blob.download_blob(validate_content=True)
+        await downloader.content_as_bytes()
+    assert 'MD5 mismatch' in str(error.value)
+
+
+def test_content_validation_skips_only_streamed_bodies():
+    policy = AsyncStorageContentValidation()
+
+    def run(stream):
+        request = PipelineRequest(HttpRequest('GET', ACCOUNT_URL), PipelineContext(None, stream=stream))
+        policy.on_request(request)
+        request.context['validate_content'] = True
+        response = _FakeResponse(request.http_request, 200, {'Content-MD5': 'bad'}, body=b'data')
+        policy.on_response(request, PipelineResponse(request.http_request, response, request.context))
+
+    # The downloader validates streamed bodies once they are read
+    run(stream=True)
+    with pytest.raises(AzureError) as error:
+        run(stream=False)
+    assert 'MD5 mismatch' in str(error.value)
+
+
+@pytest.mark.asyncio
+async def test_download_blob_to_path_resumes_from_checkpoint():
+    transport = FakeBlockBlobTransport()
+    data = os.urandom(30 * 1024)
+    transport.blobs['/container/blob'] = data
+    original = transport._handle
+
+    def fail_chunk(request):
+        if request.headers.get('x-ms-range', '').startswith('bytes=20480-'):
+            raise IOError("Connection lost")
+        return original(request)
+    transport._handle = fail_chunk
+    blob = _blob_client(transport, retry_total=0)
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'blob')
+    try:
+        downloader = await blob.download_blob()
+        with pytest.raises(IOError):
+            await downloader.download_to_path(path, max_connections=2)
+        assert os.path.getsize(path) == len(data)
+        assert os.path.exists(path + '.checkpoint')
+
+        transport._handle = original
+        transport.requests = []
+        downloader = await blob.download_blob()
+        await downloader.download_to_path(path, max_connections=2)
+
+        with open(path, 'rb') as result:
+            assert result.read() == data
+        assert not os.path.exists(path + '.checkpoint')
+        # Only the first range and the chunks missing from the checkpoint are downloaded again.
+        ranges = [r.headers['x-ms-range'] for r in transport.requests]
+        assert 'bytes=20480-24575' in ranges
+        assert len(ranges) < 1 + (len(data) - 4 * 1024) // (4 * 1024)
+    finally:
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
+
+
+@pytest.mark.asyncio
+async def test_download_blob_to_path_writes_off_the_event_loop():
+    transport = FakeBlockBlobTransport()
+    data = os.urandom(20 * 1024)
+    transport.blobs['/container/blob'] = data
+    blob = _blob_client(transport)
+    loop_thread = threading.current_thread()
+    write_threads = []
+    write_at = RangeFileWriter.write_at
+
+    def record_write(writer, offset, chunk):
+        write_threads.append(threading.current_thread())
+        write_at(writer, offset, chunk)
+
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'blob')
+    try:
+        downloader = await blob.download_blob()
+        with mock.patch.object(RangeFileWriter, 'write_at', record_write):
+            await downloader.download_to_path(path, max_connections=2)
+
+        with open(path, 'rb') as result:
+            assert result.read() == data
+        assert write_threads and loop_thread not in write_threads
+    finally:
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
+
+
+@pytest.mark.asyncio
+async def test_upload_blob_adaptive_transfer_reports_tuning():
+    transport = FakeBlockBlobTransport()
+    blob = _blob_client(transport, adaptive_transfer=True, max_adaptive_block_size=16 * 1024)
+    data = os.urandom(256 * 1024)
+    tuning = []
+
+    def callback(response):
+        if response.context['transfer_tuning'] is not None:
+            tuning.append(response.context['transfer_tuning'])
+
+    await blob.upload_blob(data, max_connections=4, raw_response_hook=callback)
+
+    assert transport.blobs['/container/blob'] == data
+    assert transport.max_in_flight <= 4
+    staged = [r for r in transport.requests if 'comp=block&' in r.url or r.url.endswith('comp=block')]
+    assert len(tuning) == len(staged)
+    assert all(1 <= t['concurrency'] <= 4 for t in tuning)
+    assert all(t['block_size'] in (4 * 1024, 8 * 1024, 16 * 1024) for t in tuning)
+    assert any(t['throughput'] for t in tuning)
+
+
+@pytest.mark.asyncio
+async def test_download_blob_adaptive_transfer():
+    transport = FakeBlockBlobTransport()
+    data = os.urandom(200 * 1024 + 5)
+    transport.blobs['/container/blob'] = data
+    blob = _blob_client(transport, adaptive_transfer=True, max_adaptive_block_size=32 * 1024)
+    tuning = []
+
+    def callback(response):
+        if response.context['transfer_tuning'] is not None:
+            tuning.append(response.context['transfer_tuning'])
+
+    downloader = await blob.download_blob(raw_response_hook=callback)
+    content = await downloader.content_as_bytes(max_connections=3)
+
+    assert content == data
+    assert transport.max_in_flight <= 3
+    assert tuning and all(t['concurrency'] <= 3 for t in tuning)
+
+
+@pytest.mark.asyncio
+async def test_delete_blobs_in_concurrent_batches():
+    transport = FakeBlockBlobTransport()
+    names = ['blob{}'.format(i) for i in range(600)]
+    for name in names:
+        transport.blobs['/container/' + name] = b'data'
+    container = BlobServiceClient(ACCOUNT_URL, credential=CREDENTIAL, transport=transport).get_container_client(
+        'container')
+
+    parts = await container.delete_blobs(*(names + ['missing']), max_connections=2, raise_on_any_failure=False)
+
+    assert not transport.blobs
+    batches = [r for r in transport.requests if r.method == 'POST']
+    assert len(batches) == 3
+    assert transport.max_in_flight == 2
+    assert [p.status_code for p in parts] == [202] * 600 + [404]
+    assert parts[-1].headers['x-ms-error-code'] == 'BlobNotFound'
+    assert parts[-1].request.url.endswith('/container/missing')
+
+
+@pytest.mark.asyncio
+async def test_batch_partial_failure_raises():
+    transport = FakeBlockBlobTransport()
+    transport.blobs['/container/hot'] = b'data'
+    container = BlobServiceClient(ACCOUNT_URL, credential=CREDENTIAL, transport=transport).get_container_client(
+        'container')
+
+    with pytest.raises(PartialBatchErrorException) as error:
+        await container.set_standard_blob_tier_blobs('Cool', 'hot', 'missing')
+
+    assert transport.tiers == {'/container/hot': 'Cool'}
+    assert [p.status_code for p in error.value.parts] == [200, 404]
+
+
+@pytest.mark.asyncio
+async def test_copy_blobs_from_container():
+    transport = FakeBlockBlobTransport()
+    transport.copy_polls = 2
+    transport.failing_copies.add('/container/data/broken')
+    large = os.urandom(10 * 1024 + 5)
+    transport.blobs.update({
+        '/source/data/large': large,
+        '/source/data/small': b'small',
+        '/source/data/broken': b'broken',
+        '/source/other': b'other'})
+    service = BlobServiceClient(
+        ACCOUNT_URL, credential=CREDENTIAL, transport=transport,
+        min_staged_copy_size=8 * 1024, max_copy_block_size=4 * 1024)
+    source = service.get_container_client('source')
+
+    result = await service.get_container_client('container').copy_blobs_from_container(
+        source, name_starts_with='data/', max_connections=2, polling_interval=0)
+
+    assert sorted(result.succeeded) == ['data/large', 'data/small']
+    assert list(result.failed) == ['data/broken']
+    assert 'failed' in str(result.failed['data/broken'])
+    assert (result.staged_copies, result.server_copies) == (1, 1)
+    assert result.bytes_copied == len(large) + len(b'small')
+    assert transport.blobs['/container/data/large'] == large
+    assert transport.blobs['/container/data/small'] == b'small'
+    assert '/container/other' not in transport.blobs
+    staged = [r for r in transport.requests if r.headers.get('x-ms-source-range')]
+    assert sorted(r.headers['x-ms-source-range'] for r in staged) == [
+        'bytes=0-4095', 'bytes=4096-8191', 'bytes=8192-10244']
+    commit = [r for r in transport.requests if r.url.endswith('comp=blocklist')]
+    assert commit[0].headers['x-ms-meta-origin'] == 'source'
+    polls = [r for r in transport.requests if r.method == 'HEAD']
+    assert len(polls) == 3
+    assert transport.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_download_blob_validates_crc64():
+    transport = FakeBlockBlobTransport()
+    data = os.urandom(9 * 1024)
+    transport.blobs['/container/blob'] = data
+    blob = _blob_client(transport)
+
+    downloader = await blob.download_blob(validate_content='crc64')
+    chunks = []
+    async for chunk in downloader:
+        chunks.append(chunk)
+
+    assert b''.join(chunks) == data
+    gets = [r for r in transport.requests if r.method == 'GET']
+    assert all(r.headers.get('x-ms-range-get-content-crc64') == 'true' for r in gets)
+    assert all('x-ms-range-get-content-md5' not in r.headers for r in gets)
+
+
+@pytest.mark.asyncio
+async def test_download_blob_crc64_mismatch_raises():
+    transport = FakeBlockBlobTransport()
+    transport.blobs['/container/blob'] = os.urandom(2 * 1024)
+    original = transport._handle
+
+    def corrupt(request):
+        response = original(request)
+        response._body = b'x' * len(response._body)
+        return response
+    transport._handle = corrupt
+    blob = _blob_client(transport)
+
+    with pytest.raises(Exception) as error:
+        downloader = await blob.download_blob(validate_content='crc64')
+        await downloader.content_as_bytes()
+    assert 'CRC64 mismatch' in str(error.value)
+
+
+@pytest.mark.asyncio
+async def test_encrypted_blob_chunks_share_decryption_key():
+    from test_blob_encryption import _CountingKeyWrapper
+    transport = FakeBlockBlobTransport()
+    kek = _CountingKeyWrapper('key1')
+    blob = _blob_client(transport, key_encryption_key=kek, require_encryption=True)
+    data = os.urandom(17 * 1024 + 5)
+
+    await blob.upload_blob(data, max_connections=3)
+    assert len(transport.blobs['/container/blob']) == len(data) + 11
+    assert 'x-ms-meta-encryptiondata' in transport.metadata['/container/blob']
+
+    downloader = await blob.download_blob()
+    assert await downloader.content_as_bytes(max_connections=3) == data
+    assert kek.unwraps == 1
+
+    chunks = []
+    async for chunk in await blob.download_blob():
+        chunks.append(chunk)
+    assert b''.join(chunks) == data
+    assert kek.unwraps == 2
+
+    # The chunks of a range continue where the content of its first download ends.
+    downloader = await blob.download_blob(offset=100, length=9000)
+    assert await downloader.content_as_bytes(max_connections=2) == data[100:9001]
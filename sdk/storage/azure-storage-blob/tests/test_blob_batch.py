@@ -0,0 +1,122 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import base64
+
+from azure.core.pipeline.transport import HttpRequest, HttpResponse
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import ContainerClient, PartialBatchErrorException
+from azure.storage.blob._blob_batch import build_batch_request, parse_batch_response, raise_on_failures
+
+from testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+
+ACCOUNT_URL = 'https://storagename.blob.core.windows.net'
+CREDENTIAL = {'account_name': 'storagename', 'account_key': base64.b64encode(b'key').decode()}
+
+BATCH_RESPONSE = (
+    b'--batchresponse_66925647-d0cb-4109-b6d3-28efe3e1e5ed\r\n'
+    b'Content-Type: application/http\r\n'
+    b'Content-ID: 1\r\n'
+    b'\r\n'
+    b'HTTP/1.1 404 The specified blob does not exist.\r\n'
+    b'x-ms-error-code: BlobNotFound\r\n'
+    b'x-ms-request-id: 778fdc83-801e-0000-62ff-0334671e2852\r\n'
+    b'x-ms-version: 2018-11-09\r\n'
+    b'Content-Length: 71\r\n'
+    b'Content-Type: application/xml\r\n'
+    b'\r\n'
+    b'<?xml version="1.0" encoding="utf-8"?>\n<Error><Code>BlobNotFound</Code></Error>\r\n'
+    b'--batchresponse_66925647-d0cb-4109-b6d3-28efe3e1e5ed\r\n'
+    b'Content-Type: application/http\r\n'
+    b'Content-ID: 0\r\n'
+    b'\r\n'
+    b'HTTP/1.1 202 Accepted\r\n'
+    b'x-ms-delete-type-permanent: true\r\n'
+    b'x-ms-request-id: 778fdc83-801e-0000-62ff-0334671e284f\r\n'
+    b'x-ms-version: 2018-11-09\r\n'
+    b'\r\n'
+    b'--batchresponse_66925647-d0cb-4109-b6d3-28efe3e1e5ed--')
+
+
+class _Response(HttpResponse):
+
+    def __init__(self, status_code, headers, body):
+        super(_Response, self).__init__(None, None)
+        self.status_code = status_code
+        self.reason = 'Reason'
+        self.headers = headers
+        self.content_type = headers.get('Content-Type')
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class StorageBlobBatchTest(StorageTestCase):
+
+    def test_batch_request_signs_each_sub_request(self):
+        container = ContainerClient(ACCOUNT_URL, 'container', credential=CREDENTIAL)
+        sub_requests = container._batch_delete_requests(['blob0', 'dir/blob 1'], delete_snapshots='include')
+
+        request = build_batch_request(container._batch_url(timeout=30), sub_requests, container.credential)
+
+        self.assertEqual(request.method, 'POST')
+        self.assertIn('comp=batch', request.url)
+        self.assertIn('timeout=30', request.url)
+        self.assertEqual(request.headers['x-ms-version'], '2018-11-09')
+        boundary = request.headers['Content-Type'].split('boundary=')[1]
+        body = request.data.decode('utf-8')
+        self.assertTrue(body.startswith('--' + boundary + '\r\n'))
+        self.assertTrue(body.endswith('--' + boundary + '--\r\n'))
+        self.assertIn('Content-ID: 0\r\n\r\nDELETE /container/blob0 HTTP/1.1\r\n', body)
+        self.assertIn('Content-ID: 1\r\n\r\nDELETE /container/dir%2Fblob%201 HTTP/1.1\r\n', body)
+        self.assertEqual(body.count('Authorization: SharedKey storagename:'), 2)
+        self.assertEqual(body.count('x-ms-delete-snapshots: include'), 2)
+        self.assertEqual(body.count('Content-Length: 0'), 2)
+
+    def test_batch_request_keeps_sas_and_tier(self):
+        container = ContainerClient(ACCOUNT_URL + '/container?sv=2018-03-28&sig=abc')
+        sub_requests = container._batch_tier_requests('Archive', ['blob0'])
+
+        request = build_batch_request(container._batch_url(), sub_requests, container.credential)
+
+        self.assertIn('sig=abc', request.url)
+        body = request.data.decode('utf-8')
+        self.assertIn('PUT /container/blob0?', body)
+        self.assertIn('comp=tier', body)
+        self.assertIn('sig=abc', body)
+        self.assertIn('x-ms-access-tier: Archive', body)
+        self.assertNotIn('Authorization', body)
+
+    def test_parse_batch_response_by_content_id(self):
+        sub_requests = [HttpRequest('DELETE', ACCOUNT_URL + '/container/blob{}'.format(i)) for i in range(2)]
+        response = _Response(202, {
+            'Content-Type': 'multipart/mixed; boundary=batchresponse_66925647-d0cb-4109-b6d3-28efe3e1e5ed'},
+            BATCH_RESPONSE)
+
+        parts = parse_batch_response(response, sub_requests)
+
+        self.assertEqual([p.status_code for p in parts], [202, 404])
+        self.assertIs(parts[1].request, sub_requests[1])
+        self.assertEqual(parts[0].headers['x-ms-delete-type-permanent'], 'true')
+        self.assertEqual(parts[1].reason, 'The specified blob does not exist.')
+        self.assertTrue(parts[1].body().endswith(b'</Error>'))
+        with self.assertRaises(PartialBatchErrorException) as error:
+            raise_on_failures(parts)
+        self.assertIs(error.exception.parts, parts)
+        self.assertIs(error.exception.response, response)
+
+    def test_parse_batch_response_failed_batch(self):
+        response = _Response(404, {'x-ms-error-code': 'ContainerNotFound'}, b'')
+
+        with self.assertRaises(ResourceNotFoundError):
+            parse_batch_response(response, [HttpRequest('DELETE', ACCOUNT_URL + '/container/blob')])
@@ -0,0 +1,189 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+import threading
+
+from azure.core.pipeline.transport import HttpTransport, HttpResponse
+from azure.core.polling import PollingScheduler
+from azure.storage.blob import BlobServiceClient, BlobProperties, BlobType
+from azure.storage.blob._blob_copy import BulkCopyTracker
+
+from testcase import (
+    StorageTestCase,
+)
+from test_blob_async import FakeBlockBlobTransport, ACCOUNT_URL, CREDENTIAL
+
+# ------------------------------------------------------------------------------
+
+
+class _SyncResponse(HttpResponse):
+
+    def __init__(self, response):
+        super(_SyncResponse, self).__init__(response.request, None)
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content_type = response.content_type
+        self._body = response.body()
+
+    def body(self):
+        return self._body
+
+    def stream_download(self, pipeline):
+        return iter([self._body])
+
+
+class _SyncTransport(HttpTransport):
+    """Serves the requests of sync clients from the in-memory service of the async tests."""
+
+    def __init__(self):
+        self.service = FakeBlockBlobTransport()
+        self.lock = threading.Lock()
+        self.threads = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def sleep(self, duration):
+        pass
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.service.requests.append(request)
+            self.threads.add(threading.current_thread().name)
+            return _SyncResponse(self.service._handle(request))
+
+
+def _blob(name, size, blob_type=BlobType.BlockBlob):
+    blob = BlobProperties(name=name)
+    blob.size = size
+    blob.blob_type = blob_type
+    return blob
+
+
+class StorageBlobBulkCopyTest(StorageTestCase):
+
+    def test_tracker_plans_staged_copies(self):
+        tracker = BulkCopyTracker(1000, 400, 0)
+
+        self.assertIsNone(tracker.plan(_blob('small', 999)))
+        self.assertIsNone(tracker.plan(_blob('page', 4096, BlobType.PageBlob)))
+        blocks = tracker.plan(_blob('large', 1000))
+        self.assertEqual([(offset, length) for _, offset, length in blocks], [(0, 400), (400, 400), (800, 200)])
+        self.assertEqual(len(set(len(block_id) for block_id, _, _ in blocks)), 1)
+
+        self.assertFalse(tracker.block_staged('large'))
+        self.assertFalse(tracker.block_staged('large'))
+        self.assertTrue(tracker.block_staged('large'))
+
+    def test_tracker_stops_staging_failed_copy(self):
+        tracker = BulkCopyTracker(1, 1, 0)
+        tracker.plan(_blob('large', 2))
+        tracker.failed('large', ValueError('first'))
+        tracker.failed('large', ValueError('second'))
+
+        self.assertFalse(tracker.block_staged('large'))
+        self.assertFalse(tracker.block_staged('large'))
+        self.assertEqual(str(tracker.finish().failed['large']), 'first')
+
+    def test_tracker_polls_pending_copies(self):
+        clock = [0.0]
+        tracker = BulkCopyTracker(1000, 400, 10)
+        tracker._clock = lambda: clock[0]
+        tracker._start = 0.0
+
+        tracker.started('done', None, 5, 'success')
+        tracker.started('pending', 'client', 7, 'pending')
+        self.assertTrue(tracker.pending)
+        self.assertEqual(tracker.time_to_poll(), 10)
+        self.assertEqual(tracker.due(), [])
+
+        clock[0] = 10
+        self.assertEqual(tracker.due(), [('pending', 'client')])
+        self.assertEqual(tracker.time_to_poll(), 10)
+        tracker.polled('pending', _blob('pending', 7))
+        clock[0] = 20
+        properties = _blob('pending', 7)
+        properties.copy.status = 'success'
+        tracker.polled('pending', properties)
+
+        self.assertFalse(tracker.pending)
+        self.assertIsNone(tracker.time_to_poll())
+        result = tracker.finish()
+        self.assertEqual((result.server_copies, result.bytes_copied), (2, 12))
+        self.assertEqual(result.elapsed, 20)
+        self.assertAlmostEqual(result.throughput, 0.6)
+
+    def test_copy_blobs_from_container(self):
+        transport = _SyncTransport()
+        transport.service.copy_polls = 1
+        large = os.urandom(9 * 1024)
+        transport.service.blobs.update({
+            '/source/large': large,
+            '/source/small': b'small'})
+        service = BlobServiceClient(
+            ACCOUNT_URL, credential=CREDENTIAL, transport=transport,
+            min_staged_copy_size=8 * 1024, max_copy_block_size=4 * 1024)
+
+        result = service.get_container_client('container').copy_blobs_from_container(
+            service.get_container_client('source'), max_connections=3, polling_interval=0)
+
+        self.assertEqual(sorted(result.succeeded), ['large', 'small'])
+        self.assertEqual(result.failed, {})
+        self.assertEqual((result.staged_copies, result.server_copies), (1, 1))
+        self.assertEqual(transport.service.blobs['/container/large'], large)
+        self.assertEqual(transport.service.blobs['/container/small'], b'small')
+        polls = [r for r in transport.service.requests if r.method == 'HEAD']
+        self.assertEqual(len(polls), 1)
+
+    def test_copy_pollers_share_scheduler(self):
+        transport = _SyncTransport()
+        transport.service.copy_polls = 3
+        transport.service.blobs['/source/blob'] = b'content'
+        service = BlobServiceClient(ACCOUNT_URL, credential=CREDENTIAL, transport=transport)
+        source_url = service.get_blob_client('source', 'blob').url
+        scheduler = PollingScheduler(max_workers=2)
+
+        threads_before = threading.active_count()
+        pollers = []
+        for i in range(20):
+            blob = service.get_blob_client('container', 'copy{}'.format(i))
+            blob._config.blob_settings.copy_polling_interval = 0.05
+            pollers.append(blob.copy_blob_from_url(source_url, polling_scheduler=scheduler))
+        # One timer thread and at most two workers, whatever the number of copies
+        self.assertLessEqual(threading.active_count(), threads_before + 3)
+
+        # The first poll is due after the polling interval
+        callback_threads = []
+        pollers[-1].add_done_callback(lambda _: callback_threads.append(threading.current_thread()))
+        for poller in pollers:
+            self.assertEqual(poller.result(timeout=10).copy.status, 'success')
+        polls = [r for r in transport.service.requests if r.method == 'HEAD']
+        self.assertEqual(len(polls), 20 * 3)
+        polling_threads = transport.threads - {threading.current_thread().name}
+        self.assertLessEqual(len(polling_threads), 2)
+        # The done callbacks run on a worker thread of the scheduler
+        self.assertEqual(len(callback_threads), 1)
+        self.assertIn(callback_threads[0].name, polling_threads)
+
+        # A failed copy is reported by the poller
+        transport.service.failing_copies.add('/container/failed')
+        blob = service.get_blob_client('container', 'failed')
+        blob._config.blob_settings.copy_polling_interval = 0.01
+        poller = blob.copy_blob_from_url(source_url, polling_scheduler=scheduler)
+        with self.assertRaises(ValueError):
+            poller.result(timeout=10)
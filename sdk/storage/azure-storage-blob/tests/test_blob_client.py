@@ -6,6 +6,8 @@
 import unittest
 import pytest
 import platform
+import subprocess
+import sys
 
 from azure.storage.blob import (
     BlobServiceClient,
@@ -444,6 +446,18 @@ class StorageClientTest(StorageTestCase):
         service.get_service_properties(raw_response_hook=callback, headers=custom_headers)
 
 
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="Clients are imported lazily on Python 3.7+")
+def test_lazy_client_imports():
+    code = (
+        "import sys, azure.storage.blob as blob;"
+        "assert 'azure.storage.blob._generated' not in sys.modules;"
+        "from azure.storage.blob import BlobServiceClient, BlobType;"
+        "assert 'azure.storage.blob._generated' in sys.modules;"
+        "assert all(hasattr(blob, name) for name in blob.__all__)"
+    )
+    subprocess.check_call([sys.executable, '-c', code])
+
+
 # ------------------------------------------------------------------------------
 if __name__ == '__main__':
     unittest.main()
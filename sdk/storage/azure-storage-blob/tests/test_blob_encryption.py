@@ -23,6 +23,9 @@ from azure.storage.blob._shared.encryption import (
     _dict_to_encryption_data,
     _validate_and_unwrap_cek,
     _generate_AES_CBC_cipher,
+    _encrypt_blob,
+    _BlobDecryptor,
+    _BlobEncryptor,
     _ERROR_OBJECT_INVALID,
 )
 from azure.storage.blob.blob_client import _ERROR_UNSUPPORTED_METHOD_FOR_ENCRYPTION
@@ -55,6 +58,31 @@ _ERROR_UNSUPPORTED_METHOD_FOR_ENCRYPTION = 'The require_encryption flag is set,
                                            ' for this method.'
 #------------------------------------------------------------------------------
 
+
+class _CountingKeyWrapper(KeyWrapper):
+
+    def __init__(self, kid='local:key1'):
+        KeyWrapper.__init__(self, kid)
+        self.unwraps = 0
+
+    def unwrap_key(self, key, algorithm):
+        self.unwraps += 1
+        return KeyWrapper.unwrap_key(self, key, algorithm)
+
+
+class _Response(object):
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class _DownloadedRange(list):
+
+    def __init__(self, chunks, headers):
+        super(_DownloadedRange, self).__init__(chunks)
+        self.response = _Response(headers)
+
+
 class StorageBlobEncryptionTest(StorageTestCase):
 
     def setUp(self):
@@ -722,6 +750,48 @@ class StorageBlobEncryptionTest(StorageTestCase):
         self.assertEqual(self.bytes, stream_blob.read())
         self.assertEqual(self.bytes.decode(), text_blob)
 
+    def test_blob_encryptor_encrypts_chunks_in_order(self):
+        content_encryption_key, iv = urandom(32), urandom(16)
+        data = urandom(10 * 1024 + 7)
+
+        encryptor = _BlobEncryptor(content_encryption_key, iv)
+        chunks = [encryptor.update(data[i:i + 1000]) for i in range(0, len(data), 1000)]
+        chunks.append(encryptor.finalize())
+
+        decryptor = _generate_AES_CBC_cipher(content_encryption_key, iv).decryptor()
+        unpadder = PKCS7(128).unpadder()
+        content = unpadder.update(decryptor.update(b"".join(chunks)) + decryptor.finalize())
+        self.assertEqual(content + unpadder.finalize(), data)
+        self.assertTrue(all(len(chunk) % 16 == 0 for chunk in chunks))
+
+    def test_blob_decryptor_decrypts_ranges_in_chunks(self):
+        kek = _CountingKeyWrapper('key1')
+        data = urandom(1000)
+        encryption_data, encrypted = _encrypt_blob(data, kek)
+        size = len(encrypted)
+        headers = {'x-ms-meta-encryptiondata': encryption_data, 'x-ms-blob-type': 'BlockBlob'}
+
+        def download(start, end):
+            # The range as the service returns it, in chunks not aligned to the cipher blocks.
+            body = encrypted[start:end + 1]
+            chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+            return _DownloadedRange(chunks, dict(headers, **{
+                'content-range': 'bytes {}-{}/{}'.format(start, end, size)}))
+
+        decryptor = _BlobDecryptor(True, kek, None, headers)
+        # The first range starts the blob, the next ones start with the cipher block before them.
+        self.assertEqual(decryptor.decrypt(download(0, 31), 3, 2), data[3:30])
+        self.assertEqual(decryptor.decrypt(download(16, 63), 16, 0), data[32:64])
+        self.assertEqual(decryptor.decrypt(download(512, size - 1), 16, 0), data[528:])
+        self.assertEqual(kek.unwraps, 1)
+
+    def test_blob_decryptor_requires_encryption(self):
+        unencrypted = _DownloadedRange([b'data'], {'x-ms-blob-type': 'BlockBlob'})
+
+        self.assertEqual(_BlobDecryptor(False, KeyWrapper('key1'), None, {}).decrypt(unencrypted, 0, 0), b'data')
+        with self.assertRaises(ValueError):
+            _BlobDecryptor(True, KeyWrapper('key1'), None, {}).decrypt(unencrypted, 0, 0)
+
 #------------------------------------------------------------------------------
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,6 +5,8 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import base64
+
 import pytest
 from dateutil.tz import tzutc
 
@@ -12,6 +14,7 @@ import requests
 from datetime import datetime, timedelta
 
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError, ResourceExistsError
+from azure.core.pipeline.transport import HttpTransport, HttpResponse
 from azure.storage.blob import (
     BlobServiceClient,
     ContainerClient,
@@ -29,6 +32,80 @@ from testcase import StorageTestCase, TestMode, record, LogCaptured
 TEST_CONTAINER_PREFIX = 'container'
 #------------------------------------------------------------------------------
 
+LIST_BLOBS_PAGE = (
+    u'<?xml version="1.0" encoding="utf-8"?>'
+    u'<EnumerationResults ServiceEndpoint="https://storagename.blob.core.windows.net/" ContainerName="container">'
+    u'<Prefix>blob</Prefix>{marker}<MaxResults>{max_results}</MaxResults><Blobs>{blobs}</Blobs>{next_marker}</EnumerationResults>')
+LIST_BLOBS_ITEM = (
+    u'<Blob><Name>{}</Name><Properties><Content-Length>11</Content-Length><BlobType>BlockBlob</BlobType>'
+    u'</Properties><Metadata><name>{}</name></Metadata></Blob>')
+
+
+class _ListBlobsResponse(HttpResponse):
+
+    def __init__(self, request, status_code, body):
+        super(_ListBlobsResponse, self).__init__(request, None)
+        self.status_code = status_code
+        self.reason = 'Reason'
+        self.headers = requests.structures.CaseInsensitiveDict({'Content-Type': 'application/xml'})
+        self.content_type = 'application/xml'
+        self._body = body
+        self.chunks_read = 0
+
+    def body(self):
+        return self._body
+
+    def stream_download(self, pipeline):
+        for start in range(0, len(self._body), 16):
+            self.chunks_read += 1
+            yield self._body[start:start + 16]
+
+
+class _ListBlobsTransport(HttpTransport):
+    """Serves list blobs pages of `page_size` blobs, or a 404 for a missing container."""
+
+    def __init__(self, names, page_size=2):
+        self.names = names
+        self.page_size = page_size
+        self.requests = []
+        self.responses = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def sleep(self, duration):
+        pass
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        if '/missing' in request.url:
+            body = (u'<?xml version="1.0" encoding="utf-8"?><Error><Code>ContainerNotFound</Code>'
+                    u'<Message>The specified container does not exist.</Message></Error>')
+            response = _ListBlobsResponse(request, 404, body.encode('utf-8'))
+            response.headers['x-ms-error-code'] = 'ContainerNotFound'
+        else:
+            start = int(request.query.get('marker') or 0)
+            names = self.names[start:start + self.page_size]
+            end = start + len(names)
+            body = LIST_BLOBS_PAGE.format(
+                marker='<Marker>{}</Marker>'.format(start) if start else '<Marker />',
+                max_results=self.page_size,
+                blobs=''.join(LIST_BLOBS_ITEM.format(name, name.upper()) for name in names),
+                next_marker='<NextMarker>{}</NextMarker>'.format(end) if end < len(self.names) else '<NextMarker />')
+            response = _ListBlobsResponse(request, 200, body.encode('utf-8'))
+        self.responses.append(response)
+        return response
+
+
 class StorageContainerTest(StorageTestCase):
 
     def setUp(self):
@@ -1000,6 +1077,51 @@ class StorageContainerTest(StorageTestCase):
         self.assertEqual(blobs[2].metadata['number'], '2')
         self.assertEqual(blobs[2].metadata['name'], 'car')
 
+    def test_list_blobs_streams_pages(self):
+        # Arrange
+        transport = _ListBlobsTransport(['blob1', 'blob2', 'blob3'])
+        credential = {'account_name': 'storagename', 'account_key': base64.b64encode(b'key').decode()}
+        container = ContainerClient(
+            'https://storagename.blob.core.windows.net', 'container', credential=credential, transport=transport)
+
+        # Act
+        pages = container.list_blobs(name_starts_with='blob', include=['metadata']).by_page()
+        first_page = next(pages)
+        first_blob = next(first_page)
+
+        # Assert
+        self.assertEqual(first_blob.name, 'blob1')
+        self.assertEqual(first_blob.container, 'container')
+        self.assertEqual(first_blob.metadata, {'name': 'BLOB1'})
+        self.assertEqual([b.name for b in first_page], ['blob2'])
+        self.assertEqual(pages.continuation_token, '2')
+        self.assertEqual(pages.prefix, 'blob')
+        self.assertEqual(pages.results_per_page, 2)
+        self.assertEqual([b.name for b in next(pages)], ['blob3'])
+        self.assertIsNone(pages.continuation_token)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(transport.requests[1].query['marker'], '2')
+        self.assertEqual(transport.requests[1].query['include'], 'metadata')
+        self.assertEqual(transport.requests[1].query['prefix'], 'blob')
+
+        # A page not consumed by the caller still provides the continuation token
+        pages = container.list_blobs().by_page()
+        next(pages)
+        self.assertEqual([b.name for b in next(pages)], ['blob3'])
+
+        # The items are decoded as the response is downloaded
+        transport = _ListBlobsTransport(['blob{}'.format(i) for i in range(1000)], page_size=1000)
+        container = ContainerClient(
+            'https://storagename.blob.core.windows.net', 'container', credential=credential, transport=transport)
+        blobs = container.list_blobs()
+        self.assertEqual(next(blobs).name, 'blob0')
+        self.assertLess(transport.responses[0].chunks_read, len(transport.responses[0].body()) // 16)
+        self.assertEqual(len(list(blobs)), 999)
+
+        with self.assertRaises(ResourceNotFoundError):
+            list(ContainerClient(
+                'https://storagename.blob.core.windows.net', 'missing',
+                credential=credential, transport=transport).list_blobs())
 
     @record
     def test_shared_access_container(self):
@@ -0,0 +1,94 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import base64
+import os
+import struct
+
+from azure.core.exceptions import AzureError
+from azure.core.pipeline import PipelineRequest, PipelineContext
+from azure.core.pipeline.transport import HttpRequest
+from azure.storage.blob._shared.crc64 import Crc64, compute_crc64, CRC64_POLYNOMIAL
+from azure.storage.blob._shared.download_chunking import validate_content_crc64
+from azure.storage.blob._shared.policies import StorageContentValidation
+
+from testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+
+
+def _bitwise_crc64(data):
+    crc = 0xFFFFFFFFFFFFFFFF
+    for byte in bytearray(data):
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ CRC64_POLYNOMIAL if crc & 1 else crc >> 1
+    return crc ^ 0xFFFFFFFFFFFFFFFF
+
+
+class _Response(object):
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class StorageCrc64Test(StorageTestCase):
+
+    def test_crc64_matches_bitwise_definition(self):
+        for size in (0, 1, 7, 8, 9, 64, 1031):
+            data = os.urandom(size)
+            self.assertEqual(compute_crc64(data, use_c_extension=False), _bitwise_crc64(data))
+            self.assertEqual(compute_crc64(data), _bitwise_crc64(data))
+
+    def test_crc64_incremental(self):
+        data = os.urandom(100 * 1024 + 3)
+        crc64 = Crc64()
+        for start in range(0, len(data), 4099):
+            crc64.update(data[start:start + 4099])
+
+        self.assertEqual(crc64.digest(), Crc64(data).digest())
+        self.assertEqual(crc64.digest(), struct.pack('<Q', _bitwise_crc64(data)))
+        self.assertEqual(Crc64().digest(), b'\x00' * 8)
+
+    def test_policy_sets_upload_crc64(self):
+        data = b'upload data'
+        http_request = HttpRequest('PUT', 'https://account.blob.core.windows.net/container/blob')
+        http_request.set_bytes_body(data)
+        request = PipelineRequest(http_request, PipelineContext(None, validate_content='crc64'))
+
+        StorageContentValidation().on_request(request)
+
+        self.assertEqual(http_request.headers['x-ms-version'], StorageContentValidation.crc64_version)
+        self.assertEqual(
+            http_request.headers['x-ms-content-crc64'], self.to_base64_crc64(data))
+        self.assertNotIn('Content-MD5', http_request.headers)
+
+    def test_policy_requests_range_crc64(self):
+        http_request = HttpRequest('GET', 'https://account.blob.core.windows.net/container/blob')
+        http_request.headers['x-ms-range-get-content-md5'] = 'true'
+        request = PipelineRequest(http_request, PipelineContext(None, validate_content='crc64'))
+
+        StorageContentValidation().on_request(request)
+
+        self.assertEqual(http_request.headers['x-ms-range-get-content-crc64'], 'true')
+        self.assertNotIn('x-ms-range-get-content-md5', http_request.headers)
+
+    def test_download_crc64_mismatch_raises(self):
+        data = b'download data'
+        crc64 = Crc64(data)
+        validate_content_crc64(crc64, _Response({'x-ms-content-crc64': self.to_base64_crc64(data)}))
+
+        with self.assertRaises(AzureError) as error:
+            validate_content_crc64(crc64, _Response({'x-ms-content-crc64': self.to_base64_crc64(b'other')}))
+        self.assertIn('CRC64 mismatch', str(error.exception))
+
+    @staticmethod
+    def to_base64_crc64(data):
+        return base64.b64encode(Crc64(data).digest()).decode('utf-8')
@@ -0,0 +1,109 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from azure.storage.blob._shared.download_chunking import RangeFileWriter, DownloadCheckpoint
+
+from testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+
+
+class StorageBlobDownloadChunkingTest(StorageTestCase):
+
+    def setUp(self):
+        super(StorageBlobDownloadChunkingTest, self).setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'blob')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        return super(StorageBlobDownloadChunkingTest, self).tearDown()
+
+    # this is a white box test that's designed to make sure chunks written concurrently
+    # at their offsets land in the right place of the preallocated file
+    def test_range_file_writer_concurrent_writes(self):
+        data = os.urandom(64 * 1024 + 10)
+        chunk_size = 4 * 1024
+        offsets = list(range(0, len(data), chunk_size))
+
+        with RangeFileWriter(self.path, len(data)) as writer:
+            self.assertEqual(os.path.getsize(self.path), len(data))
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(lambda o: writer.write_at(o, data[o:o + chunk_size]), reversed(offsets)))
+
+        with open(self.path, 'rb') as result:
+            self.assertEqual(result.read(), data)
+
+    def test_range_file_writer_keeps_or_truncates_content(self):
+        with open(self.path, 'wb') as existing:
+            existing.write(b'abcdefgh')
+
+        with RangeFileWriter(self.path, 4, keep=True) as writer:
+            writer.write_at(2, b'XY')
+        with open(self.path, 'rb') as result:
+            self.assertEqual(result.read(), b'abXY')
+
+        with RangeFileWriter(self.path, 4) as writer:
+            writer.write_at(0, b'12')
+        with open(self.path, 'rb') as result:
+            self.assertEqual(result.read(), b'12\x00\x00')
+
+    def test_download_checkpoint_resume(self):
+        identity = {'etag': '"etag"', 'offset': None, 'size': 100, 'start': 10, 'chunk_size': 10}
+        checkpoint = DownloadCheckpoint(self.path + '.checkpoint', identity)
+        self.assertFalse(checkpoint.load())
+        checkpoint.open(False)
+        checkpoint.add(10)
+        checkpoint.add(30)
+        checkpoint.close()
+        with open(self.path + '.checkpoint', 'a') as partial:
+            partial.write('5')  # a line cut short by an interruption
+
+        resumed = DownloadCheckpoint(self.path + '.checkpoint', identity)
+        self.assertTrue(resumed.load())
+        self.assertEqual(resumed.completed, {10, 30})
+
+        changed = DownloadCheckpoint(self.path + '.checkpoint', dict(identity, etag='"other"'))
+        self.assertFalse(changed.load())
+        self.assertEqual(changed.completed, set())
+
+        resumed.remove()
+        self.assertFalse(os.path.exists(self.path + '.checkpoint'))
+
+    def test_download_checkpoint_records_synced_chunks(self):
+        identity = {'etag': '"etag"', 'offset': None, 'size': 100, 'start': 0, 'chunk_size': 10}
+        checkpoint = DownloadCheckpoint(self.path + '.checkpoint', identity)
+        checkpoint.sync_interval = 2
+        with RangeFileWriter(self.path, 100) as writer:
+            synced = []
+            writer.sync = lambda: synced.append(len(synced))
+            checkpoint.open(False, writer)
+            checkpoint.add(0)
+            # Not recorded until a batch is complete, and the target synced
+            pending = DownloadCheckpoint(self.path + '.checkpoint', identity)
+            self.assertTrue(pending.load())
+            self.assertEqual((pending.completed, synced), (set(), []))
+            checkpoint.add(10)
+            self.assertEqual(len(synced), 1)
+            resumed = DownloadCheckpoint(self.path + '.checkpoint', identity)
+            self.assertTrue(resumed.load())
+            self.assertEqual(resumed.completed, {0, 10})
+
+            checkpoint.add(20)
+            checkpoint.close()
+            self.assertEqual(len(synced), 2)
+        resumed = DownloadCheckpoint(self.path + '.checkpoint', identity)
+        self.assertTrue(resumed.load())
+        self.assertEqual(resumed.completed, {0, 10, 20})
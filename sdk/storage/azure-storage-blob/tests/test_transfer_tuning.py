@@ -0,0 +1,110 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import threading
+import time
+
+from azure.storage.blob._shared.policies import StorageBlobSettings
+from azure.storage.blob._shared.transfer_tuning import (
+    AdaptiveTransferTuner,
+    get_transfer_tuner,
+    run_adaptive,
+    MAX_TUNED_BLOCK_SIZE)
+
+from testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+
+
+class StorageBlobTransferTuningTest(StorageTestCase):
+
+    def _run_window(self, tuner, clock, throughput):
+        # completes a window of chunks at the given throughput, in bytes per second
+        chunks = max(4, 2 * tuner.concurrency)
+        for _ in range(chunks):
+            clock[0] += tuner.block_size / float(throughput)
+            tuner.record(tuner.block_size, 0.1)
+
+    def test_get_transfer_tuner_only_when_enabled(self):
+        self.assertIsNone(get_transfer_tuner(StorageBlobSettings(), 4, 1024))
+        settings = StorageBlobSettings(adaptive_transfer=True)
+        self.assertIsNone(get_transfer_tuner(settings, 1, 1024))
+
+        tuner = get_transfer_tuner(settings, 4, 1024, max_block_size=1024 * 1024 * 1024)
+        self.assertEqual(tuner.max_concurrency, 4)
+        self.assertEqual(tuner.concurrency, 2)
+        self.assertEqual(tuner.max_block_size, MAX_TUNED_BLOCK_SIZE)
+
+    def test_tuner_climbs_while_throughput_improves(self):
+        clock = [0.0]
+        tuner = AdaptiveTransferTuner(4, 1024, max_block_size=4096)
+        tuner._clock = lambda: clock[0]
+        tuner.start()
+
+        # Each connection added helps until the fourth.
+        self._run_window(tuner, clock, 100)
+        self.assertEqual(tuner.concurrency, 3)
+        self._run_window(tuner, clock, 150)
+        self.assertEqual(tuner.concurrency, 4)
+        self.assertEqual(tuner.block_size, 1024)
+
+        # At the largest concurrency, the block size is tuned next.
+        self._run_window(tuner, clock, 200)
+        self.assertEqual((tuner.concurrency, tuner.block_size), (4, 2048))
+
+        # No gain from larger blocks: back to the best settings, and as the concurrency
+        # cannot grow, the larger block size is probed again.
+        self._run_window(tuner, clock, 200)
+        self.assertEqual((tuner.concurrency, tuner.block_size), (4, 2048))
+        self.assertAlmostEqual(tuner.snapshot()['throughput'], 200)
+
+    def test_tuner_halves_concurrency_on_congestion(self):
+        clock = [0.0]
+        tuner = AdaptiveTransferTuner(8, 1024)
+        tuner._clock = lambda: clock[0]
+        tuner.start()
+        for throughput in (100, 200, 300, 400):
+            self._run_window(tuner, clock, throughput)
+        self.assertEqual(tuner.concurrency, 6)
+
+        self._run_window(tuner, clock, 100)
+        self.assertEqual(tuner.concurrency, 3)
+        self.assertEqual(tuner.block_size, 1024)
+
+    def test_run_adaptive_follows_concurrency(self):
+        tuner = AdaptiveTransferTuner(4, 1024)
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def work(item):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return item * 2
+
+        tuner.concurrency = 3
+        results = run_adaptive(work, iter(range(20)), tuner)
+
+        self.assertEqual(results, [i * 2 for i in range(20)])
+        self.assertLessEqual(in_flight[1], 3)
+
+    def test_run_adaptive_raises_first_failure(self):
+        tuner = AdaptiveTransferTuner(2, 1024)
+
+        def work(item):
+            if item == 3:
+                raise ValueError("Chunk failed")
+            return item
+
+        with self.assertRaises(ValueError):
+            run_adaptive(work, iter(range(10)), tuner)
@@ -9,8 +9,9 @@
 import pytest
 
 import os
+import tempfile
 
-from azure.storage.blob._shared.upload_chunking import _SubStream
+from azure.storage.blob._shared.upload_chunking import _SubStream, MemoryMappedFile, BlockBlobChunkUploader
 from threading import Lock
 from io import (BytesIO, SEEK_SET)
 
@@ -112,3 +113,40 @@ class StorageBlobUploadChunkingTest(StorageTestCase):
         finally:
             wrapped_stream.close()
             substream.close()
+
+    # this is a white box test that's designed to make sure the chunks of a memory-mapped file
+    # are views of the mapping rather than copies read under the stream lock
+    def test_memory_mapped_file_chunks_are_views(self):
+        data = os.urandom(10 * 1024 + 100)
+        temp = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            temp.write(data)
+            temp.close()
+            with MemoryMappedFile(temp.name) as stream:
+                self.assertEqual(len(stream), len(data))
+                self.assertEqual(stream.read(100), data[:100])
+                self.assertEqual(stream.tell(), 100)
+
+                uploader = BlockBlobChunkUploader(
+                    None, len(data) - 100, 4 * 1024, stream, True, False, None, None, None, None)
+                chunks = list(uploader.get_chunk_streams())
+
+                self.assertEqual([offset for offset, _ in chunks], [0, 4 * 1024, 8 * 1024])
+                self.assertTrue(all(isinstance(chunk, memoryview) for _, chunk in chunks))
+                self.assertEqual(b"".join(bytes(chunk) for _, chunk in chunks), data[100:])
+                self.assertEqual(stream.tell(), len(data))
+                for _, chunk in chunks:
+                    chunk.release()
+        finally:
+            os.remove(temp.name)
+
+    def test_memory_mapped_file_empty(self):
+        temp = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            temp.close()
+            with MemoryMappedFile(temp.name) as stream:
+                self.assertEqual(len(stream), 0)
+                self.assertEqual(stream.read(), b"")
+            self.assertTrue(stream.closed)
+        finally:
+            os.remove(temp.name)
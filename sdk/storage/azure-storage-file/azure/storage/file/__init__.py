@@ -21,6 +21,7 @@ from .models import (
     DirectoryProperties,
     DirectoryPropertiesPaged,
     FileProperties,
+    DirectorySyncResult,
     Metrics,
     RetentionPolicy,
     CorsRule,
@@ -56,5 +57,6 @@ __all__ = [
     'DirectoryProperties',
     'DirectoryPropertiesPaged',
     'FileProperties',
+    'DirectorySyncResult',
     'ContentSettings'
 ]
@@ -0,0 +1,154 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import hashlib
+import os
+import stat
+import time
+from base64 import b64encode
+from threading import Lock
+from typing import (  # pylint: disable=unused-import
+    Any, Dict, List, Optional, Tuple
+)
+
+from .models import DirectorySyncResult
+
+
+def scan_local_directory(path):
+    # type: (str) -> Tuple[List[str], Dict[str, Tuple[int, float]]]
+    """The subdirectories of a local directory, and the size and modification time of its files.
+
+    Symbolic links to directories are skipped, so a link to an ancestor cannot make the walk loop.
+    """
+    directories = []
+    files = {}
+    for name in os.listdir(path):
+        status = os.stat(os.path.join(path, name))
+        if stat.S_ISDIR(status.st_mode):
+            if not os.path.islink(os.path.join(path, name)):
+                directories.append(name)
+        else:
+            files[name] = (status.st_size, status.st_mtime)
+    return directories, files
+
+
+def get_file_md5(path, block_size):
+    # type: (str, int) -> bytes
+    """The MD5 of a local file, read by blocks."""
+    md5 = hashlib.md5()
+    with open(path, 'rb') as stream:
+        for data in iter(lambda: stream.read(block_size), b''):
+            md5.update(data)
+    return md5.digest()
+
+
+def join_path(*names):
+    # type: (*Optional[str]) -> str
+    return '/'.join(name.strip('/') for name in names if name)
+
+
+class DirectorySyncTracker(object):
+    """Follows the sync of a local directory to a share, and aggregates its results.
+
+    The cache maps the path of each file synced, relative to the local directory, to
+    its size, modification time and MD5 at the time of the sync, as a JSON-serializable
+    dict. A file of the same size in the share, and whose size and modification time match
+    the cache, is up to date without being read. The cache is updated as files are synced,
+    so that it can be saved for the next sync.
+
+    Files are uploaded by ranges on the threads of the sync, so the state is guarded by a lock.
+
+    :param str local_path: The local directory synced.
+    :param str directory_path: The directory of the share to sync to, or None for its root.
+    :param int block_size: The size of the ranges uploaded, and of the reads of the local files.
+    :param dict cache: The cache of a previous sync, updated in place.
+    """
+
+    def __init__(self, local_path, directory_path, block_size, cache):
+        self.local_path = local_path
+        self.directory_path = directory_path
+        self.block_size = block_size
+        self.cache = cache if cache is not None else {}
+        self.result = DirectorySyncResult()
+        self._uploads = {}  # type: Dict[str, List[Any]]
+        self._lock = Lock()
+        self._clock = time.time
+        self._start = self._clock()
+
+    def local_file(self, path):
+        # type: (str) -> str
+        """The local path of a file, from its path relative to the local directory."""
+        return os.path.join(self.local_path, *path.split('/'))
+
+    def is_cached(self, path, size, mtime):
+        # type: (str, int, float) -> bool
+        """Whether the size and modification time of a local file match the cache."""
+        entry = self.cache.get(path)
+        return bool(entry) and entry['size'] == size and entry['mtime'] == mtime
+
+    def cached_md5(self, path, size):
+        # type: (str, int) -> Optional[str]
+        """The MD5 cached for a local file of this size, in base64."""
+        entry = self.cache.get(path)
+        if entry and entry['size'] == size:
+            return entry['md5']
+        return None
+
+    def directory_created(self):
+        with self._lock:
+            self.result.directories_created += 1
+
+    def unchanged(self, path, size, mtime, md5=None):
+        # type: (str, int, float, Optional[bytes]) -> None
+        with self._lock:
+            self.result.unchanged += 1
+            if md5 is not None:
+                self.cache[path] = {'size': size, 'mtime': mtime, 'md5': b64encode(md5).decode('utf-8')}
+
+    def plan(self, path, size, mtime, md5):
+        # type: (str, int, float, bytes) -> List[Tuple[int, int]]
+        """The inclusive start and end of each range to upload of a file created in the share."""
+        ranges = [(start, min(start + self.block_size, size) - 1) for start in range(0, size, self.block_size)]
+        with self._lock:
+            self._uploads[path] = [len(ranges), size, mtime, md5]
+        return ranges
+
+    def range_uploaded(self, path):
+        # type: (str) -> bool
+        """Record a range uploaded, and return whether it was the last range of the file."""
+        with self._lock:
+            upload = self._uploads.get(path)
+            if upload is None:
+                return False
+            upload[0] -= 1
+            return upload[0] == 0
+
+    def uploaded(self, path):
+        # type: (str) -> None
+        """Record a file uploaded, once all its ranges are and its Content-MD5 is set."""
+        with self._lock:
+            upload = self._uploads.pop(path, None)
+            if upload is None:
+                return
+            _, size, mtime, md5 = upload
+            self.result.uploaded.append(path)
+            self.result.bytes_uploaded += size
+            self.cache[path] = {'size': size, 'mtime': mtime, 'md5': b64encode(md5).decode('utf-8')}
+
+    def failed(self, path, error):
+        # type: (str, Exception) -> None
+        with self._lock:
+            self._uploads.pop(path, None)
+            self.cache.pop(path, None)
+            self.result.failed.setdefault(path, error)
+
+    def finish(self):
+        # type: () -> DirectorySyncResult
+        """The result, once all the files have been synced."""
+        self.result.elapsed = self._clock() - self._start
+        if self.result.elapsed > 0:
+            self.result.throughput = self.result.bytes_uploaded / self.result.elapsed
+        return self.result
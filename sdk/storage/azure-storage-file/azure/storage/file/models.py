@@ -6,6 +6,8 @@
 # pylint: disable=too-few-public-methods, too-many-instance-attributes
 # pylint: disable=super-init-not-called, too-many-lines
 
+from typing import Dict, List  # pylint: disable=unused-import
+
 from azure.core.paging import PageIterator
 from ._shared.utils import (
     return_context_and_deserialized,
@@ -617,6 +619,36 @@ class CopyProperties(DictMixin):
         return copy
 
 
+class DirectorySyncResult(DictMixin):
+    """The outcome of the sync of a local directory to a share.
+
+    :ivar list(str) uploaded:
+        The paths of the files uploaded, relative to the local directory.
+    :ivar int unchanged:
+        The number of files which were already up to date in the share.
+    :ivar int directories_created:
+        The number of directories created in the share.
+    :ivar dict(str, Exception) failed:
+        The error of each file or directory that could not be synced, by relative path.
+        The files under a directory that failed are not synced.
+    :ivar int bytes_uploaded:
+        The total size of the files uploaded.
+    :ivar float elapsed:
+        The seconds from the scan of the local directory to the end of the last upload.
+    :ivar float throughput:
+        The bytes uploaded per second.
+    """
+
+    def __init__(self):
+        self.uploaded = []  # type: List[str]
+        self.unchanged = 0
+        self.directories_created = 0
+        self.failed = {}  # type: Dict[str, Exception]
+        self.bytes_uploaded = 0
+        self.elapsed = 0.0
+        self.throughput = 0.0
+
+
 class FilePermissions(object):
     """FilePermissions class to be used with
     generating shared access signature operations.
@@ -4,6 +4,8 @@
 # license information.
 # --------------------------------------------------------------------------
 
+from base64 import b64encode
+from collections import deque
 from typing import ( # pylint: disable=unused-import
     Optional, Union, Dict, Any, TYPE_CHECKING
 )
@@ -14,6 +16,7 @@ except ImportError:
     from urllib2 import quote, unquote # type: ignore
 
 import six
+from azure.core.exceptions import AzureError, ResourceExistsError, ResourceNotFoundError
 
 from ._shared.shared_access_signature import FileSharedAccessSignature
 from .directory_client import DirectoryClient
@@ -35,9 +38,11 @@ from ._shared.utils import (
     parse_connection_str)
 
 from ._share_utils import deserialize_share_properties
+from ._directory_sync import DirectorySyncTracker, get_file_md5, join_path, scan_local_directory
+from .models import ContentSettings
 
 if TYPE_CHECKING:
-    from .models import ShareProperties, AccessPolicy
+    from .models import ShareProperties, AccessPolicy, DirectorySyncResult
 
 
 class ShareClient(StorageAccountHostsMixin):
@@ -634,3 +639,135 @@ class ShareClient(StorageAccountHostsMixin):
         directory = self.get_directory_client(directory_name)
         directory.create_directory(metadata, timeout, **kwargs)
         return directory # type: ignore
+
+    def _sync_directory_step(self, tracker, path, exists, timeout, validate_content):
+        # Lists a directory of the share, or creates it when missing, and returns the steps syncing its content
+        directories, files = scan_local_directory(tracker.local_file(path))
+        directory = self.get_directory_client(join_path(tracker.directory_path, path))
+        remote_directories, remote_files = set(), {}
+        if exists:
+            try:
+                for item in directory.list_directories_and_files(timeout=timeout):
+                    if item['is_directory']:
+                        remote_directories.add(item['name'])
+                    else:
+                        remote_files[item['name']] = item['size']
+            except ResourceNotFoundError:
+                if not directory.directory_path:
+                    raise
+                exists = False
+        if not exists:
+            try:
+                directory.create_directory(timeout=timeout)
+                tracker.directory_created()
+            except ResourceExistsError:
+                pass
+        steps = [(join_path(path, name), self._sync_directory_step,
+                  (tracker, join_path(path, name), name in remote_directories, timeout, validate_content))
+                 for name in directories]
+        steps.extend((join_path(path, name), self._sync_file_step,
+                      (tracker, join_path(path, name), size, mtime, remote_files.get(name), timeout, validate_content))
+                     for name, (size, mtime) in files.items())
+        return steps
+
+    def _sync_file_step(self, tracker, path, size, mtime, remote_size, timeout, validate_content):
+        # Creates a file which changed, uploads its first range, and returns the steps uploading the other ranges
+        if remote_size == size and tracker.is_cached(path, size, mtime):
+            tracker.unchanged(path, size, mtime)
+            return []
+        md5 = get_file_md5(tracker.local_file(path), tracker.block_size)
+        file_client = self.get_file_client(join_path(tracker.directory_path, path))
+        if remote_size == size:
+            remote_md5 = tracker.cached_md5(path, size)
+            if remote_md5 is None:
+                content_md5 = file_client.get_file_properties(timeout=timeout).content_settings.content_md5
+                remote_md5 = b64encode(bytes(content_md5)).decode('utf-8') if content_md5 else None
+            if remote_md5 == b64encode(md5).decode('utf-8'):
+                tracker.unchanged(path, size, mtime, md5)
+                return []
+        # The Content-MD5 is only set once all the ranges are uploaded, so a partial upload never matches it.
+        file_client.create_file(size, timeout=timeout)
+        ranges = tracker.plan(path, size, mtime, md5)
+        if not ranges:
+            self._finish_sync_upload(tracker, file_client, path, md5, timeout)
+            return []
+        self._upload_sync_range(tracker, file_client, path, md5, ranges[0], timeout, validate_content)
+        return [(path, self._upload_sync_range,
+                 (tracker, file_client, path, md5, file_range, timeout, validate_content))
+                for file_range in ranges[1:]]
+
+    def _upload_sync_range(self, tracker, file_client, path, md5, file_range, timeout, validate_content):
+        start, end = file_range
+        with open(tracker.local_file(path), 'rb') as stream:
+            stream.seek(start)
+            data = stream.read(end - start + 1)
+        file_client.upload_range(data, start, end, validate_content=validate_content, timeout=timeout)
+        if tracker.range_uploaded(path):
+            self._finish_sync_upload(tracker, file_client, path, md5, timeout)
+        return []
+
+    @staticmethod
+    def _finish_sync_upload(tracker, file_client, path, md5, timeout):
+        file_client.set_http_headers(ContentSettings(content_md5=bytearray(md5)), timeout=timeout)
+        tracker.uploaded(path)
+
+    def sync_directory(self, local_path, directory_path=None, cache=None, **kwargs):
+        # type: (str, Optional[str], Optional[Dict[str, Any]], Any) -> DirectorySyncResult
+        """Uploads the files of a local directory tree which are missing or changed in the share.
+
+        The local tree is walked and the directories of the share are listed in parallel,
+        a directory being listed as soon as its parent is. The missing directories are created
+        level by level, each after its parent, and the files are then compared with the listing
+        of their directory. A file is uploaded when it is missing from the share or its size
+        differs. When the sizes match, a file is up to date if its size and modification time
+        match the cache of the previous sync, or else if its MD5 matches the MD5 cached, or the
+        Content-MD5 of the file in the share. The ranges of the files uploaded are uploaded in
+        parallel, and the MD5 of each file is set as its Content-MD5 once all its ranges are, so
+        a file whose upload failed is uploaded again by the next sync. Symbolic links to
+        directories are not followed.
+
+        Files of the share which are not in the local tree are left untouched. Failed files and
+        directories do not stop the sync: the error of each one is reported in the result,
+        along with the number of bytes uploaded and the throughput of the sync.
+
+        :param str local_path:
+            The local directory to sync.
+        :param str directory_path:
+            The directory of the share to sync the local directory to. Defaults to the root of
+            the share. The directory is created if missing, but its parent must exist.
+        :param dict cache:
+            The cache of the previous sync, which maps the path of each file synced to its size,
+            modification time and MD5. It is updated in place, and can be saved as JSON for the
+            next sync. Without it, the files of the same size as in the share are read to be compared.
+        :param int max_connections:
+            The number of requests to list directories, create directories and files,
+            and upload ranges in parallel. The default value is 1.
+        :param bool validate_content:
+            If true, calculates an MD5 hash of each range uploaded, for the service to check
+            the content that has arrived against it.
+        :param int timeout:
+            The timeout parameter is expressed in seconds, for each request.
+        :returns: The files uploaded, the errors of the files not synced, and the statistics of the sync.
+        :rtype: ~azure.storage.file.models.DirectorySyncResult
+        """
+        timeout = kwargs.pop('timeout', None)
+        max_connections = kwargs.pop('max_connections', 1)
+        validate_content = kwargs.pop('validate_content', False)
+        tracker = DirectorySyncTracker(local_path, directory_path, self._config.data_settings.max_range_size, cache)
+        steps = deque([('', self._sync_directory_step, (tracker, '', True, timeout, validate_content))])
+
+        import concurrent.futures
+        running = {}  # type: Dict[Any, str]
+        with concurrent.futures.ThreadPoolExecutor(max_connections) as executor:
+            while steps or running:
+                while steps and len(running) < max_connections:
+                    path, step, args = steps.popleft()
+                    running[executor.submit(step, *args)] = path
+                done, _ = concurrent.futures.wait(list(running), return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    path = running.pop(future)
+                    try:
+                        steps.extend(future.result())
+                    except (AzureError, ValueError, IOError, OSError) as error:
+                        tracker.failed(path, error)
+        return tracker.finish()
@@ -0,0 +1,251 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import uuid
+
+from requests.structures import CaseInsensitiveDict
+from azure.core.pipeline.transport import HttpTransport, HttpResponse
+from azure.storage.file import ShareClient
+from azure.storage.file._directory_sync import DirectorySyncTracker
+
+try:
+    from urllib.parse import urlparse, parse_qs, unquote
+except ImportError:
+    from urlparse import urlparse, parse_qs  # type: ignore
+    from urllib2 import unquote  # type: ignore
+
+# ------------------------------------------------------------------------------
+_DATE = 'Sat, 22 Jun 2019 20:12:50 GMT'
+
+
+class _Response(HttpResponse):
+
+    def __init__(self, request, status_code, body=b'', headers=None):
+        super(_Response, self).__init__(request, None)
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.headers.setdefault('Content-Type', 'application/xml')
+        self.headers.setdefault('Date', _DATE)
+        self.headers.setdefault('Last-Modified', _DATE)
+        self.headers.setdefault('ETag', '"0x8D6F7460D4E2F37"')
+        self.headers.setdefault('x-ms-request-id', str(uuid.uuid4()))
+        self.content_type = self.headers.get('Content-Type')
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeShareTransport(HttpTransport):
+    """An in-memory share, holding the directories and the content and Content-MD5 of the files."""
+
+    def __init__(self):
+        self.directories = set([''])
+        self.files = {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def sleep(self, duration):
+        pass
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+            return self._handle(request)
+
+    def _handle(self, request):
+        url = urlparse(request.url)
+        path = unquote(url.path).split('/', 2)[2] if url.path.count('/') > 1 else ''
+        query = parse_qs(url.query)
+        parent = path.rpartition('/')[0]
+        if query.get('comp') == ['list']:
+            if path not in self.directories:
+                return _Response(request, 404, headers={'x-ms-error-code': 'ResourceNotFound'})
+            return _Response(request, 200, self._list(path))
+        if query.get('restype') == ['directory']:
+            if parent not in self.directories:
+                return _Response(request, 404, headers={'x-ms-error-code': 'ParentNotFound'})
+            if path in self.directories:
+                return _Response(request, 409, headers={'x-ms-error-code': 'ResourceAlreadyExists'})
+            self.directories.add(path)
+            return _Response(request, 201)
+        if request.method == 'HEAD':
+            content, md5 = self.files[path]
+            return _Response(request, 200, headers={
+                'Content-Length': str(len(content)), 'x-ms-type': 'File', 'Content-MD5': md5})
+        if query.get('comp') == ['properties']:
+            content, _ = self.files[path]
+            self.files[path] = (content, request.headers.get('x-ms-content-md5'))
+            return _Response(request, 200)
+        if query.get('comp') == ['range']:
+            start, end = [int(i) for i in request.headers['x-ms-range'].split('=')[1].split('-')]
+            content, md5 = self.files[path]
+            content[start:end + 1] = request.data
+            return _Response(request, 201)
+        if parent not in self.directories:
+            return _Response(request, 404, headers={'x-ms-error-code': 'ParentNotFound'})
+        self.files[path] = (
+            bytearray(int(request.headers['x-ms-content-length'])), request.headers.get('x-ms-content-md5'))
+        return _Response(request, 201)
+
+    def _list(self, path):
+        prefix = path + '/' if path else ''
+        children = [d[len(prefix):] for d in self.directories if d.startswith(prefix) and d != path]
+        entries = ''.join(
+            '<Directory><Name>{}</Name><Properties /></Directory>'.format(name)
+            for name in children if '/' not in name)
+        entries += ''.join(
+            '<File><Name>{}</Name><Properties><Content-Length>{}</Content-Length></Properties></File>'.format(
+                name[len(prefix):], len(content))
+            for name, (content, _) in self.files.items()
+            if name.startswith(prefix) and '/' not in name[len(prefix):])
+        return ('<?xml version="1.0" encoding="utf-8"?><EnumerationResults ServiceEndpoint="https://account'
+                '.file.core.windows.net/" ShareName="share" DirectoryPath="{}"><Entries>{}</Entries>'
+                '<NextMarker /></EnumerationResults>'.format(path, entries)).encode('utf-8')
+
+    def uploads(self):
+        return [r.url for r in self.requests if r.method == 'PUT' and 'comp=range' in r.url]
+
+
+class StorageDirectorySyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.local_path = tempfile.mkdtemp()
+        self.transport = FakeShareTransport()
+        self.share = ShareClient(
+            'https://account.file.core.windows.net/share', credential='?sv=2018-03-28&sig=fake',
+            transport=self.transport, max_range_size=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.local_path)
+
+    def _write(self, path, content):
+        local_file = os.path.join(self.local_path, *path.split('/'))
+        if not os.path.isdir(os.path.dirname(local_file)):
+            os.makedirs(os.path.dirname(local_file))
+        with open(local_file, 'wb') as stream:
+            stream.write(content)
+
+    def test_tracker_plans_ranges(self):
+        tracker = DirectorySyncTracker(self.local_path, None, 4, None)
+
+        self.assertEqual(tracker.plan('a', 10, 1.0, b'md5'), [(0, 3), (4, 7), (8, 9)])
+        self.assertFalse(tracker.range_uploaded('a'))
+        self.assertFalse(tracker.range_uploaded('a'))
+        self.assertTrue(tracker.range_uploaded('a'))
+        self.assertEqual(tracker.result.uploaded, [])
+        tracker.uploaded('a')
+        self.assertEqual(tracker.plan('empty', 0, 1.0, b'md5'), [])
+        tracker.uploaded('empty')
+
+        result = tracker.finish()
+        self.assertEqual((sorted(result.uploaded), result.bytes_uploaded), (['a', 'empty'], 10))
+        self.assertTrue(tracker.is_cached('a', 10, 1.0))
+        self.assertFalse(tracker.is_cached('a', 10, 2.0))
+
+    def test_sync_directory(self):
+        self._write('top.txt', b'top level')
+        self._write('a/one.txt', b'one')
+        self._write('a/b/two.txt', b'second file')
+        self._write('a/b/c/empty.txt', b'')
+        self.transport.directories.add('a')
+
+        cache = {}
+        result = self.share.sync_directory(self.local_path, cache=cache, max_connections=4)
+
+        self.assertEqual(result.failed, {})
+        self.assertEqual(sorted(result.uploaded), ['a/b/c/empty.txt', 'a/b/two.txt', 'a/one.txt', 'top.txt'])
+        self.assertEqual((result.directories_created, result.bytes_uploaded), (2, 23))
+        self.assertEqual(self.transport.files['a/b/two.txt'][0], b'second file')
+        self.assertEqual(self.transport.directories, set(['', 'a', 'a/b', 'a/b/c']))
+        self.assertEqual(sorted(cache), sorted(result.uploaded))
+
+        # The cache skips the unchanged files without reading them.
+        self.transport.requests = []
+        self._write('a/one.txt', b'ONE')
+        result = self.share.sync_directory(self.local_path, cache=cache, max_connections=4)
+
+        self.assertEqual((result.uploaded, result.unchanged), (['a/one.txt'], 3))
+        self.assertEqual(self.transport.files['a/one.txt'][0], b'ONE')
+        self.assertEqual(len(self.transport.uploads()), 1)
+
+        # Without the cache, files of the same size are compared with the Content-MD5 of the share.
+        self.transport.requests = []
+        result = self.share.sync_directory(self.local_path, max_connections=4)
+
+        self.assertEqual((result.uploaded, result.unchanged), ([], 4))
+        self.assertEqual(self.transport.uploads(), [])
+
+    def test_sync_directory_to_missing_directory(self):
+        self._write('file.txt', b'content')
+
+        result = self.share.sync_directory(self.local_path, directory_path='backup/daily')
+
+        self.assertEqual(list(result.failed), [''])
+        self.assertEqual(result.uploaded, [])
+
+        self.transport.directories.add('backup')
+        result = self.share.sync_directory(self.local_path, directory_path='backup/daily')
+
+        self.assertEqual((result.uploaded, result.directories_created), (['file.txt'], 1))
+        self.assertEqual(self.transport.files['backup/daily/file.txt'][0], b'content')
+
+    def test_sync_directory_uploads_again_after_failed_range(self):
+        self._write('file.txt', b'0123456789')
+        original = self.transport._handle
+
+        def fail_range(request):
+            if request.headers.get('x-ms-range') == 'bytes=4-7':
+                return _Response(request, 500, headers={'x-ms-error-code': 'InternalError'})
+            return original(request)
+        self.transport._handle = fail_range
+        self.share._config.retry_policy.total_retries = 0
+
+        result = self.share.sync_directory(self.local_path)
+
+        self.assertEqual((list(result.failed), result.uploaded), (['file.txt'], []))
+        self.assertIsNone(self.transport.files['file.txt'][1])
+
+        # The share has a file of the same size, but no Content-MD5 to match.
+        self.transport._handle = original
+        result = self.share.sync_directory(self.local_path)
+
+        self.assertEqual((result.uploaded, result.unchanged), (['file.txt'], 0))
+        self.assertEqual(self.transport.files['file.txt'][0], b'0123456789')
+        self.assertIsNotNone(self.transport.files['file.txt'][1])
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), "Symbolic links are not supported")
+    def test_sync_directory_skips_linked_directories(self):
+        self._write('a/file.txt', b'content')
+        os.symlink(self.local_path, os.path.join(self.local_path, 'a', 'loop'))
+
+        result = self.share.sync_directory(self.local_path)
+
+        self.assertEqual((result.failed, result.uploaded), ({}, ['a/file.txt']))
+        self.assertEqual(self.transport.directories, set(['', 'a']))
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@
 from .version import VERSION
 from .queue_client import QueueClient
 from .queue_service_client import QueueServiceClient
+from ._message_receiver import QueueMessageReceiver
 from ._shared.policies import ExponentialRetry, LinearRetry, NoRetry
 from ._shared.models import(
     LocationMode,
@@ -35,6 +36,8 @@ from .models import (
     CorsRule,
     RetentionPolicy,
     MessagesPaged,
+    MessageBatchResult,
+    MessageReceiverStatistics,
 )
 
 __version__ = VERSION
@@ -42,6 +45,7 @@ __version__ = VERSION
 __all__ = [
     'QueueClient',
     'QueueServiceClient',
+    'QueueMessageReceiver',
     'ExponentialRetry',
     'LinearRetry',
     'NoRetry',
@@ -67,4 +71,6 @@ __all__ = [
     'CorsRule',
     'RetentionPolicy',
     'MessagesPaged',
+    'MessageBatchResult',
+    'MessageReceiverStatistics',
 ]
@@ -0,0 +1,309 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import (  # pylint: disable=unused-import
+    Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+)
+
+from azure.core.exceptions import AzureError
+
+from .models import MessageReceiverStatistics
+
+if TYPE_CHECKING:
+    from .models import QueueMessage
+    from .queue_client import QueueClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# The bounds of the delay of a prefetch worker after a dequeue found no message.
+_MIN_IDLE_DELAY = 0.5
+_MAX_IDLE_DELAY = 8.0
+
+
+class _ReceivedMessage(object):
+    # A message held by the receiver: its visibility is renewed until it is deleted or released.
+    # The lock serializes the requests using the pop receipt, which each renewal replaces.
+
+    def __init__(self, message, renew_at):
+        self.message = message
+        self.renew_at = renew_at
+        self.lock = threading.Lock()
+        self.settled = False
+
+
+class QueueMessageReceiver(object):  # pylint: disable=too-many-instance-attributes
+    """Receives the messages of a queue ahead of their processing.
+
+    Worker threads keep up to `max_connections` dequeue requests in flight, and buffer the
+    messages received until `prefetch_count` messages are waiting to be processed. A worker
+    which finds the queue empty waits before its next request, for up to 8 seconds as the
+    queue stays empty. Unless `auto_renew` is False, the visibility timeout of each message
+    is renewed when half of it has elapsed, until the message is deleted or released through
+    the receiver, so messages buffered or taking long to process do not reappear in the queue.
+
+    The receiver should be closed once done, which releases the messages still buffered. It can
+    be used as a context manager, and iterating over it yields the messages as they arrive.
+
+    The receiver is created with :func:`~azure.storage.queue.queue_client.QueueClient.get_message_receiver`.
+
+    :param client: The client of the queue to receive the messages of.
+    :type client: ~azure.storage.queue.queue_client.QueueClient
+    :param int messages_per_page:
+        The maximum number of messages retrieved per dequeue request, up to 32. Defaults to 32.
+    :param int max_connections:
+        The number of dequeue requests to keep in flight. Defaults to 1.
+    :param int prefetch_count:
+        The maximum number of messages buffered. Defaults to `messages_per_page` times `max_connections`.
+    :param int visibility_timeout:
+        The visibility timeout of the messages received, in seconds. Defaults to 30.
+    :param bool auto_renew:
+        Whether to renew the visibility timeout of the messages held. Defaults to True.
+    :param float max_wait_time:
+        The seconds iterating over the receiver waits for a message before it stops.
+        By default, the iteration waits until the receiver is closed.
+    :param int timeout:
+        The server timeout of each request, expressed in seconds.
+    """
+
+    def __init__(self, client, **kwargs):
+        # type: (QueueClient, Any) -> None
+        self.messages_per_page = kwargs.pop('messages_per_page', 32)
+        if not 1 <= self.messages_per_page <= 32:
+            raise ValueError("Number of messages per page should be between 1 and 32")
+        self.max_connections = max(1, kwargs.pop('max_connections', 1))
+        self.prefetch_count = kwargs.pop('prefetch_count', None) or self.messages_per_page * self.max_connections
+        self.visibility_timeout = kwargs.pop('visibility_timeout', 30)
+        self.auto_renew = kwargs.pop('auto_renew', True)
+        self.max_wait_time = kwargs.pop('max_wait_time', None)
+        self.timeout = kwargs.pop('timeout', None)
+        self._client = client
+        self._kwargs = kwargs
+        self._statistics = MessageReceiverStatistics()
+        self._buffer = deque()  # type: deque
+        self._held = {}  # type: Dict[str, _ReceivedMessage]
+        self._requested = 0
+        self._error = None  # type: Optional[Exception]
+        self._condition = threading.Condition()
+        self._closing = threading.Event()
+        self._threads = []  # type: List[threading.Thread]
+        self._clock = time.time
+        self._start_time = None  # type: Optional[float]
+
+    def __enter__(self):
+        self._start()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        # type: () -> Iterator[QueueMessage]
+        while True:
+            messages = self.receive_messages(max_messages=1, max_wait_time=self.max_wait_time)
+            if not messages:
+                return
+            yield messages[0]
+
+    @property
+    def statistics(self):
+        # type: () -> MessageReceiverStatistics
+        """The counters of the receiver.
+
+        :rtype: ~azure.storage.queue.models.MessageReceiverStatistics
+        """
+        statistics = MessageReceiverStatistics()
+        with self._condition:
+            statistics.update(self._statistics)
+            if self._start_time is not None:
+                statistics.elapsed = self._clock() - self._start_time
+        if statistics.elapsed > 0:
+            statistics.throughput = statistics.messages_received / statistics.elapsed
+        return statistics
+
+    def _start(self):
+        with self._condition:
+            if self._threads or self._closing.is_set():
+                return
+            self._start_time = self._clock()
+            self._threads = [
+                threading.Thread(target=self._prefetch) for _ in range(self.max_connections)]
+            if self.auto_renew:
+                self._threads.append(threading.Thread(target=self._renew))
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def _prefetch(self):
+        idle_delay = 0.0
+        while True:
+            with self._condition:
+                # Only request the messages which fit in the buffer, counting the requests in flight.
+                while not self._closing.is_set():
+                    count = min(self.messages_per_page, self.prefetch_count - len(self._buffer) - self._requested)
+                    if count > 0:
+                        break
+                    self._condition.wait()
+                if self._closing.is_set():
+                    return
+                self._requested += count
+            started = self._clock()
+            try:
+                messages = self._client._dequeue_messages(  # pylint: disable=protected-access
+                    count, self.visibility_timeout, timeout=self.timeout, **self._kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                # Any failure stops the receiver: the error is raised to the consumer by receive_messages.
+                with self._condition:
+                    self._requested -= count
+                    self._error = self._error or error
+                    self._closing.set()
+                    self._condition.notify_all()
+                return
+            with self._condition:
+                self._requested -= count
+                self._statistics.receive_requests += 1
+                if messages:
+                    self._statistics.messages_received += len(messages)
+                    self._buffer.extend(messages)
+                    if self.auto_renew:
+                        renew_at = started + self.visibility_timeout / 2.0
+                        for message in messages:
+                            self._held[message.id] = _ReceivedMessage(message, renew_at)
+                else:
+                    self._statistics.empty_receives += 1
+                self._condition.notify_all()
+            if messages:
+                idle_delay = 0.0
+            else:
+                idle_delay = min(max(idle_delay * 2, _MIN_IDLE_DELAY), _MAX_IDLE_DELAY)
+                self._closing.wait(idle_delay)
+
+    def _renew(self):
+        while True:
+            with self._condition:
+                if self._closing.is_set():
+                    return
+                now = self._clock()
+                due = [held for held in self._held.values() if held.renew_at <= now]
+                if not due:
+                    next_renewal = min([held.renew_at for held in self._held.values()] or [None])
+                    self._condition.wait(None if next_renewal is None else next_renewal - now)
+                    continue
+            for held in due:
+                self._renew_message(held)
+
+    def _renew_message(self, held):
+        # type: (_ReceivedMessage) -> None
+        message = held.message
+        with held.lock:
+            if held.settled:
+                return
+            started = self._clock()
+            try:
+                renewed = self._client.update_message(
+                    message.id, pop_receipt=message.pop_receipt,
+                    visibility_timeout=self.visibility_timeout, timeout=self.timeout)
+            except AzureError as error:
+                _LOGGER.warning("Failed to renew the visibility timeout of message %s: %s", message.id, error)
+                with self._condition:
+                    self._held.pop(message.id, None)
+                    self._statistics.failed_renewals += 1
+                return
+            # The message is updated in place, so the objects handed out keep a valid pop receipt.
+            message.pop_receipt = renewed.pop_receipt
+            message.time_next_visible = renewed.time_next_visible
+        with self._condition:
+            held.renew_at = started + self.visibility_timeout / 2.0
+            self._statistics.visibility_renewals += 1
+
+    def receive_messages(self, max_messages=None, max_wait_time=None):
+        # type: (Optional[int], Optional[float]) -> List[QueueMessage]
+        """Takes messages from the buffer of the receiver.
+
+        :param int max_messages:
+            The maximum number of messages to return. Defaults to `messages_per_page`.
+        :param float max_wait_time:
+            The seconds to wait for a message when none is buffered. By default,
+            waits until a message is received or the receiver is closed.
+        :returns: The messages, or an empty list if none was received in time.
+        :rtype: list(~azure.storage.queue.models.QueueMessage)
+        :raises: The error of a dequeue request, once the messages received before it are taken.
+        """
+        self._start()
+        max_messages = max_messages or self.messages_per_page
+        deadline = None if max_wait_time is None else self._clock() + max_wait_time
+        with self._condition:
+            while not self._buffer and not self._closing.is_set():
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if not self._buffer and self._error is not None:
+                raise self._error  # pylint: disable=raising-bad-type
+            messages = [self._buffer.popleft() for _ in range(min(max_messages, len(self._buffer)))]
+            self._condition.notify_all()
+        return messages
+
+    def _settle(self, message, operation, **kwargs):
+        # The pop receipt is read under the lock of the message, once any renewal in flight completed.
+        with self._condition:
+            held = self._held.pop(getattr(message, 'id', message), None)
+        if held is None:
+            return operation(message, **kwargs)
+        with held.lock:
+            held.settled = True
+            return operation(held.message, **kwargs)
+
+    def delete_message(self, message):
+        # type: (QueueMessage) -> None
+        """Deletes a message received, and stops renewing its visibility timeout.
+
+        :param message: The message to delete.
+        :type message: ~azure.storage.queue.models.QueueMessage
+        """
+        self._settle(message, self._client.delete_message, timeout=self.timeout)
+        with self._condition:
+            self._statistics.messages_deleted += 1
+
+    def release_message(self, message):
+        # type: (QueueMessage) -> None
+        """Makes a message received visible again, so it can be received for another try.
+
+        :param message: The message to release.
+        :type message: ~azure.storage.queue.models.QueueMessage
+        """
+        self._settle(message, self._release)
+
+    def _release(self, message):
+        self._client.update_message(
+            message.id, pop_receipt=message.pop_receipt, visibility_timeout=0, timeout=self.timeout)
+        with self._condition:
+            self._statistics.messages_released += 1
+
+    def close(self):
+        # type: () -> None
+        """Stops receiving and renewing messages, and releases the messages still buffered.
+
+        The messages taken from the receiver and not deleted will become visible again
+        when their visibility timeout expires.
+        """
+        with self._condition:
+            self._closing.set()
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        with self._condition:
+            buffered = list(self._buffer)
+            self._buffer.clear()
+            self._held.clear()
+        for message in buffered:
+            try:
+                self._release(message)
+            except AzureError as error:
+                _LOGGER.warning("Failed to release message %s: %s", message.id, error)
@@ -6,7 +6,7 @@
 # pylint: disable=too-few-public-methods, too-many-instance-attributes
 # pylint: disable=super-init-not-called
 
-from typing import List # pylint: disable=unused-import
+from typing import Any, Dict, List # pylint: disable=unused-import
 from azure.core.paging import PageIterator
 from ._shared.utils import (
     return_context_and_deserialized,
@@ -255,6 +255,66 @@ class MessagesPaged(PageIterator):
         return "TOKEN_IGNORED", [QueueMessage._from_generated(q) for q in messages]  # pylint: disable=protected-access
 
 
+class MessageBatchResult(DictMixin):
+    """The outcome of a batch of messages enqueued or deleted concurrently.
+
+    :ivar list succeeded:
+        The messages enqueued, as QueueMessage objects, or the IDs of the messages deleted,
+        in the order of the batch.
+    :ivar dict(object, Exception) failed:
+        The error of each message that could not be enqueued, by position in the batch,
+        or that could not be deleted, by message ID.
+    :ivar int requests:
+        The number of requests sent.
+    :ivar float elapsed:
+        The seconds from the first request to the end of the last one.
+    :ivar float throughput:
+        The messages enqueued or deleted per second.
+    """
+
+    def __init__(self):
+        self.succeeded = []  # type: List[Any]
+        self.failed = {}  # type: Dict[Any, Exception]
+        self.requests = 0
+        self.elapsed = 0.0
+        self.throughput = 0.0
+
+
+class MessageReceiverStatistics(DictMixin):
+    """The counters of a QueueMessageReceiver.
+
+    :ivar int receive_requests:
+        The number of dequeue requests sent.
+    :ivar int empty_receives:
+        The number of dequeue requests which found no visible message.
+    :ivar int messages_received:
+        The number of messages dequeued, including the messages still buffered.
+    :ivar int messages_deleted:
+        The number of messages deleted through the receiver.
+    :ivar int messages_released:
+        The number of messages made visible again through the receiver, or when it was closed.
+    :ivar int visibility_renewals:
+        The number of times the visibility timeout of a message was renewed.
+    :ivar int failed_renewals:
+        The number of renewals which failed, after which the message is no longer renewed.
+    :ivar float elapsed:
+        The seconds since the receiver started.
+    :ivar float throughput:
+        The messages received per second.
+    """
+
+    def __init__(self):
+        self.receive_requests = 0
+        self.empty_receives = 0
+        self.messages_received = 0
+        self.messages_deleted = 0
+        self.messages_released = 0
+        self.visibility_renewals = 0
+        self.failed_renewals = 0
+        self.elapsed = 0.0
+        self.throughput = 0.0
+
+
 class QueueProperties(DictMixin):
     """Queue Properties.
 
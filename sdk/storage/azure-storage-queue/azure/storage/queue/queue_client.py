@@ -5,8 +5,9 @@
 # --------------------------------------------------------------------------
 
 import functools
+import time
 from typing import (  # pylint: disable=unused-import
-    Union, Optional, Any, IO, Iterable, AnyStr, Dict, List, Tuple,
+    Union, Optional, Any, IO, Iterable, AnyStr, Dict, List, Set, Tuple,
     TYPE_CHECKING)
 try:
     from urllib.parse import urlparse, quote, unquote
@@ -16,6 +17,7 @@ except ImportError:
 
 import six
 
+from azure.core.exceptions import AzureError
 from azure.core.paging import ItemPaged
 
 from ._shared.shared_access_signature import QueueSharedAccessSignature
@@ -38,7 +40,8 @@ from ._generated import AzureQueueStorage
 from ._generated.models import StorageErrorException, SignedIdentifier
 from ._generated.models import QueueMessage as GenQueueMessage
 
-from .models import QueueMessage, AccessPolicy, MessagesPaged
+from .models import QueueMessage, AccessPolicy, MessagesPaged, MessageBatchResult
+from ._message_receiver import QueueMessageReceiver
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -513,6 +516,46 @@ class QueueClient(StorageAccountHostsMixin):
         except StorageErrorException as error:
             process_storage_error(error)
 
+    def enqueue_messages(self, messages, visibility_timeout=None, time_to_live=None, timeout=None, **kwargs):
+        # type: (Iterable[Any], Optional[int], Optional[int], Optional[int], Any) -> MessageBatchResult
+        """Adds messages to the back of the message queue, sending the requests concurrently.
+
+        The service enqueues one message per request, so the messages are enqueued
+        by up to `max_connections` requests in flight, which share the connection pool
+        of the client. For more than 10 connections, create the client with a
+        `connection_pool_maxsize` of at least `max_connections`. The messages are not
+        guaranteed to be enqueued in order when more than one connection is used.
+
+        Failed messages do not stop the other messages: the error of each one is
+        reported in the result, along with the throughput of the batch.
+
+        :param messages:
+            The content of each message. Allowed type is determined by the encode_function
+            set on the service. Default is str.
+        :type messages: list(obj)
+        :param int visibility_timeout:
+            If not specified, the default value is 0. Specifies the
+            new visibility timeout value, in seconds, relative to server time.
+        :param int time_to_live:
+            Specifies the time-to-live interval for the messages, in
+            seconds. If this parameter is omitted, the default time-to-live is 7 days.
+        :param int timeout:
+            The server timeout of each request, expressed in seconds.
+        :param int max_connections:
+            The number of requests to send in parallel. The default value is 1.
+        :returns: The messages enqueued, the errors of the messages not enqueued, and
+            the statistics of the batch.
+        :rtype: ~azure.storage.queue.models.MessageBatchResult
+        """
+        max_connections = kwargs.pop('max_connections', 1)
+        enqueue = functools.partial(
+            self.enqueue_message,
+            visibility_timeout=visibility_timeout,
+            time_to_live=time_to_live,
+            timeout=timeout,
+            **kwargs)
+        return self._run_message_batch(enqueue, enumerate(messages), max_connections)
+
     def receive_messages(self, messages_per_page=None, visibility_timeout=None, timeout=None, **kwargs): # type: ignore
         # type: (Optional[int], Optional[int], Optional[int], Optional[Any]) -> ItemPaged[Message]
         """Removes one or more messages from the front of the queue.
@@ -568,6 +611,58 @@ class QueueClient(StorageAccountHostsMixin):
         except StorageErrorException as error:
             process_storage_error(error)
 
+    def _dequeue_messages(self, max_messages, visibility_timeout, timeout=None, **kwargs):
+        # type: (int, int, Optional[int], Any) -> List[QueueMessage]
+        # A single dequeue request, as sent by each page of receive_messages.
+        self._config.message_decode_policy.configure(
+            self.require_encryption,
+            self.key_encryption_key,
+            self.key_resolver_function)
+        try:
+            messages = self._client.messages.dequeue(
+                number_of_messages=max_messages,
+                visibilitytimeout=visibility_timeout,
+                timeout=timeout,
+                cls=self._config.message_decode_policy,
+                **kwargs)
+        except StorageErrorException as error:
+            process_storage_error(error)
+        return [QueueMessage._from_generated(q) for q in messages]  # pylint: disable=protected-access
+
+    def get_message_receiver(self, **kwargs):
+        # type: (Any) -> QueueMessageReceiver
+        """Gets a receiver which dequeues messages ahead of their processing.
+
+        Unlike :func:`~receive_messages`, which sends a dequeue request when the
+        messages of the previous page are consumed, the receiver keeps up to
+        `max_connections` dequeue requests in flight on background threads, and
+        renews the visibility timeout of the messages it holds until they are
+        deleted or released through the receiver.
+
+        The dequeue requests share the connection pool of the client. For more than
+        10 connections, create the client with a `connection_pool_maxsize` of at least
+        `max_connections`, or the connections above the pool size are not reused.
+
+        :param int messages_per_page:
+            The maximum number of messages retrieved per dequeue request, up to 32. Defaults to 32.
+        :param int max_connections:
+            The number of dequeue requests to keep in flight. Defaults to 1.
+        :param int prefetch_count:
+            The maximum number of messages buffered. Defaults to `messages_per_page` times `max_connections`.
+        :param int visibility_timeout:
+            The visibility timeout of the messages received, in seconds. Defaults to 30.
+        :param bool auto_renew:
+            Whether to renew the visibility timeout of the messages held. Defaults to True.
+        :param float max_wait_time:
+            The seconds iterating over the receiver waits for a message before it stops.
+            By default, the iteration waits until the receiver is closed.
+        :param int timeout:
+            The server timeout of each request, expressed in seconds.
+        :returns: A receiver, to close once done.
+        :rtype: ~azure.storage.queue.QueueMessageReceiver
+        """
+        return QueueMessageReceiver(self, **kwargs)
+
     def update_message(self, message, visibility_timeout=None, pop_receipt=None, # type: ignore
                        content=None, timeout=None, **kwargs):
         # type: (Any, int, Optional[str], Optional[Any], Optional[int], Any) -> QueueMessage
@@ -784,3 +879,59 @@ class QueueClient(StorageAccountHostsMixin):
             )
         except StorageErrorException as error:
             process_storage_error(error)
+
+    def delete_messages(self, messages, timeout=None, **kwargs):
+        # type: (Iterable[QueueMessage], Optional[int], Any) -> MessageBatchResult
+        """Deletes the specified messages, sending the requests concurrently.
+
+        The service deletes one message per request, so the messages are deleted
+        by up to `max_connections` requests in flight, which share the connection pool
+        of the client. For more than 10 connections, create the client with a
+        `connection_pool_maxsize` of at least `max_connections`.
+
+        Failed deletions do not stop the other deletions: the error of each one is
+        reported in the result, along with the throughput of the batch.
+
+        :param messages:
+            The messages to delete, as returned by :func:`~receive_messages` or
+            :func:`~update_message`, with their pop receipt.
+        :type messages: list(~azure.storage.queue.models.QueueMessage)
+        :param int timeout:
+            The server timeout of each request, expressed in seconds.
+        :param int max_connections:
+            The number of requests to send in parallel. The default value is 1.
+        :returns: The IDs of the messages deleted, the errors of the messages not deleted,
+            and the statistics of the batch.
+        :rtype: ~azure.storage.queue.models.MessageBatchResult
+        """
+        max_connections = kwargs.pop('max_connections', 1)
+
+        def delete(message):
+            self.delete_message(message, timeout=timeout, **kwargs)
+            return message.id
+        return self._run_message_batch(delete, ((message.id, message) for message in messages), max_connections)
+
+    def _run_message_batch(self, operation, items, max_connections):  # pylint: disable=no-self-use
+        # Runs the operation on each item, keeping up to max_connections requests in flight.
+        import concurrent.futures
+        result = MessageBatchResult()
+        start = time.time()
+        outcomes = []
+        running = set()  # type: Set[Any]
+        with concurrent.futures.ThreadPoolExecutor(max_connections) as executor:
+            for key, item in items:
+                if len(running) >= max_connections:
+                    _, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                future = executor.submit(operation, item)
+                running.add(future)
+                outcomes.append((key, future))
+        for key, future in outcomes:
+            try:
+                result.succeeded.append(future.result())
+            except (AzureError, ValueError) as error:
+                result.failed[key] = error
+        result.requests = len(outcomes)
+        result.elapsed = time.time() - start
+        if result.elapsed > 0:
+            result.throughput = len(result.succeeded) / result.elapsed
+        return result
@@ -0,0 +1,216 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import threading
+import unittest
+import uuid
+from collections import OrderedDict
+
+from requests.structures import CaseInsensitiveDict
+from azure.core.pipeline.transport import HttpTransport, HttpResponse
+from azure.storage.queue import QueueClient, StorageErrorCode
+
+try:
+    from urllib.parse import urlparse, parse_qs
+except ImportError:
+    from urlparse import urlparse, parse_qs  # type: ignore
+
+# ------------------------------------------------------------------------------
+_DATE = 'Sat, 22 Jun 2019 20:12:50 GMT'
+
+
+class _Response(HttpResponse):
+
+    def __init__(self, request, status_code, body=b'', headers=None):
+        super(_Response, self).__init__(request, None)
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.headers.setdefault('Content-Type', 'application/xml')
+        self.headers.setdefault('Date', _DATE)
+        self.headers.setdefault('x-ms-request-id', str(uuid.uuid4()))
+        self.content_type = self.headers.get('Content-Type')
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeQueueTransport(HttpTransport):
+    """An in-memory queue, which counts the requests in flight."""
+
+    def __init__(self):
+        self.messages = OrderedDict()
+        self.visible = {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.delay = threading.Event()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def sleep(self, duration):
+        pass
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Holds the requests briefly, so concurrent requests overlap.
+        self.delay.wait(0.01)
+        try:
+            with self.lock:
+                return self._handle(request)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def _handle(self, request):
+        path = urlparse(request.url).path.split('/')
+        query = parse_qs(urlparse(request.url).query)
+        if request.method == 'POST':
+            text = request.data.decode('utf-8').split('<MessageText>')[1].split('</MessageText>')[0]
+            message_id = str(uuid.uuid4())
+            self.messages[message_id] = [text, 'receipt-0', 0]
+            self.visible[message_id] = True
+            return _Response(request, 201, self._list([message_id]))
+        if request.method == 'GET':
+            count = int(query.get('numofmessages', ['1'])[0])
+            ids = [i for i in self.messages if self.visible[i]][:count]
+            for message_id in ids:
+                self.visible[message_id] = False
+                self.messages[message_id][1] = 'receipt-{}'.format(uuid.uuid4())
+                self.messages[message_id][2] += 1
+            return _Response(request, 200, self._list(ids))
+        message_id = path[-1]
+        receipt = query['popreceipt'][0]
+        if message_id not in self.messages or self.messages[message_id][1] != receipt:
+            return _Response(request, 404, headers={'x-ms-error-code': 'MessageNotFound'})
+        if request.method == 'DELETE':
+            del self.messages[message_id]
+            del self.visible[message_id]
+            return _Response(request, 204)
+        visibility_timeout = int(query['visibilitytimeout'][0])
+        self.visible[message_id] = visibility_timeout == 0
+        self.messages[message_id][1] = 'receipt-{}'.format(uuid.uuid4())
+        return _Response(request, 204, headers={
+            'x-ms-popreceipt': self.messages[message_id][1], 'x-ms-time-next-visible': _DATE})
+
+    def _list(self, ids):
+        items = ''.join(
+            '<QueueMessage><MessageId>{}</MessageId><InsertionTime>{}</InsertionTime>'
+            '<ExpirationTime>{}</ExpirationTime><PopReceipt>{}</PopReceipt>'
+            '<TimeNextVisible>{}</TimeNextVisible><DequeueCount>{}</DequeueCount>'
+            '<MessageText>{}</MessageText></QueueMessage>'.format(
+                i, _DATE, _DATE, self.messages[i][1], _DATE, self.messages[i][2], self.messages[i][0])
+            for i in ids)
+        return '<?xml version="1.0" encoding="utf-8"?><QueueMessagesList>{}</QueueMessagesList>'.format(
+            items).encode('utf-8')
+
+
+class StorageQueueReceiverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = FakeQueueTransport()
+        self.queue = QueueClient(
+            'https://account.queue.core.windows.net/queue', credential='?sv=2018-03-28&sig=fake',
+            transport=self.transport)
+
+    def test_enqueue_and_delete_messages_concurrently(self):
+        result = self.queue.enqueue_messages(['message{}'.format(i) for i in range(20)], max_connections=4)
+
+        self.assertEqual(result.failed, {})
+        self.assertEqual(result.requests, 20)
+        self.assertEqual(sorted(m.content for m in result.succeeded), sorted('message{}'.format(i) for i in range(20)))
+        self.assertEqual(self.transport.max_in_flight, 4)
+        self.assertGreater(result.throughput, 0)
+
+        messages = self.queue._dequeue_messages(32, 30)
+        stale = messages[0]
+        stale.pop_receipt = 'stale'
+        result = self.queue.delete_messages(messages, max_connections=8)
+
+        self.assertEqual(sorted(result.succeeded), sorted(m.id for m in messages[1:]))
+        self.assertEqual(result.failed[stale.id].error_code, StorageErrorCode.message_not_found)
+        self.assertEqual(list(self.transport.messages), [stale.id])
+
+    def test_receiver_prefetches_messages(self):
+        self.queue.enqueue_messages(['message{}'.format(i) for i in range(10)])
+
+        with self.queue.get_message_receiver(
+                messages_per_page=2, max_connections=3, max_wait_time=0.5, auto_renew=False) as receiver:
+            received = []
+            for message in receiver:
+                received.append(message.content)
+                receiver.delete_message(message)
+
+        self.assertEqual(sorted(received), ['message{}'.format(i) for i in range(10)])
+        self.assertEqual(self.transport.messages, {})
+        statistics = receiver.statistics
+        self.assertEqual((statistics.messages_received, statistics.messages_deleted), (10, 10))
+        self.assertGreaterEqual(statistics.receive_requests, 5)
+        self.assertGreater(statistics.empty_receives, 0)
+
+    def test_receiver_renews_and_releases_messages(self):
+        self.queue.enqueue_messages(['message{}'.format(i) for i in range(4)])
+        receiver = self.queue.get_message_receiver(messages_per_page=4, visibility_timeout=30)
+        clock = [0.0]
+        renewed = threading.Event()
+        receiver._clock = lambda: clock[0]
+        original = receiver._renew_message
+
+        def renew_message(held):
+            original(held)
+            renewed.set()
+        receiver._renew_message = renew_message
+
+        first = receiver.receive_messages(max_messages=1)[0]
+        receipt = first.pop_receipt
+        with receiver._condition:
+            clock[0] = 16.0
+            receiver._condition.notify_all()
+        renewed.wait(5)
+        receiver.delete_message(first)
+
+        self.assertNotEqual(first.pop_receipt, receipt)
+        self.assertGreater(receiver.statistics.visibility_renewals, 0)
+        self.assertNotIn(first.id, self.transport.messages)
+        receiver.close()
+
+        # The messages still buffered are made visible again.
+        self.assertEqual(receiver.statistics.messages_released, 3)
+        self.assertTrue(all(self.transport.visible.values()))
+        self.assertEqual(len(self.transport.messages), 3)
+
+    def test_receiver_raises_any_prefetch_error(self):
+        self.queue.enqueue_messages(['message'])
+        receiver = self.queue.get_message_receiver(max_connections=2, auto_renew=False)
+
+        def dequeue_messages(*args, **kwargs):
+            raise ValueError("Unexpected response")
+        self.queue._dequeue_messages = dequeue_messages
+
+        with self.assertRaises(ValueError):
+            receiver.receive_messages(max_wait_time=5)
+        self.assertEqual(receiver._requested, 0)
+        receiver.close()
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()